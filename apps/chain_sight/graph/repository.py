@@ -26,6 +26,10 @@ class GraphRepository(Protocol):
         rel_type: str,
         properties: Dict[str, Any],
     ) -> None: ...
+    def bulk_upsert_edge_props(
+        self, rel_type: str, rows: List[Dict[str, Any]]
+    ) -> int: ...
+    def bulk_delete_edges(self, rel_type: str, rows: List[Dict[str, Any]]) -> int: ...
     def run_query(
         self, cypher: str, params: Dict[str, Any] | None = None
     ) -> List[Dict[str, Any]]: ...
@@ -161,6 +165,33 @@ class Neo4jGraphRepository:
         self.run_query(query, {"batch": edges_data})
         return len(edges_data)
 
+    def bulk_upsert_edge_props(
+        self, rel_type: str, rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        엣지 upsert 배치 (UNWIND 1회).
+        rows: {"from_ticker", "to_ticker", "props"} — props는 기존 속성에 병합(SET +=).
+        """
+        query = f"""
+        UNWIND $batch AS row
+        MATCH (a:Stock {{ticker: row.from_ticker}})
+        MATCH (b:Stock {{ticker: row.to_ticker}})
+        MERGE (a)-[r:{rel_type}]->(b)
+        SET r += row.props
+        """
+        self.run_query(query, {"batch": rows})
+        return len(rows)
+
+    def bulk_delete_edges(self, rel_type: str, rows: List[Dict[str, Any]]) -> int:
+        """엣지 삭제 배치 (UNWIND 1회). rows: {"from_ticker", "to_ticker"}"""
+        query = f"""
+        UNWIND $batch AS row
+        MATCH (a:Stock {{ticker: row.from_ticker}})-[r:{rel_type}]->(b:Stock {{ticker: row.to_ticker}})
+        DELETE r
+        """
+        self.run_query(query, {"batch": rows})
+        return len(rows)
+
     def run_query(
         self, cypher: str, params: Dict[str, Any] | None = None
     ) -> List[Dict[str, Any]]:
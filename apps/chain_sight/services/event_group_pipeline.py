@@ -13,8 +13,9 @@ confidence = 다중신호 가산 weight: jaccard 1-hop 강도 × (1 + 13F 가산
 
 import logging
 import math
-from collections import defaultdict
-from datetime import date
+import time
+from collections import OrderedDict, defaultdict
+from datetime import date, timedelta
 from itertools import combinations
 
 import networkx as nx
@@ -32,6 +33,12 @@ DEFAULT_MIN_MEMBERS = 3
 W_COHOLD = 0.1       # 13F 공유기관수당 가산
 W_CORECONN = 0.15    # 추가 코어 연결당 가산
 
+# 그룹 지표 가격 창 / 수익률 캐시 (장수 Celery 워커에서 크기·수명 고정)
+PRICE_LOOKBACK_DAYS = 365 * 3
+PRICE_CACHE_MAX_SYMBOLS = 2048
+PRICE_CACHE_TTL = 3600
+COHOLD_CHUNK_SIZE = 1024  # 공동보유 행렬곱 행 chunk
+
 
 # ── 입력 레이어 (prod ORM) ───────────────────────────────────────────
 def _build_base(window_days=DEFAULT_WINDOW_DAYS):
@@ -91,23 +98,33 @@ def _jaccard_weights(co_count, doc_count):
     }
 
 
-def _cohold_map():
-    """serverless.InstitutionalHolding → {(a,b): 공유 기관 수}. 없으면 빈 dict."""
+def _cohold_map(symbols=None):
+    """serverless.InstitutionalHolding → {(a,b): 공유 기관 수}. 없으면 빈 dict.
+
+    종목 × 기관 0/1 incidence 행렬의 행렬곱(행 chunk)으로 전 쌍 공유 수를 한 번에 구하고
+    0 아닌 상삼각만 남긴다. symbols 가 주어지면 그 종목(co-mention 그래프)만 조회.
+    """
     try:
         from services.serverless.models import InstitutionalHolding
     except Exception:
         return {}
-    holdings = defaultdict(set)
-    for sym, cik in InstitutionalHolding.objects.values_list(
-        "stock_symbol", "institution_cik"
-    ):
-        holdings[sym].add(cik)
+    qs = InstitutionalHolding.objects.all()
+    if symbols is not None:
+        qs = qs.filter(stock_symbol__in=list(symbols))
+    rows = list(qs.values_list("stock_symbol", "institution_cik"))
+    if not rows:
+        return {}
+    syms, sym_idx = np.unique([r[0] for r in rows], return_inverse=True)
+    ciks, cik_idx = np.unique([r[1] for r in rows], return_inverse=True)
+    incidence = np.zeros((len(syms), len(ciks)), dtype=np.float32)
+    incidence[sym_idx, cik_idx] = 1.0
+
     cohold = {}
-    syms = sorted(holdings)
-    for a, b in combinations(syms, 2):
-        sh = len(holdings[a] & holdings[b])
-        if sh:
-            cohold[(a, b)] = sh
+    for start in range(0, len(syms), COHOLD_CHUNK_SIZE):
+        shared = incidence[start : start + COHOLD_CHUNK_SIZE] @ incidence.T
+        rows_i, cols = np.nonzero(np.triu(shared, k=start + 1))
+        for i, j in zip(rows_i, cols):
+            cohold[(str(syms[start + i]), str(syms[j]))] = int(shared[i, j])
     return cohold
 
 
@@ -125,7 +142,7 @@ def compute_event_groups(
     """코어-위성 그룹 계산(메모리). DB 미투입 — 적재/동치검증 공용."""
     co_count, doc_count, occ, N, as_of = _build_base(window_days)
     weights = _jaccard_weights(co_count, doc_count)
-    cohold = _cohold_map()
+    cohold = _cohold_map(doc_count)
 
     # 코어: jaccard ≥ core_thr 연결요소 + ≥min_members
     Gcore = nx.Graph()
@@ -204,8 +221,8 @@ def compute_event_groups(
                 float(np.mean([m["edge_confidence"] for m in members])) if members else 0.0, 4
             ),
             # cohesion = 코어 멤버 기준(게이팅 임계 0.2의 캘리브레이션 기준)
-            "cohesion": _pairwise_cohesion(core),
-            "breadth": _group_breadth(all_syms),
+            "cohesion": _pairwise_cohesion(core, as_of=as_of),
+            "breadth": _group_breadth(all_syms, as_of=as_of),
         })
     # TF-IDF 코어 이름 부여 (corpus = 전 그룹 코어 텍스트)
     _attach_core_names(groups)
@@ -216,66 +233,135 @@ def compute_event_groups(
 
 
 # ── 그룹 지표 (DailyPrice) ───────────────────────────────────────────
-def _returns(closes):
-    items = sorted(closes.items())
-    if len(items) < 2:
+class _ReturnCache:
+    """종목별 수익률 시리즈 LRU + TTL. 워커 프로세스 수명 동안 크기가 max_size 로 고정."""
+
+    def __init__(self, max_size=PRICE_CACHE_MAX_SYMBOLS, ttl=PRICE_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (stored_at, value)
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None, False
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1], True
+
+    def put(self, key, value):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {"size": len(self._data), "max_size": self.max_size, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+_PRICE_CACHE = _ReturnCache()
+
+
+def _returns(dates, closes):
+    """종목 1개 (날짜, 종가) 오름차순 → (수익률 날짜, 단순 수익률). 2개 미만이면 None."""
+    if len(closes) < 2:
         return None
-    px = np.array([p for _, p in items], dtype=float)
-    return dict(zip([d for d, _ in items][1:], np.diff(px) / px[:-1]))
-
+    px = np.asarray(closes, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = np.diff(px) / px[:-1]
+    ok = np.isfinite(rets)
+    return np.asarray(dates[1:], dtype="datetime64[D]")[ok], rets[ok]
 
-_PRICE_CACHE = {}
 
-
-def _load_prices(symbols):
+def _load_prices(symbols, as_of=None, lookback_days=PRICE_LOOKBACK_DAYS):
+    """{symbol: (dates, returns)} — as_of 기준 lookback 창만 조회, 캐시 미스만 DB 1회."""
     from packages.shared.stocks.models import DailyPrice
 
-    need = [s for s in symbols if s not in _PRICE_CACHE]
+    end = as_of or date.today()
+    start = end - timedelta(days=lookback_days)
+    out, need = {}, []
+    for s in dict.fromkeys(symbols):
+        value, hit = _PRICE_CACHE.get((s, start, end))
+        if not hit:
+            need.append(s)
+        elif value is not None:
+            out[s] = value
     if need:
-        tmp = defaultdict(dict)
-        for sym, d, c in DailyPrice.objects.filter(stock_id__in=need).values_list(
-            "stock_id", "date", "close_price"
-        ):
+        tmp = defaultdict(lambda: ([], []))
+        for sym, d, c in DailyPrice.objects.filter(
+            stock_id__in=need, date__gte=start, date__lte=end
+        ).order_by("stock_id", "date").values_list("stock_id", "date", "close_price"):
             if c is not None:
-                tmp[sym][d.isoformat()] = float(c)
+                tmp[sym][0].append(d)
+                tmp[sym][1].append(float(c))
         for s in need:
-            _PRICE_CACHE[s] = _returns(tmp[s]) if s in tmp else None
-    return {s: _PRICE_CACHE[s] for s in symbols if _PRICE_CACHE.get(s)}
-
-
-def _pairwise_cohesion(symbols, min_overlap=20):
-    series = _load_prices(symbols)
-    syms = list(series)
+            value = _returns(*tmp[s]) if s in tmp else None
+            _PRICE_CACHE.put((s, start, end), value)
+            if value is not None and len(value[1]):
+                out[s] = value
+    return out
+
+
+def _return_matrix(symbols, as_of=None):
+    """정렬 수익률 행렬 (행 = 데이터 있는 종목, 열 = 수익률 날짜 합집합, 결측 NaN)."""
+    series = _load_prices(symbols, as_of)
+    syms = [s for s in symbols if s in series]
+    if not syms:
+        return syms, np.empty((0, 0))
+    dates = np.unique(np.concatenate([series[s][0] for s in syms]))
+    matrix = np.full((len(syms), len(dates)), np.nan)
+    for i, s in enumerate(syms):
+        d, r = series[s]
+        matrix[i, np.searchsorted(dates, d)] = r
+    return syms, matrix
+
+
+def _pairwise_cohesion(symbols, min_overlap=20, as_of=None):
+    """코어 평균 pairwise Pearson — 쌍별 공통 날짜(pairwise-complete) 기준, 행렬곱 한 번에."""
+    syms, R = _return_matrix(list(dict.fromkeys(symbols)), as_of)
     if len(syms) < 2:
         return None
-    cors = []
-    for a, b in combinations(syms, 2):
-        common = sorted(set(series[a]) & set(series[b]))
-        if len(common) < min_overlap:
-            continue
-        va = np.array([series[a][d] for d in common])
-        vb = np.array([series[b][d] for d in common])
-        if va.std() == 0 or vb.std() == 0:
-            continue
-        cors.append(np.corrcoef(va, vb)[0, 1])
-    return round(float(np.mean(cors)), 4) if cors else None
-
-
-def _group_breadth(symbols, min_members=2):
-    series = _load_prices(symbols)
-    if len(series) < min_members:
+    present = np.isfinite(R).astype(float)
+    x = np.nan_to_num(R)
+    n = present @ present.T              # 공통 날짜 수
+    sx = x @ present.T                   # sx[i, j] = Σ_{i∩j} x_i
+    sxx = (x * x) @ present.T
+    sxy = x @ x.T
+    iu = np.triu_indices(len(syms), k=1)
+    n, sa, sb, saa, sbb, sab = (
+        n[iu], sx[iu], sx.T[iu], sxx[iu], sxx.T[iu], sxy[iu]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        va = saa - sa * sa / n
+        vb = sbb - sb * sb / n
+        cov = sab - sa * sb / n
+        # 분산 0(상수 수익률) 쌍 제외 — 합 공식의 반올림 잔차는 상대 허용오차로 판정
+        ok = (n >= min_overlap) & (va > 1e-12 * saa) & (vb > 1e-12 * sbb)
+        cors = cov[ok] / np.sqrt(va[ok] * vb[ok])
+    return round(float(np.mean(cors)), 4) if cors.size else None
+
+
+def _group_breadth(symbols, min_members=2, as_of=None):
+    syms, R = _return_matrix(list(dict.fromkeys(symbols)), as_of)
+    if len(syms) < min_members:
         return None
-    all_dates = set()
-    for s in series.values():
-        all_dates |= set(s)
-    agrees = []
-    for d in all_dates:
-        vals = [series[s][d] for s in series if d in series[s]]
-        if len(vals) < min_members:
-            continue
-        up = sum(1 for v in vals if v > 0)
-        agrees.append(max(up / len(vals), 1 - up / len(vals)))
-    return round(float(np.mean(agrees)), 4) if agrees else None
+    count = np.isfinite(R).sum(axis=0)
+    up = (R > 0).sum(axis=0)
+    sel = count >= min_members
+    if not sel.any():
+        return None
+    frac = up[sel] / count[sel]
+    return round(float(np.mean(np.maximum(frac, 1 - frac))), 4)
 
 
 # ── TF-IDF 코어 이름 (코어 멤버 등장 뉴스 텍스트) ────────────────────
@@ -394,7 +480,7 @@ def load_event_groups(cohesion_gate=COHESION_GATE, **params):
     from apps.chain_sight.models.event_group import EventGroup, GroupMembership
     from packages.shared.stocks.models import Stock
 
-    _PRICE_CACHE.clear()
+    _PRICE_CACHE.clear()  # 실행 간엔 최신 종가 재조회, 실행 내(코어 cohesion ↔ breadth)만 재사용
     result = compute_event_groups(**params)
     groups = result["groups"]
     as_of = result["as_of"]
@@ -469,4 +555,5 @@ def load_event_groups(cohesion_gate=COHESION_GATE, **params):
         "named": sum(1 for g in groups if g.get("auto_name", "—") != "—"),
         "total_members": GroupMembership.objects.count(),
         "as_of": str(as_of),
+        "price_cache": _PRICE_CACHE.stats(),
     }
@@ -112,6 +112,7 @@ def _real_sector_components(
     from apps.chain_sight.services.c6c7_service import (
         c6_correlation_from_db,
         c7_dollar_volume_from_db,
+        load_sector_panel,
     )
 
     components = {k: {"z": None, "s": None, "raw": None, "missing_reason": "not_wired"}
@@ -131,8 +132,10 @@ def _real_sector_components(
     # C5 투기 심리 (TH-7d) — 섹터 ETF 쌍 기반. 레버리지 부재 섹터(XLB·XLC)는 §3-5 결측.
     components["C5"] = c5_speculation_from_db(pri, lev, as_of)
     # C6 상관 응집 · C7 거래대금 (TH-8) — 구성종목 DailyPrice 3년 게이트(백필 도달 시 활성).
-    components["C6"] = c6_correlation_from_db(sector_symbols, as_of)
-    components["C7"] = c7_dollar_volume_from_db(sector_symbols, as_of)
+    # 섹터당 DailyPrice 1회 조회 → C6·C7 공용 symbols×dates 패널.
+    panel = load_sector_panel(sector_symbols, as_of) if sector_symbols else None
+    components["C6"] = c6_correlation_from_db(sector_symbols, as_of, panel=panel)
+    components["C7"] = c7_dollar_volume_from_db(sector_symbols, as_of, panel=panel)
     components["C8"] = _aggregate_c8_for_sector(sector_symbols, c8_by_symbol)
     return components
 
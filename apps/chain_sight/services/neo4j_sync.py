@@ -6,6 +6,9 @@ confirmed/probable → 엣지 upsert, hidden/weak/stale → 엣지 삭제.
 """
 
 import logging
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
 
 from django.utils import timezone
 
@@ -18,9 +21,32 @@ logger = logging.getLogger(__name__)
 # undirected 관계는 정규화된 방향(symbol_a < symbol_b)만 저장
 UNDIRECTED_TYPES = {"PEER_OF", "COMPETES_WITH", "CO_MENTIONED", "PRICE_CORRELATED"}
 
+# UNWIND 1회당 엣지 수
+SYNC_CHUNK_SIZE = 500
+
+# relation_type은 Cypher 관계 타입으로 삽입되므로 식별자 형식만 허용
+_REL_TYPE_RE = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+_SYNC_FIELDS = (
+    "symbol_a",
+    "symbol_b",
+    "relation_type",
+    "relation_category",
+    "relation_status",
+    "truth_score",
+    "market_score",
+    "evidence_tier_best",
+)
+
 
 def sync_dirty_relations() -> int:
-    """neo4j_dirty=True인 RelationConfidence를 Neo4j에 동기화."""
+    """
+    neo4j_dirty=True인 RelationConfidence를 Neo4j에 동기화.
+
+    (동작, relation_type)별로 묶어 SYNC_CHUNK_SIZE 단위 UNWIND로 전송하고,
+    성공한 청크의 pk만 즉시 dirty 해제. 실패한 청크는 행 단위로 재시도해
+    문제 행만 dirty로 남긴다 (다음 실행에서 재시도).
+    """
     dirty_qs = RelationConfidence.objects.filter(neo4j_dirty=True)
     count = dirty_qs.count()
     if count == 0:
@@ -28,70 +54,88 @@ def sync_dirty_relations() -> int:
         return 0
 
     repo = get_graph_repository()
-    synced_pks = []
-
-    for rc in dirty_qs.iterator(chunk_size=100):
-        try:
-            if rc.relation_status in ("confirmed", "probable"):
-                _upsert_edge(repo, rc)
-            elif rc.relation_category == "market" and rc.relation_status == "weak":
-                # market 관계(CO_MENTIONED, PRICE_CORRELATED)는 weak도 동기화
-                _upsert_edge(repo, rc)
-            else:
-                _delete_edge(repo, rc)
-            synced_pks.append(rc.pk)
-        except Exception as e:
-            logger.error(f"Failed to sync relation {rc.pk}: {e}")
-
-    # queryset.update() 사용 — save() 호출 금지 (dirty가 다시 True로 덮어씌워짐)
-    # audit P0 #9: synced_to_neo4j 제거, neo4j_dirty 단일 소스
-    if synced_pks:
-        RelationConfidence.objects.filter(pk__in=synced_pks).update(
-            neo4j_dirty=False,
-            neo4j_synced_at=timezone.now(),
+    groups: Dict[Tuple[str, str], List[Tuple[int, dict]]] = defaultdict(list)
+
+    for rc in dirty_qs.only(*_SYNC_FIELDS).iterator(chunk_size=1000):
+        if rc.relation_status in ("confirmed", "probable"):
+            action = "upsert"
+        elif rc.relation_category == "market" and rc.relation_status == "weak":
+            # market 관계(CO_MENTIONED, PRICE_CORRELATED)는 weak도 동기화
+            action = "upsert"
+        else:
+            action = "delete"
+        groups[(action, rc.relation_type)].append(
+            (rc.pk, _edge_row(rc, with_props=action == "upsert"))
         )
 
-    logger.info(
-        f"Neo4j dirty sync complete: {len(synced_pks)}/{count} relations synced"
-    )
-    return len(synced_pks)
-
-
-def _upsert_edge(repo, rc: RelationConfidence):
-    """Neo4j에 관계 엣지 upsert."""
-    # undirected 관계는 정규화 방향으로만 저장
-    if rc.relation_type in UNDIRECTED_TYPES:
-        sym_a, sym_b = normalize_pair(rc.symbol_a, rc.symbol_b)
-    else:
-        sym_a, sym_b = rc.symbol_a, rc.symbol_b
-
-    props = {
-        "truth_score": rc.truth_score,
-        "status": rc.relation_status,
-        "evidence_tier_best": rc.evidence_tier_best,
-        "relation_category": rc.relation_category,
-    }
-    if rc.market_score is not None:
-        props["market_score"] = rc.market_score
+    synced = 0
+    for (action, rel_type), items in groups.items():
+        if not _REL_TYPE_RE.match(rel_type or ""):
+            logger.error(
+                f"Invalid relation type {rel_type!r}: {len(items)} relations skipped"
+            )
+            continue
+        for start in range(0, len(items), SYNC_CHUNK_SIZE):
+            chunk = items[start : start + SYNC_CHUNK_SIZE]
+            pks = sync_edge_chunk(repo, action, rel_type, chunk)
+            # queryset.update() 사용 — save() 호출 금지 (dirty가 다시 True로 덮어씌워짐)
+            # audit P0 #9: synced_to_neo4j 제거, neo4j_dirty 단일 소스
+            if pks:
+                RelationConfidence.objects.filter(pk__in=pks).update(
+                    neo4j_dirty=False,
+                    neo4j_synced_at=timezone.now(),
+                )
+            synced += len(pks)
+
+    logger.info(f"Neo4j dirty sync complete: {synced}/{count} relations synced")
+    return synced
+
+
+def sync_edge_chunk(
+    repo, action: str, rel_type: str, chunk: List[Tuple[int, dict]]
+) -> List[int]:
+    """
+    한 청크를 UNWIND 1회로 동기화.
+
+    Returns:
+        동기화 성공한 pk 리스트 (청크 실패 시 행 단위 재시도 결과)
+    """
+    send = repo.bulk_upsert_edge_props if action == "upsert" else repo.bulk_delete_edges
+    try:
+        send(rel_type, [row for _, row in chunk])
+        return [pk for pk, _ in chunk]
+    except Exception as e:
+        logger.warning(
+            f"Edge {action} chunk failed [{rel_type}] ({len(chunk)} rows), "
+            f"retrying per row: {e}"
+        )
 
-    repo.upsert_edge(sym_a, sym_b, rc.relation_type, props)
+    synced_pks = []
+    for pk, row in chunk:
+        try:
+            send(rel_type, [row])
+            synced_pks.append(pk)
+        except Exception as e:
+            logger.error(f"Failed to sync relation {pk}: {e}")
+    return synced_pks
 
 
-def _delete_edge(repo, rc: RelationConfidence):
-    """Neo4j에서 관계 엣지 삭제."""
+def _edge_row(rc: RelationConfidence, with_props: bool) -> dict:
+    """UNWIND 파라미터 행 (undirected 관계는 정규화 방향)."""
     if rc.relation_type in UNDIRECTED_TYPES:
         sym_a, sym_b = normalize_pair(rc.symbol_a, rc.symbol_b)
     else:
         sym_a, sym_b = rc.symbol_a, rc.symbol_b
 
-    try:
-        repo.run_query(
-            """
-            MATCH (a:Stock {ticker: $symbol_a})-[r]->(b:Stock {ticker: $symbol_b})
-            WHERE type(r) = $rel_type
-            DELETE r
-        """,
-            {"symbol_a": sym_a, "symbol_b": sym_b, "rel_type": rc.relation_type},
-        )
-    except Exception as e:
-        logger.warning(f"Edge delete failed {sym_a}->{sym_b} [{rc.relation_type}]: {e}")
+    row = {"from_ticker": sym_a, "to_ticker": sym_b}
+    if with_props:
+        props = {
+            "truth_score": rc.truth_score,
+            "status": rc.relation_status,
+            "evidence_tier_best": rc.evidence_tier_best,
+            "relation_category": rc.relation_category,
+        }
+        if rc.market_score is not None:
+            props["market_score"] = rc.market_score
+        row["props"] = props
+    return row
@@ -17,27 +17,40 @@ RELATION_LABEL = {
 
 
 def build_edge_snapshot(path_nodes: List[str]) -> List[Dict]:
-    """인접 노드 쌍에 대해 Neo4j에서 관계 스냅샷을 조회."""
+    """
+    인접 노드 쌍에 대해 Neo4j에서 관계 스냅샷을 조회.
+
+    모든 쌍을 UNWIND 1회로 조회하고, 쌍마다 truth_score 최고 관계 1개를 고른다.
+    """
     if len(path_nodes) < 2:
         return []
+    pairs = [
+        {"i": i, "a": path_nodes[i], "b": path_nodes[i + 1]}
+        for i in range(len(path_nodes) - 1)
+    ]
     repo = get_graph_repository()
+    rows = repo.run_query(
+        """
+        UNWIND $pairs AS pair
+        OPTIONAL MATCH (from:Stock {ticker: pair.a})-[r]-(to:Stock {ticker: pair.b})
+        WITH pair, r
+        ORDER BY pair.i, r.truth_score DESC NULLS LAST
+        WITH pair, collect(r)[0] AS r
+        RETURN pair.i AS i,
+               type(r) AS rel_type,
+               r.truth_score AS truth_score,
+               r.status AS status,
+               startNode(r).ticker AS start_ticker
+        """,
+        {"pairs": pairs},
+    )
+    best = {row["i"]: row for row in rows if row.get("rel_type")}
+
     snapshot = []
-    for i in range(len(path_nodes) - 1):
-        a, b = path_nodes[i], path_nodes[i + 1]
-        result = repo.run_query(
-            """
-            MATCH (from:Stock {ticker: $a})-[r]-(to:Stock {ticker: $b})
-            RETURN type(r) AS rel_type,
-                   r.truth_score AS truth_score,
-                   r.status AS status,
-                   startNode(r).ticker AS start_ticker
-            ORDER BY r.truth_score DESC NULLS LAST
-            LIMIT 1
-            """,
-            {"a": a, "b": b},
-        )
-        if result:
-            row = result[0]
+    for pair in pairs:
+        a, b = pair["a"], pair["b"]
+        row = best.get(pair["i"])
+        if row:
             snapshot.append(
                 {
                     "from": row["start_ticker"],
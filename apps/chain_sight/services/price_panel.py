@@ -0,0 +1,135 @@
+"""
+섹터 가격 패널 + 롤링 엔진 (C6 상관 응집 · C7 거래대금 공용) — 설계 앵커 §2 C6·C7.
+
+섹터당 DailyPrice 1회 조회 → 정렬된 symbols × dates 행렬(close/volume, 결측 NaN).
+앵커(주간 3년 ≈ 157개)별 재필터/재스캔 대신 모든 앵커를 배열 연산 한 번에 계산한다.
+
+- rolling_sum_at: 누적합 차분으로 앵커별 트레일링 N개 합 (C7 20일 거래대금)
+- avg_pairwise_corr_at: 앵커별 창 안에서 종목 수익률을 표준화(z)하면
+  Σ_ij corr_ij = Σ_t (Σ_i z_it)² 이므로 평균 pairwise 상관 = (Σ − n) / (n(n−1)).
+  n×n 상관행렬/쌍 루프 없이 O(n·w) (C6 60일 Pearson 평균).
+
+정렬 축 = 종가가 하나라도 있는 날짜. 창 안 모든 날짜에 0 아닌 종가가 있는 종목만 그 앵커에
+참여한다(공통 거래일 정렬 — 구성종목이 같은 EOD 캘린더를 공유하면 종목별 최근 60개와 동일).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ANCHOR_BLOCK = 64  # 상관 계산 시 한 번에 펼칠 앵커 수 (메모리 = n × block × window)
+
+
+@dataclass
+class PricePanel:
+    """섹터 구성종목 가격 행렬 (행 = symbols, 열 = dates 오름차순, 결측 NaN)."""
+
+    symbols: list[str]
+    dates: np.ndarray  # datetime64[D]
+    close: np.ndarray
+    volume: np.ndarray
+
+    def closes(self) -> tuple[np.ndarray, np.ndarray]:
+        """종가가 하나라도 있는 날짜 축 → (dates, close 행렬)."""
+        has_close = ~np.isnan(self.close).all(axis=0)
+        return self.dates[has_close], self.close[:, has_close]
+
+    def dollar_volume(self) -> tuple[np.ndarray, np.ndarray]:
+        """날짜별 Σ close×volume (close·volume 모두 있는 종목만, 그런 종목이 없는 날짜 제외)."""
+        both = ~np.isnan(self.close) & ~np.isnan(self.volume)
+        has_any = both.any(axis=0)
+        dv = np.where(both, self.close * self.volume, 0.0).sum(axis=0)
+        return self.dates[has_any], dv[has_any]
+
+
+def load_price_panel(
+    syms: Sequence[str], as_of: date, lookback_days: int, pad_days: int
+) -> PricePanel:
+    """구성종목 DailyPrice(읽기 전용) → PricePanel. 조회 1회."""
+    from packages.shared.stocks.models import DailyPrice
+
+    earliest = as_of - timedelta(days=lookback_days + pad_days)
+    rows = list(
+        DailyPrice.objects.filter(
+            stock__symbol__in=list(syms), date__gte=earliest, date__lte=as_of
+        ).values_list("stock__symbol", "date", "close_price", "volume")
+    )
+    symbols = sorted({r[0] for r in rows})
+    if not rows:
+        empty = np.empty((0, 0))
+        return PricePanel(symbols, np.array([], dtype="datetime64[D]"), empty, empty.copy())
+
+    dates, col = np.unique(np.array([r[1] for r in rows], dtype="datetime64[D]"), return_inverse=True)
+    row_of = {s: i for i, s in enumerate(symbols)}
+    row = np.fromiter((row_of[r[0]] for r in rows), dtype=np.intp, count=len(rows))
+    close = np.full((len(symbols), len(dates)), np.nan)
+    volume = np.full((len(symbols), len(dates)), np.nan)
+    close[row, col] = [np.nan if r[2] is None else float(r[2]) for r in rows]
+    volume[row, col] = [np.nan if r[3] is None else float(r[3]) for r in rows]
+    return PricePanel(symbols, dates, close, volume)
+
+
+def anchor_dates(as_of: date, lookback_days: int, step_days: int) -> np.ndarray:
+    """히스토리 앵커(as_of − lookback 부터 step 간격, as_of 미만) + 마지막 원소 as_of."""
+    start = np.datetime64(as_of - timedelta(days=lookback_days), "D")
+    end = np.datetime64(as_of, "D")
+    history = np.arange(start, end, np.timedelta64(step_days, "D"))
+    return np.append(history, end)
+
+
+def rolling_sum_at(
+    dates: np.ndarray, values: np.ndarray, anchors: np.ndarray, window: int
+) -> list[Optional[float]]:
+    """앵커별 (날짜 ≤ 앵커) 마지막 window개 값의 합. 개수 미달이면 None."""
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    count = np.searchsorted(dates, anchors, side="right")
+    sums = csum[count] - csum[np.maximum(count - window, 0)]
+    return [float(s) if c >= window else None for s, c in zip(sums, count)]
+
+
+def _returns(close: np.ndarray) -> np.ndarray:
+    """종가 행렬 → 단순 수익률 행렬 (같은 모양, 첫 열·0/결측 종가 구간 NaN)."""
+    rets = np.full(close.shape, np.nan)
+    prev, cur = close[:, :-1], close[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets[:, 1:] = np.where((prev != 0) & (cur != 0), cur / prev - 1, np.nan)
+    return rets
+
+
+def avg_pairwise_corr_at(
+    dates: np.ndarray, close: np.ndarray, anchors: np.ndarray, corr_window: int
+) -> list[Optional[float]]:
+    """
+    앵커별 평균 pairwise Pearson 상관 (창 = 날짜 ≤ 앵커인 마지막 corr_window개 종가).
+
+    분산 0 종목은 제외(쌍 상관 정의 불가), 참여 종목 < 2면 None.
+    """
+    out: list[Optional[float]] = [None] * len(anchors)
+    w = corr_window - 1  # 종가 corr_window개 → 수익률 w개
+    if w < 2 or close.shape[0] < 2:
+        return out
+
+    ends = np.searchsorted(dates, anchors, side="right") - 1
+    usable = np.flatnonzero(ends >= corr_window - 1)
+    if not len(usable):
+        return out
+
+    windows = sliding_window_view(_returns(close), w, axis=1)  # [:, k] = 수익률 k..k+w-1
+    for block in range(0, len(usable), ANCHOR_BLOCK):
+        idx = usable[block : block + ANCHOR_BLOCK]
+        win = windows[:, ends[idx] - w + 1]  # (n, 앵커, w)
+        valid = np.isfinite(win).all(axis=2)
+        win = np.where(valid[..., None], win, 0.0)
+        dev = win - win.mean(axis=2, keepdims=True)
+        var = (dev**2).sum(axis=2)
+        use = valid & (var > 0)
+        z = np.where(use[..., None], dev / np.sqrt(np.where(use, var, 1.0))[..., None], 0.0)
+        total = (z.sum(axis=0) ** 2).sum(axis=1)  # Σ_ij corr_ij (대각 = n)
+        n = use.sum(axis=0)
+        for k, i in enumerate(idx):
+            if n[k] >= 2:
+                out[i] = float((total[k] - n[k]) / (n[k] * (n[k] - 1)))
+    return out
@@ -53,6 +53,7 @@ from apps.monitor.models import (
 )
 from apps.monitor.services import closure
 from apps.monitor.services.evidence_judge import judge_claim_evidences
+from apps.monitor.services.indicator_scores import invalidate_score_series
 from apps.monitor.services.pipeline import evaluate_monitor
 from apps.monitor.services.sparkline import score_series
 from apps.monitor.services.snapshot_series import snapshot_series
@@ -448,7 +449,17 @@ class IndicatorReadingViewSet(_OwnedByMonitorMixin, viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         self._assert_owner(serializer.validated_data["indicator"].monitor)
-        serializer.save()
+        reading = serializer.save()
+        invalidate_score_series([reading.indicator_id])
+
+    def perform_update(self, serializer):
+        previous = serializer.instance.indicator_id
+        reading = serializer.save()
+        invalidate_score_series([previous, reading.indicator_id])
+
+    def perform_destroy(self, instance):
+        invalidate_score_series([instance.indicator_id])
+        instance.delete()
 
 
 class ClaimEvidenceViewSet(_OwnedByMonitorMixin, viewsets.ModelViewSet):
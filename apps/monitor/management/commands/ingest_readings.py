@@ -8,6 +8,7 @@ beat 등록은 별도(MON-P2-BEAT). 예:
 from django.core.management.base import BaseCommand
 
 from apps.monitor.models import Monitor
+from apps.monitor.services.indicator_scores import refresh_score_series
 from apps.monitor.services.ingest import BACKFILL_DAYS, ingest_readings_for_monitor
 
 
@@ -32,6 +33,7 @@ class Command(BaseCommand):
                     f"  {r['symbol']} [{r['source_key']}]: {r['status']} "
                     f"ingested={r['ingested']} null_skip={r['skipped_null']}"
                 )
+            refresh_score_series(m)  # 스파크라인 score 물질화 동기화
         self.stdout.write(
             self.style.SUCCESS(f"이식 완료: {qs.count()}개 모니터, 총 {total} readings")
         )
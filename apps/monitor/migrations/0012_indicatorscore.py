@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitor', '0011_decisionjournalentry_swapholdlog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicatorScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asof_date', models.DateField()),
+                ('score', models.FloatField()),
+                ('is_sufficient', models.BooleanField(default=False)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('indicator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_scores', to='monitor.monitorindicator')),
+            ],
+            options={
+                'ordering': ['asof_date'],
+                'constraints': [models.UniqueConstraint(fields=('indicator', 'asof_date'), name='uniq_score_indicator_asof')],
+            },
+        ),
+    ]
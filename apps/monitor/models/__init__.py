@@ -2,7 +2,7 @@ from apps.monitor.models.advisor import AdvisorNote
 from apps.monitor.models.alert import AlertEvent
 from apps.monitor.models.closure import ClaimIndicatorResult, ClosureSnapshot
 from apps.monitor.models.evidence import ClaimEvidence
-from apps.monitor.models.indicator import IndicatorReading, MonitorIndicator
+from apps.monitor.models.indicator import IndicatorReading, IndicatorScore, MonitorIndicator
 from apps.monitor.models.monitor import Claim, Monitor
 from apps.monitor.models.monitoring import MonitorSnapshot
 from apps.monitor.models.swap import DecisionJournalEntry, SwapHoldLog
@@ -12,6 +12,7 @@ __all__ = [
     "Claim",
     "MonitorIndicator",
     "IndicatorReading",
+    "IndicatorScore",
     "MonitorSnapshot",
     "AlertEvent",
     "ClaimIndicatorResult",
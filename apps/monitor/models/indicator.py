@@ -2,6 +2,7 @@
 
 MonitorIndicator = Monitor에 부착된 관측 지표(구 ThesisIndicator).
 IndicatorReading = 지표의 시계열 판독값(구 IndicatorReading).
+IndicatorScore = 지표의 거래일별 score 물질화(스파크라인 원천, refresh가 증분 갱신).
 엔진(indicator_scorer)이 소비하는 필드 계약을 그대로 승계.
 """
 import uuid
@@ -86,3 +87,30 @@ class IndicatorReading(models.Model):
 
     def __str__(self):
         return f"{self.indicator_id} = {self.value} @ {self.asof:%Y-%m-%d}"
+
+
+class IndicatorScore(models.Model):
+    """지표 × 거래일 score (services/indicator_scores가 refresh 때 증분 upsert).
+
+    기록(MonitorSnapshot)이 아니라 재산출 가능한 캐시 — 지표 설정 변경(updated_at)·
+    수동 판독 변경 시 무효화되고 다음 조회/refresh에서 다시 채운다.
+    """
+
+    indicator = models.ForeignKey(
+        MonitorIndicator, on_delete=models.CASCADE, related_name="daily_scores"
+    )
+    asof_date = models.DateField()
+    score = models.FloatField()
+    is_sufficient = models.BooleanField(default=False)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["asof_date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["indicator", "asof_date"], name="uniq_score_indicator_asof"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.indicator_id} score={self.score} @ {self.asof_date}"
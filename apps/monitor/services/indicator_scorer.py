@@ -5,6 +5,7 @@ MON-P2-S2 이식: thesis/_reuse → apps/monitor. 소비 모델 = MonitorIndicat
 """
 
 import logging
+from bisect import bisect_right
 
 import numpy as np
 
@@ -22,6 +23,9 @@ EPSILON_DEFAULTS = {
 
 EXTREME_VOL_THRESHOLD = 5.0  # |z_raw| >= 5.0
 
+# 스코어링에 쓰는 판독 상태 (rejected/pending 제외)
+VALID_STATUSES = ('ok', 'extreme_jump_allowed')
+
 
 def get_scoring_params(indicator):
     """지표별 스코어링 파라미터 조회. 모델 기본값과 일치하도록 None 체크."""
@@ -115,7 +119,7 @@ def score_indicator(readings, dates, support_direction,
     }
 
 
-def source_row_count(indicator, entry, as_of_date=None):
+def source_row_count(indicator, entry, as_of_date=None, source_dates=None):
     """지표의 **계산 소스 행수**(source_n)를 조회 (MON-P2A 교정).
 
     충분성 판정 기준 = '오늘의 지표값을 만들 원천 데이터가 min_n 이상인가'.
@@ -124,18 +128,22 @@ def source_row_count(indicator, entry, as_of_date=None):
       - "stocks.EODSignal ..."  → EODSignal 행수 (composite/change/dollar)
     종목 심볼 = indicator.monitor.target_ref (scope=stock 정규화). as_of_date가 있으면
     그 날짜 이하로 제한(백테스트·회귀 asof 정합). 소스 판별 불가 시 None(게이트 미적용).
+    source_dates: {(모델명, 심볼): 날짜 오름차순 list} 선조회분 — 있으면 DB 대신 bisect.
     """
-    source = (entry or {}).get("source", "")
     symbol = (getattr(indicator.monitor, "target_ref", "") or "").upper()
     if not symbol:
         return None
-    if "DailyPrice" in source:
+    model = source_model(entry)
+    if source_dates is not None and (model, symbol) in source_dates:
+        dates = source_dates[(model, symbol)]
+        return bisect_right(dates, as_of_date) if as_of_date else len(dates)
+    if model == "DailyPrice":
         from packages.shared.stocks.models import DailyPrice
         qs = DailyPrice.objects.filter(stock__symbol=symbol)
         if as_of_date:
             qs = qs.filter(date__lte=as_of_date)
         return qs.count()
-    if "EODSignal" in source:
+    if model == "EODSignal":
         from packages.shared.stocks.models import EODSignal
         qs = EODSignal.objects.filter(stock__symbol=symbol)
         if as_of_date:
@@ -144,10 +152,36 @@ def source_row_count(indicator, entry, as_of_date=None):
     return None
 
 
-def score_indicator_from_model(indicator, as_of_date=None):
+def source_model(entry):
+    """catalog entry의 계산 소스 모델명 ('DailyPrice' | 'EODSignal' | None)."""
+    source = (entry or {}).get("source", "")
+    if "DailyPrice" in source:
+        return "DailyPrice"
+    if "EODSignal" in source:
+        return "EODSignal"
+    return None
+
+
+def validated_readings(indicator, as_of_date=None, readings=None):
+    """validated (value, asof) asof 오름차순.
+
+    readings: 선조회 [(value, asof, 현지 날짜)] asof 오름차순 — 있으면 DB 대신 as_of만 거른다
+    (``asof__date__lte``와 같은 현지 날짜 기준).
+    """
+    if readings is None:
+        qs = indicator.readings.filter(validation_status__in=VALID_STATUSES).order_by('asof')
+        if as_of_date:
+            qs = qs.filter(asof__date__lte=as_of_date)
+        return list(qs.values_list('value', 'asof'))
+    return [(v, asof) for v, asof, local in readings if not as_of_date or local <= as_of_date]
+
+
+def score_indicator_from_model(indicator, as_of_date=None, readings=None, source_dates=None):
     """
     MonitorIndicator 모델 인스턴스로부터 score 계산.
     DB에서 validated readings를 조회하여 score_indicator()에 전달.
+    readings/source_dates(선조회분)가 있으면 DB 조회 없이 같은 결과를 낸다
+    (validated_readings / source_row_count 참고).
 
     Returns:
         dict with score, raw_z, is_extreme_vol, effective_window, is_neutral_mad
@@ -179,14 +213,7 @@ def score_indicator_from_model(indicator, as_of_date=None):
     params = get_scoring_params(indicator)
 
     # validated readings 조회
-    qs = indicator.readings.filter(
-        validation_status__in=['ok', 'extreme_jump_allowed']
-    ).order_by('asof')
-
-    if as_of_date:
-        qs = qs.filter(asof__date__lte=as_of_date)
-
-    readings_qs = list(qs.values_list('value', 'asof'))
+    readings_qs = validated_readings(indicator, as_of_date, readings)
     if not readings_qs:
         return {
             'score': 0.0,
@@ -220,7 +247,7 @@ def score_indicator_from_model(indicator, as_of_date=None):
     min_n = entry.get("min_n") if entry else None
 
     if min_n is not None:
-        source_n = source_row_count(indicator, entry, as_of_date)
+        source_n = source_row_count(indicator, entry, as_of_date, source_dates)
         if source_n is not None and source_n < min_n:
             return {
                 'score': 0.0,
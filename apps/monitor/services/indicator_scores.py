@@ -0,0 +1,188 @@
+"""지표 거래일별 score 물질화 + 배치 스코어링 선조회 (MON-PERF).
+
+구 sparkline은 (거래일 × active 지표)마다 score_indicator_from_model을 불러 판독·소스 행수를
+매번 조회했다(창 × 지표에 비례하는 쿼리, 상세 화면 수백 건). 여기서는
+  - ScoringInputs: 여러 지표(여러 모니터)의 validated 판독 + 계산 소스 날짜를 한 번에 선조회 →
+    score_indicator_dispatch가 DB 없이 임의 as_of를 계산 (evaluate 배치·물질화 공용).
+  - IndicatorScore: 최근 SCORE_SERIES_DAYS 거래일의 지표별 score를 refresh가 증분 upsert →
+    sparkline·Δ5d는 1 쿼리로 읽는다. 비었거나 지표 설정이 바뀌었으면(updated_at) 조회 시점에
+    재물질화하고, 수동 판독 변경은 invalidate_score_series로 무효화한다.
+score = evaluate와 같은 score_indicator_dispatch 결과(bounded 선형 매핑 포함).
+"""
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.utils import timezone
+
+from apps.monitor.catalog import catalog_entry
+from apps.monitor.models import IndicatorReading, IndicatorScore, MonitorIndicator
+from apps.monitor.services.indicator_scorer import VALID_STATUSES, source_model
+from apps.monitor.services.technical import score_indicator_dispatch
+
+logger = logging.getLogger(__name__)
+
+SCORE_SERIES_DAYS = 120  # 물질화 거래일 수 = sparkline window 상한(api/views)
+BULK_BATCH_SIZE = 1000
+
+
+@dataclass
+class ScoringInputs:
+    """배치 스코어링 선조회분 (load_scoring_inputs)."""
+
+    readings: dict = field(default_factory=dict)      # indicator_id → [(value, asof, 현지 날짜)] asof 오름차순
+    source_dates: dict = field(default_factory=dict)  # (모델명, 심볼) → [date] 오름차순
+
+    def score(self, indicator, as_of_date):
+        """score_indicator_dispatch와 같은 결과를 DB 조회 없이."""
+        return score_indicator_dispatch(
+            indicator,
+            as_of_date=as_of_date,
+            readings=self.readings.get(indicator.id, []),
+            source_dates=self.source_dates,
+        )
+
+    def trading_dates(self, indicators):
+        """지표들의 판독 asof 거래일 distinct 오름차순 (구 sparkline._trading_asofs 기준)."""
+        return sorted({
+            asof.date() for ind in indicators for _, asof, _ in self.readings.get(ind.id, [])
+        })
+
+
+def active_indicators(monitors):
+    """{monitor_id: [active MonitorIndicator]} — 1 쿼리, indicator.monitor 캐시 연결."""
+    by_id = {m.id: m for m in monitors}
+    out = {m.id: [] for m in monitors}
+    for ind in MonitorIndicator.objects.filter(monitor_id__in=list(by_id), is_active=True):
+        ind.monitor = by_id[ind.monitor_id]
+        out[ind.monitor_id].append(ind)
+    return out
+
+
+def load_scoring_inputs(indicators, as_of_date=None):
+    """지표들의 validated 판독(1 쿼리) + 계산 소스 날짜(소스 모델당 1 쿼리) 선조회.
+
+    as_of_date가 있으면 그 날짜 이하만(``asof__date__lte`` / ``date__lte``와 같은 기준).
+    """
+    from packages.shared.stocks.models import DailyPrice, EODSignal
+
+    inputs = ScoringInputs()
+    if not indicators:
+        return inputs
+
+    qs = IndicatorReading.objects.filter(
+        indicator__in=indicators, validation_status__in=VALID_STATUSES
+    ).order_by("asof")
+    if as_of_date:
+        qs = qs.filter(asof__date__lte=as_of_date)
+    for ind_id, value, asof in qs.values_list("indicator_id", "value", "asof"):
+        inputs.readings.setdefault(ind_id, []).append(
+            (value, asof, timezone.localtime(asof).date())
+        )
+
+    # min_n 게이트가 있는 지표만 소스 행수(source_row_count)가 필요
+    wanted = defaultdict(set)
+    for ind in indicators:
+        entry = catalog_entry("stock", ind.source_key) if ind.source_key else None
+        model = source_model(entry)
+        symbol = (getattr(ind.monitor, "target_ref", "") or "").upper()
+        if entry and entry.get("min_n") is not None and model and symbol:
+            wanted[model].add(symbol)
+    models = {"DailyPrice": DailyPrice, "EODSignal": EODSignal}
+    for name, symbols in wanted.items():
+        for symbol in symbols:
+            inputs.source_dates[(name, symbol)] = []
+        src = models[name].objects.filter(stock__symbol__in=symbols)
+        if as_of_date:
+            src = src.filter(date__lte=as_of_date)
+        for symbol, d in src.order_by("date").values_list("stock__symbol", "date"):
+            inputs.source_dates[(name, symbol)].append(d)
+    return inputs
+
+
+def refresh_score_series(monitor, as_of_date=None, indicators=None, days=SCORE_SERIES_DAYS):
+    """최근 `days` 거래일 지표별 score 물질화 (refresh_monitor 증분 갱신).
+
+    새 거래일·값이 바뀐 행·지표 설정 변경(updated_at) 이후 행만 upsert하고 창 밖 행은 정리한다.
+    반환 = upsert 행 수.
+    """
+    if indicators is None:
+        indicators = active_indicators([monitor])[monitor.id]
+    if not indicators:
+        return 0
+    inputs = load_scoring_inputs(indicators, as_of_date)
+    dates = inputs.trading_dates(indicators)[-days:]
+    if not dates:
+        return 0
+
+    existing = {
+        (ind_id, d): (score, sufficient, computed_at)
+        for ind_id, d, score, sufficient, computed_at in IndicatorScore.objects.filter(
+            indicator__in=indicators, asof_date__gte=dates[0], asof_date__lte=dates[-1]
+        ).values_list("indicator_id", "asof_date", "score", "is_sufficient", "computed_at")
+    }
+    rows = []
+    for ind in indicators:
+        for d in dates:
+            res = inputs.score(ind, d)
+            value = (res["score"], bool(res.get("is_sufficient")))
+            prev = existing.get((ind.id, d))
+            if prev is None or prev[:2] != value or prev[2] < ind.updated_at:
+                rows.append(IndicatorScore(
+                    indicator=ind, asof_date=d, score=value[0], is_sufficient=value[1],
+                ))
+    if rows:
+        IndicatorScore.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["indicator", "asof_date"],
+            update_fields=["score", "is_sufficient", "computed_at"],
+            batch_size=BULK_BATCH_SIZE,
+        )
+    IndicatorScore.objects.filter(indicator__in=indicators, asof_date__lt=dates[0]).delete()
+    logger.info(
+        "score series 물질화: monitor=%s dates=%d upserted=%d", monitor.id, len(dates), len(rows)
+    )
+    return len(rows)
+
+
+def _score_rows(indicators):
+    return list(
+        IndicatorScore.objects.filter(indicator__in=indicators).values_list(
+            "indicator_id", "asof_date", "score", "is_sufficient", "computed_at"
+        )
+    )
+
+
+def _is_stale(indicators, rows):
+    """지표 행 누락 또는 지표 설정 변경(updated_at) 이후 미재계산 → 재물질화 필요."""
+    computed = {}
+    for ind_id, _, _, _, computed_at in rows:
+        computed[ind_id] = min(computed.get(ind_id, computed_at), computed_at)
+    return any(
+        ind.id not in computed or computed[ind.id] < ind.updated_at for ind in indicators
+    )
+
+
+def read_score_series(monitor, window=SCORE_SERIES_DAYS):
+    """물질화 score 조회 → (active 지표, [(거래일, {indicator_id: {'score','is_sufficient'}})]).
+
+    최근 `window` 거래일 오름차순. 정상 경로 = IndicatorScore 1 쿼리(+지표 1 쿼리).
+    """
+    indicators = active_indicators([monitor])[monitor.id]
+    if not indicators:
+        return indicators, []
+    rows = _score_rows(indicators)
+    if _is_stale(indicators, rows):
+        refresh_score_series(monitor, indicators=indicators)
+        rows = _score_rows(indicators)
+
+    by_date = defaultdict(dict)
+    for ind_id, d, score, sufficient, _ in rows:
+        by_date[d][str(ind_id)] = {"score": score, "is_sufficient": sufficient}
+    return indicators, [(d, by_date[d]) for d in sorted(by_date)[-window:]]
+
+
+def invalidate_score_series(indicator_ids):
+    """판독 수동 변경 → 해당 지표 물질화 행 삭제 (다음 조회/refresh가 다시 채운다)."""
+    IndicatorScore.objects.filter(indicator_id__in=[i for i in indicator_ids if i]).delete()
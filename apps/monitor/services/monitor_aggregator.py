@@ -37,19 +37,23 @@ def _parse_entry(v):
     return v, (v is not None)
 
 
-def aggregate_monitor(monitor, indicator_scores):
+def aggregate_monitor(monitor, indicator_scores, indicators=None):
     """
     Monitor 종합 점수를 **유효(충분) 지표만** 가중평균으로 집계 (MON-P2A T2).
 
     Args:
         monitor: Monitor 인스턴스
         indicator_scores: dict {indicator_id(str): {'score','is_sufficient'} | float | None}
+        indicators: 선조회한 active 지표 목록(배치 평가·스파크라인) — 없으면 DB 조회
 
     Returns:
         dict with overall_score(유효 0이면 None), weakest_link, divergence,
               bias_warning, category_overlap
     """
-    indicators = list(monitor.indicators.filter(is_active=True, is_paused=False))
+    if indicators is None:
+        indicators = list(monitor.indicators.filter(is_active=True, is_paused=False))
+    else:
+        indicators = [i for i in indicators if i.is_active and not i.is_paused]
 
     # 유효(is_sufficient) 지표만 수집 — 무데이터/부분윈도우는 분모에서 제거(재정규화).
     eff = []  # (indicator, score, weight)
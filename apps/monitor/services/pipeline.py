@@ -7,35 +7,69 @@ evaluate_monitor: 지표 스코어 → 집계 → 스냅샷 upsert → 상태 
 import logging
 
 from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
 from apps.monitor.models import Monitor, MonitorSnapshot
+from apps.monitor.services.indicator_scores import (
+    active_indicators,
+    load_scoring_inputs,
+    refresh_score_series,
+)
 from apps.monitor.services.ingest import BACKFILL_DAYS, ingest_readings_for_monitor
 from apps.monitor.services.monitor_aggregator import aggregate_monitor
-from apps.monitor.services.state_machine import determine_state
+from apps.monitor.services.state_machine import SCORE_HISTORY_LEN, determine_state
 from apps.monitor.services.technical import score_indicator_dispatch
 
 logger = logging.getLogger(__name__)
 
 
+def _recent_snapshot_scores(monitors, as_of):
+    """{monitor_id: as_of 이전 최근 스냅샷 overall_score 시간순} — 전 모니터 1 쿼리.
+
+    상태기는 현재 포함 최근 SCORE_HISTORY_LEN개만 보므로 그 직전 몫만 읽는다.
+    """
+    out = {m.id: [] for m in monitors}
+    rows = (
+        MonitorSnapshot.objects.filter(monitor__in=monitors, asof_date__lt=as_of)
+        .annotate(rank=Window(
+            RowNumber(), partition_by=[F("monitor_id")], order_by=F("asof_date").desc()
+        ))
+        .filter(rank__lt=SCORE_HISTORY_LEN)
+        .order_by("monitor_id", "asof_date")
+        .values_list("monitor_id", "overall_score")
+    )
+    for monitor_id, score in rows:
+        out[monitor_id].append(score)
+    return out
+
+
 @transaction.atomic
-def evaluate_monitor(monitor, as_of_date=None):
+def evaluate_monitor(monitor, as_of_date=None, indicators=None, inputs=None, prev_scores=None):
     """Monitor 하나를 평가하고 스냅샷·상태를 갱신한다.
 
+    indicators/inputs/prev_scores = evaluate_monitors 배치 선조회분(active 지표,
+    ScoringInputs, 직전 스냅샷 점수). 없으면 이 모니터 몫만 조회한다.
+
     Returns: 평가 결과 dict (overall_score·state·지표별 점수·경고).
     """
     as_of = as_of_date or timezone.localdate()
 
     prev_state = monitor.current_state  # 전이 감지용(update 전 상태, MON-P3-ALERT)
 
-    indicators = list(monitor.indicators.filter(is_active=True))
+    if indicators is None:
+        indicators = list(monitor.indicators.filter(is_active=True))
 
     indicator_scores = {}
     scored = 0    # active·non-paused 지표 수 (coverage 분모)
     covered = 0   # 그 중 충분한 실데이터 보유 수 (분자)
     for ind in indicators:
         # dispatch: bounded 지표만 선형 매핑 우회, 그 외는 기존 score_indicator_from_model 통과(행위보존).
-        res = score_indicator_dispatch(ind, as_of_date=as_of)
+        if inputs is None:
+            res = score_indicator_dispatch(ind, as_of_date=as_of)
+        else:
+            res = inputs.score(ind, as_of)
         sufficient = bool(res.get('is_sufficient')) and not res.get('is_paused')
         # MON-P2A T2: aggregator 입력 계약 확장 — score만이 아니라 sufficiency도 전달
         # (재정규화가 무데이터/부분윈도우 지표를 분모에서 제외할 수 있도록).
@@ -45,17 +79,14 @@ def evaluate_monitor(monitor, as_of_date=None):
             if sufficient:
                 covered += 1
 
-    agg = aggregate_monitor(monitor, indicator_scores)
+    agg = aggregate_monitor(monitor, indicator_scores, indicators=indicators)
     overall_score = agg['overall_score']  # 유효 지표 0이면 None(MON-P2A T2)
 
     data_coverage = (covered / scored) if scored else 0.0
 
-    # 과거 스냅샷 점수(현재 asof 이전) → prev_score·score_history
-    prev_scores = list(
-        monitor.snapshots.filter(asof_date__lt=as_of)
-        .order_by('asof_date')
-        .values_list('overall_score', flat=True)
-    )
+    # 과거 스냅샷 점수(현재 asof 이전, 최근 SCORE_HISTORY_LEN-1개) → prev_score·score_history
+    if prev_scores is None:
+        prev_scores = _recent_snapshot_scores([monitor], as_of)[monitor.id]
     prev_score = prev_scores[-1] if prev_scores else None
     score_history = prev_scores + [overall_score]  # 현재 포함, 시간순
 
@@ -103,11 +134,31 @@ def evaluate_monitor(monitor, as_of_date=None):
 
 
 def evaluate_monitors(queryset, as_of_date=None):
-    """여러 Monitor를 평가. 개별 실패는 격리(로그)하고 계속 진행."""
+    """여러 Monitor를 평가. 개별 실패는 격리(로그)하고 계속 진행.
+
+    active 지표·validated 판독·계산 소스 날짜·직전 스냅샷 점수를 전 모니터분 한 번에
+    선조회(모니터 수와 무관한 고정 쿼리) → 모니터별로는 스냅샷 upsert·상태 반영만 쓴다.
+    """
+    as_of = as_of_date or timezone.localdate()
+    monitors = list(queryset)
+    if not monitors:
+        return []
+    indicators = active_indicators(monitors)
+    inputs = load_scoring_inputs(
+        [ind for inds in indicators.values() for ind in inds], as_of_date=as_of
+    )
+    history = _recent_snapshot_scores(monitors, as_of)
+
     results = []
-    for monitor in queryset:
+    for monitor in monitors:
         try:
-            results.append(evaluate_monitor(monitor, as_of_date=as_of_date))
+            results.append(evaluate_monitor(
+                monitor,
+                as_of_date=as_of,
+                indicators=indicators[monitor.id],
+                inputs=inputs,
+                prev_scores=history[monitor.id],
+            ))
         except Exception:  # noqa: BLE001 — 배치 격리
             logger.exception("evaluate_monitor 실패: monitor_id=%s", monitor.id)
     return results
@@ -139,6 +190,10 @@ def refresh_monitor(monitor, backfill_days=BACKFILL_DAYS, as_of_date=None):
     )
     result = evaluate_monitor(monitor, as_of_date=as_of_date)
     result["ingested"] = ingested
+    # 스파크라인 원천 지표별 score 증분 물질화 (ingest가 갱신한 판독 반영)
+    result["scores_materialized"] = refresh_score_series(
+        monitor, as_of_date=_date.fromisoformat(result["asof_date"])
+    )
 
     # 전이 알림 감지 + 마감 제안 갱신 (MON-P3-ALERT, evaluate 직후 같은 흐름 — 신규 beat 없음)
     as_of = _date.fromisoformat(result["asof_date"])
@@ -4,8 +4,8 @@
 (D-MON-P2B ⑴ — 값·델타·일지 3원 소스 혼재 해소). 일지는 "시스템이 그날 실제로
 기록한 값"만 담으므로 로직 변경에도 과거가 불변(기록 무결성).
 
-대비: sparkline(`score_series`)는 IndicatorReading에서 매 호출 재산출하는 **추세 곡선**
-(기록 아님)으로 목록 카드·StateBandSparkline이 계속 소비한다 — 무접촉. 여기 시계열은
+대비: sparkline(`score_series`)는 IndicatorReading에서 재산출(IndicatorScore 물질화)하는
+**추세 곡선**(기록 아님)으로 목록 카드·StateBandSparkline이 계속 소비한다 — 무접촉. 여기 시계열은
 그와 별개 원천(스냅샷)이다.
 """
 from apps.monitor.models.monitoring import MonitorSnapshot
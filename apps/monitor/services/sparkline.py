@@ -3,12 +3,14 @@
 MonitorSnapshot이 불충분할 때(초기 2건) 스파크라인을 렌더할 수 있도록, IndicatorReading에서
 거래일별 overall_score를 **읽기 전용으로 재계산**한다(스냅샷 쓰기·상태 변경 없음 →
 evaluate-replay 백필의 과거 전이 알림 오발 회피, §0.2 결정).
+지표별 score는 indicator_scores가 물질화한 IndicatorScore(refresh 증분 갱신)에서 1 쿼리로
+읽고, 거래일별 집계만 여기서 한다.
 
 상태 구간 임계값은 엔진의 `score_to_phase` 경계를 단일 출처로 하달(FE 하드코딩 금지).
 Δ5d는 계산만 준비하고 표시는 회전 맵 트랙 몫(결정 1b).
 """
 from apps.monitor.models import AlertEvent
-from apps.monitor.services.indicator_scorer import score_indicator_from_model
+from apps.monitor.services.indicator_scores import read_score_series
 from apps.monitor.services.monitor_aggregator import aggregate_monitor
 
 WINDOW_DEFAULT = 30  # 최근 거래일 수
@@ -24,32 +26,14 @@ SCORE_BANDS = [
 ]
 
 
-def _trading_asofs(monitor):
-    """모니터 active 지표들의 reading asof(거래일) 오름차순 distinct 목록."""
-    dates = set()
-    for ind in monitor.indicators.filter(is_active=True):
-        for asof in ind.readings.filter(
-            validation_status__in=["ok", "extreme_jump_allowed"]
-        ).values_list("asof", flat=True):
-            dates.add(asof.date() if hasattr(asof, "date") else asof)
-    return sorted(dates)
-
-
-def _overall_at(monitor, indicators, as_of):
-    """as_of 시점 overall_score(읽기 전용). evaluate의 스코어 단계만 재현.
+def _overall_at(monitor, indicators, scores):
+    """거래일 하나의 overall_score(읽기 전용). evaluate의 집계 단계만 재현.
 
     MON-P2A T2: aggregator가 재정규화하도록 {score, is_sufficient} 계약으로 전달
     (strip 점수와 동일 로직 — 무데이터/부분윈도우 제외). 유효 0 구간은 트렌드
     연속성을 위해 0.0으로 표기(overall None → 0.0).
     """
-    scores = {}
-    for ind in indicators:
-        r = score_indicator_from_model(ind, as_of_date=as_of)
-        scores[str(ind.id)] = {
-            'score': r['score'],
-            'is_sufficient': r.get('is_sufficient', True),
-        }
-    ov = aggregate_monitor(monitor, scores)["overall_score"]
+    ov = aggregate_monitor(monitor, scores, indicators=indicators)["overall_score"]
     return ov if ov is not None else 0.0
 
 
@@ -64,12 +48,12 @@ def score_series(monitor, window=WINDOW_DEFAULT):
         "window": int,
     }
     """
-    indicators = list(monitor.indicators.filter(is_active=True))
-    asofs = _trading_asofs(monitor)[-window:]
+    indicators, rows = read_score_series(monitor, window)
+    asofs = [d for d, _ in rows]
 
     series = [
-        {"asof": d.isoformat(), "score": _overall_at(monitor, indicators, d)}
-        for d in asofs
+        {"asof": d.isoformat(), "score": _overall_at(monitor, indicators, scores)}
+        for d, scores in rows
     ]
 
     transition_asofs = set(
@@ -19,6 +19,7 @@ CRITICAL_SCORE_THRESHOLD = -0.6
 DAILY_CHANGE_CRITICAL = 0.3
 TREND_THRESHOLD = 0.15
 TREND_MIN_SNAPSHOTS = 3
+SCORE_HISTORY_LEN = 5  # 추세 판정에 쓰는 최근 overall score 수(현재 포함)
 
 
 def determine_state(monitor, overall_score, prev_score,
@@ -92,7 +93,7 @@ def determine_state(monitor, overall_score, prev_score,
         }
 
     # 최근 스냅샷 기반 판정 (수학 모델 Section 5 의사코드 순서 그대로)
-    recent = score_history[-5:] if score_history else []
+    recent = score_history[-SCORE_HISTORY_LEN:] if score_history else []
 
     if len(recent) < TREND_MIN_SNAPSHOTS:
         new_state = 'active'
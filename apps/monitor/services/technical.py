@@ -12,7 +12,11 @@ from django.utils import timezone
 
 from apps.monitor.catalog import catalog_entry
 from apps.monitor.models import IndicatorReading
-from apps.monitor.services.indicator_scorer import score_indicator_from_model, source_row_count
+from apps.monitor.services.indicator_scorer import (
+    score_indicator_from_model,
+    source_row_count,
+    validated_readings,
+)
 from packages.shared.stocks.indicators import TechnicalIndicators
 
 logger = logging.getLogger(__name__)
@@ -201,18 +205,20 @@ def bounded_linear_score(value, compute_key, support_direction):
     return round(s, 4)
 
 
-def score_indicator_dispatch(indicator, as_of_date=None):
+def score_indicator_dispatch(indicator, as_of_date=None, readings=None, source_dates=None):
     """지표 스코어 라우팅 — bounded는 선형 매핑, 그 외는 기존 score_indicator_from_model.
 
     비-bounded(기존 3종·custom·zscore S계열)는 **완전히 동일 경로**로 통과(행위보존).
     is_paused·override_score는 어느 모드든 기존 함수가 처리하도록 먼저 위임.
+    readings/source_dates = 배치 선조회분(indicator_scores.ScoringInputs) — 그대로 전달.
     """
+    prefetched = {"readings": readings, "source_dates": source_dates}
     if indicator.is_paused or indicator.override_score is not None:
-        return score_indicator_from_model(indicator, as_of_date=as_of_date)
+        return score_indicator_from_model(indicator, as_of_date=as_of_date, **prefetched)
 
     entry = catalog_entry("stock", indicator.source_key) if indicator.source_key else None
     if not entry or entry.get("scoring_mode") != "bounded":
-        return score_indicator_from_model(indicator, as_of_date=as_of_date)
+        return score_indicator_from_model(indicator, as_of_date=as_of_date, **prefetched)
 
     # bounded: 최신 판독값을 선형 매핑.
     # MON-P2A(교정): bounded의 충분성도 zscore와 동일 계약 — 계산 소스 행수(source_n) >=
@@ -220,7 +226,7 @@ def score_indicator_dispatch(indicator, as_of_date=None):
     # 쓰지 않는다. source_n < min_n이면 무언 계산 금지(불충분 반환).
     min_n = entry.get("min_n")
     if min_n is not None:
-        source_n = source_row_count(indicator, entry, as_of_date)
+        source_n = source_row_count(indicator, entry, as_of_date, source_dates)
         if source_n is not None and source_n < min_n:
             return {
                 "score": 0.0, "raw_z": 0.0, "is_extreme_vol": False,
@@ -228,12 +234,16 @@ def score_indicator_dispatch(indicator, as_of_date=None):
                 "scoring_mode": "bounded", "source_n": source_n,
             }
 
-    qs = indicator.readings.filter(
-        validation_status__in=["ok", "extreme_jump_allowed"]
-    )
-    if as_of_date:
-        qs = qs.filter(asof__date__lte=as_of_date)
-    latest = qs.order_by("-asof").values_list("value", flat=True).first()
+    if readings is None:
+        qs = indicator.readings.filter(
+            validation_status__in=["ok", "extreme_jump_allowed"]
+        )
+        if as_of_date:
+            qs = qs.filter(asof__date__lte=as_of_date)
+        latest = qs.order_by("-asof").values_list("value", flat=True).first()
+    else:
+        valid = validated_readings(indicator, as_of_date, readings)
+        latest = valid[-1][0] if valid else None
     if latest is None:
         return {
             "score": 0.0, "raw_z": 0.0, "is_extreme_vol": False,
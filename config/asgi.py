@@ -16,6 +16,14 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 # Django ASGI application을 먼저 초기화
 django_asgi_app = get_asgi_application()
 
+# 임베딩 모델 선로딩 (RAG_EMBEDDING_WARMUP) — 첫 RAG 요청의 모델 로딩 지연 제거
+from django.conf import settings
+
+if settings.RAG_EMBEDDING_WARMUP:
+    from services.rag_analysis.services.embedding_runtime import warm_up
+
+    warm_up()
+
 # Channels imports
 from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
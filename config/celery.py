@@ -107,6 +107,23 @@ def reset_connections_after_fork(**kwargs):
         pass
 
 
+@worker_process_init.connect
+def warm_up_embedding_models(**kwargs):
+    """
+    임베딩/Cross-Encoder 모델 선로딩 (settings.RAG_EMBEDDING_WARMUP).
+    fork 이후 자식 프로세스에서 로딩해야 PyTorch 상태가 공유되지 않음.
+    """
+    from django.conf import settings
+
+    if not getattr(settings, 'RAG_EMBEDDING_WARMUP', False):
+        return
+    try:
+        from services.rag_analysis.services.embedding_runtime import warm_up
+        warm_up()
+    except ImportError:
+        pass
+
+
 @worker_shutdown.connect
 def close_neo4j_on_shutdown(**kwargs):
     """
@@ -220,6 +237,16 @@ app.conf.beat_schedule = {
         'options': {'queue': 'neo4j'},
     },
 
+    # RAG 문서 인덱스 색인 + 정리 (뉴스 수집 이후, 평일 07:15~19:15 EST 2시간마다)
+    # 보존 기간 내 뉴스 선인코딩 → 보존 기간 경과/삭제 문서 행 제거 (인덱스 크기 상한)
+    # RAG_DOCUMENT_INDEX_ENABLED(기본 OFF)가 꺼져 있으면 태스크는 인코딩 없이 즉시 skipped —
+    # 검색 경로(pipeline_v2._fetch_documents)가 문서를 공급할 때 켠다.
+    'index-rag-documents': {
+        'task': 'services.rag_analysis.tasks.index_rag_documents',
+        'schedule': crontab(minute=15, hour='7-19/2', day_of_week='1-5'),
+        'options': {'expires': 3600}  # 1시간 후 만료
+    },
+
     # Semantic Cache 태스크 — 제거됨 (미초기화 상태, 향후 폐기 예정)
     # cleanup-expired-semantic-cache, warm-semantic-cache, semantic-cache-stats
 
@@ -547,6 +574,21 @@ app.conf.beat_schedule = {
         'options': {'expires': 3600}  # 1시간 후 만료
     },
 
+    # 스크리너 유니버스 스냅샷 시세 갱신 (FilterEngine 스냅샷 경로, 시장 시간 중 15분마다)
+    'refresh-screener-universe': {
+        'task': 'services.serverless.tasks.refresh_screener_universe',
+        'schedule': crontab(minute='*/15', hour='9-16', day_of_week='1-5'),
+        'options': {'expires': 600}
+    },
+
+    # 스크리너 유니버스 펀더멘탈 지표 갱신 (평일 06:30 ET, 일 1회)
+    'refresh-screener-universe-metrics': {
+        'task': 'services.serverless.tasks.refresh_screener_universe',
+        'schedule': crontab(hour=6, minute=30, day_of_week='1-5'),
+        'kwargs': {'include_metrics': True},
+        'options': {'expires': 3600}
+    },
+
     # Screener Alerts 체크 (시장 시간 중 15분마다)
     'check-screener-alerts': {
         'task': 'services.serverless.tasks.check_screener_alerts',
@@ -572,6 +614,21 @@ app.conf.beat_schedule = {
         'options': {'expires': 3600}  # 1시간 후 만료
     },
 
+    # 컬럼형 가격 캐시 전체 재구축 (일요일 03:30 ET, 증분 갱신은 EOD sync 직후 체인)
+    'rebuild-price-store': {
+        'task': 'packages.shared.stocks.tasks.refresh_price_store',
+        'schedule': crontab(hour=3, minute=30, day_of_week=0),
+        'kwargs': {'full': True},
+        'options': {'expires': 3600}
+    },
+
+    # 최신 기술적 지표 스냅샷 야간 재계산 (평시 갱신은 EOD sync 직후 체인)
+    'refresh-indicator-snapshots': {
+        'task': 'packages.shared.stocks.tasks.refresh_indicator_snapshots',
+        'schedule': crontab(hour=2, minute=0),
+        'options': {'expires': 3600}
+    },
+
     # DailyPrice → Stock.change_percent 일괄 계산 (EOD sync 직후, API 호출 없음)
     'update-sp500-change-percent': {
         'task': 'update-sp500-change-percent',
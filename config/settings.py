@@ -590,3 +590,71 @@ CHAINSIGHT_UPWARD_LEARNING_ENABLED = (
 # 타입 변경 비자동 안전핀은 스위치와 무관하게 항상 유지(decide_gate 하드룰).
 DOMAIN_AUTO_APPROVE = os.getenv('DOMAIN_AUTO_APPROVE', 'false').lower() == 'true'
 DOMAIN_CONFIDENCE_THRESHOLD = float(os.getenv('DOMAIN_CONFIDENCE_THRESHOLD', '0.75'))
+
+# ============================================================
+# EOD Pipeline 증분 롤링 상태 (Stage 3 Calculate)
+# ============================================================
+# ON(기본) = EODRollingState에서 1봉씩 전진(O(symbols) 로드). 상태 없음/불일치 종목만 365일 재구축.
+# OFF = 기존 365일 전체 로드 + pandas rolling 경로. 동치성 점검: pipeline_status --verify-rolling.
+EOD_ROLLING_STATE_ENABLED = os.getenv('EOD_ROLLING_STATE_ENABLED', 'true').lower() == 'true'
+
+# 컬럼형 DailyPrice 캐시 (symbol × date mmap). 미구축/OFF면 소비자는 ORM fallback.
+# 갱신: sync_sp500_eod_prices 직후 refresh_price_store 태스크 (증분).
+PRICE_STORE_ENABLED = os.getenv('PRICE_STORE_ENABLED', 'true').lower() == 'true'
+PRICE_STORE_DIR = Path(os.getenv('PRICE_STORE_DIR', str(BASE_DIR / 'var' / 'price_store')))
+
+# EOD JSON Bake (Stage 7). 파일 생성을 스레드 풀로 분산(0/1 = 직렬, Celery prefork 워커에서도 동작),
+# 내용 해시가 직전 bake와 같은 파일은 새로 쓰지 않고 hardlink.
+# PRECOMPRESS ON = 정적 서버용 .json.gz(+brotli 설치 시 .json.br) 동반 생성.
+EOD_BAKE_WORKERS = int(os.getenv('EOD_BAKE_WORKERS', '4'))
+EOD_BAKE_PRECOMPRESS = os.getenv('EOD_BAKE_PRECOMPRESS', 'false').lower() == 'true'
+
+# FMP 커넥션 풀 모드 (providers/fmp/transport.py). ON = client.FMPClient가 공유 keep-alive
+# Session + 워커 공유 Redis 토큰 버킷(RATE_LIMITS['fmp'] 분당 한도) + 동일 요청 병합 사용.
+# OFF(기본) = 기존 requests.get + request_delay sleep. fetch_many/AsyncFMPClient 동시성 상한은 공통.
+FMP_POOLED_CLIENT = os.getenv('FMP_POOLED_CLIENT', 'false').lower() == 'true'
+FMP_MAX_CONCURRENCY = int(os.getenv('FMP_MAX_CONCURRENCY', '8'))
+
+# RAG 문서 임베딩/BM25 용어 통계 영속 인덱스 (rag_analysis/services/document_index.py).
+# ON = 문서는 내용 해시당 1회만 인코딩(세그먼트 .npy mmap), 쿼리는 쿼리 문자열만 인코딩,
+#      index-rag-documents beat 등록(config/celery.py).
+# OFF(기본) = 기존 경로(매 쿼리 후보 문서 전체 encode_batch + BM25 재구축), beat 미등록.
+# pipeline_v2._fetch_documents가 문서를 공급하기 전까지는 인덱스 소비자가 없으므로 기본 OFF.
+RAG_DOCUMENT_INDEX_ENABLED = os.getenv('RAG_DOCUMENT_INDEX_ENABLED', 'false').lower() == 'true'
+RAG_DOCUMENT_INDEX_DIR = Path(
+    os.getenv('RAG_DOCUMENT_INDEX_DIR', str(BASE_DIR / 'var' / 'rag_index'))
+)
+# 색인 보존 기간(일). index_rag_documents beat가 이보다 먼저 색인된 행과 삭제/아카이브된
+# 뉴스 행을 정리한다 (정리된 문서도 다시 검색되면 그때 재색인).
+RAG_DOCUMENT_INDEX_RETENTION_DAYS = int(os.getenv('RAG_DOCUMENT_INDEX_RETENTION_DAYS', '30'))
+
+# RAG 임베딩 런타임 (rag_analysis/services/embedding_runtime.py). 모델은 프로세스당 1회 로딩해
+# semantic cache/vector search/reranker가 공유. 쿼리 벡터 LRU 크기, 비동기 encode 병합 창(ms)과
+# 최대 배치. WARMUP ON = Celery 워커 프로세스/ASGI 부팅 시 모델 선로딩(첫 요청 지연 제거).
+RAG_EMBEDDING_CACHE_SIZE = int(os.getenv('RAG_EMBEDDING_CACHE_SIZE', '1024'))
+RAG_EMBEDDING_BATCH_WINDOW_MS = float(os.getenv('RAG_EMBEDDING_BATCH_WINDOW_MS', '5'))
+RAG_EMBEDDING_MAX_BATCH = int(os.getenv('RAG_EMBEDDING_MAX_BATCH', '64'))
+RAG_EMBEDDING_WARMUP = os.getenv('RAG_EMBEDDING_WARMUP', 'false').lower() == 'true'
+
+# 뉴스 제목 중복 제거 (news/services/deduplicator.py). 배치 내 비교는 항상 MinHash LSH 후보 + 정확 유사도.
+# CROSS_BATCH ON = 최근 WINDOW_HOURS 동안 다른 배치/Provider가 저장한 제목(다른 URL)과도 비교(cache 공유).
+NEWS_DEDUP_CROSS_BATCH = os.getenv('NEWS_DEDUP_CROSS_BATCH', 'false').lower() == 'true'
+NEWS_DEDUP_WINDOW_HOURS = int(os.getenv('NEWS_DEDUP_WINDOW_HOURS', '72'))
+
+# 스크리너 유니버스 스냅샷 (serverless/services/screener_universe.py). ON = FilterEngine이 스냅샷에
+# 벡터 mask 적용 + 결과 행 번호 캐시(페이지 이동 = 슬라이스). 스냅샷 미구축 시 기존 FMP 경로.
+# 갱신: refresh_screener_universe 태스크. METRICS_LIMIT = key-metrics-ttm 조회 종목 수(시총 상위).
+SCREENER_UNIVERSE_ENABLED = os.getenv('SCREENER_UNIVERSE_ENABLED', 'true').lower() == 'true'
+SCREENER_UNIVERSE_METRICS_LIMIT = int(os.getenv('SCREENER_UNIVERSE_METRICS_LIMIT', '1000'))
+
+# 스크리너 알림 배치 평가 (serverless/services/alert_engine.py). volume_spike 기본 RVOL 임계값
+# (알림 필터에 rvol_min이 있으면 그 값 사용).
+SCREENER_ALERT_RVOL_THRESHOLD = float(os.getenv('SCREENER_ALERT_RVOL_THRESHOLD', '2.0'))
+
+# SEC EDGAR 로컬 캐시 (packages/shared/api_request/sec_edgar_cache.py). SECEdgarClient와 sec_pipeline
+# 수집기가 공유. ticker→CIK 인덱스는 TICKER_INDEX_MAX_AGE(초)마다, submissions JSON은
+# SUBMISSIONS_MAX_AGE(초)마다 ETag/If-Modified-Since 조건부 GET. filing 문서(10-K/8-K/13F)는 불변 캐시.
+SEC_EDGAR_CACHE_ENABLED = os.getenv('SEC_EDGAR_CACHE_ENABLED', 'true').lower() == 'true'
+SEC_EDGAR_CACHE_DIR = Path(os.getenv('SEC_EDGAR_CACHE_DIR', str(BASE_DIR / 'var' / 'sec_edgar')))
+SEC_EDGAR_TICKER_INDEX_MAX_AGE = int(os.getenv('SEC_EDGAR_TICKER_INDEX_MAX_AGE', '86400'))
+SEC_EDGAR_SUBMISSIONS_MAX_AGE = int(os.getenv('SEC_EDGAR_SUBMISSIONS_MAX_AGE', '3600'))
@@ -32,3 +32,16 @@ CACHES = {
 
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+
+# 컬럼형 가격 캐시는 DB 트랜잭션 롤백과 무관하게 디스크에 남으므로 기본 OFF.
+# 저장소 테스트는 override_settings(PRICE_STORE_ENABLED=True, PRICE_STORE_DIR=tmp_path)로 켠다.
+PRICE_STORE_ENABLED = False
+
+# JSON bake는 테스트에서 스레드 풀 없이 직렬 실행.
+EOD_BAKE_WORKERS = 0
+
+# RAG 문서 인덱스도 디스크에 남으므로 기본 OFF (테스트는 tmp_path로 켠다).
+RAG_DOCUMENT_INDEX_ENABLED = False
+
+# SEC EDGAR 디스크 캐시도 기본 OFF (테스트는 tmp_path로 켠다).
+SEC_EDGAR_CACHE_ENABLED = False
@@ -401,6 +401,13 @@ export type AlertType =
   | 'new_high'
   | 'new_low';
 
+// price_target 알림 목표가 항목 (direction 생략 시 'above')
+export interface PriceTarget {
+  symbol: string;
+  target_price: number;
+  direction?: 'above' | 'below';
+}
+
 export interface ScreenerAlert {
   id: number;
   name: string;
@@ -410,7 +417,7 @@ export interface ScreenerAlert {
   filters_json: ScreenerFilters;
   alert_type: AlertType;
   target_count?: number;
-  target_symbols: string[];
+  target_symbols: PriceTarget[];
   is_active: boolean;
   cooldown_hours: number;
   last_triggered_at?: string;
@@ -431,7 +438,7 @@ export interface CreateAlertPayload {
   filters_json?: ScreenerFilters;
   alert_type?: AlertType;
   target_count?: number;
-  target_symbols?: string[];
+  target_symbols?: PriceTarget[]; // price_target 알림 필수 (1개 이상)
   cooldown_hours?: number;
   notify_in_app?: boolean;
   notify_email?: boolean;
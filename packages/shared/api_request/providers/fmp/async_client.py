@@ -0,0 +1,141 @@
+# api_request/providers/fmp/async_client.py
+"""
+FMP 비동기 클라이언트 (asyncio)
+
+FMPClient._make_request와 같은 파라미터 조립/응답 검증(prepare_params, parse_response)을
+httpx.AsyncClient 위에서 수행합니다.
+
+- 동시성 상한: asyncio.Semaphore (기본 settings.FMP_MAX_CONCURRENCY)
+- 속도 제한: 동기 클라이언트와 같은 워커 공유 토큰 버킷 (transport.get_token_bucket)
+- 동일 endpoint+params 동시 요청은 하나의 Task를 공유
+
+Usage:
+    async with AsyncFMPClient() as client:
+        results = await client.get_many(
+            [("/stable/key-metrics-ttm", {"symbol": s}) for s in symbols]
+        )
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from django.conf import settings
+
+from packages.shared.api_request.providers.fmp.client import (
+    FMPAuthError,
+    FMPClientError,
+    FMPPremiumError,
+    FMPRateLimitError,
+    parse_response,
+    prepare_params,
+)
+from packages.shared.api_request.providers.fmp.transport import (
+    get_max_concurrency,
+    get_token_bucket,
+    request_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFMPClient:
+    """
+    FMP API 비동기 클라이언트
+
+    예외 타입은 FMPClient와 동일합니다 (FMPClientError 계열).
+    """
+
+    BASE_URL = "https://financialmodelingprep.com"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+    ):
+        self.api_key = api_key or settings.FMP_API_KEY
+        if not self.api_key:
+            raise ValueError("FMP API Key is required")
+
+        self.max_concurrency = max_concurrency or get_max_concurrency()
+        self.max_retries = max_retries
+        self.bucket = get_token_bucket("fmp")
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "AsyncFMPClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        FMP API 요청 (동일 요청 진행 중이면 그 결과를 공유)
+
+        Returns:
+            API 응답 데이터 (JSON parsed). 병합된 호출은 같은 객체를 받으므로 읽기 전용으로 사용.
+        """
+        params = prepare_params(dict(params or {}), self.api_key)
+        url = f"{self.BASE_URL}{endpoint}"
+        key = request_key(url, params)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def get_many(
+        self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Any]:
+        """
+        여러 요청 동시 실행
+
+        Returns:
+            calls 순서대로 응답 리스트. 실패한 요청은 예외 객체가 그 자리에 들어감.
+        """
+        return await asyncio.gather(
+            *(self.get(endpoint, params) for endpoint, params in calls),
+            return_exceptions=True,
+        )
+
+    async def _fetch(self, url: str, endpoint: str, params: Dict[str, Any]) -> Any:
+        for attempt in range(self.max_retries):
+            try:
+                async with self._slots:
+                    # 버킷 예약은 Redis 왕복 1회 — 대기는 이벤트 루프를 막지 않도록 asyncio.sleep
+                    wait = self.bucket.reserve()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    response = await self.client.get(url, params=params)
+                return parse_response(response, endpoint)
+
+            except (FMPPremiumError, FMPAuthError, FMPRateLimitError):
+                raise  # 재시도 불필요한 에러는 즉시 전파
+            except (httpx.HTTPError, FMPClientError) as e:
+                if attempt >= self.max_retries - 1:
+                    logger.error(
+                        f"FMP async request failed after {self.max_retries} attempts: {e}"
+                    )
+                    raise
+                wait_time = (attempt + 1) * 2
+                logger.warning(
+                    f"FMP async request failed (attempt {attempt + 1}), "
+                    f"retrying in {wait_time}s: {e}"
+                )
+                await asyncio.sleep(wait_time)
@@ -11,14 +11,19 @@ FMP API 문서: https://site.financialmodelingprep.com/developer/docs
 import logging
 import time
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
+from django.conf import settings
 
 from packages.shared.api_request.providers.fmp.symbol_convert import (
     restore_symbols_in_response,
     to_fmp_symbols_param,
 )
+from packages.shared.api_request.providers.fmp.transport import (
+    get_transport,
+    run_concurrently,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +52,61 @@ class FMPPremiumError(FMPClientError):
     pass
 
 
+def prepare_params(
+    params: Optional[Dict[str, Any]], api_key: str
+) -> Dict[str, Any]:
+    """
+    요청 파라미터 조립 (apikey 추가 + 심볼 표기 변환)
+    """
+    # API 키 추가
+    if params is None:
+        params = {}
+    params["apikey"] = api_key
+
+    # DOTSYM 경계 변환 (옵션 1): 내부 정본(dot) → FMP API 표기(hyphen).
+    # 요청 조립 단일 경로에서만 변환 — 앱 계층은 dot 원형만 다룬다.
+    # dot 없는 심볼은 passthrough(행위보존). cf. symbol_convert.py
+    for _sym_key in ("symbol", "symbols"):
+        if params.get(_sym_key):
+            params[_sym_key] = to_fmp_symbols_param(params[_sym_key])
+    return params
+
+
+def parse_response(response: Any, endpoint: str) -> Any:
+    """
+    HTTP 응답 검증 + JSON 파싱 (requests / httpx Response 공용)
+
+    Raises:
+        FMPAuthError, FMPPremiumError, FMPRateLimitError, FMPClientError,
+        HTTP 에러 (response.raise_for_status)
+    """
+    # HTTP 에러 체크
+    if response.status_code == 401:
+        raise FMPAuthError("Invalid API key")
+    elif response.status_code == 402:
+        raise FMPPremiumError(f"Premium-only symbol/endpoint (402): {endpoint}")
+    elif response.status_code == 403:
+        raise FMPAuthError("API access forbidden")
+    elif response.status_code == 429:
+        raise FMPRateLimitError("Rate limit exceeded")
+    elif response.status_code != 200:
+        logger.error(f"FMP HTTP error {response.status_code}: {response.text}")
+        response.raise_for_status()
+
+    data = response.json()
+
+    # FMP 에러 응답 체크
+    if isinstance(data, dict) and "Error Message" in data:
+        error_msg = data["Error Message"]
+        if "Invalid API KEY" in error_msg:
+            raise FMPAuthError(error_msg)
+        raise FMPClientError(error_msg)
+
+    # DOTSYM 응답 경계 역변환: FMP hyphen(BRK-B) → 내부 정본 dot(BRK.B).
+    # 앱 계층은 항상 dot 원형을 받는다(완전 격리). cf. symbol_convert.py
+    return restore_symbols_in_response(data)
+
+
 class FMPClient:
     """
     Financial Modeling Prep API Client (Starter Plan)
@@ -57,6 +117,7 @@ class FMPClient:
     - Rate Limit: 300 calls/분, 10,000 calls/일
     - Rate limiting 자동 처리
     - 재시도 로직 포함
+    - pooled 모드: 공유 커넥션 풀 + 워커 공유 토큰 버킷 + 동일 요청 병합 (transport.py)
     """
 
     BASE_URL = "https://financialmodelingprep.com"
@@ -66,12 +127,14 @@ class FMPClient:
         api_key: str,
         request_delay: float = 0.2,  # FMP Starter Plan
         max_retries: int = 3,
+        pooled: Optional[bool] = None,
     ):
         """
         Args:
             api_key: FMP API 키
-            request_delay: 요청 간 대기 시간 (초)
+            request_delay: 요청 간 대기 시간 (초, pooled 모드에서는 미사용)
             max_retries: 최대 재시도 횟수
+            pooled: 공유 PooledTransport 사용 여부 (None이면 settings.FMP_POOLED_CLIENT)
         """
         self.api_key = api_key
         self.request_delay = request_delay
@@ -83,6 +146,10 @@ class FMPClient:
         if not self.api_key:
             raise ValueError("FMP API Key is required")
 
+        if pooled is None:
+            pooled = getattr(settings, "FMP_POOLED_CLIENT", False)
+        self._transport = get_transport("fmp") if pooled else None
+
     def _get_url(self, endpoint: str) -> str:
         """API URL 생성 (/stable/* 엔드포인트)"""
         return f"{self.BASE_URL}{endpoint}"
@@ -100,26 +167,17 @@ class FMPClient:
         Returns:
             API 응답 데이터 (JSON parsed)
         """
-        # API 키 추가
-        if params is None:
-            params = {}
-        params["apikey"] = self.api_key
+        params = prepare_params(params, self.api_key)
 
-        # DOTSYM 경계 변환 (옵션 1): 내부 정본(dot) → FMP API 표기(hyphen).
-        # 요청 조립 단일 경로에서만 변환 — 앱 계층은 dot 원형만 다룬다.
-        # dot 없는 심볼은 passthrough(행위보존). cf. symbol_convert.py
-        for _sym_key in ("symbol", "symbols"):
-            if params.get(_sym_key):
-                params[_sym_key] = to_fmp_symbols_param(params[_sym_key])
+        # Rate limiting (pooled 모드는 공유 토큰 버킷이 대신함)
+        if self._transport is None:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
 
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.request_delay:
-            sleep_time = self.request_delay - time_since_last
-            logger.debug(f"FMP rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+            if time_since_last < self.request_delay:
+                sleep_time = self.request_delay - time_since_last
+                logger.debug(f"FMP rate limiting: sleeping {sleep_time:.2f}s")
+                time.sleep(sleep_time)
 
         # 일일 한도 체크
         if self.daily_calls >= self.daily_limit:
@@ -133,39 +191,14 @@ class FMPClient:
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, params=params, timeout=30)
+                if self._transport is not None:
+                    response = self._transport.get(url, params)
+                else:
+                    response = requests.get(url, params=params, timeout=30)
                 self.last_request_time = time.time()
                 self.daily_calls += 1
 
-                # HTTP 에러 체크
-                if response.status_code == 401:
-                    raise FMPAuthError("Invalid API key")
-                elif response.status_code == 402:
-                    raise FMPPremiumError(
-                        f"Premium-only symbol/endpoint (402): {endpoint}"
-                    )
-                elif response.status_code == 403:
-                    raise FMPAuthError("API access forbidden")
-                elif response.status_code == 429:
-                    raise FMPRateLimitError("Rate limit exceeded")
-                elif response.status_code != 200:
-                    logger.error(
-                        f"FMP HTTP error {response.status_code}: {response.text}"
-                    )
-                    response.raise_for_status()
-
-                data = response.json()
-
-                # FMP 에러 응답 체크
-                if isinstance(data, dict) and "Error Message" in data:
-                    error_msg = data["Error Message"]
-                    if "Invalid API KEY" in error_msg:
-                        raise FMPAuthError(error_msg)
-                    raise FMPClientError(error_msg)
-
-                # DOTSYM 응답 경계 역변환: FMP hyphen(BRK-B) → 내부 정본 dot(BRK.B).
-                # 앱 계층은 항상 dot 원형을 받는다(완전 격리). cf. symbol_convert.py
-                return restore_symbols_in_response(data)
+                return parse_response(response, endpoint)
 
             except (FMPPremiumError, FMPAuthError, FMPRateLimitError):
                 raise  # 재시도 불필요한 에러는 즉시 전파
@@ -185,6 +218,34 @@ class FMPClient:
 
         raise last_error
 
+    def fetch_many(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        여러 요청 동시 실행
+
+        pooled 모드에서는 FMP_MAX_CONCURRENCY 만큼 병렬로 보내고(버킷이 속도 제한),
+        기본 모드에서는 request_delay를 지키며 순차 실행합니다.
+
+        Args:
+            calls: [(endpoint, params), ...]
+            max_workers: 동시 실행 수 (기본: settings.FMP_MAX_CONCURRENCY)
+
+        Returns:
+            calls 순서대로 응답 리스트. 실패한 요청은 예외 객체가 그 자리에 들어감.
+        """
+        if self._transport is None:
+            max_workers = 1
+        elif max_workers is None:
+            max_workers = self._transport.max_concurrency
+        return run_concurrently(
+            lambda call: self._make_request(call[0], dict(call[1] or {})),
+            calls,
+            max_workers,
+        )
+
     # ============================================================
     # Quote / Price Endpoints
     # ============================================================
@@ -14,8 +14,19 @@ import httpx
 from django.conf import settings
 from django.core.cache import cache
 
+from packages.shared.api_request.providers.fmp.transport import (
+    SingleFlight,
+    get_max_concurrency,
+    get_token_bucket,
+    request_key,
+    run_concurrently,
+)
+
 logger = logging.getLogger(__name__)
 
+# fetch_many 동일 요청 병합 (프로세스 내 FMPClient 인스턴스 공유)
+_inflight = SingleFlight()
+
 
 class FMPAPIError(Exception):
     """FMP API 에러"""
@@ -94,6 +105,40 @@ class FMPClient:
             logger.error(f"FMP API 예상치 못한 에러: {e} - {endpoint}")
             raise FMPAPIError(f"Unexpected error: {str(e)}")
 
+    def fetch_many(
+        self,
+        endpoint: str,
+        params_list: List[Dict],
+        max_workers: Optional[int] = None,
+    ) -> List:
+        """
+        같은 엔드포인트 여러 요청 동시 실행
+
+        - 동시성: max_workers (기본 settings.FMP_MAX_CONCURRENCY), httpx 커넥션 풀 공유
+        - 속도: 워커 공유 토큰 버킷 (transport.get_token_bucket("fmp"))
+        - 진행 중인 동일 endpoint+params 요청은 결과를 공유 (읽기 전용으로 사용)
+
+        Args:
+            endpoint: API 엔드포인트 (예: /stable/key-metrics-ttm)
+            params_list: 요청별 쿼리 파라미터 목록
+
+        Returns:
+            params_list 순서대로 응답 리스트. 실패한 요청은 FMPAPIError가 그 자리에 들어감.
+        """
+        bucket = get_token_bucket("fmp")
+
+        def _fetch(params: Dict):
+            bucket.acquire()
+            return self._make_request(endpoint, params)
+
+        return run_concurrently(
+            lambda params: _inflight.do(
+                request_key(endpoint, params), lambda: _fetch(params)
+            ),
+            params_list,
+            max_workers or get_max_concurrency(),
+        )
+
     def get_market_gainers(self) -> List[Dict]:
         """
         상승 TOP 종목 (Gainers)
@@ -0,0 +1,240 @@
+# api_request/providers/fmp/transport.py
+"""
+FMP 공용 전송 계층
+
+- TokenBucket: Redis 토큰 버킷 (Celery/웹 워커 전체 공유, Redis 불가 시 프로세스 로컬)
+- SingleFlight: 같은 endpoint+params 동시 요청을 1회 네트워크 호출로 병합
+- PooledTransport: keep-alive requests.Session + 동시성 상한 + 버킷 + 병합
+- run_concurrently: 호출 목록을 스레드 풀로 실행 (순서 보존, 예외는 자리에 반환)
+
+버킷 속도는 rate_limiter.RATE_LIMITS['fmp'] 분당 한도(안전 마진 적용값)를 따릅니다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+from requests.adapters import HTTPAdapter
+
+from packages.shared.api_request.rate_limiter import RATE_LIMITS, LimitType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# 토큰 차감은 선예약 방식: 토큰이 모자라면 음수로 내려가고 호출자가 wait초 대기.
+# TIME은 Redis 서버 시계 → 워커 간 시계 차이와 무관.
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+class TokenBucket:
+    """
+    워커 공유 토큰 버킷
+
+    Usage:
+        bucket = get_token_bucket("fmp")
+        bucket.acquire()              # 동기: 필요한 만큼 sleep
+        wait = bucket.reserve()       # 비동기 호출자: 대기 시간만 받아 asyncio.sleep
+    """
+
+    CACHE_KEY_PREFIX = "token_bucket"
+
+    def __init__(self, name: str, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            name: 버킷 이름 (provider)
+            rate: 초당 토큰 보충 수
+            capacity: 최대 버스트 (기본: 1초 분량)
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._ts = time.monotonic()
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.CACHE_KEY_PREFIX}:{self.name}"
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 → 대기해야 할 시간(초)"""
+        try:
+            client = cache._cache.get_client()
+            return float(
+                client.eval(_RESERVE_SCRIPT, 1, self.cache_key, self.rate, self.capacity)
+            )
+        except (AttributeError, RedisError) as e:
+            # Redis 미사용(get_client 없음) 또는 접근 실패 시 프로세스 로컬 버킷
+            logger.debug(f"Token bucket local fallback: {e}")
+            return self._reserve_local()
+
+    def _reserve_local(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = (
+                min(self.capacity, self._tokens + (now - self._ts) * self.rate) - 1
+            )
+            self._ts = now
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"{self.name} token bucket: sleeping {wait:.2f}s")
+            time.sleep(wait)
+
+
+class SingleFlight:
+    """
+    동일 key 동시 호출 병합
+
+    먼저 들어온 호출(leader)만 fn을 실행하고, 실행 중 같은 key로 들어온 호출은
+    leader의 결과(또는 예외)를 그대로 받습니다. 완료 후에는 key를 비워 캐시처럼
+    남지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]]) -> tuple:
+    """병합 key: url + 정렬된 params"""
+    return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+
+class PooledTransport:
+    """
+    keep-alive 커넥션 풀 전송
+
+    requests.Session 하나를 프로세스 내 모든 FMPClient가 공유합니다.
+    get()은 동시성 상한(세마포어) 안에서 버킷 토큰을 받은 뒤 요청하며,
+    같은 url+params 동시 요청은 하나의 Response를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = 30,
+    ):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._inflight = SingleFlight()
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        return self._inflight.do(
+            request_key(url, params), lambda: self._send(url, params)
+        )
+
+    def _send(self, url: str, params: Optional[Dict[str, Any]]):
+        with self._slots:
+            self.bucket.acquire()
+            return self.session.get(url, params=params, timeout=self.timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def run_concurrently(
+    fn: Callable[[Any], Any], items: Sequence[Any], max_workers: int
+) -> List[Any]:
+    """
+    items 각각에 fn 실행 (스레드 풀)
+
+    Returns:
+        items 순서대로 결과 리스트. 실패한 항목은 예외 객체가 그 자리에 들어감.
+    """
+
+    def _safe(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [_safe(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(_safe, items))
+
+
+def get_max_concurrency() -> int:
+    return getattr(settings, "FMP_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+
+
+# Provider별 싱글톤 인스턴스
+_buckets: Dict[str, TokenBucket] = {}
+_transports: Dict[str, PooledTransport] = {}
+_singleton_lock = threading.Lock()
+
+
+def get_token_bucket(provider: str = "fmp") -> TokenBucket:
+    """
+    Provider별 토큰 버킷 (속도 = RATE_LIMITS 분당 한도 / 60)
+    """
+    with _singleton_lock:
+        if provider not in _buckets:
+            per_minute = RATE_LIMITS.get(provider, {}).get(LimitType.PER_MINUTE, 60)
+            _buckets[provider] = TokenBucket(provider, rate=per_minute / 60)
+        return _buckets[provider]
+
+
+def get_transport(provider: str = "fmp") -> PooledTransport:
+    """Provider별 공유 PooledTransport"""
+    bucket = get_token_bucket(provider)
+    with _singleton_lock:
+        if provider not in _transports:
+            _transports[provider] = PooledTransport(
+                bucket, max_concurrency=get_max_concurrency()
+            )
+        return _transports[provider]
@@ -0,0 +1,217 @@
+"""
+SEC EDGAR 로컬 캐시 (ticker↔CIK 인덱스 + content-addressed 응답 저장소)
+
+SEC fair-access 한도(10 req/s) 때문에 재요청 1회 절약 = 파이프라인 배치 시간 단축.
+같은 디렉토리를 공유하는 모든 워커/재실행이 다운로드를 재사용합니다.
+
+레이아웃:
+    {SEC_EDGAR_CACHE_DIR}/objects/{sha[:2]}/{sha}   응답 본문 (sha256(본문), 같은 본문은 1벌)
+    {SEC_EDGAR_CACHE_DIR}/refs/{sha256(url)}.json   {"url", "object", "encoding", "etag",
+                                                     "last_modified", "fetched_at"}
+
+쓰기는 임시 파일 + os.replace 원자 교체.
+
+정책:
+- Archives 문서(10-K/8-K HTML, 13F XML, filing index): accession 단위 불변 → immutable, 재요청 없음
+- submissions JSON / company_tickers.json: max_age 이내면 그대로 재사용,
+  이후 ETag(If-None-Match) / Last-Modified(If-Modified-Since) 조건부 GET → 304면 캐시 본문
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# fetch(headers) → requests.Response (호출자가 rate limit / 에러 처리)
+Fetcher = Callable[[Dict[str, str]], object]
+
+
+class SECEdgarCache:
+    """
+    디스크 응답 캐시
+
+    Usage:
+        cache = get_sec_edgar_cache()  # 비활성화면 None
+        text = cache.get(url, lambda headers: session.get(url, headers=headers), immutable=True)
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.SEC_EDGAR_CACHE_DIR)
+
+    def get(
+        self,
+        url: str,
+        fetch: Fetcher,
+        immutable: bool = False,
+        max_age: float = 0,
+    ) -> str:
+        """
+        캐시 우선 본문 조회
+
+        Args:
+            url: 요청 URL (캐시 키)
+            fetch: 조건부 헤더를 받아 응답을 돌려주는 함수
+            immutable: True면 캐시 본문이 있으면 요청하지 않음
+            max_age: 이 시간(초) 이내 저장/검증된 본문은 요청 없이 사용
+        """
+        ref = self._read_ref(url)
+        body = self._read_object(ref) if ref else None
+        if body is not None and (immutable or time.time() - ref["fetched_at"] < max_age):
+            return self._decode(body, ref)
+
+        headers: Dict[str, str] = {}
+        if body is not None:
+            if ref.get("etag"):
+                headers["If-None-Match"] = ref["etag"]
+            if ref.get("last_modified"):
+                headers["If-Modified-Since"] = ref["last_modified"]
+
+        response = fetch(headers)
+        if response.status_code == 304 and body is not None:
+            self._write_ref(url, {**ref, "fetched_at": time.time()})
+            logger.debug(f"[SECEdgarCache] not modified: {url}")
+            return self._decode(body, ref)
+
+        text = response.text
+        self.store(
+            url,
+            response.content,
+            encoding=response.encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return text
+
+    def store(
+        self,
+        url: str,
+        content: bytes,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """본문 저장 + URL ref 교체 (실패는 로그만, 요청 결과에는 영향 없음)."""
+        try:
+            digest = hashlib.sha256(content).hexdigest()
+            path = self._object_path(digest)
+            if not path.exists():
+                self._atomic_write(path, content)
+            self._write_ref(
+                url,
+                {
+                    "url": url,
+                    "object": digest,
+                    "encoding": encoding,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fetched_at": time.time(),
+                },
+            )
+        except (OSError, TypeError) as e:
+            logger.warning(f"[SECEdgarCache] store failed for {url}: {e}")
+
+    # ========================================
+    # Private Methods
+    # ========================================
+
+    def _ref_path(self, url: str) -> Path:
+        return self.root / "refs" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def _read_ref(self, url: str) -> Optional[dict]:
+        try:
+            return json.loads(self._ref_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_ref(self, url: str, ref: dict) -> None:
+        try:
+            self._atomic_write(self._ref_path(url), json.dumps(ref).encode())
+        except OSError as e:
+            logger.warning(f"[SECEdgarCache] ref write failed for {url}: {e}")
+
+    def _read_object(self, ref: dict) -> Optional[bytes]:
+        try:
+            return self._object_path(ref["object"]).read_bytes()
+        except (OSError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _decode(body: bytes, ref: dict) -> str:
+        return body.decode(ref.get("encoding") or "utf-8", errors="replace")
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+_caches: Dict[str, SECEdgarCache] = {}
+_ticker_index: Dict[str, object] = {"map": None, "checked_at": 0.0}
+_ticker_lock = threading.Lock()
+
+
+def get_sec_edgar_cache() -> Optional[SECEdgarCache]:
+    """설정된 디렉토리의 캐시 (SEC_EDGAR_CACHE_ENABLED=False면 None)."""
+    if not getattr(settings, "SEC_EDGAR_CACHE_ENABLED", False):
+        return None
+    root = str(settings.SEC_EDGAR_CACHE_DIR)
+    if root not in _caches:
+        _caches[root] = SECEdgarCache(Path(root))
+    return _caches[root]
+
+
+def parse_ticker_index(data: dict) -> Dict[str, str]:
+    """company_tickers.json → {TICKER: 10자리 CIK} (중복 ticker는 먼저 나온 항목)."""
+    index: Dict[str, str] = {}
+    for company in data.values():
+        ticker = str(company.get("ticker") or "").upper()
+        if ticker:
+            index.setdefault(ticker, str(company.get("cik_str", "")).zfill(10))
+    return index
+
+
+def get_ticker_index(fetch: Fetcher) -> Dict[str, str]:
+    """
+    프로세스 공유 ticker → CIK 인덱스
+
+    SEC_EDGAR_TICKER_INDEX_MAX_AGE(초)마다 디스크 캐시를 조건부 GET으로 검증합니다.
+    캐시가 꺼져 있으면 매번 내려받으므로 호출자가 결과를 보관해야 합니다.
+    """
+    cache = get_sec_edgar_cache()
+    if cache is None:
+        return parse_ticker_index(fetch({}).json())
+
+    max_age = float(getattr(settings, "SEC_EDGAR_TICKER_INDEX_MAX_AGE", 86400))
+    with _ticker_lock:
+        if (
+            _ticker_index["map"] is not None
+            and time.time() - _ticker_index["checked_at"] < max_age
+        ):
+            return _ticker_index["map"]
+        text = cache.get(SEC_TICKERS_URL, fetch, max_age=max_age)
+        _ticker_index["map"] = parse_ticker_index(json.loads(text))
+        _ticker_index["checked_at"] = time.time()
+        logger.info(f"[SECEdgarCache] ticker index loaded: {len(_ticker_index['map'])} tickers")
+        return _ticker_index["map"]
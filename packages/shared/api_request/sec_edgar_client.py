@@ -14,8 +14,14 @@ Main use case for Stock-Vis:
 References:
 - API Docs: https://www.sec.gov/search-filings/edgar-application-programming-interfaces
 - 10-K Item 1A contains business risks including customer concentration disclosure
+
+Caching (SEC_EDGAR_CACHE_ENABLED, see sec_edgar_cache.py):
+- ticker -> CIK index shared per process, revalidated with ETag/If-Modified-Since
+- submissions JSON reused for SEC_EDGAR_SUBMISSIONS_MAX_AGE seconds, then conditional GET
+- filing documents (10-K/8-K HTML, 13F XML, filing index) are immutable and never re-downloaded
 """
 
+import json
 import logging
 import re
 import time
@@ -27,6 +33,8 @@ import requests
 from bs4 import BeautifulSoup
 from django.conf import settings
 
+from .sec_edgar_cache import get_sec_edgar_cache, get_ticker_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,6 +126,8 @@ class SECEdgarClient:
 
         # CIK cache (ticker -> CIK)
         self._cik_cache: Dict[str, str] = {}
+        # company_tickers.json index (ticker -> CIK), loaded once
+        self._ticker_index: Optional[Dict[str, str]] = None
 
         logger.info("SEC EDGAR client initialized")
 
@@ -181,6 +191,34 @@ class SECEdgarClient:
             logger.error(f"SEC EDGAR request failed: {e}")
             raise SECEdgarError(f"Request failed: {e}")
 
+    def _fetch_text(
+        self, url: str, immutable: bool = False, max_age: float = 0, timeout: int = 30
+    ) -> str:
+        """
+        GET text through the local SEC cache (plain request when the cache is disabled)
+
+        Args:
+            url: Request URL
+            immutable: Filing documents - cached body is reused without a request
+            max_age: Seconds a cached body is reused before a conditional GET
+            timeout: Request timeout in seconds
+        """
+        cache = get_sec_edgar_cache()
+        if cache is None:
+            return self._make_request(url, timeout=timeout).text
+        return cache.get(
+            url,
+            lambda headers: self._make_request(url, headers=headers, timeout=timeout),
+            immutable=immutable,
+            max_age=max_age,
+        )
+
+    def _fetch_json(self, url: str, max_age: float = 0) -> Any:
+        """GET JSON through the local SEC cache"""
+        if get_sec_edgar_cache() is None:
+            return self._make_request(url).json()
+        return json.loads(self._fetch_text(url, max_age=max_age))
+
     def get_cik(self, ticker: str) -> Optional[str]:
         """
         Get CIK (Central Index Key) for a ticker symbol
@@ -204,18 +242,18 @@ class SECEdgarClient:
             return self._cik_cache[ticker]
 
         try:
-            # SEC provides a company tickers JSON file
-            url = f"{self.WWW_URL}/files/company_tickers.json"
-            response = self._make_request(url)
-            data = response.json()
-
-            # Search for ticker
-            for key, company in data.items():
-                if company.get("ticker", "").upper() == ticker:
-                    cik = str(company.get("cik_str", "")).zfill(10)
-                    self._cik_cache[ticker] = cik
-                    logger.info(f"Found CIK for {ticker}: {cik}")
-                    return cik
+            # SEC provides a company tickers JSON file (indexed once, not rescanned per miss)
+            if self._ticker_index is None:
+                url = f"{self.WWW_URL}/files/company_tickers.json"
+                self._ticker_index = get_ticker_index(
+                    lambda headers: self._make_request(url, headers=headers or None)
+                )
+
+            cik = self._ticker_index.get(ticker)
+            if cik:
+                self._cik_cache[ticker] = cik
+                logger.info(f"Found CIK for {ticker}: {cik}")
+                return cik
 
             logger.warning(f"CIK not found for ticker: {ticker}")
             return None
@@ -240,8 +278,9 @@ class SECEdgarClient:
 
         try:
             url = f"{self.SUBMISSIONS_URL}/CIK{cik}.json"
-            response = self._make_request(url)
-            return response.json()
+            return self._fetch_json(
+                url, max_age=getattr(settings, "SEC_EDGAR_SUBMISSIONS_MAX_AGE", 3600)
+            )
 
         except SECEdgarError:
             raise
@@ -338,15 +377,15 @@ class SECEdgarClient:
 
             logger.info(f"Downloading 10-K: {url}")
 
-            response = self._make_request(url, timeout=120)
+            raw = self._fetch_text(url, immutable=True, timeout=120)
 
             # Convert HTML to text
             if filing.primary_document.endswith(
                 ".htm"
             ) or filing.primary_document.endswith(".html"):
-                text = self._html_to_text(response.text)
+                text = self._html_to_text(raw)
             else:
-                text = response.text
+                text = raw
 
             logger.info(
                 f"Downloaded 10-K for {filing.company_name}: {len(text)} characters"
@@ -567,13 +606,13 @@ class SECEdgarClient:
             acc_formatted = f"{filing.accession_number[:10]}-{filing.accession_number[10:12]}-{filing.accession_number[12:]}"
             index_url = f"{self.ARCHIVES_URL}/{filing.cik}/{filing.accession_number}/"
 
-            response = self._make_request(index_url)
+            index_html = self._fetch_text(index_url, immutable=True)
 
             # Find the info table document (usually ends with .xml and contains 'infotable' or 'information')
             info_table_url = None
 
             # Try to find XML info table from the index page
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(index_html, "html.parser")
             for link in soup.find_all("a"):
                 href = link.get("href", "").lower()
                 if (
@@ -587,9 +626,9 @@ class SECEdgarClient:
                 info_table_url = f"{self.ARCHIVES_URL}/{filing.cik}/{filing.accession_number}/{filing.info_table_document}"
 
             logger.info(f"Downloading 13F info table: {info_table_url}")
-            response = self._make_request(info_table_url, timeout=60)
+            xml_content = self._fetch_text(info_table_url, immutable=True, timeout=60)
 
-            return self._parse_13f_xml(response.text)
+            return self._parse_13f_xml(xml_content)
 
         except SECEdgarError:
             raise
@@ -713,8 +752,7 @@ class SECEdgarClient:
             # Similar pattern to download_10k_text
             url = f"{self.ARCHIVES_URL}/{filing.cik}/{filing.accession_number}/"
 
-            response = self._make_request(url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(self._fetch_text(url, immutable=True), "html.parser")
 
             # Find primary document (usually .htm)
             doc_url = None
@@ -729,8 +767,7 @@ class SECEdgarClient:
                     f"Could not find 8-K document for {filing.accession_number}"
                 )
 
-            response = self._make_request(doc_url, timeout=60)
-            return self._html_to_text(response.text)
+            return self._html_to_text(self._fetch_text(doc_url, immutable=True, timeout=60))
 
         except SECEdgarError:
             raise
@@ -1,6 +1,9 @@
 """
 기술적 지표 계산 모듈
 RSI, MACD, Bollinger Bands, SMA, EMA 등의 기술적 지표를 계산
+
+모든 지표는 NumPy 벡터 커널(cumsum SMA, 블록 재귀 필터 EMA/Wilder)로 계산하며,
+종목별 함수는 1행 래퍼, calculate_all_indicators_batch는 symbols × dates 행렬 API입니다.
 """
 
 from datetime import datetime, timedelta
@@ -12,8 +15,192 @@ import pandas as pd
 from django.core.cache import cache
 
 
+# ── NumPy 커널 (symbols × dates 2-D, 결측/미정의 NaN) ─────────────────
+# 모든 커널은 행이 왼쪽 정렬(유효값이 0열부터 연속, 결측은 뒤쪽)이라고 가정합니다.
+# 종목별 래퍼는 리스트를 1행 행렬로, 배치 API는 _compact_order로 정렬한 뒤 호출합니다.
+
+_EWM_BLOCK = 64  # 재귀 필터 블록 크기 (블록 내부는 행렬곱, 블록 간만 Python 반복)
+
+
+def _as_matrix(values) -> np.ndarray:
+    """리스트/1-D 배열(Decimal 포함) → float64 (1, n) 행렬"""
+    return np.asarray(values, dtype=float).reshape(1, -1)
+
+
+def _to_list(row: np.ndarray, digits: Optional[int] = 2) -> List[Optional[float]]:
+    """NaN → None, 출력 시점에만 반올림"""
+    if digits is not None:
+        row = np.round(row, digits)
+    return [None if v != v else v for v in row.tolist()]
+
+
+def _rolling_mean(x: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """x[:, start:] 구간 단순 이동평균 (cumsum 차분, O(n)). 값은 start+period-1 열부터."""
+    out = np.full(x.shape, np.nan)
+    seg = x[:, start:]
+    if period <= 0 or seg.shape[1] < period:
+        return out
+
+    # 행 첫 값 기준 편차로 누적해 cumsum 자릿수 손실을 줄임
+    base = seg[:, :1]
+    csum = np.cumsum(np.nan_to_num(seg - base), axis=1)
+    csum = np.concatenate([np.zeros((x.shape[0], 1)), csum], axis=1)
+    out[:, start + period - 1 :] = (csum[:, period:] - csum[:, :-period]) / period + base
+    out[np.isnan(x)] = np.nan
+    return out
+
+
+def _rolling_window(x: np.ndarray, period: int, reducer: str) -> np.ndarray:
+    """std(모집단)/max/min 롤링 창 (sliding_window_view, NaN 전파)"""
+    out = np.full(x.shape, np.nan)
+    if period <= 0 or x.shape[1] < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(x, period, axis=1)
+    out[:, period - 1 :] = getattr(windows, reducer)(axis=-1)
+    return out
+
+
+def _ewm(x: np.ndarray, alpha: float, period: int, start: int = 0) -> np.ndarray:
+    """
+    SMA 시드 재귀 필터 y_t = alpha·x_t + (1-alpha)·y_{t-1}.
+
+    시드는 x[:, start:start+period] 평균(start+period-1 열). EMA는 alpha=2/(period+1),
+    Wilder 평활(RSI/ATR)은 alpha=1/period. 블록 단위로 하삼각 감쇠 커널을 곱해
+    lfilter와 같은 결과를 종목 축 전체에 대해 한 번에 계산합니다.
+    """
+    out = np.full(x.shape, np.nan)
+    seed_col = start + period - 1
+    if period <= 0 or seed_col >= x.shape[1]:
+        return out
+    out[:, seed_col] = x[:, start : seed_col + 1].mean(axis=1)
+
+    beta = 1.0 - alpha
+    lags = np.subtract.outer(np.arange(_EWM_BLOCK), np.arange(_EWM_BLOCK))
+    kernel = np.where(lags >= 0, alpha * beta ** np.clip(lags, 0, None), 0.0)
+    decay = beta ** np.arange(1, _EWM_BLOCK + 1)
+
+    rest = np.nan_to_num(x[:, seed_col + 1 :])
+    prev = out[:, seed_col]
+    for b0 in range(0, rest.shape[1], _EWM_BLOCK):
+        block = rest[:, b0 : b0 + _EWM_BLOCK]
+        w = block.shape[1]
+        y = block @ kernel[:w, :w].T + prev[:, None] * decay[:w]
+        out[:, seed_col + 1 + b0 : seed_col + 1 + b0 + w] = y
+        prev = y[:, -1]
+
+    out[np.isnan(x)] = np.nan
+    return out
+
+
+def _rsi(close: np.ndarray, period: int) -> np.ndarray:
+    out = np.full(close.shape, np.nan)
+    if close.shape[1] < period + 1:
+        return out
+    delta = np.diff(close, axis=1)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    gains[np.isnan(delta)] = np.nan
+    losses[np.isnan(delta)] = np.nan
+
+    avg_gain = _ewm(gains, 1.0 / period, period)
+    avg_loss = _ewm(losses, 1.0 / period, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    out[:, 1:] = np.where(avg_loss == 0, 100.0, rsi)
+    return out
+
+
+def _macd(
+    close: np.ndarray, fast_period: int, slow_period: int, signal_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ema_fast = _ewm(close, 2.0 / (fast_period + 1), fast_period)
+    ema_slow = _ewm(close, 2.0 / (slow_period + 1), slow_period)
+    macd = ema_fast - ema_slow
+    signal = _ewm(
+        macd,
+        2.0 / (signal_period + 1),
+        signal_period,
+        start=max(fast_period, slow_period) - 1,
+    )
+    return macd, signal, macd - signal
+
+
+def _bollinger(
+    close: np.ndarray, period: int, std_dev: float
+) -> Dict[str, np.ndarray]:
+    middle = _rolling_mean(close, period)
+    std = _rolling_window(close, period, "std")
+    upper = middle + std_dev * std
+    lower = middle - std_dev * std
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = np.where(middle != 0, (upper - lower) / middle * 100, np.nan)
+        percent_b = np.where(
+            upper != lower, (close - lower) / (upper - lower) * 100, np.nan
+        )
+    return {
+        "upper": upper,
+        "middle": middle,
+        "lower": lower,
+        "bandwidth": bandwidth,
+        "percent_b": percent_b,
+    }
+
+
+def _stochastic(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    smooth_k: int,
+    smooth_d: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    highest = _rolling_window(high, period, "max")
+    lowest = _rolling_window(low, period, "min")
+    spread = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_k = np.where(spread != 0, (close - lowest) / spread * 100, 50.0)
+    raw_k[np.isnan(spread) | np.isnan(close)] = np.nan
+
+    percent_k = _rolling_mean(raw_k, smooth_k, start=period - 1)
+    percent_d = _rolling_mean(percent_k, smooth_d, start=period + smooth_k - 2)
+    return percent_k, percent_d
+
+
+def _atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    out = np.full(close.shape, np.nan)
+    prev_close = close[:, :-1]
+    true_range = np.maximum.reduce(
+        [
+            high[:, 1:] - low[:, 1:],
+            np.abs(high[:, 1:] - prev_close),
+            np.abs(low[:, 1:] - prev_close),
+        ]
+    )
+    out[:, 1:] = _ewm(true_range, 1.0 / period, period)
+    return out
+
+
+def _obv(volume: np.ndarray, close: np.ndarray) -> np.ndarray:
+    direction = np.sign(np.diff(close, axis=1))
+    flows = np.concatenate([volume[:, :1], direction * volume[:, 1:]], axis=1)
+    return np.cumsum(flows, axis=1)
+
+
+def _compact_order(valid: np.ndarray) -> np.ndarray:
+    """행별 유효 셀을 앞으로 모으는 안정 정렬 인덱스 (종목별 자체 거래일 기준 계산)"""
+    return np.argsort(~valid, axis=1, kind="stable")
+
+
 class TechnicalIndicators:
-    """기술적 지표 계산 클래스"""
+    """
+    기술적 지표 계산 클래스
+
+    종목별 함수(calculate_sma 등)는 1행 행렬로 NumPy 커널을 호출하는 얇은 래퍼이며,
+    출력 시점에만 소수 2자리 반올림합니다. 여러 종목은 calculate_all_indicators_batch로
+    symbols × dates 행렬을 한 번에 계산합니다.
+    """
 
     @staticmethod
     def calculate_sma(prices: List[float], period: int) -> List[Optional[float]]:
@@ -27,24 +214,15 @@ class TechnicalIndicators:
         Returns:
             SMA 값 리스트
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-
-        sma = []
-        for i in range(len(prices)):
-            if i < period - 1:
-                sma.append(None)
-            else:
-                avg = sum(prices[i - period + 1 : i + 1]) / period
-                sma.append(round(avg, 2))
-
-        return sma
+        return _to_list(_rolling_mean(_as_matrix(prices), period)[0])
 
     @staticmethod
     def calculate_ema(prices: List[float], period: int) -> List[Optional[float]]:
         """
         지수 이동 평균 (Exponential Moving Average) 계산
 
+        첫 EMA는 최초 period개 SMA로 시작합니다.
+
         Args:
             prices: 가격 리스트
             period: 이동평균 기간
@@ -52,28 +230,15 @@ class TechnicalIndicators:
         Returns:
             EMA 값 리스트
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-
-        multiplier = 2 / (period + 1)
-        ema = [None] * (period - 1)
-
-        # 첫 번째 EMA는 SMA로 시작
-        sma = sum(prices[:period]) / period
-        ema.append(round(sma, 2))
-
-        # 이후 EMA 계산
-        for i in range(period, len(prices)):
-            current_ema = (prices[i] * multiplier) + (ema[-1] * (1 - multiplier))
-            ema.append(round(current_ema, 2))
-
-        return ema
+        return _to_list(_ewm(_as_matrix(prices), 2.0 / (period + 1), period)[0])
 
     @staticmethod
     def calculate_rsi(prices: List[float], period: int = 14) -> List[Optional[float]]:
         """
         상대강도지수 (Relative Strength Index) 계산
 
+        Wilder 평활(Smoothed Moving Average), 평균 하락이 0이면 100.
+
         Args:
             prices: 가격 리스트
             period: RSI 계산 기간 (기본값: 14일)
@@ -81,38 +246,7 @@ class TechnicalIndicators:
         Returns:
             RSI 값 리스트 (0-100)
         """
-        if len(prices) < period + 1:
-            return [None] * len(prices)
-
-        # 가격 변화 계산
-        price_changes = []
-        for i in range(1, len(prices)):
-            price_changes.append(prices[i] - prices[i - 1])
-
-        # 상승과 하락 분리
-        gains = [change if change > 0 else 0 for change in price_changes]
-        losses = [-change if change < 0 else 0 for change in price_changes]
-
-        rsi = [None] * (period)
-
-        # 첫 번째 평균 상승/하락
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-
-        for i in range(period, len(price_changes) + 1):
-            if avg_loss == 0:
-                rsi.append(100)
-            else:
-                rs = avg_gain / avg_loss
-                current_rsi = 100 - (100 / (1 + rs))
-                rsi.append(round(current_rsi, 2))
-
-            # 다음 평균 계산 (Smoothed Moving Average)
-            if i < len(price_changes):
-                avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-                avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-        return rsi
+        return _to_list(_rsi(_as_matrix(prices), period)[0])
 
     @staticmethod
     def calculate_macd(
@@ -133,54 +267,14 @@ class TechnicalIndicators:
         Returns:
             MACD, Signal, Histogram 값을 포함한 딕셔너리
         """
-        if len(prices) < slow_period:
-            return {
-                "macd": [None] * len(prices),
-                "signal": [None] * len(prices),
-                "histogram": [None] * len(prices),
-            }
-
-        # EMA 계산
-        ema_fast = TechnicalIndicators.calculate_ema(prices, fast_period)
-        ema_slow = TechnicalIndicators.calculate_ema(prices, slow_period)
-
-        # MACD 라인 계산
-        macd_line = []
-        for i in range(len(prices)):
-            if ema_fast[i] is None or ema_slow[i] is None:
-                macd_line.append(None)
-            else:
-                macd_line.append(round(ema_fast[i] - ema_slow[i], 2))
-
-        # Signal 라인 계산 (MACD의 EMA)
-        macd_values = [m for m in macd_line if m is not None]
-        if len(macd_values) >= signal_period:
-            signal_ema = TechnicalIndicators.calculate_ema(macd_values, signal_period)
-
-            # 전체 길이에 맞게 Signal 라인 조정
-            signal_line = []
-            signal_idx = 0
-            for m in macd_line:
-                if m is None:
-                    signal_line.append(None)
-                else:
-                    if signal_idx < len(signal_ema):
-                        signal_line.append(signal_ema[signal_idx])
-                        signal_idx += 1
-                    else:
-                        signal_line.append(None)
-        else:
-            signal_line = [None] * len(prices)
-
-        # Histogram 계산 (MACD - Signal)
-        histogram = []
-        for i in range(len(prices)):
-            if macd_line[i] is not None and signal_line[i] is not None:
-                histogram.append(round(macd_line[i] - signal_line[i], 2))
-            else:
-                histogram.append(None)
-
-        return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+        macd, signal, histogram = _macd(
+            _as_matrix(prices), fast_period, slow_period, signal_period
+        )
+        return {
+            "macd": _to_list(macd[0]),
+            "signal": _to_list(signal[0]),
+            "histogram": _to_list(histogram[0]),
+        }
 
     @staticmethod
     def calculate_bollinger_bands(
@@ -197,62 +291,8 @@ class TechnicalIndicators:
         Returns:
             상단밴드, 중간밴드(SMA), 하단밴드 값을 포함한 딕셔너리
         """
-        if len(prices) < period:
-            return {
-                "upper": [None] * len(prices),
-                "middle": [None] * len(prices),
-                "lower": [None] * len(prices),
-                "bandwidth": [None] * len(prices),
-                "percent_b": [None] * len(prices),
-            }
-
-        # 중간 밴드 (SMA) 계산
-        middle_band = TechnicalIndicators.calculate_sma(prices, period)
-
-        upper_band = []
-        lower_band = []
-        bandwidth = []
-        percent_b = []
-
-        for i in range(len(prices)):
-            if i < period - 1:
-                upper_band.append(None)
-                lower_band.append(None)
-                bandwidth.append(None)
-                percent_b.append(None)
-            else:
-                # 표준편차 계산
-                window_prices = prices[i - period + 1 : i + 1]
-                std = np.std(window_prices)
-
-                # 밴드 계산
-                upper = middle_band[i] + (std_dev * std)
-                lower = middle_band[i] - (std_dev * std)
-
-                upper_band.append(round(upper, 2))
-                lower_band.append(round(lower, 2))
-
-                # Bandwidth 계산 (상단 - 하단) / 중간
-                if middle_band[i] != 0:
-                    bw = ((upper - lower) / middle_band[i]) * 100
-                    bandwidth.append(round(bw, 2))
-                else:
-                    bandwidth.append(None)
-
-                # %B 계산 (현재가격 - 하단) / (상단 - 하단)
-                if upper != lower:
-                    pb = ((prices[i] - lower) / (upper - lower)) * 100
-                    percent_b.append(round(pb, 2))
-                else:
-                    percent_b.append(None)
-
-        return {
-            "upper": upper_band,
-            "middle": middle_band,
-            "lower": lower_band,
-            "bandwidth": bandwidth,
-            "percent_b": percent_b,
-        }
+        bands = _bollinger(_as_matrix(prices), period, std_dev)
+        return {key: _to_list(arr[0]) for key, arr in bands.items()}
 
     @staticmethod
     def calculate_stochastic(
@@ -277,60 +317,18 @@ class TechnicalIndicators:
         Returns:
             %K와 %D 값을 포함한 딕셔너리
         """
-        if len(close_prices) < period:
-            return {
-                "percent_k": [None] * len(close_prices),
-                "percent_d": [None] * len(close_prices),
-            }
-
-        raw_k = []
-
-        for i in range(len(close_prices)):
-            if i < period - 1:
-                raw_k.append(None)
-            else:
-                # 기간 내 최고가와 최저가
-                highest = max(high_prices[i - period + 1 : i + 1])
-                lowest = min(low_prices[i - period + 1 : i + 1])
-
-                if highest != lowest:
-                    k = ((close_prices[i] - lowest) / (highest - lowest)) * 100
-                    raw_k.append(round(k, 2))
-                else:
-                    raw_k.append(50)  # 변동이 없을 때 중간값
-
-        # %K 평활화 (SMA)
-        percent_k = TechnicalIndicators.calculate_sma(
-            [k for k in raw_k if k is not None], smooth_k
+        percent_k, percent_d = _stochastic(
+            _as_matrix(high_prices),
+            _as_matrix(low_prices),
+            _as_matrix(close_prices),
+            period,
+            smooth_k,
+            smooth_d,
         )
-
-        # %D 계산 (%K의 SMA)
-        percent_d = TechnicalIndicators.calculate_sma(percent_k, smooth_d)
-
-        # 전체 길이에 맞게 조정
-        final_k = []
-        final_d = []
-        k_idx = 0
-        d_idx = 0
-
-        for i, k in enumerate(raw_k):
-            if k is None:
-                final_k.append(None)
-                final_d.append(None)
-            else:
-                if k_idx < len(percent_k):
-                    final_k.append(percent_k[k_idx])
-                    k_idx += 1
-                else:
-                    final_k.append(None)
-
-                if d_idx < len(percent_d):
-                    final_d.append(percent_d[d_idx])
-                    d_idx += 1
-                else:
-                    final_d.append(None)
-
-        return {"percent_k": final_k, "percent_d": final_d}
+        return {
+            "percent_k": _to_list(percent_k[0]),
+            "percent_d": _to_list(percent_d[0]),
+        }
 
     @staticmethod
     def calculate_atr(
@@ -351,34 +349,14 @@ class TechnicalIndicators:
         Returns:
             ATR 값 리스트
         """
-        if len(close_prices) < period + 1:
-            return [None] * len(close_prices)
-
-        true_ranges = []
-
-        for i in range(1, len(close_prices)):
-            # True Range 계산
-            high_low = high_prices[i] - low_prices[i]
-            high_close = abs(high_prices[i] - close_prices[i - 1])
-            low_close = abs(low_prices[i] - close_prices[i - 1])
-
-            true_range = max(high_low, high_close, low_close)
-            true_ranges.append(true_range)
-
-        atr = [None]  # 첫 번째 값은 None
-
-        # 첫 번째 ATR은 단순 평균
-        first_atr = sum(true_ranges[:period]) / period
-        atr.extend([None] * (period - 1))
-        atr.append(round(first_atr, 2))
-
-        # 이후 ATR은 지수 이동 평균
-        current_atr = first_atr
-        for i in range(period, len(true_ranges)):
-            current_atr = ((current_atr * (period - 1)) + true_ranges[i]) / period
-            atr.append(round(current_atr, 2))
-
-        return atr
+        return _to_list(
+            _atr(
+                _as_matrix(high_prices),
+                _as_matrix(low_prices),
+                _as_matrix(close_prices),
+                period,
+            )[0]
+        )
 
     @staticmethod
     def calculate_obv(volumes: List[float], close_prices: List[float]) -> List[float]:
@@ -398,20 +376,7 @@ class TechnicalIndicators:
         if len(close_prices) == 0:
             return []
 
-        obv = [volumes[0]]
-
-        for i in range(1, len(close_prices)):
-            if close_prices[i] > close_prices[i - 1]:
-                # 가격 상승: OBV에 거래량 추가
-                obv.append(obv[-1] + volumes[i])
-            elif close_prices[i] < close_prices[i - 1]:
-                # 가격 하락: OBV에서 거래량 차감
-                obv.append(obv[-1] - volumes[i])
-            else:
-                # 가격 변동 없음: OBV 유지
-                obv.append(obv[-1])
-
-        return obv
+        return _obv(_as_matrix(volumes), _as_matrix(close_prices))[0].tolist()
 
     @staticmethod
     def identify_support_resistance(
@@ -428,20 +393,18 @@ class TechnicalIndicators:
         Returns:
             지지선과 저항선 레벨
         """
-        if len(prices) < window * 2:
+        # 중심 ±window 창이 하나도 없으면(≤ 2·window개) 레벨 없음
+        if len(prices) <= window * 2:
             return {"support": [], "resistance": []}
 
-        # 로컬 최대값과 최소값 찾기
-        highs = []
-        lows = []
-
-        for i in range(window, len(prices) - window):
-            window_slice = prices[i - window : i + window + 1]
-
-            if prices[i] == max(window_slice):
-                highs.append(prices[i])
-            elif prices[i] == min(window_slice):
-                lows.append(prices[i])
+        # 로컬 최대값과 최소값 찾기 (중심 ±window 창)
+        arr = np.asarray(prices, dtype=float)
+        windows = np.lib.stride_tricks.sliding_window_view(arr, 2 * window + 1)
+        centre = arr[window : len(arr) - window]
+        is_high = centre == windows.max(axis=1)
+        is_low = ~is_high & (centre == windows.min(axis=1))
+        highs = centre[is_high].tolist()
+        lows = centre[is_low].tolist()
 
         # 클러스터링으로 주요 레벨 식별
         def cluster_levels(levels: List[float], threshold: float = 0.01) -> List[float]:
@@ -476,6 +439,83 @@ class TechnicalIndicators:
             "resistance": sorted(resistance_levels, reverse=True),
         }
 
+    @staticmethod
+    def calculate_all_indicators_batch(
+        close: np.ndarray,
+        high: Optional[np.ndarray] = None,
+        low: Optional[np.ndarray] = None,
+        volume: Optional[np.ndarray] = None,
+    ) -> Dict[str, object]:
+        """
+        여러 종목의 기술적 지표를 한 번에 계산
+
+        행마다 close가 NaN인 셀은 결측으로 보고, 종목별 자체 거래일(유효 셀)만으로
+        계산한 뒤 원래 열 위치에 되돌립니다. PriceHistoryStore.read() 행렬을 그대로
+        넘길 수 있습니다.
+
+        Args:
+            close: 종가 행렬 (symbols × dates)
+            high / low: 고가/저가 행렬 (생략 시 close)
+            volume: 거래량 행렬 (생략 시 0)
+
+        Returns:
+            calculate_all_indicators와 같은 키. 시계열 지표는 (symbols × dates)
+            float64 행렬(미정의 NaN, 반올림 없음), support_levels/resistance_levels는
+            종목별 리스트의 리스트.
+        """
+        close = np.atleast_2d(np.asarray(close, dtype=float))
+        high = close if high is None else np.atleast_2d(np.asarray(high, dtype=float))
+        low = close if low is None else np.atleast_2d(np.asarray(low, dtype=float))
+        volume = (
+            np.zeros_like(close)
+            if volume is None
+            else np.atleast_2d(np.asarray(volume, dtype=float))
+        )
+
+        valid = ~np.isnan(close)
+        order = _compact_order(valid)
+        compact_valid = np.take_along_axis(valid, order, axis=1)
+
+        def compact(mat: np.ndarray) -> np.ndarray:
+            out = np.take_along_axis(mat, order, axis=1)
+            out[~compact_valid] = np.nan
+            return out
+
+        c, h, l, v = compact(close), compact(high), compact(low), compact(volume)
+
+        series = {
+            "sma_20": _rolling_mean(c, 20),
+            "sma_50": _rolling_mean(c, 50),
+            "sma_200": _rolling_mean(c, 200),
+            "ema_12": _ewm(c, 2.0 / 13, 12),
+            "ema_26": _ewm(c, 2.0 / 27, 26),
+            "rsi": _rsi(c, 14),
+        }
+        series["macd"], series["signal"], series["histogram"] = _macd(c, 12, 26, 9)
+        for key, arr in _bollinger(c, 20, 2).items():
+            series[f"bb_{key}"] = arr
+        series["stoch_k"], series["stoch_d"] = _stochastic(h, l, c, 14, 3, 3)
+        series["atr"] = _atr(h, l, c, 14)
+        series["obv"] = _obv(v, c)
+
+        indicators: Dict[str, object] = {}
+        for key, arr in series.items():
+            restored = np.empty_like(arr)
+            np.put_along_axis(restored, order, arr, axis=1)
+            restored[~valid] = np.nan
+            indicators[key] = restored
+
+        levels = [
+            TechnicalIndicators.identify_support_resistance(
+                row[~np.isnan(row)].tolist()
+            )
+            for row in c
+        ]
+        indicators["support_levels"] = [lv["support"] for lv in levels]
+        indicators["resistance_levels"] = [lv["resistance"] for lv in levels]
+
+        return indicators
+
     @staticmethod
     def calculate_all_indicators(stock_data: pd.DataFrame) -> Dict:
         """
@@ -488,56 +528,21 @@ class TechnicalIndicators:
             모든 기술적 지표를 포함한 딕셔너리
         """
         # Decimal 타입을 float으로 변환
-        close_prices = [float(x) for x in stock_data["close"].tolist()]
-        high_prices = [float(x) for x in stock_data["high"].tolist()]
-        low_prices = [float(x) for x in stock_data["low"].tolist()]
-        volumes = [float(x) for x in stock_data["volume"].tolist()]
-
-        indicators = {}
-
-        # 이동평균
-        indicators["sma_20"] = TechnicalIndicators.calculate_sma(close_prices, 20)
-        indicators["sma_50"] = TechnicalIndicators.calculate_sma(close_prices, 50)
-        indicators["sma_200"] = TechnicalIndicators.calculate_sma(close_prices, 200)
-        indicators["ema_12"] = TechnicalIndicators.calculate_ema(close_prices, 12)
-        indicators["ema_26"] = TechnicalIndicators.calculate_ema(close_prices, 26)
-
-        # RSI
-        indicators["rsi"] = TechnicalIndicators.calculate_rsi(close_prices)
-
-        # MACD
-        macd_result = TechnicalIndicators.calculate_macd(close_prices)
-        indicators.update(macd_result)
-
-        # 볼린저 밴드
-        bb_result = TechnicalIndicators.calculate_bollinger_bands(close_prices)
-        indicators["bb_upper"] = bb_result["upper"]
-        indicators["bb_middle"] = bb_result["middle"]
-        indicators["bb_lower"] = bb_result["lower"]
-        indicators["bb_bandwidth"] = bb_result["bandwidth"]
-        indicators["bb_percent_b"] = bb_result["percent_b"]
-
-        # 스토캐스틱
-        stoch_result = TechnicalIndicators.calculate_stochastic(
-            high_prices, low_prices, close_prices
+        batch = TechnicalIndicators.calculate_all_indicators_batch(
+            _as_matrix(stock_data["close"].tolist()),
+            _as_matrix(stock_data["high"].tolist()),
+            _as_matrix(stock_data["low"].tolist()),
+            _as_matrix(stock_data["volume"].tolist()),
         )
-        indicators["stoch_k"] = stoch_result["percent_k"]
-        indicators["stoch_d"] = stoch_result["percent_d"]
 
-        # ATR
-        indicators["atr"] = TechnicalIndicators.calculate_atr(
-            high_prices, low_prices, close_prices
-        )
-
-        # OBV
-        indicators["obv"] = TechnicalIndicators.calculate_obv(volumes, close_prices)
-
-        # 지지/저항선
-        support_resistance = TechnicalIndicators.identify_support_resistance(
-            close_prices
-        )
-        indicators["support_levels"] = support_resistance["support"]
-        indicators["resistance_levels"] = support_resistance["resistance"]
+        indicators = {}
+        for key, value in batch.items():
+            if key in ("support_levels", "resistance_levels"):
+                indicators[key] = value[0]
+            elif key == "obv":
+                indicators[key] = _to_list(value[0], digits=None)
+            else:
+                indicators[key] = _to_list(value[0])
 
         return indicators
 
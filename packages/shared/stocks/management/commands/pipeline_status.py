@@ -6,6 +6,7 @@ EOD Pipeline 상태 조회 + 즉시 실행 Management Command
     python manage.py pipeline_status --run           # 즉시 실행 (직전 거래일)
     python manage.py pipeline_status --run --date 2026-02-25  # 특정 날짜 실행
     python manage.py pipeline_status --quality       # ingest_quality 상세
+    python manage.py pipeline_status --verify-rolling --date 2026-02-25  # 증분 vs 전체 경로 동치성
 """
 
 import json
@@ -24,10 +25,17 @@ class Command(BaseCommand):
             "--quality", action="store_true", help="ingest_quality 상세 출력"
         )
         parser.add_argument("--days", type=int, default=7, help="조회 일수 (기본: 7)")
+        parser.add_argument(
+            "--verify-rolling",
+            action="store_true",
+            help="EODRollingState 증분 지표와 pandas 전체 경로 동치성 점검",
+        )
 
     def handle(self, *args, **options):
         if options["run"]:
             self._run_pipeline(options.get("date"))
+        elif options["verify_rolling"]:
+            self._verify_rolling(options.get("date"))
         elif options["quality"]:
             self._show_quality(options["days"])
         else:
@@ -68,6 +76,47 @@ class Command(BaseCommand):
                 )
             )
 
+    def _verify_rolling(self, target_date_str):
+        from packages.shared.stocks.models import DailyPrice
+        from packages.shared.stocks.services.eod_rolling_state import (
+            verify_equivalence,
+        )
+        from packages.shared.stocks.services.eod_signal_calculator import (
+            EODSignalCalculator,
+        )
+
+        if target_date_str:
+            target = date.fromisoformat(target_date_str)
+        else:
+            target = (
+                DailyPrice.objects.order_by("-date")
+                .values_list("date", flat=True)
+                .first()
+            )
+            if target is None:
+                raise CommandError("DailyPrice 데이터가 없습니다.")
+
+        report = verify_equivalence(EODSignalCalculator(), target)
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"\n=== Rolling State 동치성 ({target}, {report['symbols']}종목) ==="
+            )
+        )
+        for col, diff in report["max_abs_diff"].items():
+            self.stdout.write(f"  {col:<18} max|Δ|={diff:.3e}")
+
+        if report["missing"]:
+            self.stdout.write(
+                self.style.WARNING(f"  한쪽에만 존재: {', '.join(report['missing'][:20])}")
+            )
+        if report["mismatches"]:
+            for col, symbols in report["mismatches"].items():
+                self.stdout.write(
+                    self.style.ERROR(f"  불일치 {col}: {', '.join(symbols[:20])}")
+                )
+        else:
+            self.stdout.write(self.style.SUCCESS("  일치"))
+
     def _show_status(self, days):
         from packages.shared.stocks.models import PipelineLog
 
@@ -0,0 +1,33 @@
+"""
+컬럼형 가격 캐시(PriceHistoryStore) 관리 명령.
+
+DailyPrice → {PRICE_STORE_DIR} 버전 디렉토리 + manifest 교체.
+평시 증분 갱신은 sync_sp500_eod_prices 직후 refresh_price_store 태스크가 담당.
+
+사용:
+    python manage.py price_store            # 증분 갱신 (저장소 없으면 전체 구축)
+    python manage.py price_store --full     # 전체 재구축
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "DailyPrice 컬럼형 캐시(PriceHistoryStore) 구축/증분 갱신."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="전체 재구축.")
+
+    def handle(self, *args, **opts):
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        store = PriceHistoryStore()
+        self.stdout.write(f"저장소: {store.root} (full={opts['full']})")
+        result = store.refresh(full=opts["full"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['mode']}: {result['symbols']}종 × {result['dates']}일 "
+                f"(rows={result['rows']}, 재적재 {result['reloaded_symbols']}종, "
+                f"last_date={result['last_date']})"
+            )
+        )
@@ -0,0 +1,59 @@
+"""
+SignalAccuracy 수익률 소급 관리 명령 (EOD Pipeline Stage 8 수동 실행).
+
+평시에는 파이프라인 Stage 8이 target_date 기준으로 실행한다. 누락 구간·과거 지평을
+다시 채울 때 사용한다.
+
+사용:
+    python manage.py signal_accuracy_backfill                       # 오늘 기준 전체 대기 행
+    python manage.py signal_accuracy_backfill --as-of 2026-03-31 --since 2026-01-01
+    python manage.py signal_accuracy_backfill --horizons 20 --dry-run
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "SignalAccuracy 1d/5d/20d 수익률 집합 기반 소급 (Stage 8 수동 실행)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--as-of", default=None,
+                            help="선행 종가 상한일 YYYY-MM-DD (기본: 오늘).")
+        parser.add_argument("--since", default=None,
+                            help="signal_date 하한 YYYY-MM-DD (기본: 전체).")
+        parser.add_argument("--horizons", nargs="*", type=int, default=[1, 5, 20],
+                            help="대상 지평(일) — 1 5 20 중 선택.")
+        parser.add_argument("--dry-run", action="store_true", help="계산만, 쓰기 없음.")
+
+    def handle(self, *args, **opts):
+        from packages.shared.stocks.services.signal_accuracy_backfill import (
+            HORIZONS,
+            backfill_signal_accuracy,
+        )
+
+        invalid = sorted(set(opts["horizons"]) - set(HORIZONS))
+        if invalid:
+            raise CommandError(f"지원하지 않는 지평: {invalid} (허용: {list(HORIZONS)})")
+
+        try:
+            as_of = (
+                date.fromisoformat(opts["as_of"])
+                if opts["as_of"]
+                else timezone.now().date()
+            )
+            since = date.fromisoformat(opts["since"]) if opts["since"] else None
+        except ValueError as e:
+            raise CommandError(f"날짜 형식 오류 (YYYY-MM-DD): {e}")
+
+        stats = backfill_signal_accuracy(
+            as_of, horizons=opts["horizons"], since=since, dry_run=opts["dry_run"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"as_of={as_of} 대기 {stats['pending']}행 → "
+                f"{stats['updated']} (총 {stats['total']}건, dry_run={opts['dry_run']})"
+            )
+        )
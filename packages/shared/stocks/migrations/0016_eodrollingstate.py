@@ -0,0 +1,30 @@
+# Generated by Django 5.2.14 on 2026-10-17 02:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0015_merge_0014_stock_cik_0014_stocksplit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EODRollingState',
+            fields=[
+                ('stock', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='eod_rolling_state', serialize=False, to='stocks.stock')),
+                ('as_of', models.DateField(help_text='버퍼 마지막 봉 날짜')),
+                ('version', models.PositiveSmallIntegerField(default=1)),
+                ('buffers', models.JSONField(default=dict)),
+                ('consecutive_up', models.IntegerField(default=0)),
+                ('consecutive_down', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'stocks_eod_rolling_state',
+                'indexes': [models.Index(fields=['as_of'], name='stocks_eod__as_of_440d4a_idx')],
+            },
+        ),
+    ]
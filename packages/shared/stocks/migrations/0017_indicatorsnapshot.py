@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0016_eodrollingstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicatorSnapshot',
+            fields=[
+                ('stock', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='indicator_snapshot', serialize=False, to='stocks.stock')),
+                ('as_of', models.DateField(help_text='계산에 쓴 마지막 일봉 날짜')),
+                ('close_price', models.FloatField()),
+                ('rsi', models.FloatField(blank=True, null=True)),
+                ('rsi_signal', models.CharField(blank=True, default='', max_length=16)),
+                ('macd', models.FloatField(blank=True, null=True)),
+                ('macd_signal', models.FloatField(blank=True, null=True)),
+                ('macd_histogram', models.FloatField(blank=True, null=True)),
+                ('bb_percent_b', models.FloatField(blank=True, null=True)),
+                ('bb_bandwidth', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'stocks_indicator_snapshot',
+                'indexes': [models.Index(fields=['as_of'], name='stocks_indi_as_of_26aeaf_idx')],
+            },
+        ),
+    ]
@@ -167,6 +167,14 @@ class Stock(models.Model):
     def __str__(self):
         return f"{self.stock_name} ({self.symbol})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 로드 시점 종목명 — 이름이 바뀐 save만 TickerMatcher 이름 인덱스 무효화 (sec_pipeline.signals)
+        if "stock_name" in instance.__dict__:
+            instance._loaded_stock_name = instance.stock_name
+        return instance
+
     @property
     def change_percent_numeric(self):
         """퍼센트 문자열을 숫자로 변환"""
@@ -1222,6 +1230,73 @@ class PipelineLog(models.Model):
         return f"Pipeline {self.date} [{self.status}] ({self.run_id})"
 
 
+class EODRollingState(models.Model):
+    """
+    EOD 시그널 계산용 종목별 롤링 상태 (증분 엔진).
+
+    최근 252거래일 close/high/volume 링버퍼 + 연속 상승/하락 카운터.
+    파이프라인이 거래일마다 1봉씩 전진시키며, 결손/불일치 시 전체 재구축.
+    """
+
+    stock = models.OneToOneField(
+        "Stock",
+        on_delete=models.CASCADE,
+        related_name="eod_rolling_state",
+        primary_key=True,
+    )
+    as_of = models.DateField(help_text="버퍼 마지막 봉 날짜")
+    version = models.PositiveSmallIntegerField(default=1)
+
+    # {"dates": [ordinal], "close": [...], "high": [...], "volume": [...]}
+    buffers = models.JSONField(default=dict)
+    consecutive_up = models.IntegerField(default=0)
+    consecutive_down = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stocks_eod_rolling_state"
+        indexes = [models.Index(fields=["as_of"])]
+
+    def __str__(self):
+        return f"{self.stock_id} rolling state @ {self.as_of}"
+
+
+class IndicatorSnapshot(models.Model):
+    """
+    종목별 최신 기술적 지표 스냅샷 (IndicatorComparisonView 일괄 조회용).
+
+    최근 50거래일 종가 기준 RSI·MACD·볼린저 마지막 값. 야간 + EOD 가격 동기화 직후
+    refresh_indicator_snapshots가 전 종목을 갱신하며, 비교 API는 이 테이블 1회 조회로 응답.
+    """
+
+    stock = models.OneToOneField(
+        "Stock",
+        on_delete=models.CASCADE,
+        related_name="indicator_snapshot",
+        primary_key=True,
+    )
+    as_of = models.DateField(help_text="계산에 쓴 마지막 일봉 날짜")
+    close_price = models.FloatField()
+
+    rsi = models.FloatField(null=True, blank=True)
+    rsi_signal = models.CharField(max_length=16, blank=True, default="")
+    macd = models.FloatField(null=True, blank=True)
+    macd_signal = models.FloatField(null=True, blank=True)
+    macd_histogram = models.FloatField(null=True, blank=True)
+    bb_percent_b = models.FloatField(null=True, blank=True)
+    bb_bandwidth = models.FloatField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stocks_indicator_snapshot"
+        indexes = [models.Index(fields=["as_of"])]
+
+    def __str__(self):
+        return f"{self.stock_id} indicators @ {self.as_of}"
+
+
 class StockNews(models.Model):
     """뉴스 기사 저장. News Enricher가 계층적 매칭에 사용."""
 
@@ -0,0 +1,237 @@
+"""
+EOD JSON Bake Writer — 내용 주소 기반 파일 쓰기 (Stage 7 보조)
+
+EODJSONBaker가 TMP 트리에 쓰는 모든 JSON을 이 writer로 씁니다.
+
+1. 직렬화: orjson (미설치 시 stdlib json compact)
+2. 내용 해시(sha256)가 직전 bake manifest와 같으면 기존 OUTPUT 파일을 TMP에 hardlink
+   → 쓰기/압축 생략, atomic swap 후에도 inode 공유로 디스크 churn 없음
+3. 달라진 파일만 새로 쓰고, precompress ON이면 .gz / .br(brotli 설치 시) 동반 생성
+4. write_many()는 파일 수가 많으면 ThreadPoolExecutor로 분산
+   (해시·gzip/brotli 압축·파일 쓰기는 GIL을 풀어 병렬 진행, Celery prefork 데몬 워커에서도 동작)
+
+manifest: {OUTPUT}/.bake_manifest.json = {"rel/path.json": sha256, ...}
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from django.conf import settings
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경 → stdlib json
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".bake_manifest.json"
+PARALLEL_MIN_FILES = 64  # 이보다 적으면 스레드 분산 이득이 없음
+_CHUNK_SIZE = 32
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dump(default=str)와 같은 결과 (float/int 서브클래스는 숫자 유지)"""
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    return str(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """UTF-8 JSON bytes (ensure_ascii=False 동등)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        data, ensure_ascii=False, default=str, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _compressed_siblings(path: Path) -> list[Path]:
+    siblings = [path.with_name(path.name + ".gz")]
+    if brotli is not None:
+        siblings.append(path.with_name(path.name + ".br"))
+    return siblings
+
+
+def _write_compressed(path: Path, body: bytes) -> None:
+    # mtime=0: 같은 내용이면 같은 .gz bytes
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(body, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + ".br").write_bytes(brotli.compress(body))
+
+
+def _link_or_false(src: Path, dst: Path) -> bool:
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        return False
+
+
+def bake_file(
+    tmp_root: str,
+    prev_root: Optional[str],
+    rel_path: str,
+    data: Any,
+    prev_digest: Optional[str],
+    precompress: bool,
+) -> tuple[str, str, bool]:
+    """
+    단일 파일 bake (스레드 풀 작업 단위).
+
+    Returns:
+        (rel_path, sha256, reused) — reused=True면 직전 파일 hardlink
+    """
+    body = dumps(data)
+    digest = hashlib.sha256(body).hexdigest()
+    dst = Path(tmp_root) / rel_path
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    if prev_root and digest == prev_digest:
+        src = Path(prev_root) / rel_path
+        if _link_or_false(src, dst):
+            siblings = _compressed_siblings(src) if precompress else []
+            if not all(_link_or_false(s, dst.with_name(s.name)) for s in siblings):
+                # 직전 bake가 압축본 없이 끝난 경우 — 공유 inode는 건드리지 않고 새로 생성
+                for s in siblings:
+                    dst.with_name(s.name).unlink(missing_ok=True)
+                _write_compressed(dst, body)
+            return rel_path, digest, True
+
+    dst.write_bytes(body)
+    if precompress:
+        _write_compressed(dst, body)
+    return rel_path, digest, False
+
+
+def _bake_chunk(args: tuple) -> list[tuple[str, str, bool]]:
+    tmp_root, prev_root, precompress, jobs = args
+    return [
+        bake_file(tmp_root, prev_root, rel, data, prev_digest, precompress)
+        for rel, data, prev_digest in jobs
+    ]
+
+
+class BakeWriter:
+    """
+    TMP 트리 JSON writer.
+
+    Usage:
+        writer = BakeWriter(tmp_dir, output_dir)
+        writer.write(tmp_dir / "dashboard.json", data)
+        writer.write_many([(tmp_dir / "stocks" / "AAPL.json", data), ...])
+        stats = writer.finalize()  # manifest 기록, atomic swap 직전 호출
+    """
+
+    def __init__(
+        self,
+        tmp_root: Path,
+        prev_root: Optional[Path] = None,
+        workers: Optional[int] = None,
+        precompress: Optional[bool] = None,
+    ):
+        self.tmp_root = Path(tmp_root)
+        self.prev_root = Path(prev_root) if prev_root else None
+        self.workers = (
+            getattr(settings, "EOD_BAKE_WORKERS", 0) if workers is None else workers
+        )
+        self.precompress = (
+            getattr(settings, "EOD_BAKE_PRECOMPRESS", False)
+            if precompress is None
+            else precompress
+        )
+        self.prev_digests = self._load_manifest()
+        self.digests: dict[str, str] = {}
+        self.stats = {"written": 0, "reused": 0}
+
+    def _load_manifest(self) -> dict:
+        if self.prev_root is None:
+            return {}
+        try:
+            return json.loads((self.prev_root / MANIFEST_NAME).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _rel(self, path: Path) -> str:
+        return Path(path).relative_to(self.tmp_root).as_posix()
+
+    def _record(self, results) -> None:
+        for rel, digest, reused in results:
+            self.digests[rel] = digest
+            self.stats["reused" if reused else "written"] += 1
+
+    def write(self, path: Path, data: Any) -> None:
+        rel = self._rel(path)
+        self._record(
+            [
+                bake_file(
+                    str(self.tmp_root),
+                    str(self.prev_root) if self.prev_root else None,
+                    rel,
+                    data,
+                    self.prev_digests.get(rel),
+                    self.precompress,
+                )
+            ]
+        )
+
+    def write_many(self, items: list[tuple[Path, Any]]) -> int:
+        """
+        여러 파일 bake. 파일 수가 PARALLEL_MIN_FILES 이상이고 workers > 1이면 스레드 풀.
+
+        프로세스가 아닌 스레드로 분산하므로 Celery prefork 워커(데몬 프로세스) 안에서도
+        병렬로 씁니다. 직렬화(orjson)는 GIL을 잡고, 해시/압축/쓰기 구간이 겹쳐 실행됩니다.
+        """
+        if self.workers <= 1 or len(items) < PARALLEL_MIN_FILES:
+            return self._write_serial(items)
+
+        jobs = []
+        for path, data in items:
+            rel = self._rel(path)
+            jobs.append((rel, data, self.prev_digests.get(rel)))
+        prev_root = str(self.prev_root) if self.prev_root else None
+        chunks = [
+            (str(self.tmp_root), prev_root, self.precompress, jobs[i : i + _CHUNK_SIZE])
+            for i in range(0, len(jobs), _CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for chunk_results in pool.map(_bake_chunk, chunks):
+                self._record(chunk_results)
+        return len(jobs)
+
+    def _write_serial(self, items: list[tuple[Path, Any]]) -> int:
+        for path, data in items:
+            self.write(path, data)
+        return len(items)
+
+    def finalize(self) -> dict:
+        """manifest를 TMP 트리에 기록하고 통계를 반환합니다."""
+        self.tmp_root.mkdir(parents=True, exist_ok=True)
+        (self.tmp_root / MANIFEST_NAME).write_text(
+            json.dumps(self.digests, sort_keys=True)
+        )
+        logger.info(
+            f"[BakeWriter] {self.stats['written']}개 작성, "
+            f"{self.stats['reused']}개 재사용(hardlink)"
+        )
+        return dict(self.stats)
@@ -3,12 +3,12 @@ EOD JSON Baker (Step 5)
 
 Atomic Write 패턴 + 파일시스템 직접 서빙.
 
-1. TMP_DIR에 JSON 생성
+1. TMP_DIR에 JSON 생성 (BakeWriter: 내용 해시 동일 파일은 직전 OUTPUT에서 hardlink,
+   cards/stocks는 스레드 풀 분산, 선택적으로 .json.gz/.br 동반 생성)
 2. _atomic_swap(): OLD → 기존 OUTPUT, TMP → OUTPUT, OLD 삭제
 3. DB EODDashboardSnapshot upsert
 """
 
-import json
 import logging
 import shutil
 from datetime import date, datetime, timezone
@@ -18,6 +18,8 @@ from django.conf import settings
 from django.utils import timezone as dj_timezone
 
 from packages.shared.stocks.models import DailyPrice, EODDashboardSnapshot, PipelineLog
+from packages.shared.stocks.services.eod_bake_writer import BakeWriter
+from packages.shared.stocks.services.price_store import get_price_store
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +69,7 @@ class EODJSONBaker:
         self.TMP_DIR.mkdir(parents=True, exist_ok=True)
         (self.TMP_DIR / "cards").mkdir(exist_ok=True)
         (self.TMP_DIR / "stocks").mkdir(exist_ok=True)
+        self._writer = BakeWriter(self.TMP_DIR, self.OUTPUT_DIR)
 
         files_written = 0
 
@@ -108,6 +111,9 @@ class EODJSONBaker:
         self._write_json(self.TMP_DIR / "meta.json", meta_json)
         files_written += 1
 
+        # 내용 해시 manifest 기록 (다음 bake의 skip-unchanged 기준)
+        write_stats = self._writer.finalize()
+
         # Atomic swap
         self._atomic_swap()
 
@@ -117,10 +123,14 @@ class EODJSONBaker:
         )
 
         logger.info(
-            f"[EODJSONBaker] bake 완료: {files_written}개 파일, "
-            f"snapshot_id={snapshot.pk}"
+            f"[EODJSONBaker] bake 완료: {files_written}개 파일 "
+            f"(변경 없음 {write_stats['reused']}개), snapshot_id={snapshot.pk}"
         )
-        return {"files_written": files_written, "snapshot_id": snapshot.pk}
+        return {
+            "files_written": files_written,
+            "files_unchanged": write_stats["reused"],
+            "snapshot_id": snapshot.pk,
+        }
 
     def _build_dashboard_json(
         self,
@@ -259,6 +269,8 @@ class EODJSONBaker:
         """
         from collections import defaultdict
 
+        self._preload_company_names(signals_data)
+
         # 시그널별 종목 그룹핑
         signal_stocks: dict[str, list[dict]] = defaultdict(list)
         for item in signals_data:
@@ -359,7 +371,7 @@ class EODJSONBaker:
 
         news_ctx = item.get("news_context", {})
 
-        # Stock 모델에서 company_name 조회 (캐시)
+        # Stock 모델에서 company_name 조회 (캐시, 보통 _preload_company_names로 선적재)
         symbol = item.get("stock_id", "")
         if not hasattr(self, "_company_name_cache"):
             self._company_name_cache = {}
@@ -399,6 +411,25 @@ class EODJSONBaker:
             "chain_sight_cta": False,
         }
 
+    def _preload_company_names(self, signals_data: list[dict]) -> None:
+        """preview용 company_name을 1회 쿼리로 _company_name_cache에 적재합니다."""
+        from packages.shared.stocks.models import Stock
+
+        if not hasattr(self, "_company_name_cache"):
+            self._company_name_cache = {}
+        missing = {
+            item["stock_id"]
+            for item in signals_data
+            if item.get("stock_id") and item["stock_id"] not in self._company_name_cache
+        }
+        if not missing:
+            return
+        names = dict(
+            Stock.objects.filter(symbol__in=missing).values_list("symbol", "stock_name")
+        )
+        for symbol in missing:
+            self._company_name_cache[symbol] = names.get(symbol) or ""
+
     def _preload_mini_charts(self, signals_data: list[dict], target_date: date):
         """
         preview_stocks에 포함될 종목의 최근 20일 종가를 bulk 로드하여
@@ -412,30 +443,53 @@ class EODJSONBaker:
 
         start_date = target_date - timedelta(days=40)  # 20거래일 확보
 
-        rows = list(
+        # symbol별 종가 배열 생성 (최근 20개만 유지)
+        chart_map: dict[str, list[float]] = {
+            sym: [close for _, close, _ in bars[-20:]]
+            for sym, bars in self._load_price_history(
+                symbols, start_date, target_date
+            ).items()
+        }
+
+        # signals_data에 주입
+        for item in signals_data:
+            item["_mini_chart_20d"] = chart_map.get(item["stock_id"], [])
+
+    def _load_price_history(
+        self, symbols: list[str], start_date: date, end_date: date
+    ) -> dict[str, list[tuple[date, float, int]]]:
+        """
+        symbol별 (date, close, volume) 오름차순 목록.
+        컬럼형 PriceHistoryStore가 end_date까지 적재돼 있으면 mmap 행렬에서,
+        아니면 DailyPrice bulk 쿼리에서 읽습니다.
+        """
+        history: dict[str, list[tuple[date, float, int]]] = {}
+
+        store = get_price_store()
+        if store is not None and store.covers(end_date):
+            m = store.read(symbols, start_date, end_date, fields=("close", "volume"))
+            valid = m.valid
+            for i, sym in enumerate(m.symbols):
+                cols = valid[i].nonzero()[0]
+                if len(cols):
+                    history[sym] = [
+                        (m.dates[j], float(m["close"][i, j]), int(m["volume"][i, j]))
+                        for j in cols
+                    ]
+            return history
+
+        rows = (
             DailyPrice.objects.filter(
                 stock__symbol__in=symbols,
                 date__gte=start_date,
-                date__lte=target_date,
+                date__lte=end_date,
             )
-            .values_list("stock__symbol", "date", "close_price")
+            .values_list("stock__symbol", "date", "close_price", "volume")
             .order_by("stock__symbol", "date")
         )
-
-        # symbol별 종가 배열 생성
-        chart_map: dict[str, list[float]] = {}
-        for sym, dt, close in rows:
-            if sym not in chart_map:
-                chart_map[sym] = []
-            chart_map[sym].append(float(close))
-
-        # 최근 20개만 유지
-        for sym in chart_map:
-            chart_map[sym] = chart_map[sym][-20:]
-
-        # signals_data에 주입
-        for item in signals_data:
-            item["_mini_chart_20d"] = chart_map.get(item["stock_id"], [])
+        for sym, dt, close, vol in rows:
+            history.setdefault(sym, []).append((dt, float(close), int(vol)))
+        return history
 
     def _get_sector_distribution(self, stocks: list[dict]) -> list[str]:
         """섹터별 종목 수 상위 10개의 섹터명을 반환합니다."""
@@ -459,49 +513,40 @@ class EODJSONBaker:
             for sig in item.get("signals", []):
                 signal_stocks[sig["id"]].append(item)
 
-        files_written = 0
+        self._preload_company_names(signals_data)
+
+        files = []
         for sig_id, stocks in signal_stocks.items():
             if not stocks:
                 continue
 
-            sorted_by_score = sorted(
-                stocks, key=lambda x: self._get_signal_value(x, sig_id), reverse=True
-            )
-            sorted_by_volume = sorted(
-                stocks, key=lambda x: x.get("volume", 0), reverse=True
-            )
-            sorted_by_return = sorted(
-                stocks, key=lambda x: abs(x.get("change_pct", 0.0)), reverse=True
-            )
-            sorted_by_market_cap = sorted(
-                stocks, key=lambda x: x.get("market_cap") or 0, reverse=True
-            )
+            # preview dict는 종목당 1회 생성, 4개 정렬은 인덱스 순서만 계산
+            previews = [self._build_preview_stock(s, sig_id) for s in stocks]
+            scores = [self._get_signal_value(s, sig_id) for s in stocks]
+
+            def ordered(key) -> list[dict]:
+                order = sorted(range(len(stocks)), key=key, reverse=True)
+                return [previews[i] for i in order]
 
             card_data = {
                 "signal_id": sig_id,
                 "category": SIGNAL_CATEGORIES.get(sig_id, "technical"),
                 "title": SIGNAL_METADATA.get(sig_id, {}).get("title", sig_id),
                 "total_count": len(stocks),
-                "stocks_by_score": [
-                    self._build_preview_stock(s, sig_id) for s in sorted_by_score
-                ],
-                "stocks_by_volume": [
-                    self._build_preview_stock(s, sig_id) for s in sorted_by_volume
-                ],
-                "stocks_by_return": [
-                    self._build_preview_stock(s, sig_id) for s in sorted_by_return
-                ],
-                "stocks_by_market_cap": [
-                    self._build_preview_stock(s, sig_id) for s in sorted_by_market_cap
-                ],
+                "stocks_by_score": ordered(lambda i: scores[i]),
+                "stocks_by_volume": ordered(lambda i: stocks[i].get("volume", 0)),
+                "stocks_by_return": ordered(
+                    lambda i: abs(stocks[i].get("change_pct", 0.0))
+                ),
+                "stocks_by_market_cap": ordered(
+                    lambda i: stocks[i].get("market_cap") or 0
+                ),
                 "sector_distribution": self._get_sector_distribution(stocks),
                 "market_summary": market_summary,
             }
+            files.append((self.TMP_DIR / "cards" / f"{sig_id}.json", card_data))
 
-            self._write_json(self.TMP_DIR / "cards" / f"{sig_id}.json", card_data)
-            files_written += 1
-
-        return files_written
+        return self._write_json_many(files)
 
     def _build_stock_jsons(self, signals_data: list[dict], target_date: date) -> int:
         """
@@ -510,7 +555,6 @@ class EODJSONBaker:
         Returns:
             생성된 파일 수
         """
-        files_written = 0
         symbols = [item["stock_id"] for item in signals_data]
 
         # 60일 히스토리 bulk 로드
@@ -520,32 +564,18 @@ class EODJSONBaker:
             days=90
         )  # 60 거래일 확보를 위해 90일 조회
 
-        history_qs = list(
-            DailyPrice.objects.filter(
-                stock__symbol__in=symbols,
-                date__gte=history_start,
-                date__lte=target_date,
-            )
-            .values_list("stock__symbol", "date", "close_price", "volume")
-            .order_by("stock__symbol", "date")
-        )
-
-        # symbol별 그룹핑
-        history_map: dict[str, list] = {}
-        for sym, dt, close, vol in history_qs:
-            if sym not in history_map:
-                history_map[sym] = []
-            history_map[sym].append(
-                {
-                    "date": str(dt),
-                    "close": float(close),
-                    "volume": int(vol),
-                }
-            )
-        # 최근 60일만 유지
-        for sym in history_map:
-            history_map[sym] = history_map[sym][-60:]
+        # symbol별 그룹핑 (최근 60일만 유지)
+        history_map: dict[str, list] = {
+            sym: [
+                {"date": str(dt), "close": close, "volume": vol}
+                for dt, close, vol in bars[-60:]
+            ]
+            for sym, bars in self._load_price_history(
+                symbols, history_start, target_date
+            ).items()
+        }
 
+        files = []
         for item in signals_data:
             symbol = item["stock_id"]
             mini_chart = self._get_mini_chart_data_from_history(symbol, history_map)
@@ -571,10 +601,9 @@ class EODJSONBaker:
                 "mini_chart": mini_chart,
             }
 
-            self._write_json(self.TMP_DIR / "stocks" / f"{symbol}.json", stock_data)
-            files_written += 1
+            files.append((self.TMP_DIR / "stocks" / f"{symbol}.json", stock_data))
 
-        return files_written
+        return self._write_json_many(files)
 
     def _build_meta_json(self, target_date: date, pipeline_log: "PipelineLog") -> dict:
         """meta.json 생성."""
@@ -640,11 +669,20 @@ class EODJSONBaker:
         history = history_map.get(symbol, [])
         return [row["close"] for row in history[-20:]]
 
+    def _get_writer(self) -> BakeWriter:
+        """bake() 밖에서 개별 빌드 메서드를 호출한 경우에도 writer를 준비합니다."""
+        writer = getattr(self, "_writer", None)
+        if writer is None or writer.tmp_root != self.TMP_DIR:
+            writer = self._writer = BakeWriter(self.TMP_DIR, self.OUTPUT_DIR)
+        return writer
+
     def _write_json(self, path: Path, data: dict) -> None:
-        """JSON 파일을 안전하게 씁니다."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, default=str)
+        """JSON 파일을 씁니다 (내용이 직전 bake와 같으면 hardlink)."""
+        self._get_writer().write(path, data)
+
+    def _write_json_many(self, files: list[tuple[Path, dict]]) -> int:
+        """여러 JSON 파일을 씁니다 (EOD_BAKE_WORKERS > 1이면 스레드 풀). 파일 수 반환."""
+        return self._get_writer().write_many(files)
 
     def _upsert_snapshot(
         self,
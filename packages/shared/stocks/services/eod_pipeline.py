@@ -5,7 +5,7 @@ EOD Pipeline (Step 6)
 
 Stage 1  Ingest     DailyPrice에서 S&P500 데이터 로드 + 품질 체크
 Stage 2  Filter     volume >= 100K, dollar_volume >= $500K
-Stage 3  Calculate  EODSignalCalculator.calculate_batch()
+Stage 3  Calculate  EODSignalCalculator.calculate_batch() (EODRollingState 증분)
 Stage 4  Tag        EODSignalTagger.tag_signals()
 Stage 5  Enrich     EODNewsEnricher.enrich()
 Stage 6  DB Upsert  bulk_create(update_conflicts=True)
@@ -17,10 +17,11 @@ Health              signal_count > 0 확인
 import logging
 import time
 import uuid
-from datetime import date, timedelta
+from datetime import date
 from decimal import Decimal
 
 import pandas as pd
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone as dj_timezone
 
@@ -28,7 +29,6 @@ from packages.shared.stocks.models import (
     DailyPrice,
     EODSignal,
     PipelineLog,
-    SignalAccuracy,
     SP500Constituent,
     Stock,
 )
@@ -36,6 +36,9 @@ from packages.shared.stocks.services.eod_json_baker import EODJSONBaker
 from packages.shared.stocks.services.eod_news_enricher import EODNewsEnricher
 from packages.shared.stocks.services.eod_signal_calculator import EODSignalCalculator
 from packages.shared.stocks.services.eod_signal_tagger import EODSignalTagger
+from packages.shared.stocks.services.signal_accuracy_backfill import (
+    backfill_signal_accuracy,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +125,10 @@ class EODPipeline:
             # ── Stage 3: Calculate ────────────────────────────────────
             stage3_start = time.perf_counter()
             calculator = EODSignalCalculator()
-            signals_df = calculator.calculate_batch(target_date)
+            signals_df = calculator.calculate_batch(
+                target_date,
+                use_rolling_state=settings.EOD_ROLLING_STATE_ENABLED,
+            )
             stage3_elapsed = time.perf_counter() - stage3_start
             signals_count = len(signals_df) if not signals_df.empty else 0
             log.stages["calculate"] = {
@@ -416,112 +422,12 @@ class EODPipeline:
         """
         Stage 8: SignalAccuracy 소급 업데이트.
 
-        이전 시그널에 대해 1d/5d/20d 수익률을 계산하여 업데이트합니다.
+        미충족 1d/5d/20d 수익률 전체를 집합 기반으로 계산해 bulk_update합니다.
+        (대기 행 1회 + 종가 1회 조회, 배치 한도 없음 — signal_accuracy_backfill 참조)
         이미 채워진 항목은 건너뜁니다.
         """
-        updated_count = 0
-
-        # 수익률 업데이트가 필요한 SignalAccuracy 조회
-        # - return_1d is None AND signal_date가 1일 이상 전
-        # - return_5d is None AND signal_date가 5일 이상 전
-        # - return_20d is None AND signal_date가 20일 이상 전
-
-        lookback_configs = [
-            ("return_1d", "excess_1d", 1),
-            ("return_5d", "excess_5d", 5),
-            ("return_20d", "excess_20d", 20),
-        ]
-
-        for return_field, excess_field, days in lookback_configs:
-            cutoff = target_date - timedelta(days=days)
-            pending = SignalAccuracy.objects.filter(
-                **{f"{return_field}__isnull": True},
-                signal_date__lte=cutoff,
-            ).select_related("stock")[:500]  # 배치 한도
-
-            for accuracy in pending:
-                try:
-                    # 시그널 당일 종가
-                    signal_price_qs = (
-                        DailyPrice.objects.filter(
-                            stock=accuracy.stock,
-                            date=accuracy.signal_date,
-                        )
-                        .values_list("close_price", flat=True)
-                        .first()
-                    )
-
-                    if signal_price_qs is None:
-                        continue
-
-                    signal_price = float(signal_price_qs)
-                    if signal_price == 0:
-                        continue
-
-                    # target_date (현재일) 종가
-                    current_price_qs = (
-                        DailyPrice.objects.filter(
-                            stock=accuracy.stock,
-                            date__lte=target_date,
-                            date__gte=accuracy.signal_date + timedelta(days=days - 1),
-                        )
-                        .order_by("date")
-                        .values_list("close_price", flat=True)
-                        .first()
-                    )
-
-                    if current_price_qs is None:
-                        continue
-
-                    current_price = float(current_price_qs)
-                    stock_return = (current_price - signal_price) / signal_price * 100
-
-                    # SPY 수익률 (초과 수익률 계산)
-                    spy_signal = (
-                        DailyPrice.objects.filter(
-                            stock__symbol="SPY",
-                            date=accuracy.signal_date,
-                        )
-                        .values_list("close_price", flat=True)
-                        .first()
-                    )
-                    spy_current = (
-                        DailyPrice.objects.filter(
-                            stock__symbol="SPY",
-                            date__lte=target_date,
-                            date__gte=accuracy.signal_date + timedelta(days=days - 1),
-                        )
-                        .order_by("date")
-                        .values_list("close_price", flat=True)
-                        .first()
-                    )
-
-                    excess = None
-                    if spy_signal and spy_current:
-                        spy_return = (
-                            (float(spy_current) - float(spy_signal))
-                            / float(spy_signal)
-                            * 100
-                        )
-                        excess = stock_return - spy_return
-
-                    setattr(accuracy, return_field, round(stock_return, 4))
-                    setattr(
-                        accuracy,
-                        excess_field,
-                        round(excess, 4) if excess is not None else None,
-                    )
-                    accuracy.save(update_fields=[return_field, excess_field])
-                    updated_count += 1
-
-                except Exception as e:
-                    logger.warning(
-                        f"[EODPipeline] Accuracy backfill 실패: "
-                        f"{accuracy.stock_id} {accuracy.signal_date} {return_field}: {e}"
-                    )
-                    continue
-
-        return updated_count
+        stats = backfill_signal_accuracy(target_date)
+        return stats["total"]
 
     def _build_market_summary(
         self,
@@ -0,0 +1,413 @@
+"""
+EOD Rolling State Engine (Step 2 증분 모드)
+
+EODSignalCalculator의 롤링 지표를 종목별 영속 상태(EODRollingState)에서
+거래일마다 1봉씩 전진시켜 계산합니다.
+
+- 정상 경로: 상태 로드(종목 수 행) + as_of 이후 DailyPrice만 로드 → O(symbols)
+- 재구축 경로: 상태 없음 / 버전 불일치 / 공백 과다 / as_of 종가 불일치(분할·정정)
+  / 과거 날짜 재계산 → 해당 종목만 365일 로드 후 버퍼 재생성
+- 산식은 EODSignalCalculator._calculate_indicators(pandas rolling)와 동일하며
+  verify_equivalence()로 전체 경로 대비 동치성을 점검합니다.
+"""
+
+import logging
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from django.db.models import Q
+
+from packages.shared.stocks.models import DailyPrice, EODRollingState
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+BUFFER_BARS = 252  # 52주 최고가 창 = 필요한 최장 버퍼
+LOOKBACK_DAYS = 365  # 전체 경로(_load_price_data)와 동일한 달력일 창
+MAX_GAP_DAYS = 10  # as_of → target_date 허용 공백 (초과 시 재구축)
+
+# 증분 엔진이 생성하는 롤링 지표 컬럼 (동치성 점검 대상)
+ROLLING_COLUMNS = [
+    "prev_close",
+    "avg_vol_20d",
+    "sma_50",
+    "sma_200",
+    "prev_sma_50",
+    "prev_sma_200",
+    "avg_gain_14",
+    "avg_loss_14",
+    "rsi_14",
+    "high_52w",
+    "consecutive_up",
+    "consecutive_down",
+]
+
+_BAR_COLUMNS = ["symbol", "date", "open", "high", "low", "close", "volume"]
+
+
+def _empty_buffer() -> dict:
+    return {
+        "dates": [],
+        "close": [],
+        "high": [],
+        "volume": [],
+        "consecutive_up": 0,
+        "consecutive_down": 0,
+    }
+
+
+def _append_bar(buf: dict, bar_date: date, close: float, high: float, volume: float):
+    """버퍼에 1봉 추가 + 연속 상승/하락 카운터 전진 (_count_consecutive와 동일 규칙)."""
+    prev_close = buf["close"][-1] if buf["close"] else None
+    up = prev_close is not None and close > prev_close
+    down = prev_close is not None and close < prev_close
+    buf["consecutive_up"] = buf["consecutive_up"] + 1 if up else 0
+    buf["consecutive_down"] = buf["consecutive_down"] + 1 if down else 0
+
+    buf["dates"].append(bar_date.toordinal())
+    buf["close"].append(close)
+    buf["high"].append(high)
+    buf["volume"].append(volume)
+
+
+def _trim(buf: dict, target_date: date):
+    """365일 창 밖 봉 제거 + 최근 BUFFER_BARS봉만 유지."""
+    cutoff = (target_date - timedelta(days=LOOKBACK_DAYS)).toordinal()
+    start = 0
+    dates = buf["dates"]
+    while start < len(dates) and dates[start] < cutoff:
+        start += 1
+    start = max(start, len(dates) - BUFFER_BARS)
+    if start > 0:
+        for key in ("dates", "close", "high", "volume"):
+            buf[key] = buf[key][start:]
+
+
+def _window_mean(m: np.ndarray, length: int, min_periods: int, end: int = 0):
+    """우측 정렬 행렬의 마지막 length 열(end만큼 좌측 이동) 평균. 유효 개수 미달 시 NaN."""
+    width = m.shape[1]
+    win = m[:, width - length - end : width - end]
+    valid = ~np.isnan(win)
+    count = valid.sum(axis=1)
+    total = np.where(valid, win, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    return np.where(count >= min_periods, mean, np.nan)
+
+
+class EODRollingStateEngine:
+    """
+    종목별 롤링 상태를 전진/재구축하고 target_date 행의 롤링 지표를 계산합니다.
+
+    compute() 결과는 target_date 봉이 있는 종목만 포함하며,
+    컬럼은 symbol/date/OHLCV + ROLLING_COLUMNS + up/down 입니다.
+    """
+
+    def __init__(self, max_gap_days: int = MAX_GAP_DAYS):
+        self.max_gap_days = max_gap_days
+
+    def compute(
+        self, symbols: list[str], target_date: date, persist: bool = True
+    ) -> tuple[pd.DataFrame, dict]:
+        """
+        Args:
+            symbols: 계산 대상 종목
+            target_date: 계산 기준일
+            persist: 전진한 상태를 EODRollingState에 저장할지 여부
+
+        Returns:
+            (지표 DataFrame, {"incremental", "rebuilt", "stale", "persisted"} 건수)
+        """
+        states = {
+            s.stock_id: s
+            for s in EODRollingState.objects.filter(stock_id__in=symbols)
+        }
+
+        incremental = {}
+        for symbol, state in states.items():
+            if self._is_reusable(state, target_date):
+                incremental[symbol] = state
+
+        buffers, today_bars, stale = self._advance(incremental, target_date)
+        advanced = len(buffers)
+        rebuild_symbols = [s for s in symbols if s not in buffers]
+        if rebuild_symbols:
+            rebuilt, rebuilt_bars = self._rebuild(rebuild_symbols, target_date)
+            buffers.update(rebuilt)
+            today_bars.update(rebuilt_bars)
+
+        persisted = 0
+        if persist:
+            persisted = self._persist(buffers, states, target_date)
+
+        stats = {
+            "incremental": advanced,
+            "rebuilt": len(rebuild_symbols),
+            "stale": len(stale),
+            "persisted": persisted,
+        }
+        logger.info(
+            f"[EODRollingState] {target_date}: 증분 {stats['incremental']}종목, "
+            f"재구축 {stats['rebuilt']}종목, 저장 {persisted}종목"
+        )
+        return self._indicator_frame(buffers, today_bars, target_date), stats
+
+    def _is_reusable(self, state: EODRollingState, target_date: date) -> bool:
+        if state.version != STATE_VERSION or not state.buffers.get("dates"):
+            return False
+        if state.as_of > target_date:
+            return False  # 과거 날짜 재계산 → 재구축 (상태는 되돌리지 않음)
+        return (target_date - state.as_of).days <= self.max_gap_days
+
+    def _advance(
+        self, states: dict[str, EODRollingState], target_date: date
+    ) -> tuple[dict, dict, list[str]]:
+        """as_of 이후 봉만 로드해 버퍼를 전진. as_of 종가 불일치 종목은 stale로 반환."""
+        if not states:
+            return {}, {}, []
+
+        # as_of별로 묶어 단일 쿼리 (보통 전 종목 동일 as_of)
+        by_as_of: dict[date, list[str]] = {}
+        for symbol, state in states.items():
+            by_as_of.setdefault(state.as_of, []).append(symbol)
+        cond = Q()
+        for as_of, group in by_as_of.items():
+            cond |= Q(stock__symbol__in=group, date__gte=as_of)
+
+        rows = (
+            DailyPrice.objects.filter(cond, date__lte=target_date)
+            .order_by("stock__symbol", "date")
+            .values_list(
+                "stock__symbol",
+                "date",
+                "open_price",
+                "high_price",
+                "low_price",
+                "close_price",
+                "volume",
+            )
+        )
+
+        buffers = {}
+        today_bars = {}
+        stale = set()
+        for symbol, d, o, h, low, c, v in rows:
+            if symbol in stale:
+                continue
+            state = states[symbol]
+            if symbol not in buffers:
+                buffers[symbol] = {
+                    **{k: list(v) for k, v in state.buffers.items()},
+                    "consecutive_up": state.consecutive_up,
+                    "consecutive_down": state.consecutive_down,
+                }
+            buf = buffers[symbol]
+            if d == state.as_of:
+                # 분할 소급 조정·데이터 정정 감지: 저장된 마지막 종가와 비교
+                if not np.isclose(buf["close"][-1], float(c), rtol=1e-9, atol=1e-6):
+                    stale.add(symbol)
+            else:
+                _append_bar(buf, d, float(c), float(h), float(v))
+            if d == target_date:
+                today_bars[symbol] = (o, h, low, c, v)
+
+        # as_of 봉 자체가 사라진 종목도 재구축 대상
+        stale.update(s for s in states if s not in buffers)
+        for symbol in stale:
+            buffers.pop(symbol, None)
+            today_bars.pop(symbol, None)
+        for buf in buffers.values():
+            _trim(buf, target_date)
+        return buffers, today_bars, sorted(stale)
+
+    def _rebuild(
+        self, symbols: list[str], target_date: date
+    ) -> tuple[dict, dict]:
+        """365일 DailyPrice로 버퍼를 처음부터 재생성."""
+        rows = (
+            DailyPrice.objects.filter(
+                stock__symbol__in=symbols,
+                date__gte=target_date - timedelta(days=LOOKBACK_DAYS),
+                date__lte=target_date,
+            )
+            .order_by("stock__symbol", "date")
+            .values_list(
+                "stock__symbol",
+                "date",
+                "open_price",
+                "high_price",
+                "low_price",
+                "close_price",
+                "volume",
+            )
+        )
+
+        buffers = {}
+        today_bars = {}
+        for symbol, d, o, h, low, c, v in rows:
+            buf = buffers.setdefault(symbol, _empty_buffer())
+            _append_bar(buf, d, float(c), float(h), float(v))
+            if d == target_date:
+                today_bars[symbol] = (o, h, low, c, v)
+        for buf in buffers.values():
+            _trim(buf, target_date)
+        return buffers, today_bars
+
+    def _persist(
+        self,
+        buffers: dict,
+        states: dict[str, EODRollingState],
+        target_date: date,
+    ) -> int:
+        """전진한 버퍼를 bulk upsert. 더 최신 상태를 과거 날짜로 덮어쓰지 않음."""
+        records = []
+        for symbol, buf in buffers.items():
+            if not buf["dates"]:
+                continue
+            as_of = date.fromordinal(buf["dates"][-1])
+            existing = states.get(symbol)
+            if existing is not None and existing.as_of > as_of:
+                continue
+            records.append(
+                EODRollingState(
+                    stock_id=symbol,
+                    as_of=as_of,
+                    version=STATE_VERSION,
+                    buffers={k: buf[k] for k in ("dates", "close", "high", "volume")},
+                    consecutive_up=buf["consecutive_up"],
+                    consecutive_down=buf["consecutive_down"],
+                )
+            )
+
+        if not records:
+            return 0
+
+        with transaction.atomic():
+            EODRollingState.objects.bulk_create(
+                records,
+                update_conflicts=True,
+                unique_fields=["stock"],
+                update_fields=[
+                    "as_of",
+                    "version",
+                    "buffers",
+                    "consecutive_up",
+                    "consecutive_down",
+                    "updated_at",
+                ],
+            )
+        return len(records)
+
+    def _indicator_frame(
+        self, buffers: dict, today_bars: dict, target_date: date
+    ) -> pd.DataFrame:
+        """
+        target_date 봉이 있는 종목의 버퍼를 우측 정렬 행렬로 쌓아 지표를 한 번에 계산.
+        창 길이/min_periods는 _calculate_indicators의 rolling 설정과 동일.
+        """
+        target_ord = target_date.toordinal()
+        symbols = sorted(
+            s
+            for s, buf in buffers.items()
+            if s in today_bars and buf["dates"] and buf["dates"][-1] == target_ord
+        )
+        if not symbols:
+            return pd.DataFrame(columns=_BAR_COLUMNS + ROLLING_COLUMNS)
+
+        n, width = len(symbols), BUFFER_BARS
+        close = np.full((n, width), np.nan)
+        high = np.full((n, width), np.nan)
+        volume = np.full((n, width), np.nan)
+        consecutive_up = np.zeros(n, dtype=int)
+        consecutive_down = np.zeros(n, dtype=int)
+        for i, symbol in enumerate(symbols):
+            buf = buffers[symbol]
+            k = len(buf["close"])
+            close[i, width - k :] = buf["close"]
+            high[i, width - k :] = buf["high"]
+            volume[i, width - k :] = buf["volume"]
+            consecutive_up[i] = buf["consecutive_up"]
+            consecutive_down[i] = buf["consecutive_down"]
+
+        bars = np.array(
+            [[float(x) for x in today_bars[s]] for s in symbols], dtype=float
+        )
+        df = pd.DataFrame(
+            {
+                "symbol": symbols,
+                "date": target_date,
+                "open": bars[:, 0],
+                "high": bars[:, 1],
+                "low": bars[:, 2],
+                "close": bars[:, 3],
+                "volume": bars[:, 4],
+            }
+        )
+
+        df["prev_close"] = close[:, -2]
+        df["avg_vol_20d"] = _window_mean(volume, 20, 10)
+        df["sma_50"] = _window_mean(close, 50, 40)
+        df["sma_200"] = _window_mean(close, 200, 150)
+        df["prev_sma_50"] = _window_mean(close, 50, 40, end=1)
+        df["prev_sma_200"] = _window_mean(close, 200, 150, end=1)
+
+        delta = np.diff(close[:, -15:], axis=1)
+        df["avg_gain_14"] = _window_mean(np.clip(delta, 0, None), 14, 14)
+        df["avg_loss_14"] = _window_mean(np.clip(-delta, 0, None), 14, 14)
+        rs = df["avg_gain_14"] / df["avg_loss_14"].replace(0, np.nan)
+        df["rsi_14"] = 100 - (100 / (1 + rs))
+
+        high_count = (~np.isnan(high)).sum(axis=1)
+        df["high_52w"] = np.where(
+            high_count >= 200, np.fmax.reduce(high, axis=1), np.nan
+        )
+
+        df["up"] = (df["close"] > df["prev_close"]).astype(int)
+        df["down"] = (df["close"] < df["prev_close"]).astype(int)
+        df["consecutive_up"] = consecutive_up
+        df["consecutive_down"] = consecutive_down
+        return df
+
+
+def verify_equivalence(
+    calculator, target_date: date, rtol: float = 1e-9, atol: float = 1e-6
+) -> dict:
+    """
+    증분 엔진 결과를 기존 pandas 전체 경로와 비교합니다 (상태는 저장하지 않음).
+
+    Returns:
+        {"symbols": int, "missing": [...], "mismatches": {col: [symbol, ...]},
+         "max_abs_diff": {col: float}}
+    """
+    full_df = calculator._load_price_data(target_date)
+    if full_df.empty:
+        return {"symbols": 0, "missing": [], "mismatches": {}, "max_abs_diff": {}}
+
+    full = calculator._calculate_indicators(full_df)
+    full = full[full["date"] == target_date].set_index("symbol")
+
+    symbols = sorted(full_df["symbol"].unique().tolist())
+    rolling, _ = EODRollingStateEngine().compute(symbols, target_date, persist=False)
+    rolling = rolling.set_index("symbol")
+
+    common = full.index.intersection(rolling.index)
+    missing = sorted(set(full.index) ^ set(rolling.index))
+    mismatches = {}
+    max_abs_diff = {}
+    for col in ROLLING_COLUMNS:
+        a = full.loc[common, col].astype(float).to_numpy()
+        b = rolling.loc[common, col].astype(float).to_numpy()
+        ok = np.isclose(a, b, rtol=rtol, atol=atol, equal_nan=True)
+        diff = np.abs(a - b)
+        max_abs_diff[col] = float(np.nanmax(diff)) if np.any(~np.isnan(diff)) else 0.0
+        if not ok.all():
+            mismatches[col] = sorted(common[~ok].tolist())
+
+    return {
+        "symbols": len(common),
+        "missing": missing,
+        "mismatches": mismatches,
+        "max_abs_diff": max_abs_diff,
+    }
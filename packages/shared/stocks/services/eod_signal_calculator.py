@@ -20,6 +20,7 @@ import numpy as np
 import pandas as pd
 
 from packages.shared.stocks.models import DailyPrice, SP500Constituent, Stock
+from packages.shared.stocks.services.price_store import get_price_store
 
 logger = logging.getLogger(__name__)
 
@@ -79,17 +80,24 @@ class EODSignalCalculator:
         self.thresholds = THRESHOLDS
 
     @profile_stage
-    def calculate_batch(self, target_date: date) -> pd.DataFrame:
+    def calculate_batch(
+        self, target_date: date, use_rolling_state: bool = False
+    ) -> pd.DataFrame:
         """
         S&P 500 전 종목의 250일 DailyPrice → DataFrame → 벡터 연산 → 시그널 DataFrame 반환.
 
         Args:
             target_date: 시그널 계산 대상 날짜
+            use_rolling_state: True면 EODRollingState 증분 엔진으로 롤링 지표 계산
+                (365일 재로드 없이 as_of 이후 봉만 로드)
 
         Returns:
             target_date 행만 포함한 DataFrame (시그널 컬럼 포함)
         """
-        df = self._load_price_data(target_date)
+        if use_rolling_state:
+            df = self._load_rolling_indicators(target_date)
+        else:
+            df = self._load_price_data(target_date)
         if df.empty:
             logger.warning(f"[EODSignalCalculator] {target_date} 가격 데이터 없음")
             return pd.DataFrame()
@@ -99,30 +107,20 @@ class EODSignalCalculator:
             f"[EODSignalCalculator] VIX regime: {regime} (target_date={target_date})"
         )
 
-        df = self._calculate_indicators(df)
+        if not use_rolling_state:
+            df = self._calculate_indicators(df)
         result = self._detect_signals(df, regime, target_date)
         return result
 
-    def _load_price_data(self, target_date: date) -> pd.DataFrame:
-        """
-        S&P500 종목의 250일 DailyPrice 데이터를 bulk 로드하여 long format DataFrame으로 반환.
-
-        Columns: symbol, date, open, high, low, close, volume, sector, industry
-        """
-        symbols = list(
+    def _get_active_symbols(self) -> list[str]:
+        return list(
             SP500Constituent.objects.filter(is_active=True).values_list(
                 "symbol", flat=True
             )
         )
-        if not symbols:
-            logger.warning("[EODSignalCalculator] 활성 S&P500 종목 없음")
-            return pd.DataFrame()
-
-        start_date = target_date - timedelta(
-            days=365
-        )  # 252 거래일 확보를 위해 365일 조회
 
-        # sector/industry/market_cap 매핑
+    def _attach_stock_meta(self, df: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+        """sector / industry / market_cap 매핑 컬럼 추가."""
         stock_meta = Stock.objects.filter(symbol__in=symbols).values(
             "symbol", "sector", "industry", "market_capitalization"
         )
@@ -135,39 +133,86 @@ class EODSignalCalculator:
             for row in stock_meta
         }
 
-        rows = list(
-            DailyPrice.objects.filter(
-                stock__symbol__in=symbols,
-                date__gte=start_date,
-                date__lte=target_date,
-            ).values_list(
-                "stock__symbol",
-                "date",
-                "open_price",
-                "high_price",
-                "low_price",
-                "close_price",
-                "volume",
-            )
+        df["sector"] = df["symbol"].map(sector_map).fillna("")
+        df["industry"] = df["symbol"].map(industry_map).fillna("")
+        df["market_cap"] = df["symbol"].map(market_cap_map)
+        return df
+
+    def _load_rolling_indicators(self, target_date: date) -> pd.DataFrame:
+        """
+        EODRollingStateEngine으로 target_date 행의 롤링 지표를 계산하고
+        봉 단위 지표(_calculate_bar_features)까지 채운 DataFrame을 반환.
+        """
+        from packages.shared.stocks.services.eod_rolling_state import (
+            EODRollingStateEngine,
         )
 
-        if not rows:
+        symbols = self._get_active_symbols()
+        if not symbols:
+            logger.warning("[EODSignalCalculator] 활성 S&P500 종목 없음")
+            return pd.DataFrame()
+
+        df, _ = EODRollingStateEngine().compute(symbols, target_date)
+        if df.empty:
             return pd.DataFrame()
 
-        df = pd.DataFrame(
-            rows, columns=["symbol", "date", "open", "high", "low", "close", "volume"]
-        )
+        df = self._attach_stock_meta(df, symbols)
+        return self._calculate_bar_features(df)
+
+    def _load_price_data(self, target_date: date) -> pd.DataFrame:
+        """
+        S&P500 종목의 250일 DailyPrice 데이터를 bulk 로드하여 long format DataFrame으로 반환.
 
-        # Decimal → float 변환
-        for col in ["open", "high", "low", "close"]:
-            df[col] = df[col].astype(float)
-        df["volume"] = df["volume"].astype(float)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        Columns: symbol, date, open, high, low, close, volume, sector, industry
+        """
+        symbols = self._get_active_symbols()
+        if not symbols:
+            logger.warning("[EODSignalCalculator] 활성 S&P500 종목 없음")
+            return pd.DataFrame()
+
+        start_date = target_date - timedelta(
+            days=365
+        )  # 252 거래일 확보를 위해 365일 조회
+
+        store = get_price_store()
+        if store is not None and store.covers(target_date):
+            # 컬럼형 캐시: ORM 행 materialize / Decimal 변환 없이 정렬 행렬에서 전개
+            df = store.read(symbols, start_date, target_date).to_frame()
+            if df.empty:
+                return pd.DataFrame()
+        else:
+            rows = list(
+                DailyPrice.objects.filter(
+                    stock__symbol__in=symbols,
+                    date__gte=start_date,
+                    date__lte=target_date,
+                ).values_list(
+                    "stock__symbol",
+                    "date",
+                    "open_price",
+                    "high_price",
+                    "low_price",
+                    "close_price",
+                    "volume",
+                )
+            )
+
+            if not rows:
+                return pd.DataFrame()
+
+            df = pd.DataFrame(
+                rows,
+                columns=["symbol", "date", "open", "high", "low", "close", "volume"],
+            )
+
+            # Decimal → float 변환
+            for col in ["open", "high", "low", "close"]:
+                df[col] = df[col].astype(float)
+            df["volume"] = df["volume"].astype(float)
+            df["date"] = pd.to_datetime(df["date"]).dt.date
 
         # sector / industry / market_cap 매핑
-        df["sector"] = df["symbol"].map(sector_map).fillna("")
-        df["industry"] = df["symbol"].map(industry_map).fillna("")
-        df["market_cap"] = df["symbol"].map(market_cap_map)
+        df = self._attach_stock_meta(df, symbols)
 
         logger.info(
             f"[EODSignalCalculator] 로드 완료: {len(df)}행, {df['symbol'].nunique()}종목"
@@ -198,16 +243,11 @@ class EODSignalCalculator:
 
         # ── 기본 지표 ──────────────────────────────────────────────
         df["prev_close"] = g["close"].shift(1)
-        df["change_pct"] = (
-            (df["close"] - df["prev_close"]) / df["prev_close"].replace(0, np.nan) * 100
-        )
 
         # 20일 평균 거래량 (min_periods=10)
         df["avg_vol_20d"] = g["volume"].transform(
             lambda x: x.rolling(20, min_periods=10).mean()
         )
-        # avg_vol_20d == 0 이면 NaN 처리
-        df["vol_ratio"] = df["volume"] / df["avg_vol_20d"].replace(0, np.nan)
 
         # ── SMA ────────────────────────────────────────────────────
         df["sma_50"] = g["close"].transform(
@@ -253,6 +293,19 @@ class EODSignalCalculator:
             _count_consecutive
         )
 
+        return self._calculate_bar_features(df)
+
+    def _calculate_bar_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        롤링 지표(prev_close, avg_vol_20d) 위에서 봉 단위 지표와 섹터 평균을 계산.
+        전체 경로와 증분(EODRollingState) 경로가 공유합니다.
+        """
+        df["change_pct"] = (
+            (df["close"] - df["prev_close"]) / df["prev_close"].replace(0, np.nan) * 100
+        )
+        # avg_vol_20d == 0 이면 NaN 처리
+        df["vol_ratio"] = df["volume"] / df["avg_vol_20d"].replace(0, np.nan)
+
         # ── 봉 분석 ─────────────────────────────────────────────────
         df["body"] = (df["close"] - df["open"]).abs()
         df["range"] = df["high"] - df["low"]
@@ -0,0 +1,282 @@
+"""
+기술적 지표 스냅샷 + 시계열 캐시 (views_indicators 전용)
+
+- IndicatorSnapshot: 종목별 최근 COMPARISON_WINDOW거래일 종가로 계산한 RSI·MACD·볼린저
+  마지막 값. refresh_indicator_snapshots가 DailyPrice 1회 조회(윈도 함수로 종목별 최근 N행)
+  → calculate_all_indicators_batch 행렬 계산 → bulk upsert. 비교 API는 스냅샷 1회 조회로
+  응답하고, 스냅샷이 없는 종목만 요청 시점에 계산해 채운다.
+- 시계열 캐시: (종목, 기간)별 OHLCV 배열 + 전체 지표("all")를 캐시에 두고, 재조회 시
+  마지막 날짜 - REFRESH_OVERLAP_DAYS 이후 행만 읽어 덧붙인다(최근 정정 흡수).
+  기간 시작일이 지난 앞쪽 행은 잘라내며, 배열이 바뀐 경우에만 지표를 재계산한다.
+  캐시 이후 분할(StockSplit)이 들어온 종목은 전체 재적재.
+"""
+
+import logging
+from datetime import date
+from typing import Optional
+
+import numpy as np
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from packages.shared.stocks.indicators import IndicatorSignals, TechnicalIndicators
+from packages.shared.stocks.models import (
+    DailyPrice,
+    IndicatorSnapshot,
+    StockSplit,
+)
+from packages.shared.stocks.services.price_store import REFRESH_OVERLAP_DAYS
+
+logger = logging.getLogger(__name__)
+
+COMPARISON_WINDOW = 50  # 비교 API 계산 창 (최근 50거래일 종가)
+SNAPSHOT_FIELDS = (
+    "as_of",
+    "close_price",
+    "rsi",
+    "rsi_signal",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "bb_percent_b",
+    "bb_bandwidth",
+)
+BULK_BATCH_SIZE = 1000
+
+SERIES_CACHE_TTL = 60 * 60 * 24  # 시계열 캐시 1일 (장중 갱신은 덧붙이기로 흡수)
+_OHLCV = ("open_price", "high_price", "low_price", "close_price", "volume")
+
+
+# ── 최신 지표 스냅샷 ────────────────────────────────────────────
+def _last_value(row: np.ndarray) -> Optional[float]:
+    """행의 마지막 열(최신 거래일) 값 — 2자리 반올림, 미정의 None."""
+    value = row[-1]
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def compute_indicator_snapshots(symbols=None) -> list[IndicatorSnapshot]:
+    """
+    종목별 최근 COMPARISON_WINDOW개 종가 → 저장 전 IndicatorSnapshot 리스트.
+
+    symbols가 None이면 DailyPrice가 있는 전 종목. 조회 1회.
+    """
+    ranked = DailyPrice.objects.annotate(
+        rn=Window(RowNumber(), partition_by=[F("stock_id")], order_by=F("date").desc())
+    )
+    if symbols is not None:
+        ranked = ranked.filter(stock_id__in=[s.upper() for s in symbols])
+    rows = list(
+        ranked.filter(rn__lte=COMPARISON_WINDOW).values_list(
+            "stock_id", "date", "close_price", "rn"
+        )
+    )
+    if not rows:
+        return []
+
+    tickers = sorted({r[0] for r in rows})
+    row_of = {s: i for i, s in enumerate(tickers)}
+    # rn 1 = 최신 → 열 (N - rn): 행마다 오른쪽 정렬, 앞쪽 결측은 배치 API가 압축
+    close = np.full((len(tickers), COMPARISON_WINDOW), np.nan)
+    as_of: dict[str, date] = {}
+    for symbol, d, price, rn in rows:
+        close[row_of[symbol], COMPARISON_WINDOW - rn] = float(price)
+        if rn == 1:
+            as_of[symbol] = d
+
+    batch = TechnicalIndicators.calculate_all_indicators_batch(close)
+    snapshots = []
+    for i, symbol in enumerate(tickers):
+        rsi = _last_value(batch["rsi"][i])
+        snapshots.append(
+            IndicatorSnapshot(
+                stock_id=symbol,
+                as_of=as_of[symbol],
+                close_price=float(close[i, -1]),
+                rsi=rsi,
+                rsi_signal=IndicatorSignals.get_rsi_signal(rsi) if rsi is not None else "",
+                macd=_last_value(batch["macd"][i]),
+                macd_signal=_last_value(batch["signal"][i]),
+                macd_histogram=_last_value(batch["histogram"][i]),
+                bb_percent_b=_last_value(batch["bb_percent_b"][i]),
+                bb_bandwidth=_last_value(batch["bb_bandwidth"][i]),
+            )
+        )
+    return snapshots
+
+
+def refresh_indicator_snapshots(symbols=None) -> dict:
+    """
+    IndicatorSnapshot 갱신 (야간 + EOD 가격 동기화 직후, 단일 종목 수집 직후).
+
+    Returns:
+        {"symbols": int, "as_of": str|None}
+    """
+    snapshots = compute_indicator_snapshots(symbols)
+    if snapshots:
+        IndicatorSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=["stock"],
+            update_fields=[*SNAPSHOT_FIELDS, "updated_at"],
+            batch_size=BULK_BATCH_SIZE,
+        )
+    latest = max((s.as_of for s in snapshots), default=None)
+    result = {"symbols": len(snapshots), "as_of": str(latest) if latest else None}
+    logger.info(f"[IndicatorSnapshot] 갱신 완료: {result}")
+    return result
+
+
+def load_indicator_snapshots(symbols) -> dict[str, IndicatorSnapshot]:
+    """
+    {symbol: IndicatorSnapshot(stock 동반)} — 스냅샷 1회 조회.
+
+    스냅샷이 없는 종목(신규 상장·야간 작업 이전)은 그 자리에서 계산해 저장한 뒤 합친다.
+    """
+    symbols = {s.upper() for s in symbols}
+    snapshots = {
+        s.stock_id: s
+        for s in IndicatorSnapshot.objects.filter(stock_id__in=symbols).select_related(
+            "stock"
+        )
+    }
+    missing = symbols - snapshots.keys()
+    if missing and refresh_indicator_snapshots(missing)["symbols"]:
+        snapshots.update(
+            (s.stock_id, s)
+            for s in IndicatorSnapshot.objects.filter(
+                stock_id__in=missing
+            ).select_related("stock")
+        )
+    return snapshots
+
+
+# ── 시계열 캐시 ─────────────────────────────────────────────────
+def series_cache_key(symbol: str, period: str) -> str:
+    return f"indicator_series_{symbol.upper()}_{period}"
+
+
+def _fetch_bars(stock, since: Optional[date]) -> dict[str, list]:
+    query = DailyPrice.objects.filter(stock=stock)
+    if since:
+        query = query.filter(date__gte=since)
+    bars = {"dates": [], **{field: [] for field in _OHLCV}}
+    for d, *values in query.order_by("date").values_list("date", *_OHLCV):
+        bars["dates"].append(d)
+        for field, value in zip(_OHLCV, values):
+            bars[field].append(float(value))
+    return bars
+
+
+def _merge_bars(cached: dict, recent: dict, start: Optional[date], since: date) -> dict:
+    """캐시 배열의 since 이전 구간 + recent(재동기화 구간), start 이전(기간 밖) 행은 제거."""
+    dates = cached["dates"]
+    hi = next((i for i, d in enumerate(dates) if d >= since), len(dates))
+    merged = {key: cached[key][:hi] + recent[key] for key in ("dates", *_OHLCV)}
+    if start is None:
+        return merged
+    lo = next((i for i, d in enumerate(merged["dates"]) if d >= start), len(merged["dates"]))
+    return {key: values[lo:] for key, values in merged.items()}
+
+
+def compute_indicator_series(close, high, low, volume) -> dict:
+    """TechnicalIndicatorView의 "all" 지표 dict (종목별 래퍼 결과 그대로)."""
+    indicators = {
+        "sma_20": TechnicalIndicators.calculate_sma(close, 20),
+        "sma_50": TechnicalIndicators.calculate_sma(close, 50),
+        "sma_200": TechnicalIndicators.calculate_sma(close, 200),
+        "ema_12": TechnicalIndicators.calculate_ema(close, 12),
+        "ema_26": TechnicalIndicators.calculate_ema(close, 26),
+    }
+
+    rsi_values = TechnicalIndicators.calculate_rsi(close)
+    indicators["rsi"] = rsi_values
+    if rsi_values and rsi_values[-1] is not None:
+        indicators["rsi_signal"] = IndicatorSignals.get_rsi_signal(rsi_values[-1])
+
+    macd_result = TechnicalIndicators.calculate_macd(close)
+    indicators["macd"] = macd_result["macd"]
+    indicators["macd_signal"] = macd_result["signal"]
+    indicators["macd_histogram"] = macd_result["histogram"]
+    if (
+        len(macd_result["macd"]) >= 2
+        and macd_result["macd"][-1] is not None
+        and macd_result["signal"][-1] is not None
+    ):
+        indicators["macd_trade_signal"] = IndicatorSignals.get_macd_signal(
+            macd_result["macd"][-1],
+            macd_result["signal"][-1],
+            macd_result["macd"][-2],
+            macd_result["signal"][-2],
+        )
+
+    bb_result = TechnicalIndicators.calculate_bollinger_bands(close)
+    indicators["bb_upper"] = bb_result["upper"]
+    indicators["bb_middle"] = bb_result["middle"]
+    indicators["bb_lower"] = bb_result["lower"]
+    indicators["bb_bandwidth"] = bb_result["bandwidth"]
+    indicators["bb_percent_b"] = bb_result["percent_b"]
+    if bb_result["upper"] and bb_result["upper"][-1] is not None:
+        indicators["bb_signal"] = IndicatorSignals.get_bollinger_signal(
+            close[-1],
+            bb_result["upper"][-1],
+            bb_result["lower"][-1],
+            bb_result["middle"][-1],
+        )
+
+    stoch_result = TechnicalIndicators.calculate_stochastic(high, low, close)
+    indicators["stoch_k"] = stoch_result["percent_k"]
+    indicators["stoch_d"] = stoch_result["percent_d"]
+    if stoch_result["percent_k"] and stoch_result["percent_k"][-1] is not None:
+        indicators["stoch_signal"] = IndicatorSignals.get_stochastic_signal(
+            stoch_result["percent_k"][-1],
+            stoch_result["percent_d"][-1] if stoch_result["percent_d"][-1] else 50,
+        )
+
+    indicators["atr"] = TechnicalIndicators.calculate_atr(high, low, close)
+    indicators["obv"] = TechnicalIndicators.calculate_obv(volume, close)
+
+    sr_levels = TechnicalIndicators.identify_support_resistance(close)
+    indicators["support_levels"] = sr_levels["support"]
+    indicators["resistance_levels"] = sr_levels["resistance"]
+    return indicators
+
+
+def load_indicator_series(stock, period: str, start: Optional[date]) -> Optional[dict]:
+    """
+    (종목, 기간) 시계열 캐시 → {"dates", OHLCV 배열..., "indicators"}. 가격이 없으면 None.
+
+    캐시 적중 시 분할 확인 1회 + 재동기화 구간 조회 1회만 수행하고, 배열이 그대로면
+    캐시된 지표를 재사용한다.
+    """
+    key = series_cache_key(stock.symbol, period)
+    cached = cache.get(key)
+    now = timezone.now()
+
+    if cached and not StockSplit.objects.filter(
+        stock=stock, created_at__gt=cached["built_at"]
+    ).exists():
+        last = cached["dates"][-1]
+        since = date.fromordinal(last.toordinal() - REFRESH_OVERLAP_DAYS)
+        bars = _merge_bars(cached, _fetch_bars(stock, since), start, since)
+        if all(bars[k] == cached[k] for k in ("dates", *_OHLCV)):
+            return cached
+        built_at = cached["built_at"]
+    else:
+        bars = _fetch_bars(stock, start)
+        built_at = now
+
+    if not bars["dates"]:
+        cache.delete(key)
+        return None
+
+    entry = {
+        **bars,
+        "built_at": built_at,
+        "indicators": compute_indicator_series(
+            bars["close_price"], bars["high_price"], bars["low_price"], bars["volume"]
+        ),
+    }
+    cache.set(key, entry, SERIES_CACHE_TTL)
+    return entry
@@ -0,0 +1,349 @@
+"""
+Price History Store (컬럼형 DailyPrice 캐시)
+
+DailyPrice를 필드별 연속 배열(symbol × date, row-major)로 디스크에 보관하고
+memory-map으로 읽습니다. EOD Calculator / JSONBaker 등 야간 파이프라인 소비자가
+같은 창을 ORM으로 반복 조회하던 것을 정렬된 행렬 읽기로 대체합니다.
+
+디스크 레이아웃:
+    {PRICE_STORE_DIR}/manifest.json          현재 버전 포인터 (os.replace로 원자 교체)
+    {PRICE_STORE_DIR}/v{build_id}/symbols.json
+    {PRICE_STORE_DIR}/v{build_id}/dates.npy  int64 ordinal (오름차순)
+    {PRICE_STORE_DIR}/v{build_id}/{open,high,low,close}.npy  float64, 결측 NaN
+    {PRICE_STORE_DIR}/v{build_id}/volume.npy int64, 결측 0
+
+갱신 (refresh):
+- 최초/full: DailyPrice 전체 1회 스트리밍
+- 증분: 마지막 날짜 - REFRESH_OVERLAP_DAYS 이후 행만 재동기화 +
+  신규 종목·신규 분할(StockSplit) 종목은 전체 이력 재적재
+- 새 버전 디렉토리에 쓴 뒤 manifest 교체 → 기존 mmap 독자는 이전 버전을 계속 읽음
+"""
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.utils import timezone as dj_timezone
+
+from packages.shared.stocks.models import DailyPrice, StockSplit
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+_DB_COLUMNS = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+    "volume": "volume",
+}
+REFRESH_OVERLAP_DAYS = 10  # 최근 정정(재수집) 흡수용 재동기화 창
+_KEEP_VERSIONS = 2  # 현재 + 직전 (열린 mmap 독자 보호)
+
+
+@dataclass
+class PriceMatrix:
+    """symbols × dates로 정렬된 필드별 행렬. 결측은 close NaN(volume 0)."""
+
+    symbols: list[str]
+    dates: list[date]
+    fields: dict[str, np.ndarray]
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~np.isnan(self.fields["close"])
+
+    def to_frame(self) -> pd.DataFrame:
+        """long format DataFrame (symbol, date, 필드...). 결측 셀은 제외."""
+        sym_idx, date_idx = np.nonzero(self.valid)
+        data = {
+            "symbol": np.asarray(self.symbols, dtype=object)[sym_idx],
+            "date": np.asarray(self.dates, dtype=object)[date_idx],
+        }
+        for field, arr in self.fields.items():
+            values = arr[sym_idx, date_idx]
+            data[field] = values.astype(float) if field == "volume" else values
+        return pd.DataFrame(data)
+
+
+class PriceHistoryStore:
+    """
+    컬럼형 가격 이력 저장소.
+
+    Usage:
+        store = get_price_store()
+        if store is not None and store.covers(target_date):
+            m = store.read(["AAPL", "NVDA"], start, target_date, fields=("close",))
+            m["close"]  # (2, n_dates) float64
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.PRICE_STORE_DIR)
+        self.manifest: dict = {}
+        self.symbols: list[str] = []
+        self._symbol_index: dict[str, int] = {}
+        self.dates = np.empty(0, dtype=np.int64)
+        self.arrays: dict[str, np.ndarray] = {}
+
+    # ── 읽기 ────────────────────────────────────────────────────
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def load(self) -> bool:
+        """현재 버전을 mmap으로 연다. 저장소가 없으면 False."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        version_dir = self.root / manifest["version"]
+        self.symbols = json.loads((version_dir / "symbols.json").read_text())
+        self._symbol_index = {s: i for i, s in enumerate(self.symbols)}
+        self.dates = np.load(version_dir / "dates.npy")
+        self.arrays = {
+            field: np.load(version_dir / f"{field}.npy", mmap_mode="r")
+            for field in PRICE_FIELDS
+        }
+        self.manifest = manifest
+        return True
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return date.fromordinal(int(self.dates[-1])) if len(self.dates) else None
+
+    def covers(self, end: date) -> bool:
+        """end 날짜까지 적재되어 있는지."""
+        last = self.last_date
+        return last is not None and last >= end
+
+    def read(
+        self,
+        symbols: list[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        fields: tuple[str, ...] = PRICE_FIELDS,
+    ) -> PriceMatrix:
+        """
+        symbols × [start, end] 정렬 행렬 반환. 저장소에 없는 종목은 전부 결측 행.
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.dates, start.toordinal()))
+        hi = (
+            len(self.dates)
+            if end is None
+            else int(np.searchsorted(self.dates, end.toordinal(), side="right"))
+        )
+        symbols = [s.upper() for s in symbols]
+        rows = np.array([self._symbol_index.get(s, -1) for s in symbols], dtype=np.int64)
+        known = rows >= 0
+
+        out = {}
+        for field in fields:
+            src = self.arrays[field]
+            if field == "volume":
+                mat = np.zeros((len(symbols), hi - lo), dtype=np.int64)
+            else:
+                mat = np.full((len(symbols), hi - lo), np.nan)
+            if known.any():
+                mat[known] = src[rows[known], lo:hi]
+            out[field] = mat
+        if "close" not in out:
+            # 결측 판정용 close는 항상 포함
+            mat = np.full((len(symbols), hi - lo), np.nan)
+            if known.any():
+                mat[known] = self.arrays["close"][rows[known], lo:hi]
+            out["close"] = mat
+
+        dates = [date.fromordinal(int(d)) for d in self.dates[lo:hi]]
+        return PriceMatrix(symbols=symbols, dates=dates, fields=out)
+
+    # ── 갱신 ────────────────────────────────────────────────────
+    def refresh(self, full: bool = False) -> dict:
+        """
+        DailyPrice → 컬럼형 저장소 갱신.
+
+        Returns:
+            {"mode": "full"|"incremental", "symbols": int, "dates": int,
+             "rows": int, "reloaded_symbols": int, "last_date": str}
+        """
+        started_at = dj_timezone.now()
+        has_current = not full and self.load()
+
+        if not has_current:
+            rows = self._fetch_rows(DailyPrice.objects.all())
+            symbols, dates, arrays = self._build(rows)
+            result = {"mode": "full", "rows": len(rows[0]), "reloaded_symbols": 0}
+        else:
+            since = self.last_date - timedelta(days=REFRESH_OVERLAP_DAYS)
+            built_at = datetime.fromisoformat(self.manifest["built_at"])
+            recent = self._fetch_rows(DailyPrice.objects.filter(date__gte=since))
+
+            reload_symbols = set(
+                StockSplit.objects.filter(created_at__gt=built_at).values_list(
+                    "stock_id", flat=True
+                )
+            )
+            reload_symbols |= set(recent[0].tolist()) - set(self.symbols)
+            full_rows = self._fetch_rows(
+                DailyPrice.objects.filter(stock_id__in=reload_symbols)
+            )
+            symbols, dates, arrays = self._merge(since, recent, reload_symbols, full_rows)
+            result = {
+                "mode": "incremental",
+                "rows": len(recent[0]) + len(full_rows[0]),
+                "reloaded_symbols": len(reload_symbols),
+            }
+
+        self._write(symbols, dates, arrays, started_at)
+        self.load()
+        result.update(
+            {
+                "symbols": len(self.symbols),
+                "dates": len(self.dates),
+                "last_date": str(self.last_date) if self.last_date else None,
+            }
+        )
+        logger.info(f"[PriceHistoryStore] refresh 완료: {result}")
+        return result
+
+    def _fetch_rows(self, qs) -> tuple[np.ndarray, ...]:
+        """(symbols, ordinals, open, high, low, close, volume) 컬럼 배열."""
+        values = list(
+            qs.values_list(
+                "stock_id", "date", *(_DB_COLUMNS[f] for f in PRICE_FIELDS)
+            ).iterator(chunk_size=20000)
+        )
+        if not values:
+            empty_f = np.empty(0)
+            return (
+                np.empty(0, dtype=object),
+                np.empty(0, dtype=np.int64),
+                empty_f,
+                empty_f,
+                empty_f,
+                empty_f,
+                np.empty(0, dtype=np.int64),
+            )
+        cols = list(zip(*values))
+        return (
+            np.asarray(cols[0], dtype=object),
+            np.fromiter((d.toordinal() for d in cols[1]), dtype=np.int64),
+            np.asarray(cols[2], dtype=float),
+            np.asarray(cols[3], dtype=float),
+            np.asarray(cols[4], dtype=float),
+            np.asarray(cols[5], dtype=float),
+            np.asarray(cols[6], dtype=np.int64),
+        )
+
+    @staticmethod
+    def _empty_arrays(n_symbols: int, n_dates: int) -> dict[str, np.ndarray]:
+        arrays = {
+            f: np.full((n_symbols, n_dates), np.nan)
+            for f in PRICE_FIELDS
+            if f != "volume"
+        }
+        arrays["volume"] = np.zeros((n_symbols, n_dates), dtype=np.int64)
+        return arrays
+
+    @staticmethod
+    def _scatter(arrays, symbol_index, date_values, rows):
+        if not len(rows[0]):
+            return
+        sym_idx = pd.Index(list(symbol_index)).get_indexer(rows[0])
+        date_idx = np.searchsorted(date_values, rows[1])
+        for field, values in zip(PRICE_FIELDS, rows[2:]):
+            arrays[field][sym_idx, date_idx] = values
+
+    def _build(self, rows):
+        symbols = sorted(set(rows[0].tolist()))
+        dates = np.unique(rows[1])
+        arrays = self._empty_arrays(len(symbols), len(dates))
+        self._scatter(arrays, {s: i for i, s in enumerate(symbols)}, dates, rows)
+        return symbols, dates, arrays
+
+    def _merge(self, since: date, recent, reload_symbols: set, full_rows):
+        """기존 배열 + 재동기화 창 + 재적재 종목을 합친 새 배열."""
+        symbols = sorted(set(self.symbols) | set(recent[0].tolist()) | reload_symbols)
+        symbol_index = {s: i for i, s in enumerate(symbols)}
+        since_ord = since.toordinal()
+        kept_dates = self.dates[self.dates < since_ord]
+        dates = np.unique(np.concatenate([kept_dates, recent[1], full_rows[1]]))
+        arrays = self._empty_arrays(len(symbols), len(dates))
+
+        # 재동기화 창 이전 구간 복사 (재적재 종목 제외)
+        old_rows = np.array([symbol_index[s] for s in self.symbols], dtype=np.int64)
+        keep = np.array([s not in reload_symbols for s in self.symbols], dtype=bool)
+        old_cols = np.searchsorted(dates, kept_dates)
+        for field in PRICE_FIELDS:
+            src = np.asarray(self.arrays[field][:, : len(kept_dates)])
+            arrays[field][np.ix_(old_rows[keep], old_cols)] = src[keep]
+
+        self._scatter(arrays, symbol_index, dates, recent)
+        self._scatter(arrays, symbol_index, dates, full_rows)
+        return symbols, dates, arrays
+
+    def _write(self, symbols, dates, arrays, built_at) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        version = f"v{built_at:%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        version_dir = self.root / version
+        version_dir.mkdir()
+
+        (version_dir / "symbols.json").write_text(json.dumps(symbols))
+        np.save(version_dir / "dates.npy", np.asarray(dates, dtype=np.int64))
+        for field in PRICE_FIELDS:
+            np.save(version_dir / f"{field}.npy", np.ascontiguousarray(arrays[field]))
+
+        manifest = {
+            "version": version,
+            "built_at": built_at.isoformat(),
+            "symbols": len(symbols),
+            "dates": len(dates),
+        }
+        tmp = self.root / f"manifest.{version}.tmp"
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, self.manifest_path)
+
+        versions = sorted(p for p in self.root.glob("v*") if p.is_dir())
+        for old in versions[:-_KEEP_VERSIONS]:
+            if old.name != version:
+                shutil.rmtree(old, ignore_errors=True)
+
+
+_store: Optional[PriceHistoryStore] = None
+_store_mtime: Optional[float] = None
+
+
+def get_price_store() -> Optional[PriceHistoryStore]:
+    """
+    프로세스 공유 저장소 인스턴스. manifest가 바뀌면 새 버전을 다시 연다.
+    비활성화(PRICE_STORE_ENABLED=False) 또는 미구축이면 None → 호출자는 ORM fallback.
+    """
+    global _store, _store_mtime
+
+    if not getattr(settings, "PRICE_STORE_ENABLED", False):
+        return None
+
+    root = Path(settings.PRICE_STORE_DIR)
+    try:
+        mtime = (root / "manifest.json").stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    if _store is None or _store.root != root or _store_mtime != mtime:
+        store = PriceHistoryStore(root)
+        if not store.load():
+            return None
+        _store, _store_mtime = store, mtime
+    return _store
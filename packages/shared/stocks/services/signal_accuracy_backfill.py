@@ -0,0 +1,179 @@
+"""
+SignalAccuracy 수익률 소급 (EOD Pipeline Stage 8) — 집합 기반.
+
+미충족 (row, horizon) 전체를 한 번에 처리한다:
+1. 대기 행 1회 조회 (return_{h}d IS NULL AND signal_date <= as_of - h)
+2. 대상 종목 + SPY의 종가를 [최소 signal_date, as_of] 구간 1회 조회
+3. 시그널 당일 종가 = (symbol, signal_date) 정확 일치,
+   선행 종가 = signal_date + h일 이후 첫 거래일 종가 (merge_asof forward, as_of 이하)
+4. 수익률/초과수익률(vs SPY) 벡터 계산 → horizon별 bulk_update
+
+선행 창은 tasks.backfill_signal_accuracy(Celery)와 같은 `signal_date + h` 규약.
+as_of를 과거로 주면 그 시점까지의 가격만 사용하므로 과거 horizon 재계산에도 쓸 수 있다.
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from django.db.models import Q
+
+from packages.shared.stocks.models import DailyPrice, SignalAccuracy
+
+logger = logging.getLogger(__name__)
+
+HORIZONS = (1, 5, 20)
+BENCHMARK_SYMBOL = "SPY"
+
+
+def backfill_signal_accuracy(
+    as_of: date,
+    horizons: Sequence[int] = HORIZONS,
+    since: Optional[date] = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    as_of 기준 미충족 SignalAccuracy 수익률을 일괄 소급.
+
+    Args:
+        as_of: 선행 종가 상한일 (파이프라인 target_date)
+        horizons: 대상 지평(일) — 1/5/20 중 선택
+        since: signal_date 하한 (None이면 전체 대기 행)
+        dry_run: 계산만 하고 쓰지 않음
+
+    Returns:
+        {"pending": 대기 행 수, "updated": {"1d": n, ...}, "total": n}
+    """
+    horizons = [h for h in HORIZONS if h in set(horizons)]
+    stats = {"pending": 0, "updated": {f"{h}d": 0 for h in horizons}, "total": 0}
+    if not horizons:
+        return stats
+
+    pending_q = Q()
+    for h in horizons:
+        pending_q |= Q(
+            **{f"return_{h}d__isnull": True},
+            signal_date__lte=as_of - timedelta(days=h),
+        )
+    qs = SignalAccuracy.objects.filter(pending_q)
+    if since is not None:
+        qs = qs.filter(signal_date__gte=since)
+
+    pending = pd.DataFrame(
+        list(
+            qs.values_list(
+                "id", "stock_id", "signal_date", *(f"return_{h}d" for h in horizons)
+            )
+        ),
+        columns=["id", "symbol", "signal_date", *(f"return_{h}d" for h in horizons)],
+    )
+    stats["pending"] = len(pending)
+    if pending.empty:
+        return stats
+
+    prices = _load_closes(
+        set(pending["symbol"]) | {BENCHMARK_SYMBOL},
+        pending["signal_date"].min(),
+        as_of,
+    )
+    if prices.empty:
+        return stats
+
+    pending["signal_date"] = pd.to_datetime(pending["signal_date"]).astype(
+        "datetime64[ns]"
+    )
+    pending = _attach_signal_close(pending, prices, "symbol", "close_at_signal")
+    pending["bench"] = BENCHMARK_SYMBOL
+    pending = _attach_signal_close(pending, prices, "bench", "spy_at_signal")
+
+    for h in horizons:
+        field = f"return_{h}d"
+        rows = pending[
+            pending[field].isna()
+            & (pending["signal_date"] <= pd.Timestamp(as_of - timedelta(days=h)))
+            & (pending["close_at_signal"] > 0)
+        ]
+        if rows.empty:
+            continue
+
+        rows = rows.assign(forward_date=rows["signal_date"] + pd.Timedelta(days=h))
+        rows = _attach_forward_close(rows, prices, "symbol", "close_forward")
+        rows = _attach_forward_close(rows, prices, "bench", "spy_forward")
+        rows = rows[rows["close_forward"].notna()]
+        if rows.empty:
+            continue
+
+        stock_return = (
+            (rows["close_forward"] - rows["close_at_signal"])
+            / rows["close_at_signal"]
+            * 100
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spy_return = (
+                (rows["spy_forward"] - rows["spy_at_signal"])
+                / rows["spy_at_signal"]
+                * 100
+            )
+        has_spy = (rows["spy_at_signal"] > 0) & (rows["spy_forward"] > 0)
+        excess = (stock_return - spy_return).where(has_spy)
+
+        objs = [
+            SignalAccuracy(
+                id=int(pk),
+                **{
+                    field: round(float(ret), 4),
+                    f"excess_{h}d": None if pd.isna(exc) else round(float(exc), 4),
+                },
+            )
+            for pk, ret, exc in zip(rows["id"], stock_return, excess)
+        ]
+        if not dry_run:
+            SignalAccuracy.objects.bulk_update(
+                objs, [field, f"excess_{h}d"], batch_size=1000
+            )
+        stats["updated"][f"{h}d"] = len(objs)
+
+    stats["total"] = sum(stats["updated"].values())
+    logger.info(f"[SignalAccuracyBackfill] as_of={as_of} dry_run={dry_run}: {stats}")
+    return stats
+
+
+def _load_closes(symbols: set, start: date, end: date) -> pd.DataFrame:
+    """대상 종목 종가 1회 조회 → (symbol, date, close) 날짜 정렬 DataFrame"""
+    rows = DailyPrice.objects.filter(
+        stock_id__in=symbols, date__gte=start, date__lte=end
+    ).values_list("stock_id", "date", "close_price")
+    df = pd.DataFrame(list(rows), columns=["symbol", "date", "close"])
+    if df.empty:
+        return df
+    df["date"] = pd.to_datetime(df["date"]).astype("datetime64[ns]")
+    df["close"] = df["close"].astype(float)
+    return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def _attach_signal_close(
+    df: pd.DataFrame, prices: pd.DataFrame, key: str, column: str
+) -> pd.DataFrame:
+    """(key 종목, signal_date) 정확 일치 종가"""
+    exact = prices.rename(
+        columns={"symbol": key, "date": "signal_date", "close": column}
+    )
+    return df.merge(exact, on=[key, "signal_date"], how="left")
+
+
+def _attach_forward_close(
+    df: pd.DataFrame, prices: pd.DataFrame, key: str, column: str
+) -> pd.DataFrame:
+    """forward_date 이후 첫 거래일 종가 (key 종목 기준 merge_asof forward)"""
+    forward = prices.rename(
+        columns={"symbol": key, "date": "forward_date", "close": column}
+    )
+    return pd.merge_asof(
+        df.sort_values("forward_date", kind="stable"),
+        forward,
+        on="forward_date",
+        by=key,
+        direction="forward",
+    )
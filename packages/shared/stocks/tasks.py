@@ -3,6 +3,7 @@ import time
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.core.cache import cache
 from django.db import transaction
 
@@ -17,22 +18,92 @@ def chunks(lst, n):
         yield lst[i : i + n]
 
 
+# 주간 롤업 (종목 × ISO 주 월~금): 시가/종가 = 윈도 함수 FIRST_VALUE, 고/저/거래량 = GROUP BY
+_WEEKLY_ROLLUP_SQL = """
+    WITH days AS (
+        SELECT
+            stock_id,
+            date,
+            high_price,
+            low_price,
+            volume,
+            date_trunc('week', date)::date AS week,
+            FIRST_VALUE(open_price) OVER (
+                PARTITION BY stock_id, date_trunc('week', date) ORDER BY date
+            ) AS week_open,
+            FIRST_VALUE(close_price) OVER (
+                PARTITION BY stock_id, date_trunc('week', date) ORDER BY date DESC
+            ) AS week_close
+        FROM stocks_daily_price
+        WHERE stock_id = ANY(%s)
+          AND date BETWEEN %s AND %s
+          AND EXTRACT(ISODOW FROM date) <= 5
+    )
+    SELECT
+        stock_id,
+        MIN(date) AS week_start_date,
+        MAX(date) AS week_end_date,
+        MIN(week_open) AS open_price,
+        MAX(high_price) AS high_price,
+        MIN(low_price) AS low_price,
+        MIN(week_close) AS close_price,
+        SUM(volume)::bigint AS volume,
+        SUM(volume)::bigint / COUNT(*) AS average_volume
+    FROM days
+    GROUP BY stock_id, week
+"""
+
+WEEKLY_UPDATE_FIELDS = [
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "week_start_date",
+    "week_end_date",
+    "average_volume",
+]
+
+
+def _previous_friday(today):
+    """직전 금요일 (오늘이 금요일이면 오늘)."""
+    from datetime import timedelta
+
+    days_since_friday = (today.weekday() - 4) % 7
+    if days_since_friday == 0 and today.weekday() != 4:
+        days_since_friday = 7
+    return today - timedelta(days=days_since_friday)
+
+
+def _weekly_rollup(symbols, range_start, range_end):
+    """DailyPrice → 주간 집계 행 (DB 1회 집계). WeeklyPrice 인스턴스 리스트 (저장 전)."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(_WEEKLY_ROLLUP_SQL, [list(symbols), range_start, range_end])
+        columns = [col[0] for col in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    return [WeeklyPrice(date=row["week_end_date"], **row) for row in rows]
+
+
 @shared_task
-def aggregate_weekly_prices(target_week_end=None):
+def aggregate_weekly_prices(target_week_end=None, start_date=None, end_date=None):
     """
     DailyPrice → WeeklyPrice DB 집계 (API 호출 없음)
 
     이미 수집된 DailyPrice 데이터를 ISO 주차 기준으로 WeeklyPrice로 변환.
+    집계는 SQL 1회(시가/종가 = 윈도 함수, 고가/저가/거래량 = GROUP BY),
+    저장은 bulk upsert (stock, date=주 마지막 거래일).
     Beat 스케줄: 토요일 01:00 (금요일 EOD 동기화 이후)
 
     Args:
         target_week_end: 대상 주 금요일 날짜 (YYYY-MM-DD 문자열, 기본: 직전 금요일)
+        start_date: 백필 시작일 (YYYY-MM-DD) — 주면 start_date ~ end_date가 걸친 모든 주를
+            한 번에 재생성 (주 단위로 확장: 시작 주 월요일 ~ 마지막 주 금요일)
+        end_date: 백필 종료일 (기본: target_week_end 또는 직전 금요일)
     """
-    from collections import defaultdict
     from datetime import date, timedelta
 
-    from django.db.models import Avg, Max, Min, Sum
-
     from .models import SP500Constituent
 
     try:
@@ -41,14 +112,17 @@ def aggregate_weekly_prices(target_week_end=None):
         if target_week_end:
             week_end = date.fromisoformat(target_week_end)
         else:
-            # 직전 금요일 계산
-            days_since_friday = (today.weekday() - 4) % 7
-            if days_since_friday == 0 and today.weekday() != 4:
-                days_since_friday = 7
-            week_end = today - timedelta(days=days_since_friday)
-
-        # 해당 주 월~금 범위
-        week_start = week_end - timedelta(days=4)
+            week_end = _previous_friday(today)
+        if end_date:
+            last = date.fromisoformat(end_date)
+            week_end = last - timedelta(days=last.weekday()) + timedelta(days=4)
+
+        # 해당 주(들) 월~금 범위
+        if start_date:
+            first = date.fromisoformat(start_date)
+            week_start = first - timedelta(days=first.weekday())
+        else:
+            week_start = week_end - timedelta(days=4)
 
         logger.info(f"Aggregating weekly prices for {week_start} ~ {week_end}")
 
@@ -67,65 +141,35 @@ def aggregate_weekly_prices(target_week_end=None):
                 "updated": 0,
             }
 
-        # 해당 주간의 모든 DailyPrice 조회
-        daily_prices = DailyPrice.objects.filter(
-            stock__symbol__in=sp500_symbols,
-            date__gte=week_start,
-            date__lte=week_end,
-        ).select_related("stock")
-
-        # 종목별 그룹화
-        symbol_prices = defaultdict(list)
-        for dp in daily_prices:
-            symbol_prices[dp.stock_id].append(dp)
-
-        created = 0
-        updated = 0
-
-        for symbol, prices in symbol_prices.items():
-            if not prices:
-                continue
-
-            prices_sorted = sorted(prices, key=lambda x: x.date)
-
-            first_day = prices_sorted[0]
-            last_day = prices_sorted[-1]
-
-            defaults = {
-                "open_price": first_day.open_price,
-                "high_price": max(p.high_price for p in prices_sorted),
-                "low_price": min(p.low_price for p in prices_sorted),
-                "close_price": last_day.close_price,
-                "volume": sum(p.volume for p in prices_sorted),
-                "week_start_date": first_day.date,
-                "week_end_date": last_day.date,
-                "average_volume": sum(p.volume for p in prices_sorted)
-                // len(prices_sorted),
-            }
+        weekly = _weekly_rollup(sp500_symbols, week_start, week_end)
 
-            try:
-                stock = Stock.objects.get(symbol=symbol)
-            except Stock.DoesNotExist:
-                logger.warning(f"Stock {symbol} not found, skipping")
-                continue
-
-            _, was_created = WeeklyPrice.objects.update_or_create(
-                stock=stock,
-                date=last_day.date,
-                defaults=defaults,
-            )
+        existing = set(
+            WeeklyPrice.objects.filter(
+                stock_id__in=sp500_symbols,
+                date__gte=week_start,
+                date__lte=week_end,
+            ).values_list("stock_id", "date")
+        )
+        created = sum(1 for w in weekly if (w.stock_id, w.date) not in existing)
 
-            if was_created:
-                created += 1
-            else:
-                updated += 1
+        with transaction.atomic():
+            WeeklyPrice.objects.bulk_create(
+                weekly,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["stock", "date"],
+                update_fields=WEEKLY_UPDATE_FIELDS,
+            )
 
         result = {
             "week_end": str(week_end),
-            "symbols_aggregated": created + updated,
+            "symbols_aggregated": len({w.stock_id for w in weekly}),
             "created": created,
-            "updated": updated,
+            "updated": len(weekly) - created,
         }
+        if start_date:
+            result["week_start"] = str(week_start)
+            result["weeks"] = len({w.week_start_date.isocalendar()[:2] for w in weekly})
         logger.info(f"Weekly aggregation complete: {result}")
         return result
 
@@ -346,6 +390,9 @@ def update_stock_with_provider(self, symbol, use_fallback=True):
         except Exception as e:
             logger.error(f"[Provider] Failed to update financials for {symbol}: {e}")
 
+        if results["prices"]:
+            refresh_indicator_snapshots.delay([symbol])
+
         # 캐시 무효화
         cache.delete(f"stock_quote_{symbol}")
         cache.delete(f"overview_{symbol}")
@@ -469,6 +516,14 @@ def sync_sp500_eod_prices(self, target_date=None):
         result = service.sync_eod_prices(target_date=target)
 
         logger.info(f"S&P 500 EOD 동기화 완료: {result}")
+
+        # 컬럼형 가격 캐시 증분 갱신 (EOD 파이프라인 18:30 이전)
+        if settings.PRICE_STORE_ENABLED:
+            refresh_price_store.delay()
+
+        # 최신 지표 스냅샷 (지표 비교 API)
+        refresh_indicator_snapshots.delay()
+
         return result
 
     except Exception as e:
@@ -476,6 +531,30 @@ def sync_sp500_eod_prices(self, target_date=None):
         raise self.retry(exc=e, countdown=300 * (self.request.retries + 1))
 
 
+@shared_task(soft_time_limit=900, time_limit=960)
+def refresh_price_store(full=False):
+    """
+    DailyPrice → 컬럼형 PriceHistoryStore 갱신.
+    기본은 증분(최근 창 재동기화 + 신규/분할 종목 재적재), full=True면 전체 재구축.
+    """
+    from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+    result = PriceHistoryStore().refresh(full=full)
+    logger.info(f"PriceHistoryStore 갱신 완료: {result}")
+    return result
+
+
+@shared_task(soft_time_limit=600, time_limit=660)
+def refresh_indicator_snapshots(symbols=None):
+    """
+    최근 50거래일 종가 → IndicatorSnapshot(RSI·MACD·볼린저 최신값) 일괄 갱신.
+    symbols 생략 시 DailyPrice가 있는 전 종목.
+    """
+    from packages.shared.stocks.services import indicator_snapshot
+
+    return indicator_snapshot.refresh_indicator_snapshots(symbols)
+
+
 @shared_task(
     name="update-sp500-change-percent",
     max_retries=2,
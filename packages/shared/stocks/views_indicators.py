@@ -13,6 +13,34 @@ from rest_framework.views import APIView
 
 from .indicators import IndicatorSignals, TechnicalIndicators
 from .models import DailyPrice, Stock
+from .services.indicator_snapshot import (
+    load_indicator_series,
+    load_indicator_snapshots,
+)
+
+PERIOD_DAYS = {"30d": 30, "60d": 60, "90d": 90, "180d": 180, "1y": 365, "2y": 730}
+
+# indicators 쿼리 파라미터 → 지표 그룹
+INDICATOR_GROUPS = {
+    "sma": "sma",
+    "ema": "ema",
+    "rsi": "rsi",
+    "macd": "macd",
+    "bb": "bb",
+    "bollinger": "bb",
+    "stoch": "stoch",
+    "stochastic": "stoch",
+    "atr": "atr",
+    "obv": "obv",
+    "support_resistance": "support_resistance",
+}
+
+
+def _indicator_group(key):
+    """지표 키(sma_20, bb_signal, support_levels ...) → 그룹"""
+    if key in ("support_levels", "resistance_levels"):
+        return "support_resistance"
+    return key.split("_")[0]
 
 
 class TechnicalIndicatorView(APIView):
@@ -44,52 +72,24 @@ class TechnicalIndicatorView(APIView):
 
         # 기간에 따른 날짜 계산
         end_date = datetime.now().date()
+        days = PERIOD_DAYS.get(period)
+        start_date = end_date - timedelta(days=days) if days else None  # max
 
-        if period == "30d":
-            start_date = end_date - timedelta(days=30)
-        elif period == "60d":
-            start_date = end_date - timedelta(days=60)
-        elif period == "90d":
-            start_date = end_date - timedelta(days=90)
-        elif period == "180d":
-            start_date = end_date - timedelta(days=180)
-        elif period == "1y":
-            start_date = end_date - timedelta(days=365)
-        elif period == "2y":
-            start_date = end_date - timedelta(days=730)
-        else:  # max
-            start_date = None
-
-        # 가격 데이터 조회
-        query = DailyPrice.objects.filter(stock=stock)
-        if start_date:
-            query = query.filter(date__gte=start_date)
-
-        prices_data = query.order_by("date").values(
-            "date", "open_price", "high_price", "low_price", "close_price", "volume"
-        )
-
-        if not prices_data:
+        # 가격 배열 + 전체 지표 (시계열 캐시, 신규 봉만 덧붙임)
+        series = load_indicator_series(stock, period, start_date)
+        if series is None:
             return Response(
                 {"error": f"No price data available for {symbol}"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # DataFrame 생성
-        df = pd.DataFrame(list(prices_data))
-        df["date"] = pd.to_datetime(df["date"])
-
-        # 기술적 지표 계산
-        close_prices = df["close_price"].astype(float).tolist()
-        high_prices = df["high_price"].astype(float).tolist()
-        low_prices = df["low_price"].astype(float).tolist()
-        volumes = df["volume"].astype(float).tolist()
+        close_prices = series["close_price"]
 
         indicators_data = {
             "symbol": symbol,
             "stock_name": stock.stock_name,
             "period": period,
-            "dates": df["date"].dt.strftime("%Y-%m-%d").tolist(),
+            "dates": [d.strftime("%Y-%m-%d") for d in series["dates"]],
             "prices": close_prices,
             "current_price": float(stock.real_time_price)
             if stock.real_time_price
@@ -97,119 +97,15 @@ class TechnicalIndicatorView(APIView):
             "indicators": {},
         }
 
-        # 요청된 지표만 계산
-        if "all" in requested_indicators or "sma" in requested_indicators:
-            indicators_data["indicators"]["sma_20"] = TechnicalIndicators.calculate_sma(
-                close_prices, 20
-            )
-            indicators_data["indicators"]["sma_50"] = TechnicalIndicators.calculate_sma(
-                close_prices, 50
-            )
-            indicators_data["indicators"]["sma_200"] = (
-                TechnicalIndicators.calculate_sma(close_prices, 200)
-            )
-
-        if "all" in requested_indicators or "ema" in requested_indicators:
-            indicators_data["indicators"]["ema_12"] = TechnicalIndicators.calculate_ema(
-                close_prices, 12
-            )
-            indicators_data["indicators"]["ema_26"] = TechnicalIndicators.calculate_ema(
-                close_prices, 26
-            )
-
-        if "all" in requested_indicators or "rsi" in requested_indicators:
-            rsi_values = TechnicalIndicators.calculate_rsi(close_prices)
-            indicators_data["indicators"]["rsi"] = rsi_values
-            if rsi_values and rsi_values[-1] is not None:
-                indicators_data["indicators"]["rsi_signal"] = (
-                    IndicatorSignals.get_rsi_signal(rsi_values[-1])
-                )
-
-        if "all" in requested_indicators or "macd" in requested_indicators:
-            macd_result = TechnicalIndicators.calculate_macd(close_prices)
-            indicators_data["indicators"]["macd"] = macd_result["macd"]
-            indicators_data["indicators"]["macd_signal"] = macd_result["signal"]
-            indicators_data["indicators"]["macd_histogram"] = macd_result["histogram"]
-
-            # MACD 매매 신호
-            if (
-                len(macd_result["macd"]) >= 2
-                and macd_result["macd"][-1] is not None
-                and macd_result["signal"][-1] is not None
-            ):
-                indicators_data["indicators"]["macd_trade_signal"] = (
-                    IndicatorSignals.get_macd_signal(
-                        macd_result["macd"][-1],
-                        macd_result["signal"][-1],
-                        macd_result["macd"][-2] if len(macd_result["macd"]) > 1 else 0,
-                        macd_result["signal"][-2]
-                        if len(macd_result["signal"]) > 1
-                        else 0,
-                    )
-                )
-
-        if (
-            "all" in requested_indicators
-            or "bb" in requested_indicators
-            or "bollinger" in requested_indicators
-        ):
-            bb_result = TechnicalIndicators.calculate_bollinger_bands(close_prices)
-            indicators_data["indicators"]["bb_upper"] = bb_result["upper"]
-            indicators_data["indicators"]["bb_middle"] = bb_result["middle"]
-            indicators_data["indicators"]["bb_lower"] = bb_result["lower"]
-            indicators_data["indicators"]["bb_bandwidth"] = bb_result["bandwidth"]
-            indicators_data["indicators"]["bb_percent_b"] = bb_result["percent_b"]
-
-            # 볼린저 밴드 신호
-            if bb_result["upper"] and bb_result["upper"][-1] is not None:
-                indicators_data["indicators"]["bb_signal"] = (
-                    IndicatorSignals.get_bollinger_signal(
-                        close_prices[-1],
-                        bb_result["upper"][-1],
-                        bb_result["lower"][-1],
-                        bb_result["middle"][-1],
-                    )
-                )
-
-        if (
-            "all" in requested_indicators
-            or "stoch" in requested_indicators
-            or "stochastic" in requested_indicators
-        ):
-            stoch_result = TechnicalIndicators.calculate_stochastic(
-                high_prices, low_prices, close_prices
-            )
-            indicators_data["indicators"]["stoch_k"] = stoch_result["percent_k"]
-            indicators_data["indicators"]["stoch_d"] = stoch_result["percent_d"]
-
-            # 스토캐스틱 신호
-            if stoch_result["percent_k"] and stoch_result["percent_k"][-1] is not None:
-                indicators_data["indicators"]["stoch_signal"] = (
-                    IndicatorSignals.get_stochastic_signal(
-                        stoch_result["percent_k"][-1],
-                        stoch_result["percent_d"][-1]
-                        if stoch_result["percent_d"][-1]
-                        else 50,
-                    )
-                )
-
-        if "all" in requested_indicators or "atr" in requested_indicators:
-            indicators_data["indicators"]["atr"] = TechnicalIndicators.calculate_atr(
-                high_prices, low_prices, close_prices
-            )
-
-        if "all" in requested_indicators or "obv" in requested_indicators:
-            indicators_data["indicators"]["obv"] = TechnicalIndicators.calculate_obv(
-                volumes, close_prices
-            )
-
-        if (
-            "all" in requested_indicators
-            or "support_resistance" in requested_indicators
-        ):
-            sr_levels = TechnicalIndicators.identify_support_resistance(close_prices)
-            indicators_data["indicators"]["support_levels"] = sr_levels["support"]
-            indicators_data["indicators"]["resistance_levels"] = sr_levels["resistance"]
+        # 요청된 지표만 (캐시된 "all" 결과에서 발췌)
+        wanted = (
+            None
+            if "all" in requested_indicators
+            else {INDICATOR_GROUPS.get(name) for name in requested_indicators}
+        )
+        for key, values in series["indicators"].items():
+            if wanted is None or _indicator_group(key) in wanted:
+                indicators_data["indicators"][key] = values
 
         # 종합 신호 계산
         composite_input = {"price": close_prices[-1] if close_prices else None}
@@ -368,68 +264,44 @@ class IndicatorComparisonView(APIView):
 
         comparison_data = {"indicators": indicators, "stocks": []}
 
+        # 최신 지표 스냅샷 일괄 조회 (종목별 가격 조회·재계산 없음)
+        snapshots = load_indicator_snapshots(symbols)
+
         for symbol in symbols:
             symbol = symbol.upper()
-
-            try:
-                stock = Stock.objects.get(symbol=symbol)
-            except Stock.DoesNotExist:
-                continue
-
-            # 최근 50일 데이터
-            prices = (
-                DailyPrice.objects.filter(stock=stock)
-                .order_by("-date")[:50]
-                .values_list("close_price", flat=True)
-            )
-
-            if not prices:
+            snapshot = snapshots.get(symbol)
+            if snapshot is None:
                 continue
 
-            prices_list = list(reversed([float(p) for p in prices]))
-
+            stock = snapshot.stock
             stock_data = {
                 "symbol": symbol,
                 "stock_name": stock.stock_name,
                 "current_price": float(stock.real_time_price)
                 if stock.real_time_price
-                else prices_list[-1],
+                else snapshot.close_price,
                 "indicators": {},
             }
 
-            # RSI 계산
-            if "rsi" in indicators:
-                rsi_values = TechnicalIndicators.calculate_rsi(prices_list)
-                if rsi_values and rsi_values[-1] is not None:
-                    stock_data["indicators"]["rsi"] = rsi_values[-1]
-                    stock_data["indicators"]["rsi_signal"] = (
-                        IndicatorSignals.get_rsi_signal(rsi_values[-1])
-                    )
-
-            # MACD 계산
-            if "macd" in indicators:
-                macd_result = TechnicalIndicators.calculate_macd(prices_list)
-                if macd_result["macd"] and macd_result["macd"][-1] is not None:
-                    stock_data["indicators"]["macd"] = macd_result["macd"][-1]
-                    stock_data["indicators"]["macd_signal_value"] = (
-                        macd_result["signal"][-1] if macd_result["signal"][-1] else 0
-                    )
-                    stock_data["indicators"]["macd_histogram"] = (
-                        macd_result["histogram"][-1]
-                        if macd_result["histogram"][-1]
-                        else 0
-                    )
+            # RSI
+            if "rsi" in indicators and snapshot.rsi is not None:
+                stock_data["indicators"]["rsi"] = snapshot.rsi
+                stock_data["indicators"]["rsi_signal"] = snapshot.rsi_signal
+
+            # MACD
+            if "macd" in indicators and snapshot.macd is not None:
+                stock_data["indicators"]["macd"] = snapshot.macd
+                stock_data["indicators"]["macd_signal_value"] = (
+                    snapshot.macd_signal or 0
+                )
+                stock_data["indicators"]["macd_histogram"] = (
+                    snapshot.macd_histogram or 0
+                )
 
             # 볼린저 밴드
-            if "bollinger" in indicators:
-                bb_result = TechnicalIndicators.calculate_bollinger_bands(prices_list)
-                if bb_result["percent_b"] and bb_result["percent_b"][-1] is not None:
-                    stock_data["indicators"]["bb_percent_b"] = bb_result["percent_b"][
-                        -1
-                    ]
-                    stock_data["indicators"]["bb_bandwidth"] = (
-                        bb_result["bandwidth"][-1] if bb_result["bandwidth"][-1] else 0
-                    )
+            if "bollinger" in indicators and snapshot.bb_percent_b is not None:
+                stock_data["indicators"]["bb_percent_b"] = snapshot.bb_percent_b
+                stock_data["indicators"]["bb_bandwidth"] = snapshot.bb_bandwidth or 0
 
             comparison_data["stocks"].append(stock_data)
 
@@ -149,11 +149,15 @@ class NewsArticle(models.Model):
             models.Index(fields=["llm_analyzed", "-published_at"]),
         ]
 
+    @staticmethod
+    def hash_url(url: str) -> str:
+        """정규화 URL SHA256 (bulk_create는 save()를 거치지 않으므로 직접 호출)"""
+        return hashlib.sha256(url.lower().strip().encode()).hexdigest()
+
     def save(self, *args, **kwargs):
         """URL 해시 자동 생성"""
         if not self.url_hash:
-            normalized_url = self.url.lower().strip()
-            self.url_hash = hashlib.sha256(normalized_url.encode()).hexdigest()
+            self.url_hash = self.hash_url(self.url)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
 from ..models import EntityHighlight, NewsArticle, NewsEntity
 from ..providers import FinnhubNewsProvider, MarketauxNewsProvider, RawNewsArticle
@@ -18,6 +19,19 @@ from .deduplicator import NewsDeduplicator
 
 logger = logging.getLogger(__name__)
 
+# 청크 단위 bulk 저장 (청크가 실패하면 그 청크만 기사별 savepoint로 재시도)
+BULK_SAVE_CHUNK_SIZE = 200
+
+# 기존 뉴스 보강 시 bulk_update 대상 필드
+ARTICLE_UPDATE_FIELDS = [
+    "sentiment_score",
+    "sentiment_source",
+    "finnhub_id",
+    "marketaux_uuid",
+    "fmp_id",
+    "updated_at",
+]
+
 
 class NewsAggregatorService:
     """뉴스 통합 서비스"""
@@ -192,6 +206,9 @@ class NewsAggregatorService:
         """
         뉴스 리스트를 데이터베이스에 저장
 
+        청크마다 URL 일괄 조회 1회 → 신규 bulk_create / 기존 bulk_update / 엔티티 bulk_create.
+        청크 bulk 저장이 DB 에러로 실패하면 그 청크만 기사별 savepoint 경로로 재시도합니다.
+
         Args:
             articles: 뉴스 리스트
 
@@ -202,6 +219,90 @@ class NewsAggregatorService:
         updated_count = 0
         skipped_count = 0
 
+        for start in range(0, len(articles), BULK_SAVE_CHUNK_SIZE):
+            chunk = articles[start : start + BULK_SAVE_CHUNK_SIZE]
+            try:
+                with transaction.atomic():
+                    saved, updated, skipped = self._bulk_save_chunk(chunk)
+            except Exception as e:
+                logger.warning(
+                    f"Bulk article save failed ({len(chunk)} articles), "
+                    f"falling back to per-row: {e}"
+                )
+                saved, updated, skipped = self._save_articles_per_row(chunk)
+
+            saved_count += saved
+            updated_count += updated
+            skipped_count += skipped
+
+        return saved_count, updated_count, skipped_count
+
+    def _bulk_save_chunk(self, chunk: List[RawNewsArticle]) -> tuple:
+        """
+        청크 1개 bulk 저장 (쿼리 수가 기사 수와 무관)
+
+        같은 URL이 청크 안에 여러 번 나오면 첫 항목이 생성, 이후 항목은 업데이트로 집계.
+        엔티티는 새 뉴스 또는 엔티티가 없던 기존 뉴스에만 추가합니다.
+        """
+        existing = NewsArticle.objects.in_bulk(
+            list({raw.url for raw in chunk}), field_name="url"
+        )
+        with_entities = set(
+            NewsEntity.objects.filter(news__in=list(existing.values()))
+            .values_list("news__url", flat=True)
+            .distinct()
+        )
+
+        created: Dict[str, NewsArticle] = {}
+        changed: Dict[str, NewsArticle] = {}
+        entities: Dict[str, List[Dict[str, Any]]] = {}
+        saved_count = 0
+        updated_count = 0
+        skipped_count = 0
+
+        for raw_article in chunk:
+            try:
+                article = existing.get(raw_article.url) or created.get(raw_article.url)
+                if article is None:
+                    created[raw_article.url] = self._new_article(raw_article)
+                    saved_count += 1
+                else:
+                    fields = self._article_updates(article, raw_article)
+                    for name, value in fields.items():
+                        setattr(article, name, value)
+                    if fields and raw_article.url in existing:
+                        changed[raw_article.url] = article
+                    updated_count += 1
+
+                if raw_article.entities and raw_article.url not in with_entities:
+                    entities[raw_article.url] = raw_article.entities
+                    with_entities.add(raw_article.url)
+
+            except Exception as e:
+                logger.error(f"Failed to save article: {e}, url: {raw_article.url}")
+                skipped_count += 1
+
+        if created:
+            NewsArticle.objects.bulk_create(list(created.values()))
+        if changed:
+            now = timezone.now()
+            for article in changed.values():
+                article.updated_at = now
+            NewsArticle.objects.bulk_update(list(changed.values()), ARTICLE_UPDATE_FIELDS)
+
+        saved_articles = {**existing, **created}
+        self._bulk_save_entities(
+            [(saved_articles[url], entities_data) for url, entities_data in entities.items()]
+        )
+
+        return saved_count, updated_count, skipped_count
+
+    def _save_articles_per_row(self, articles: List[RawNewsArticle]) -> tuple:
+        """기사별 savepoint 저장 (bulk 실패 청크 재시도용)"""
+        saved_count = 0
+        updated_count = 0
+        skipped_count = 0
+
         for raw_article in articles:
             try:
                 # 기사별 savepoint 격리: 한 기사의 DB 에러(예: 필드 길이 초과)가
@@ -244,61 +345,69 @@ class NewsAggregatorService:
         # URL로 중복 체크
         try:
             article = NewsArticle.objects.get(url=raw_article.url)
-            created = False
-
-            # 기존 데이터 업데이트 (감성 점수 등)
-            updated = False
-            if raw_article.sentiment_score and not article.sentiment_score:
-                article.sentiment_score = raw_article.sentiment_score
-                article.sentiment_source = raw_article.sentiment_source
-                updated = True
-
-            if raw_article.provider_id:
-                if raw_article.provider_name == "finnhub" and not article.finnhub_id:
-                    article.finnhub_id = int(raw_article.provider_id)
-                    updated = True
-                elif (
-                    raw_article.provider_name == "marketaux"
-                    and not article.marketaux_uuid
-                ):
-                    article.marketaux_uuid = raw_article.provider_id
-                    updated = True
-                elif raw_article.provider_name == "fmp" and not article.fmp_id:
-                    article.fmp_id = raw_article.provider_id
-                    updated = True
-
-            if updated:
-                article.save()
-
-            return article, created
-
         except NewsArticle.DoesNotExist:
             # 새 뉴스 생성
-            article = NewsArticle.objects.create(
-                url=raw_article.url,
-                title=raw_article.title,
-                summary=raw_article.summary,
-                image_url=raw_article.image_url or "",
-                source=raw_article.source,
-                published_at=raw_article.published_at,
-                language=raw_article.language,
-                category=raw_article.category,
-                finnhub_id=int(raw_article.provider_id)
-                if raw_article.provider_name == "finnhub" and raw_article.provider_id
-                else None,
-                marketaux_uuid=raw_article.provider_id
-                if raw_article.provider_name == "marketaux"
-                else "",
-                fmp_id=raw_article.provider_id
-                if raw_article.provider_name == "fmp"
-                else "",
-                sentiment_score=raw_article.sentiment_score,
-                sentiment_source=raw_article.sentiment_source,
-                is_press_release=raw_article.is_press_release,
-                is_official=raw_article.is_press_release,
-            )
+            article = self._new_article(raw_article)
+            article.save(force_insert=True)
             return article, True
 
+        # 기존 데이터 업데이트 (감성 점수 등)
+        fields = self._article_updates(article, raw_article)
+        if fields:
+            for name, value in fields.items():
+                setattr(article, name, value)
+            article.save()
+
+        return article, False
+
+    @staticmethod
+    def _new_article(raw_article: RawNewsArticle) -> NewsArticle:
+        """원본 뉴스 → 저장 전 NewsArticle (url_hash 포함)"""
+        return NewsArticle(
+            url=raw_article.url,
+            url_hash=NewsArticle.hash_url(raw_article.url),
+            title=raw_article.title,
+            summary=raw_article.summary,
+            image_url=raw_article.image_url or "",
+            source=raw_article.source,
+            published_at=raw_article.published_at,
+            language=raw_article.language,
+            category=raw_article.category,
+            finnhub_id=int(raw_article.provider_id)
+            if raw_article.provider_name == "finnhub" and raw_article.provider_id
+            else None,
+            marketaux_uuid=raw_article.provider_id
+            if raw_article.provider_name == "marketaux"
+            else "",
+            fmp_id=raw_article.provider_id
+            if raw_article.provider_name == "fmp"
+            else "",
+            sentiment_score=raw_article.sentiment_score,
+            sentiment_source=raw_article.sentiment_source,
+            is_press_release=raw_article.is_press_release,
+            is_official=raw_article.is_press_release,
+        )
+
+    @staticmethod
+    def _article_updates(
+        article: NewsArticle, raw_article: RawNewsArticle
+    ) -> Dict[str, Any]:
+        """기존 뉴스에 채울 필드 (비어 있는 감성 점수 / provider ID만)"""
+        fields: Dict[str, Any] = {}
+        if raw_article.sentiment_score and not article.sentiment_score:
+            fields["sentiment_score"] = raw_article.sentiment_score
+            fields["sentiment_source"] = raw_article.sentiment_source
+
+        if raw_article.provider_id:
+            if raw_article.provider_name == "finnhub" and not article.finnhub_id:
+                fields["finnhub_id"] = int(raw_article.provider_id)
+            elif raw_article.provider_name == "marketaux" and not article.marketaux_uuid:
+                fields["marketaux_uuid"] = raw_article.provider_id
+            elif raw_article.provider_name == "fmp" and not article.fmp_id:
+                fields["fmp_id"] = raw_article.provider_id
+
+        return fields
+
     def fetch_and_save_company_news_fmp(
         self,
         symbol: str,
@@ -412,21 +521,11 @@ class NewsAggregatorService:
         for entity_data in entities_data:
             try:
                 # NewsEntity 생성/업데이트
-                # None 값을 빈 문자열로 변환 (DB NOT NULL 제약조건)
+                symbol, defaults = self._entity_fields(entity_data)
                 entity, created = NewsEntity.objects.update_or_create(
                     news=article,
-                    symbol=entity_data.get("symbol", "").upper(),
-                    defaults={
-                        "entity_name": entity_data.get("entity_name") or "",
-                        "entity_type": entity_data.get("entity_type") or "equity",
-                        "exchange": entity_data.get("exchange") or "",
-                        "country": entity_data.get("country") or "",
-                        "industry": entity_data.get("industry") or "",
-                        "match_score": entity_data.get("match_score")
-                        or Decimal("1.00000"),
-                        "sentiment_score": entity_data.get("sentiment_score"),
-                        "source": entity_data.get("source") or "finnhub",
-                    },
+                    symbol=symbol,
+                    defaults=defaults,
                 )
 
                 # EntityHighlight 저장 (Marketaux 전용)
@@ -446,3 +545,60 @@ class NewsAggregatorService:
             except Exception as e:
                 logger.error(f"Failed to save entity: {e}, entity_data: {entity_data}")
                 continue
+
+    def _bulk_save_entities(self, pairs: List[tuple]):
+        """
+        새로 연결할 NewsEntity/EntityHighlight 일괄 저장
+
+        Args:
+            pairs: [(NewsArticle, entities_data), ...] — 엔티티가 없는 뉴스만
+        """
+        entities: Dict[tuple, NewsEntity] = {}
+        highlights: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+
+        for article, entities_data in pairs:
+            for entity_data in entities_data:
+                try:
+                    symbol, defaults = self._entity_fields(entity_data)
+                    key = (article.pk, symbol)
+                    # 같은 (뉴스, 심볼)은 update_or_create처럼 마지막 항목 우선
+                    entities[key] = NewsEntity(news=article, symbol=symbol, **defaults)
+                    if "highlights" in entity_data:
+                        for highlight_data in entity_data["highlights"]:
+                            highlights.setdefault(key, {})[
+                                highlight_data.get("text", "")
+                            ] = highlight_data
+                except Exception as e:
+                    logger.error(f"Failed to save entity: {e}, entity_data: {entity_data}")
+                    continue
+
+        if not entities:
+            return
+        NewsEntity.objects.bulk_create(list(entities.values()))
+        rows = [
+            EntityHighlight(
+                news_entity=entities[key],
+                highlight_text=text,
+                sentiment=highlight_data.get("sentiment", Decimal("0.000")),
+                location=highlight_data.get("location", "main_text"),
+            )
+            for key, by_text in highlights.items()
+            for text, highlight_data in by_text.items()
+        ]
+        if rows:
+            EntityHighlight.objects.bulk_create(rows)
+
+    @staticmethod
+    def _entity_fields(entity_data: Dict[str, Any]) -> tuple:
+        """엔티티 데이터 → (symbol, defaults)"""
+        # None 값을 빈 문자열로 변환 (DB NOT NULL 제약조건)
+        return entity_data.get("symbol", "").upper(), {
+            "entity_name": entity_data.get("entity_name") or "",
+            "entity_type": entity_data.get("entity_type") or "equity",
+            "exchange": entity_data.get("exchange") or "",
+            "country": entity_data.get("country") or "",
+            "industry": entity_data.get("industry") or "",
+            "match_score": entity_data.get("match_score") or Decimal("1.00000"),
+            "sentiment_score": entity_data.get("sentiment_score"),
+            "source": entity_data.get("source") or "finnhub",
+        }
@@ -2,14 +2,23 @@
 뉴스 중복 제거 서비스
 
 URL 정규화 및 해시 기반 중복 제거
+제목 유사도는 MinHash + LSH(title_lsh.py)로 후보만 추린 뒤 SequenceMatcher로 검증
 """
 
 import hashlib
 import logging
 from difflib import SequenceMatcher
-from typing import List, Set
+from typing import List, Optional, Set
+
+from django.conf import settings
 
 from ..providers.base import RawNewsArticle
+from .title_lsh import (
+    RecentTitleWindow,
+    TitleLSHIndex,
+    TitleMinHasher,
+    normalize_title,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +26,26 @@ logger = logging.getLogger(__name__)
 class NewsDeduplicator:
     """뉴스 중복 제거 서비스"""
 
-    def __init__(self, title_similarity_threshold: float = 0.85):
+    def __init__(
+        self,
+        title_similarity_threshold: float = 0.85,
+        cross_batch: Optional[bool] = None,
+    ):
         """
         Args:
             title_similarity_threshold: 제목 유사도 임계값 (0.0 ~ 1.0)
+            cross_batch: 최근 N시간(NEWS_DEDUP_WINDOW_HOURS) 다른 배치 제목과도 비교
+                (기본: settings.NEWS_DEDUP_CROSS_BATCH)
         """
         self.title_similarity_threshold = title_similarity_threshold
+        self.hasher = TitleMinHasher()
+        if cross_batch is None:
+            cross_batch = getattr(settings, "NEWS_DEDUP_CROSS_BATCH", False)
+        self.window = (
+            RecentTitleWindow(getattr(settings, "NEWS_DEDUP_WINDOW_HOURS", 72))
+            if cross_batch
+            else None
+        )
 
     def deduplicate(self, articles: List[RawNewsArticle]) -> List[RawNewsArticle]:
         """
@@ -88,35 +111,83 @@ class NewsDeduplicator:
         같은 뉴스가 여러 출처에서 나올 경우,
         URL은 다르지만 제목이 매우 유사한 경우 중복으로 간주
 
+        LSH 버킷을 공유하는 제목만 정확한 유사도로 비교합니다 (전체 쌍 비교 없음).
+        cross_batch 모드에서는 최근 window에 등록된 다른 URL의 제목도 비교 대상이며,
+        같은 URL 재수집은 저장 단계 갱신을 위해 중복으로 보지 않습니다.
+
         Args:
             articles: 뉴스 리스트
 
         Returns:
             List[RawNewsArticle]: 중복 제거된 뉴스 리스트
         """
-        unique_articles = []
+        if not articles:
+            return []
 
-        for article in articles:
-            is_duplicate = False
+        titles = [normalize_title(a.title) for a in articles]
+        band_keys = self.hasher.band_keys(titles)
+        recent = (
+            self.window.lookup({k for keys in band_keys for k in keys})
+            if self.window
+            else {}
+        )
 
-            for existing in unique_articles:
-                similarity = self._calculate_title_similarity(
-                    article.title, existing.title
-                )
+        index = TitleLSHIndex()
+        unique_articles: List[RawNewsArticle] = []
+        kept = []
 
-                if similarity >= self.title_similarity_threshold:
-                    logger.debug(
-                        f"Similar title found (similarity: {similarity:.2f}): "
-                        f"'{article.title}' vs '{existing.title}'"
-                    )
-                    is_duplicate = True
-                    break
+        for article, title, keys in zip(articles, titles, band_keys):
+            url_hash = self._calculate_url_hash(article.url)
+            if self._is_similar_in_batch(article, index, keys, unique_articles):
+                continue
+            if recent and self._is_similar_recent(article, url_hash, keys, recent):
+                continue
 
-            if not is_duplicate:
-                unique_articles.append(article)
+            index.add(keys, len(unique_articles))
+            unique_articles.append(article)
+            kept.append((keys, url_hash, title))
+
+        if self.window:
+            self.window.add(kept)
 
         return unique_articles
 
+    def _is_similar_in_batch(
+        self,
+        article: RawNewsArticle,
+        index: TitleLSHIndex,
+        keys: List[str],
+        unique_articles: List[RawNewsArticle],
+    ) -> bool:
+        for pos in index.candidates(keys):
+            existing = unique_articles[pos]
+            similarity = self._calculate_title_similarity(article.title, existing.title)
+            if similarity >= self.title_similarity_threshold:
+                logger.debug(
+                    f"Similar title found (similarity: {similarity:.2f}): "
+                    f"'{article.title}' vs '{existing.title}'"
+                )
+                return True
+        return False
+
+    def _is_similar_recent(
+        self, article: RawNewsArticle, url_hash: str, keys: List[str], recent: dict
+    ) -> bool:
+        seen: Set[str] = set()
+        for key in keys:
+            for other_hash, other_title, _ in recent.get(key, ()):
+                if other_hash == url_hash or other_hash in seen:
+                    continue
+                seen.add(other_hash)
+                similarity = self._calculate_title_similarity(article.title, other_title)
+                if similarity >= self.title_similarity_threshold:
+                    logger.debug(
+                        f"Similar recent title found (similarity: {similarity:.2f}): "
+                        f"'{article.title}' vs '{other_title}'"
+                    )
+                    return True
+        return False
+
     def _calculate_url_hash(self, url: str) -> str:
         """
         URL 해시 계산
@@ -0,0 +1,253 @@
+"""
+뉴스 엔티티 매처 (Aho–Corasick 다중 패턴 자동자)
+
+제목+요약을 자동자 1회 선형 스캔해 회사명/섹터 키워드 언급을 모두 찾습니다.
+후보 단어마다 SymbolMatcher(Redis/DB/FMP)를 부르던 경로를 대체합니다.
+
+- 회사명: 단어 단위 자동자 (SymbolMatcher.HARDCODED_MAPPINGS + Stock 이름/정규화 이름
+  + 범용 CompanyAlias). 단어 경계에서만 매칭하고, 기존 후보 규칙처럼 첫 글자가
+  대문자(또는 숫자)인 언급만 인정합니다.
+- 티커: Stock.symbol 집합. 전부 대문자인 단어 단위 토큰만 인정합니다 ("NVDA shares jump").
+  기존 후보 규칙(3글자 이상 후보의 SymbolMatcher 정확 티커 매칭)과 같은 재현율.
+- 섹터 키워드: 문자 단위 자동자 (KEYWORD_SECTOR_MAP). 기존 match_sectors의
+  부분 문자열 의미(키워드당 1회 집계, 빈도 순)를 그대로 유지합니다.
+- cashtag / 거래소 괄호 패턴은 이미 단일 정규식 패스라 news_classifier에서 그대로 처리.
+
+회사명 자동자는 프로세스당 1회 구축하고 Stock/CompanyAlias fingerprint가 바뀌거나
+ENTITY_MATCHER_MAX_AGE가 지나면 재구축합니다 (get_entity_matcher).
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Count, Max
+
+from packages.shared.stocks.models import Stock
+
+from .keyword_sector_map import KEYWORD_SECTOR_MAP
+
+logger = logging.getLogger(__name__)
+
+# 기존 후보 규칙: 3글자 이상
+MIN_NAME_LENGTH = 3
+ENTITY_MATCHER_MAX_AGE = 6 * 3600
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9&]+")
+# 원문(대소문자 유지)의 전부 대문자 단어 — 클래스 주식 표기(BRK.B) 포함
+TICKER_TOKEN_PATTERN = re.compile(
+    r"(?<![A-Za-z0-9&])[A-Z][A-Z0-9]*(?:\.[A-Z])?(?![A-Za-z0-9&])"
+)
+
+
+class AhoCorasick:
+    """
+    Aho–Corasick 자동자
+
+    심볼은 해시 가능한 아무 값 (문자열의 문자, 토큰 리스트의 토큰).
+    iter()는 입력 길이에 선형 — 패턴 수와 무관하게 1회 스캔으로 모든 출현을 보고합니다.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[Sequence[Hashable], Any]]):
+        self._goto: List[Dict[Hashable, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[tuple] = [()]
+
+        for symbols, value in patterns:
+            if not symbols:
+                continue
+            state = 0
+            for symbol in symbols:
+                nxt = self._goto[state].get(symbol)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][symbol] = nxt
+                state = nxt
+            self._out[state] += ((len(symbols), value),)
+
+        # BFS로 실패 링크 + 출력 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(symbol, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter(self, symbols: Iterable[Hashable]) -> Iterator[Tuple[int, int, Any]]:
+        """(끝 위치, 패턴 길이, 값) 출현 전부"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, symbol in enumerate(symbols):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for length, value in out[state]:
+                yield position, length, value
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 텍스트 → 단어 토큰 (패턴과 본문에 같은 규칙)"""
+    return TOKEN_PATTERN.findall(text)
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """소문자 변환 (길이가 바뀌는 문자는 그대로 두어 원문 인덱스 유지)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+_SECTOR_AUTOMATON = AhoCorasick((keyword, keyword) for keyword in KEYWORD_SECTOR_MAP)
+_KEYWORD_ORDER = {keyword: i for i, keyword in enumerate(KEYWORD_SECTOR_MAP)}
+
+
+def sectors_in(text_lower: str) -> List[str]:
+    """
+    소문자 텍스트 → 섹터 리스트 (매칭 키워드 수 내림차순, 동률은 사전 순서)
+
+    keyword_sector_map.match_sectors와 같은 결과를 문자 자동자 1회 스캔으로 계산합니다.
+    """
+    keywords = {keyword for _, _, keyword in _SECTOR_AUTOMATON.iter(text_lower)}
+    sector_counts: Dict[str, int] = {}
+    for keyword in sorted(keywords, key=_KEYWORD_ORDER.__getitem__):
+        sector = KEYWORD_SECTOR_MAP[keyword]
+        sector_counts[sector] = sector_counts.get(sector, 0) + 1
+    return sorted(sector_counts, key=lambda s: sector_counts[s], reverse=True)
+
+
+@dataclass
+class EntityMentions:
+    """텍스트 1건의 엔티티 언급"""
+
+    tickers: set = field(default_factory=set)
+    sectors: List[str] = field(default_factory=list)
+
+
+class EntityMatcher:
+    """
+    회사명 + 섹터 키워드 매처
+
+    Usage:
+        mentions = get_entity_matcher().scan(f"{title} {summary}")
+        mentions.tickers  # {'AAPL', 'NVDA'}
+        mentions.sectors  # ['Technology']
+    """
+
+    def __init__(
+        self, companies: Dict[str, str], fingerprint=None, symbols: Iterable[str] = ()
+    ):
+        """
+        Args:
+            companies: {회사명: ticker} — 이름은 tokenize 규칙으로 정규화되며 먼저 나온 항목 우선
+            symbols: 본문의 대문자 티커로 인정할 종목 심볼 (MIN_NAME_LENGTH 미만은 제외)
+        """
+        names: Dict[Tuple[str, ...], str] = {}
+        for name, symbol in companies.items():
+            tokens = tuple(tokenize(_lower_preserving_offsets(name or "")))
+            if symbol and len(" ".join(tokens)) >= MIN_NAME_LENGTH:
+                names.setdefault(tokens, symbol.upper())
+        self._companies = AhoCorasick(names.items())
+        self._symbols = frozenset(
+            s.upper() for s in symbols if s and len(s) >= MIN_NAME_LENGTH
+        )
+        self.size = len(names)
+        self.fingerprint = fingerprint
+        self.built_at = time.time()
+
+    @classmethod
+    def build(cls, fingerprint=None) -> "EntityMatcher":
+        """하드코딩 매핑 → Stock 이름 → 범용 CompanyAlias 순으로 회사명 사전 + Stock 심볼 집합 구축"""
+        from services.sec_pipeline.models import CompanyAlias
+        from services.serverless.services.symbol_matcher import SymbolMatcher, get_symbol_matcher
+
+        normalize = get_symbol_matcher()._normalize_name
+        companies: Dict[str, str] = dict(SymbolMatcher.HARDCODED_MAPPINGS)
+        symbols = []
+        for symbol, name in Stock.objects.values_list("symbol", "stock_name"):
+            symbols.append(symbol)
+            if name:
+                companies.setdefault(name, symbol)
+                companies.setdefault(normalize(name), symbol)
+        for alias, ticker in CompanyAlias.objects.filter(context_sector="").values_list(
+            "alias", "ticker"
+        ):
+            companies.setdefault(alias, ticker)
+        return cls(companies, fingerprint, symbols)
+
+    def scan(self, text: str) -> EntityMentions:
+        """텍스트 1회 스캔 → 회사 ticker(회사명 + 대문자 티커) + 섹터"""
+        if not text:
+            return EntityMentions()
+        lowered = _lower_preserving_offsets(text)
+        spans = [(m.start(), m.group()) for m in TOKEN_PATTERN.finditer(lowered)]
+        tickers = set()
+        for end, length, symbol in self._companies.iter(token for _, token in spans):
+            start = spans[end - length + 1][0]
+            if not text[start].islower():
+                tickers.add(symbol)
+        if self._symbols:
+            tickers.update(
+                token
+                for token in TICKER_TOKEN_PATTERN.findall(text)
+                if token in self._symbols
+            )
+        return EntityMentions(tickers=tickers, sectors=sectors_in(lowered))
+
+    def scan_many(self, texts: Iterable[str]) -> List[EntityMentions]:
+        """배치 스캔 (입력 순서 유지)"""
+        return [self.scan(text) for text in texts]
+
+
+_matcher_lock = threading.Lock()
+_shared: Dict[str, Optional[EntityMatcher]] = {"matcher": None}
+
+
+def _fingerprint() -> tuple:
+    from services.sec_pipeline.models import CompanyAlias
+
+    stocks = Stock.objects.aggregate(count=Count("symbol"), latest=Max("created_at"))
+    aliases = CompanyAlias.objects.aggregate(count=Count("id"), latest=Max("id"))
+    return stocks["count"], stocks["latest"], aliases["count"], aliases["latest"]
+
+
+def get_entity_matcher() -> EntityMatcher:
+    """프로세스 공유 EntityMatcher (fingerprint 변경 또는 만료 시 재구축)"""
+    fingerprint = _fingerprint()
+    matcher = _shared["matcher"]
+    if (
+        matcher is not None
+        and matcher.fingerprint == fingerprint
+        and time.time() - matcher.built_at < ENTITY_MATCHER_MAX_AGE
+    ):
+        return matcher
+    with _matcher_lock:
+        matcher = _shared["matcher"]
+        if (
+            matcher is None
+            or matcher.fingerprint != fingerprint
+            or time.time() - matcher.built_at >= ENTITY_MATCHER_MAX_AGE
+        ):
+            started = time.perf_counter()
+            matcher = EntityMatcher.build(fingerprint)
+            _shared["matcher"] = matcher
+            logger.info(
+                f"[EntityMatcher] built {matcher.size} company names, "
+                f"{len(matcher._symbols)} symbols "
+                f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+    return matcher
@@ -213,15 +213,7 @@ def match_sectors(text: str) -> list[str]:
     if not text:
         return []
 
-    text_lower = text.lower()
-    sector_counts = {}
+    # 문자 단위 Aho–Corasick 1회 스캔 (키워드별 `in` 검사와 같은 결과)
+    from .entity_matcher import sectors_in
 
-    for keyword, sector in KEYWORD_SECTOR_MAP.items():
-        if keyword in text_lower:
-            sector_counts[sector] = sector_counts.get(sector, 0) + 1
-
-    # 매칭 빈도 순으로 정렬
-    sorted_sectors = sorted(
-        sector_counts.keys(), key=lambda s: sector_counts[s], reverse=True
-    )
-    return sorted_sectors
+    return sectors_in(text.lower())
@@ -2,22 +2,23 @@
 뉴스 분류 서비스 (News Intelligence Pipeline v3 - Phase 1)
 
 3단계 규칙 엔진으로 뉴스를 분류하고 중요도를 산정합니다.
-- Engine A: 종목 매칭 (SymbolMatcher + cashtag/괄호 regex)
-- Engine B: 섹터 분류 (키워드→섹터 매핑)
+- Engine A: 종목 매칭 (EntityMatcher 회사명 자동자 + cashtag/괄호 regex)
+- Engine B: 섹터 분류 (키워드→섹터 매핑, 같은 EntityMatcher 스캔)
 - Engine C: 5-factor 중요도 스코어링
 - 퍼센타일 선별: 당일 누적 기준 상위 15%, 미분석 필터
 """
 
 import logging
 import re
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 
 from django.utils import timezone
 
-from ..models import NewsArticle
-from .keyword_sector_map import match_sectors
+from ..models import NewsArticle, NewsEntity
+from .entity_matcher import EntityMentions, get_entity_matcher, sectors_in
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,13 @@ DEFAULT_SOURCE_SCORE = 0.5
 # 퍼센타일 선별 비율
 TOP_PERCENTILE = 0.15  # 상위 15%
 
+# ── classify_batch 청크 처리 ──
+
+CLASSIFY_CHUNK_SIZE = 500
+
+# 분류에 필요한 컬럼만 로드 (텍스트 + Engine C 입력)
+CLASSIFY_FIELDS = ("id", "title", "summary", "source", "published_at", "sentiment_score")
+CLASSIFY_UPDATE_FIELDS = ["rule_tickers", "rule_sectors", "importance_score", "updated_at"]
 
 class NewsClassifier:
     """
@@ -146,7 +154,7 @@ class NewsClassifier:
         else:
             # Phase 5: 배포된 ML 가중치 자동 적용
             self.weights = self._load_deployed_weights()
-        self._symbol_matcher = None
+        self._entity_matcher = None
 
     @staticmethod
     def _load_deployed_weights() -> dict:
@@ -163,19 +171,22 @@ class NewsClassifier:
         return DEFAULT_WEIGHTS
 
     @property
-    def symbol_matcher(self):
-        """SymbolMatcher lazy initialization"""
-        if self._symbol_matcher is None:
-            from services.serverless.services.symbol_matcher import get_symbol_matcher
-
-            self._symbol_matcher = get_symbol_matcher()
-        return self._symbol_matcher
+    def entity_matcher(self):
+        """EntityMatcher lazy initialization (프로세스 공유 자동자)"""
+        if self._entity_matcher is None:
+            self._entity_matcher = get_entity_matcher()
+        return self._entity_matcher
 
     # ════════════════════════════════════════
     # Engine A: 종목 매칭
     # ════════════════════════════════════════
 
-    def extract_tickers(self, article: NewsArticle) -> list[str]:
+    def extract_tickers(
+        self,
+        article: NewsArticle,
+        entity_symbols: Optional[list] = None,
+        mentions: Optional[EntityMentions] = None,
+    ) -> list[str]:
         """
         뉴스에서 관련 ticker 추출
 
@@ -183,26 +194,52 @@ class NewsClassifier:
         1. 기존 NewsEntity (provider가 제공한 ticker)
         2. Cashtag ($AAPL)
         3. 거래소 괄호 패턴 (NASDAQ: AAPL)
-        4. SymbolMatcher (본문 내 회사명)
+        4. EntityMatcher (본문 내 회사명)
+
+        Args:
+            entity_symbols: 미리 조회한 NewsEntity symbol (None이면 조회)
+            mentions: 미리 스캔한 EntityMentions (None이면 스캔)
         """
         tickers = set()
+        text = self._article_text(article)
+        if entity_symbols is None:
+            entity_symbols = list(article.entities.values_list("symbol", flat=True))
 
         # 1. 기존 NewsEntity에서 ticker
-        entity_symbols = list(article.entities.values_list("symbol", flat=True))
         tickers.update(s.upper() for s in entity_symbols)
 
         # 2-3. 제목 + 본문에서 regex 추출
-        text = f"{article.title} {article.summary or ''}"
         tickers.update(self._extract_cashtags(text))
         tickers.update(self._extract_exchange_tickers(text))
 
-        # 4. 본문 내 회사명 → SymbolMatcher
+        # 4. 본문 내 회사명 → EntityMatcher
         if len(tickers) < 3:  # 이미 충분하면 skip
-            matched = self._match_company_names(text)
-            tickers.update(matched)
+            tickers.update(self._match_company_names(text, mentions))
 
         return sorted(tickers)[:10]  # 최대 10개
 
+    def scan_batch(self, articles: list) -> tuple[dict, list[EntityMentions]]:
+        """
+        배치 엔티티 스캔
+
+        NewsEntity는 배치 전체 1회 조회, 기사당 자동자 스캔 1회로 회사명과 섹터를 함께 찾습니다.
+
+        Returns:
+            ({article_id: [symbol, ...]}, [EntityMentions, ...] (articles 순서))
+        """
+        entity_symbols: dict = {}
+        for news_id, symbol in NewsEntity.objects.filter(
+            news_id__in=[article.pk for article in articles]
+        ).values_list("news_id", "symbol"):
+            entity_symbols.setdefault(news_id, []).append(symbol)
+
+        texts = [self._article_text(article) for article in articles]
+        return entity_symbols, self.entity_matcher.scan_many(texts)
+
+    @staticmethod
+    def _article_text(article: NewsArticle) -> str:
+        return f"{article.title} {article.summary or ''}"
+
     def _extract_cashtags(self, text: str) -> set[str]:
         """$AAPL 형태의 cashtag 추출"""
         matches = CASHTAG_PATTERN.findall(text)
@@ -213,35 +250,15 @@ class NewsClassifier:
         matches = EXCHANGE_PATTERN.findall(text)
         return set(matches)
 
-    def _match_company_names(self, text: str) -> set[str]:
-        """본문 내 회사명을 SymbolMatcher로 매칭"""
-        tickers = set()
-        text_lower = text.lower()
-
-        # 대문자로 시작하는 단어들을 후보로 추출 (간단한 NER 대체)
-        # 2~3개 단어 조합까지 시도
-        words = text.split()
-        candidates = set()
-
-        for i, word in enumerate(words):
-            # 1-word candidate
-            clean = re.sub(r"[^\w\s&\'-]", "", word).strip()
-            if clean and clean[0].isupper() and len(clean) >= 3:
-                candidates.add(clean)
-                # 2-word candidate
-                if i + 1 < len(words):
-                    next_word = re.sub(r"[^\w\s&\'-]", "", words[i + 1]).strip()
-                    candidates.add(f"{clean} {next_word}")
-
-        for candidate in candidates:
-            symbol = self.symbol_matcher.match(candidate)
-            if symbol:
-                # 동음이의어 문맥 필터
-                if symbol in AMBIGUOUS_TICKERS:
-                    if not self._has_stock_context(text_lower):
-                        continue
-                tickers.add(symbol)
-
+    def _match_company_names(
+        self, text: str, mentions: Optional[EntityMentions] = None
+    ) -> set[str]:
+        """본문 내 회사명을 EntityMatcher 자동자로 매칭 (동음이의어는 주식 문맥 필요)"""
+        if mentions is None:
+            mentions = self.entity_matcher.scan(text)
+        tickers = set(mentions.tickers)
+        if tickers & AMBIGUOUS_TICKERS and not self._has_stock_context(text.lower()):
+            tickers -= AMBIGUOUS_TICKERS
         return tickers
 
     def _has_stock_context(self, text_lower: str) -> bool:
@@ -252,10 +269,13 @@ class NewsClassifier:
     # Engine B: 섹터 분류
     # ════════════════════════════════════════
 
-    def extract_sectors(self, article: NewsArticle) -> list[str]:
+    def extract_sectors(
+        self, article: NewsArticle, mentions: Optional[EntityMentions] = None
+    ) -> list[str]:
         """뉴스에서 관련 섹터 추출 (키워드 매핑)"""
-        text = f"{article.title} {article.summary or ''}"
-        return match_sectors(text)
+        if mentions is not None:
+            return mentions.sectors
+        return sectors_in(self._article_text(article).lower())
 
     # ════════════════════════════════════════
     # Engine C: 5-factor 중요도 스코어링
@@ -323,60 +343,100 @@ class NewsClassifier:
     # ════════════════════════════════════════
 
     def classify_batch(
-        self, article_ids: Optional[list] = None, hours: int = 4
+        self,
+        article_ids: Optional[list] = None,
+        hours: Optional[int] = 4,
+        reclassify: bool = False,
+        chunk_size: int = CLASSIFY_CHUNK_SIZE,
     ) -> dict:
         """
         뉴스 배치 분류 (수집 직후 체이닝)
 
+        pk 순 keyset 청크로 필요한 컬럼만 읽고, 청크마다 스캔 → 스코어 → bulk_update.
+        자동자 스캔은 프로세스 안에서 직렬로 실행합니다 (Celery prefork 워커는 데몬이라
+        자식 프로세스 풀을 띄울 수 없고, 순수 Python 스캔은 스레드로 나눠도 GIL에 묶임).
+
         Args:
             article_ids: 특정 뉴스 ID 리스트 (None이면 최근 N시간)
-            hours: article_ids가 None일 때 조회 범위
+            hours: article_ids가 None일 때 조회 범위 (None이면 전체 기간)
+            reclassify: True면 이미 점수가 있는 뉴스도 다시 분류 (가중치 재배포 시)
+            chunk_size: 청크당 뉴스 수
 
         Returns:
-            dict: {classified: int, skipped: int, errors: int}
+            dict: {classified, skipped, errors, chunks, elapsed_ms, articles_per_sec}
         """
+        articles = NewsArticle.objects.all()
         if article_ids:
-            articles = NewsArticle.objects.filter(
-                id__in=article_ids,
-                importance_score__isnull=True,
-            )
-        else:
-            cutoff = timezone.now() - __import__("datetime").timedelta(hours=hours)
-            articles = NewsArticle.objects.filter(
-                published_at__gte=cutoff,
-                importance_score__isnull=True,
+            articles = articles.filter(id__in=article_ids)
+        elif hours is not None:
+            cutoff = timezone.now() - timedelta(hours=hours)
+            articles = articles.filter(published_at__gte=cutoff)
+        if not reclassify:
+            articles = articles.filter(importance_score__isnull=True)
+        articles = articles.only(*CLASSIFY_FIELDS).order_by("pk")
+
+        result = {"classified": 0, "skipped": 0, "errors": 0, "chunks": 0}
+        started = time.perf_counter()
+        for chunk in self._iter_chunks(articles, chunk_size):
+            chunk_started = time.perf_counter()
+            classified, errors = self._classify_chunk(chunk)
+            elapsed = time.perf_counter() - chunk_started
+
+            result["classified"] += classified
+            result["errors"] += errors
+            result["chunks"] += 1
+            logger.info(
+                f"[NewsClassifier] chunk {result['chunks']}: {len(chunk)} articles "
+                f"in {elapsed * 1000:.0f}ms ({len(chunk) / max(elapsed, 1e-6):.0f}/s)"
             )
 
-        classified = 0
-        skipped = 0
-        errors = 0
+        elapsed = time.perf_counter() - started
+        total = result["classified"] + result["errors"]
+        result["elapsed_ms"] = round(elapsed * 1000, 1)
+        result["articles_per_sec"] = round(total / elapsed, 1) if total else 0.0
+        logger.info(f"NewsClassifier batch complete: {result}")
+        return result
 
-        for article in articles:
+    def _classify_chunk(self, articles: list) -> tuple[int, int]:
+        """청크 1개 분류 + bulk_update. (classified, errors) 반환"""
+        entity_symbols, mentions = self.scan_batch(articles)
+
+        classified: list = []
+        errors = 0
+        now = timezone.now()
+        for article, found in zip(articles, mentions):
             try:
-                tickers = self.extract_tickers(article)
-                sectors = self.extract_sectors(article)
+                tickers = self.extract_tickers(
+                    article, entity_symbols.get(article.pk, []), found
+                )
+                sectors = self.extract_sectors(article, found)
                 score = self.calculate_importance(article, tickers, sectors)
 
                 article.rule_tickers = tickers if tickers else None
                 article.rule_sectors = sectors if sectors else None
                 article.importance_score = score
-                article.save(
-                    update_fields=[
-                        "rule_tickers",
-                        "rule_sectors",
-                        "importance_score",
-                        "updated_at",
-                    ]
-                )
-                classified += 1
+                article.updated_at = now
+                classified.append(article)
 
             except Exception as e:
                 logger.error(f"Classification error for {article.id}: {e}")
                 errors += 1
 
-        result = {"classified": classified, "skipped": skipped, "errors": errors}
-        logger.info(f"NewsClassifier batch complete: {result}")
-        return result
+        if classified:
+            NewsArticle.objects.bulk_update(classified, CLASSIFY_UPDATE_FIELDS)
+        return len(classified), errors
+
+    @staticmethod
+    def _iter_chunks(queryset, chunk_size: int):
+        """pk keyset 페이지네이션 (갱신으로 필터에서 빠지는 행이 있어도 누락/중복 없음)"""
+        last_pk = None
+        while True:
+            page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            chunk = list(page[:chunk_size])
+            if not chunk:
+                return
+            yield chunk
+            last_pk = chunk[-1].pk
 
     # ════════════════════════════════════════
     # 퍼센타일 선별 (당일 누적 기준 + 미전송 필터)
@@ -0,0 +1,179 @@
+"""
+뉴스 제목 MinHash + LSH 인덱스
+
+제목을 문자 3-gram shingle 집합으로 보고 MinHash 서명을 band로 나눈 버킷 key를 만듭니다.
+같은 버킷을 하나라도 공유하는 제목만 중복 후보가 되며, 최종 판정은 호출자가
+정확한 유사도(SequenceMatcher)로 검증합니다 → LSH는 비교 횟수만 줄이고 오탐은 만들지 않음.
+
+- 기본 32 band x 3 row: Jaccard 0.5 제목쌍이 후보가 될 확률 ≈ 98.6%, 0.2 ≈ 23%
+- RecentTitleWindow: band 버킷을 Django cache에 보관해 배치/Provider를 넘어선
+  최근 N시간 제목과 비교 (settings.NEWS_DEDUP_CROSS_BATCH)
+"""
+
+import hashlib
+import logging
+import time
+import zlib
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+NUM_BANDS = 32
+ROWS_PER_BAND = 3
+
+# 2^32 초과 최소 소수 — a, h < 2^32 이므로 a*h + b 가 uint64에 들어감
+_PRIME = np.uint64(4294967311)
+
+
+def normalize_title(title: str) -> str:
+    """대소문자 무시, 공백 정규화"""
+    return " ".join((title or "").lower().split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """문자 n-gram shingle (짧은 제목은 전체를 1개 shingle로)"""
+    if len(text) <= size:
+        return [text]
+    return list({text[i : i + size] for i in range(len(text) - size + 1)})
+
+
+class TitleMinHasher:
+    """
+    제목 배치 → MinHash 서명 / LSH band key
+
+    서명 계산은 배치 전체 shingle 해시를 한 번에 순열 변환하고
+    제목 경계별 np.minimum.reduceat으로 최소값을 구합니다.
+    """
+
+    def __init__(
+        self,
+        num_bands: int = NUM_BANDS,
+        rows_per_band: int = ROWS_PER_BAND,
+        seed: int = 1,
+    ):
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        num_perm = num_bands * rows_per_band
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, num_perm, dtype=np.uint64)
+
+    def signatures(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        Args:
+            titles: 정규화된 제목 리스트
+
+        Returns:
+            (len(titles) x num_perm) uint64 서명
+        """
+        if not titles:
+            return np.zeros((0, len(self._a)), dtype=np.uint64)
+        hashes: List[int] = []
+        offsets: List[int] = []
+        for title in titles:
+            offsets.append(len(hashes))
+            hashes.extend(zlib.crc32(s.encode("utf-8")) for s in shingles(title))
+        h = np.asarray(hashes, dtype=np.uint64)[:, None]
+        permuted = (h * self._a + self._b) % _PRIME
+        return np.minimum.reduceat(permuted, offsets, axis=0)
+
+    def band_keys(self, titles: Sequence[str]) -> List[List[str]]:
+        """
+        제목별 LSH 버킷 key 리스트 (band 번호 포함, 프로세스 간 안정적인 해시)
+        """
+        sigs = self.signatures(titles)
+        bands = sigs.reshape(len(titles), self.num_bands, self.rows_per_band)
+        return [
+            [
+                f"{band}:{hashlib.blake2b(row.tobytes(), digest_size=8).hexdigest()}"
+                for band, row in enumerate(title_bands)
+            ]
+            for title_bands in bands
+        ]
+
+
+class TitleLSHIndex:
+    """
+    배치 내 LSH 인덱스 (버킷 key → 등록 순번 리스트)
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, List[int]] = {}
+
+    def candidates(self, keys: Iterable[str]) -> List[int]:
+        """버킷을 공유하는 항목 순번 (등록 순, 중복 없음)"""
+        found: Dict[int, None] = {}
+        for key in keys:
+            for item in self._buckets.get(key, ()):
+                found[item] = None
+        return sorted(found)
+
+    def add(self, keys: Iterable[str], item: int) -> None:
+        for key in keys:
+            self._buckets.setdefault(key, []).append(item)
+
+
+class RecentTitleWindow:
+    """
+    최근 N시간 제목 LSH 버킷 (Django cache, 워커/Provider 공유)
+
+    버킷 값은 [url_hash, 정규화 제목, 등록 시각] 리스트. 읽기는 get_many 1회,
+    쓰기는 get_many + set_many 1회씩이며 만료 항목은 쓰기 시 정리합니다.
+    동시 쓰기는 마지막 쓰기가 이기는 best-effort입니다 (놓친 항목은 다음 배치의
+    URL/유사도 검사로 보완).
+    """
+
+    CACHE_KEY_PREFIX = "news_dedup:lsh"
+
+    def __init__(self, window_hours: int = 72):
+        self.window_seconds = int(window_hours * 3600)
+
+    def _cache_key(self, band_key: str) -> str:
+        return f"{self.CACHE_KEY_PREFIX}:{band_key}"
+
+    def lookup(self, band_keys: Iterable[str]) -> Dict[str, list]:
+        """버킷 key → 최근 항목 리스트 (cache 오류 시 빈 dict)"""
+        keys = {self._cache_key(k): k for k in band_keys}
+        if not keys:
+            return {}
+        try:
+            found = cache.get_many(list(keys))
+        except Exception as e:
+            logger.warning(f"[RecentTitleWindow] lookup failed: {e}")
+            return {}
+        cutoff = time.time() - self.window_seconds
+        return {
+            keys[ck]: [entry for entry in entries if entry[2] >= cutoff]
+            for ck, entries in found.items()
+        }
+
+    def add(self, items: Sequence[tuple]) -> None:
+        """
+        Args:
+            items: (band_keys, url_hash, normalized_title) 리스트
+        """
+        if not items:
+            return
+        now = time.time()
+        cutoff = now - self.window_seconds
+        additions: Dict[str, list] = {}
+        for band_keys, url_hash, title in items:
+            for key in band_keys:
+                additions.setdefault(self._cache_key(key), []).append(
+                    [url_hash, title, now]
+                )
+        try:
+            existing = cache.get_many(list(additions))
+            cache.set_many(
+                {
+                    ck: [e for e in existing.get(ck, []) if e[2] >= cutoff] + new
+                    for ck, new in additions.items()
+                },
+                timeout=self.window_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"[RecentTitleWindow] add failed: {e}")
@@ -551,6 +551,53 @@ def classify_news_batch(self, article_ids=None, hours=4):
         )
 
 
+@shared_task(
+    bind=True,
+    max_retries=1,
+    default_retry_delay=60 * 10,
+    soft_time_limit=3600,  # 60분 소프트 타임아웃
+    time_limit=3660,  # 61분 하드 타임아웃
+)
+def reclassify_news_importance(self, hours=None):
+    """
+    뉴스 중요도 재분류 태스크 (ML 가중치 배포 직후)
+
+    이미 점수가 있는 뉴스까지 배포된 가중치로 다시 계산합니다.
+    classify_batch 청크 + bulk_update 경로라 전체 아카이브도 한 번에 처리합니다.
+
+    Args:
+        hours: 최근 N시간만 재분류 (None이면 전체)
+
+    Returns:
+        dict: {classified, skipped, errors, chunks, elapsed_ms, articles_per_sec}
+    """
+    _start = time.time()
+    _result = {"saved": 0, "skipped": 0, "errors": 0}
+    try:
+        from services.news.services.news_classifier import NewsClassifier
+
+        classifier = NewsClassifier()
+        result = classifier.classify_batch(hours=hours, reclassify=True)
+
+        logger.info(f"reclassify_news_importance completed: {result}")
+        _result = {
+            "saved": result.get("classified", 0),
+            "skipped": result.get("skipped", 0),
+            "errors": result.get("errors", 0),
+        }
+        return result
+
+    except Exception as exc:
+        _result["errors"] = _result.get("errors", 0) + 1
+        logger.exception(f"reclassify_news_importance failed: {exc}")
+        raise self.retry(exc=exc)
+    finally:
+        _log_collection(
+            "reclassify_news_importance", "internal", 0, _result,
+            duration=time.time() - _start,
+        )
+
+
 @shared_task(
     bind=True,
     max_retries=2,
@@ -860,6 +907,9 @@ def check_auto_deploy(self):
         logger.info(
             f"check_auto_deploy: {result.get('action')} - {result.get('reason')}"
         )
+        if result.get("action") == "deployed":
+            # 새 가중치로 기존 importance_score 재계산
+            reclassify_news_importance.delay()
         return result
 
     except Exception as exc:
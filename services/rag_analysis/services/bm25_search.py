@@ -2,14 +2,23 @@
 BM25 Search Service
 
 rank_bm25를 사용한 키워드 기반 검색 서비스
+
+DocumentIndex에 이미 색인된 문서는 저장된 용어 통계(OkapiScorer)로 점수를 계산해
+매 검색마다 전체 문서를 다시 토큰화하지 않습니다.
 """
 
 import logging
-import re
 from typing import List, Optional, Tuple
 
 from rank_bm25 import BM25Okapi
 
+from .document_index import (
+    OkapiScorer,
+    document_bm25_text,
+    get_document_index,
+    tokenize,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +27,7 @@ class BM25SearchService:
 
     def __init__(self):
         """BM25 인덱스 초기화"""
-        self._index: Optional[BM25Okapi] = None
+        self._index: Optional[BM25Okapi | OkapiScorer] = None
         self._documents: Optional[List[dict]] = None
 
     def _tokenize(self, text: str) -> List[str]:
@@ -31,15 +40,8 @@ class BM25SearchService:
         Returns:
             토큰 리스트
         """
-        if not text:
-            return []
-
-        # 한글, 영문, 숫자를 각각 추출
-        # [가-힣]+: 한글 연속
-        # [a-zA-Z]+: 영문 연속
-        # [0-9]+: 숫자 연속
-        tokens = re.findall(r"[가-힣]+|[a-zA-Z]+|[0-9]+", text.lower())
-        return tokens
+        # 한글/영문/숫자 연속 추출 — DocumentIndex 용어 통계와 같은 규칙이어야 함
+        return tokenize(text)
 
     def build_index(self, documents: List[dict]) -> None:
         """
@@ -56,14 +58,20 @@ class BM25SearchService:
 
         try:
             self._documents = documents
+
+            cached = self._build_from_document_index(documents)
+            if cached is not None:
+                self._index = cached
+                logger.info(
+                    f"BM25 index built with {len(documents)} documents (cached terms)"
+                )
+                return
+
             tokenized_docs = []
 
             for doc in documents:
                 # 제목과 내용을 결합하여 토큰화
-                text = doc.get("content", doc.get("text", ""))
-                title = doc.get("title", "")
-                combined = f"{title} {text}"
-                tokens = self._tokenize(combined)
+                tokens = self._tokenize(document_bm25_text(doc))
                 tokenized_docs.append(tokens)
 
             # BM25 인덱스 생성
@@ -75,6 +83,24 @@ class BM25SearchService:
             self._index = None
             self._documents = None
 
+    def _build_from_document_index(
+        self, documents: List[dict]
+    ) -> Optional[OkapiScorer]:
+        """
+        모든 문서가 DocumentIndex에 색인되어 있으면 저장된 용어 통계로 구축
+
+        Returns:
+            OkapiScorer, 인덱스 비활성화 또는 미색인 문서가 있으면 None
+        """
+        index = get_document_index()
+        if index is None:
+            return None
+        rows = index.lookup(documents)
+        if any(row is None for row in rows):
+            return None
+        doc_freqs, doc_len = index.term_stats(rows)
+        return OkapiScorer(doc_freqs, doc_len)
+
     def search(
         self,
         query: str,
@@ -0,0 +1,457 @@
+"""
+Document Index Service
+
+RAG 검색 대상 문서의 임베딩과 BM25 용어 통계를 디스크에 영속 보관합니다.
+문서는 내용 해시(title + content)당 한 번만 인코딩/토큰화하고, 쿼리 시에는
+쿼리 문자열만 인코딩한 뒤 정규화 벡터 행렬과의 내적으로 유사도를 계산합니다.
+
+디스크 레이아웃 (append-only 세그먼트):
+    {RAG_DOCUMENT_INDEX_DIR}/manifest.json        {"model", "dim", "segments": [...]} (os.replace 원자 교체)
+    {RAG_DOCUMENT_INDEX_DIR}/seg-{id}/vectors.npy float32 L2 정규화 임베딩 (mmap)
+    {RAG_DOCUMENT_INDEX_DIR}/seg-{id}/rows.json   {"keys", "hashes", "lengths", "terms", "indexed_at"}
+
+- 새 문서(뉴스/공시 도착, 또는 쿼리 시 처음 보는 문서)는 새 세그먼트로 추가
+- 세그먼트가 MAX_SEGMENTS를 넘으면 병합하면서, 문서 id별 최신 내용이 아닌 행은 제거
+- prune()은 보존 기간(indexed_at 기준)이 지났거나 삭제된 문서 행을 제거 (index_rag_documents beat)
+- 쓰기는 파일 락(.lock)으로 워커 간 직렬화, 독자는 manifest가 바뀌면 다시 연다
+- 모델(MODEL_NAME)이 바뀌면 기존 세그먼트는 무시하고 새로 채운다
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_DIM = 384  # all-MiniLM-L6-v2 차원
+MAX_SEGMENTS = 16
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-zA-Z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """BM25 토큰화 (한글/영문/숫자 연속 추출, 소문자)"""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def document_text(doc: dict) -> str:
+    """임베딩 대상 텍스트 (content 우선, 없으면 text)"""
+    return doc.get("content", doc.get("text", ""))
+
+
+def document_bm25_text(doc: dict) -> str:
+    """BM25 대상 텍스트 (제목 + 본문)"""
+    return f"{doc.get('title', '')} {document_text(doc)}"
+
+
+def content_hash(doc: dict) -> str:
+    """임베딩/토큰 결과를 결정하는 내용(title, content)의 해시"""
+    payload = json.dumps([doc.get("title", ""), document_text(doc)], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def document_key(doc: dict) -> str:
+    """
+    문서 고유 ID
+
+    우선순위: id > symbol+date+type > 내용 해시 (프로세스 간 안정)
+    """
+    if "id" in doc:
+        return str(doc["id"])
+
+    parts = []
+    if "symbol" in doc:
+        parts.append(doc["symbol"].upper())
+    if "date" in doc or "created_at" in doc:
+        parts.append(doc.get("date", doc.get("created_at", "")))
+    if "type" in doc:
+        parts.append(doc["type"])
+
+    if parts:
+        return "_".join(parts)
+
+    return hashlib.sha1(str(doc).encode("utf-8")).hexdigest()
+
+
+class OkapiScorer:
+    """
+    캐시된 용어 통계로 계산하는 BM25Okapi
+
+    rank_bm25.BM25Okapi(corpus)와 같은 점수를 냅니다 (idf 하한 epsilon 포함).
+    corpus = 검색 후보 문서 집합이므로 idf도 후보 집합 기준입니다.
+    """
+
+    def __init__(
+        self,
+        doc_freqs: Sequence[Dict[str, int]],
+        doc_len: Sequence[int],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        self.doc_freqs = list(doc_freqs)
+        self.doc_len = np.asarray(doc_len, dtype=float)
+        self.corpus_size = len(self.doc_freqs)
+        self.k1 = k1
+        self.b = b
+        self.avgdl = self.doc_len.sum() / self.corpus_size
+
+        nd = Counter()
+        for freqs in self.doc_freqs:
+            nd.update(freqs.keys())
+
+        self.idf = {
+            word: np.log(self.corpus_size - freq + 0.5) - np.log(freq + 0.5)
+            for word, freq in nd.items()
+        }
+        self.average_idf = sum(self.idf.values()) / len(self.idf)
+        eps = epsilon * self.average_idf
+        for word, idf in self.idf.items():
+            if idf < 0:
+                self.idf[word] = eps
+
+    def get_scores(self, query: List[str]) -> np.ndarray:
+        score = np.zeros(self.corpus_size)
+        norm = self.k1 * (1 - self.b + self.b * self.doc_len / self.avgdl)
+        for q in query:
+            q_freq = np.array([doc.get(q) or 0 for doc in self.doc_freqs], dtype=float)
+            score += (self.idf.get(q) or 0) * (
+                q_freq * (self.k1 + 1) / (q_freq + norm)
+            )
+        return score
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+class DocumentIndex:
+    """
+    영속 문서 임베딩 + BM25 통계 인덱스
+
+    Usage:
+        index = get_document_index()
+        rows = index.ensure(documents, encode_batch)   # 미색인 문서만 인코딩
+        sims = index.vectors(rows) @ normalized_query
+        freqs, lengths = index.term_stats(rows)
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+        dim: int = DEFAULT_DIM,
+    ):
+        self.root = Path(root or settings.RAG_DOCUMENT_INDEX_DIR)
+        self.model_name = model_name
+        self.dim = dim
+        self._manifest_version: Optional[tuple] = None
+        self._reset_view()
+
+    def _reset_view(self) -> None:
+        self.segments: List[str] = []
+        self._vectors: List[np.ndarray] = []
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._hashes: List[str] = []
+        self._keys: List[str] = []
+        self._lengths: List[int] = []
+        self._terms: List[Dict[str, int]] = []
+        self._indexed_at: List[float] = []
+        self._row_by_hash: Dict[str, int] = {}
+
+    # ── 읽기 ────────────────────────────────────────────────────
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def refresh(self) -> None:
+        """manifest가 바뀌었으면 세그먼트를 다시 연다."""
+        for _ in range(2):
+            try:
+                stat = self.manifest_path.stat()
+            except FileNotFoundError:
+                self._manifest_version = None
+                self._reset_view()
+                return
+            version = (stat.st_ino, stat.st_mtime_ns)
+            if version == self._manifest_version:
+                return
+
+            manifest = self._read_manifest()
+            self._reset_view()
+            try:
+                if (
+                    manifest.get("model") == self.model_name
+                    and manifest.get("dim") == self.dim
+                ):
+                    for name in manifest.get("segments", []):
+                        self._open_segment(name)
+            except FileNotFoundError:
+                # manifest를 읽은 직후 병합으로 세그먼트가 교체됨 → 새 manifest로 재시도
+                self._reset_view()
+                continue
+            self._manifest_version = version
+            return
+
+    def _read_manifest(self) -> dict:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _open_segment(self, name: str) -> None:
+        seg_dir = self.root / name
+        rows = json.loads((seg_dir / "rows.json").read_text())
+        vectors = np.load(seg_dir / "vectors.npy", mmap_mode="r")
+
+        start = len(self._hashes)
+        self.segments.append(name)
+        self._vectors.append(vectors)
+        self._offsets = np.append(self._offsets, start + len(rows["hashes"]))
+        self._hashes.extend(rows["hashes"])
+        self._keys.extend(rows["keys"])
+        self._lengths.extend(rows["lengths"])
+        self._terms.extend(rows["terms"])
+        # indexed_at 이전 세그먼트는 색인 시각 0 → 다음 prune에서 제거 후 재색인
+        self._indexed_at.extend(rows.get("indexed_at", [0.0] * len(rows["hashes"])))
+        for i, h in enumerate(rows["hashes"]):
+            self._row_by_hash[h] = start + i
+
+    def lookup(self, documents: Sequence[dict]) -> List[Optional[int]]:
+        """문서별 행 번호 (미색인 문서는 None)"""
+        self.refresh()
+        return [self._row_by_hash.get(content_hash(doc)) for doc in documents]
+
+    def keys(self) -> List[str]:
+        """색인된 행의 문서 id (document_key)"""
+        self.refresh()
+        return list(self._keys)
+
+    def vectors(self, rows: Sequence[int]) -> np.ndarray:
+        """행 번호 → 정규화 임베딩 (len(rows) × dim)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.empty((len(rows), self.dim), dtype=np.float32)
+        seg_ids = np.searchsorted(self._offsets, rows, side="right") - 1
+        for s in np.unique(seg_ids):
+            mask = seg_ids == s
+            out[mask] = self._vectors[s][rows[mask] - self._offsets[s]]
+        return out
+
+    def term_stats(self, rows: Sequence[int]) -> Tuple[List[Dict[str, int]], List[int]]:
+        """행 번호 → (용어 빈도, 토큰 수) — OkapiScorer 입력"""
+        return [self._terms[r] for r in rows], [self._lengths[r] for r in rows]
+
+    # ── 쓰기 ────────────────────────────────────────────────────
+    def ensure(
+        self,
+        documents: Sequence[dict],
+        encode_batch: Callable[[List[str]], np.ndarray],
+    ) -> List[int]:
+        """
+        모든 문서를 색인하고 행 번호를 반환합니다.
+
+        미색인 문서만 encode_batch 1회로 인코딩해 새 세그먼트에 추가합니다.
+        """
+        rows = self.lookup(documents)
+        missing: Dict[str, dict] = {}
+        for doc, row in zip(documents, rows):
+            if row is None:
+                missing.setdefault(content_hash(doc), doc)
+        if not missing:
+            return rows
+
+        docs = list(missing.values())
+        vectors = _normalize(encode_batch([document_text(d) for d in docs]))
+        self.add(docs, vectors, hashes=list(missing.keys()))
+        return self.lookup(documents)
+
+    def add(
+        self,
+        documents: Sequence[dict],
+        vectors: np.ndarray,
+        hashes: Optional[List[str]] = None,
+    ) -> int:
+        """
+        인코딩된 문서를 새 세그먼트로 추가 (다른 워커가 먼저 추가한 내용은 건너뜀)
+
+        Returns:
+            추가된 행 수
+        """
+        hashes = hashes or [content_hash(d) for d in documents]
+        with self._write_lock():
+            self._manifest_version = None
+            self.refresh()
+            keep, seen = [], set(self._row_by_hash)
+            for i, h in enumerate(hashes):
+                if h not in seen:
+                    seen.add(h)
+                    keep.append(i)
+            if keep:
+                segments = self.segments + [
+                    self._write_segment(
+                        [documents[i] for i in keep],
+                        np.asarray(vectors)[keep],
+                        [hashes[i] for i in keep],
+                    )
+                ]
+                if len(segments) > MAX_SEGMENTS:
+                    segments = [self._compact(segments)]
+                self._write_manifest(segments)
+            self._manifest_version = None
+            self.refresh()
+        if keep:
+            logger.info(f"[DocumentIndex] {len(keep)}개 문서 색인 (총 {len(self)}개)")
+        return len(keep)
+
+    @contextmanager
+    def _write_lock(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_segment(
+        self, documents: Sequence[dict], vectors: np.ndarray, hashes: List[str]
+    ) -> str:
+        name = f"seg-{uuid.uuid4().hex[:12]}"
+        seg_dir = self.root / name
+        seg_dir.mkdir()
+
+        terms = [Counter(tokenize(document_bm25_text(d))) for d in documents]
+        rows = {
+            "keys": [document_key(d) for d in documents],
+            "hashes": hashes,
+            "lengths": [sum(t.values()) for t in terms],
+            "terms": [dict(t) for t in terms],
+            "indexed_at": [time.time()] * len(documents),
+        }
+        np.save(seg_dir / "vectors.npy", _normalize(vectors))
+        (seg_dir / "rows.json").write_text(json.dumps(rows, ensure_ascii=False))
+        return name
+
+    def prune(self, max_age: float, deleted_keys: Iterable[str] = ()) -> int:
+        """
+        보존 기간(max_age초)보다 먼저 색인된 행과 deleted_keys 문서의 행을 제거하고
+        남은 행을 세그먼트 하나로 병합합니다. 제거된 문서도 다시 검색되면 그때 재색인됩니다.
+
+        Returns:
+            제거된 행 수
+        """
+        deleted = set(deleted_keys)
+        cutoff = time.time() - max_age
+        with self._write_lock():
+            self._manifest_version = None
+            self.refresh()
+            before = len(self)
+
+            def keep(key: str, indexed_at: float) -> bool:
+                return key not in deleted and indexed_at >= cutoff
+
+            if all(keep(k, t) for k, t in zip(self._keys, self._indexed_at)):
+                return 0
+            segments = [self._compact(self.segments, keep=keep)]
+            self._write_manifest(segments)
+            self._manifest_version = None
+            self.refresh()
+        removed = before - len(self)
+        if removed:
+            logger.info(f"[DocumentIndex] {removed}개 행 정리 (남은 {len(self)}개)")
+        return removed
+
+    def _compact(
+        self,
+        segments: List[str],
+        keep: Optional[Callable[[str, float], bool]] = None,
+    ) -> str:
+        """
+        세그먼트 병합. 문서 id별로 마지막에 색인된 내용만 남긴다
+        (다른 id가 같은 내용을 참조하면 유지). keep(key, indexed_at)이 False인 행은 제거.
+        """
+        view = DocumentIndex(self.root, self.model_name, self.dim)
+        for name in segments:
+            view._open_segment(name)
+
+        latest = {key: h for key, h in zip(view._keys, view._hashes)}
+        live = set(latest.values())
+        rows = [
+            r
+            for h, r in view._row_by_hash.items()
+            if h in live and (keep is None or keep(view._keys[r], view._indexed_at[r]))
+        ]
+        rows.sort()
+
+        name = f"seg-{uuid.uuid4().hex[:12]}"
+        seg_dir = self.root / name
+        seg_dir.mkdir()
+        np.save(seg_dir / "vectors.npy", view.vectors(rows))
+        (seg_dir / "rows.json").write_text(
+            json.dumps(
+                {
+                    "keys": [view._keys[r] for r in rows],
+                    "hashes": [view._hashes[r] for r in rows],
+                    "lengths": [view._lengths[r] for r in rows],
+                    "terms": [view._terms[r] for r in rows],
+                    "indexed_at": [view._indexed_at[r] for r in rows],
+                },
+                ensure_ascii=False,
+            )
+        )
+        logger.info(
+            f"[DocumentIndex] {len(segments)}개 세그먼트 병합: "
+            f"{len(view)} → {len(rows)}행"
+        )
+        return name
+
+    def _write_manifest(self, segments: List[str]) -> None:
+        manifest = {"model": self.model_name, "dim": self.dim, "segments": segments}
+        tmp = self.root / f"manifest.{uuid.uuid4().hex[:8]}.tmp"
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, self.manifest_path)
+
+        # 병합으로 빠진 세그먼트 정리 (열린 mmap 독자는 unlink 후에도 계속 읽음)
+        for seg_dir in self.root.glob("seg-*"):
+            if seg_dir.name not in segments:
+                shutil.rmtree(seg_dir, ignore_errors=True)
+
+
+_index: Optional[DocumentIndex] = None
+
+
+def get_document_index() -> Optional[DocumentIndex]:
+    """
+    프로세스 공유 인덱스 인스턴스.
+    비활성화(RAG_DOCUMENT_INDEX_ENABLED=False)면 None → 호출자는 매 쿼리 인코딩 경로.
+    """
+    global _index
+
+    if not getattr(settings, "RAG_DOCUMENT_INDEX_ENABLED", False):
+        return None
+
+    root = Path(settings.RAG_DOCUMENT_INDEX_DIR)
+    if _index is None or _index.root != root:
+        _index = DocumentIndex(root)
+    return _index
@@ -0,0 +1,299 @@
+"""
+Embedding Runtime - 프로세스 공용 임베딩 모델 런타임
+
+- 모델 레지스트리: (종류, 모델명)당 1회 로딩. SemanticCacheService, VectorSearchService,
+  CrossEncoderReranker가 같은 인스턴스를 공유합니다.
+- 쿼리 임베딩 LRU: 최근 쿼리 문자열의 벡터 재사용 (문서 벡터는 DocumentIndex 담당)
+- 마이크로 배칭: 비동기 요청의 aencode() 호출을 짧은 창(batch window) 동안 모아
+  model.encode 1회(forward pass 1회)로 처리
+- warm_up(): 워커 부팅 시 모델 선로딩 (settings.RAG_EMBEDDING_WARMUP)
+
+sentence_transformers는 실제 로딩 시점에만 import합니다.
+
+Usage:
+    runtime = get_embedding_runtime()
+    vector = runtime.encode("AAPL 실적 전망")          # 동기
+    vector = await runtime.aencode("AAPL 실적 전망")   # 비동기 (동시 호출 병합)
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .document_index import DEFAULT_DIM, DEFAULT_MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+BI_ENCODER = "bi"
+CROSS_ENCODER = "cross"
+
+DEFAULT_CROSS_ENCODER_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_BATCH_WINDOW_MS = 5
+DEFAULT_MAX_BATCH_SIZE = 64
+
+
+# ============================================================
+# 모델 레지스트리
+# ============================================================
+
+_models: Dict[Tuple[str, str], Any] = {}
+_models_lock = threading.Lock()
+
+
+def _load_model(name: str, kind: str) -> Any:
+    from sentence_transformers import CrossEncoder, SentenceTransformer
+
+    model_cls = CrossEncoder if kind == CROSS_ENCODER else SentenceTransformer
+    return model_cls(name)
+
+
+def get_model(
+    name: str = DEFAULT_MODEL_NAME,
+    kind: str = BI_ENCODER,
+    factory: Optional[Callable[[str], Any]] = None,
+) -> Any:
+    """
+    공유 모델 인스턴스 반환 (최초 호출 시 로딩)
+
+    Args:
+        name: 모델명
+        kind: BI_ENCODER(SentenceTransformer) 또는 CROSS_ENCODER
+        factory: 모델 생성 함수 (기본: sentence_transformers 클래스)
+    """
+    key = (kind, name)
+    model = _models.get(key)
+    if model is not None:
+        return model
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            logger.info(f"[EmbeddingRuntime] Loading {kind}-encoder model: {name}")
+            model = (factory or (lambda n: _load_model(n, kind)))(name)
+            _models[key] = model
+            logger.info(f"[EmbeddingRuntime] Model loaded: {name}")
+    return model
+
+
+def register_model(name: str, model: Any, kind: str = BI_ENCODER) -> None:
+    """이미 생성된 모델을 레지스트리에 등록 (테스트/외부 로딩용)"""
+    with _models_lock:
+        _models[(kind, name)] = model
+
+
+def reset_models() -> None:
+    """레지스트리와 런타임 싱글톤 초기화"""
+    global _runtime
+    with _models_lock:
+        _models.clear()
+        _runtime = None
+
+
+# ============================================================
+# 런타임
+# ============================================================
+
+
+class EmbeddingRuntime:
+    """
+    Bi-encoder 임베딩 런타임
+
+    반환 벡터는 LRU에 보관된 배열과 같은 객체이므로 읽기 전용입니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        dim: int = DEFAULT_DIM,
+    ):
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.dim = dim
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # 이벤트 루프별 대기 배치 {loop: {text: Future}}
+        self._pending: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]] = {}
+
+    @property
+    def model(self) -> Any:
+        return get_model(self.model_name)
+
+    # -------------------------------------------------------- LRU
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            vector = self._cache.get(text)
+            if vector is not None:
+                self._cache.move_to_end(text)
+            return vector
+
+    def _cache_put(self, text: str, vector: np.ndarray) -> np.ndarray:
+        vector = np.array(vector)  # 배치 배열의 행 view를 LRU에 묶어두지 않도록 복사
+        vector.flags.writeable = False
+        if self.cache_size <= 0:
+            return vector
+        with self._cache_lock:
+            self._cache[text] = vector
+            self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"size": len(self._cache), "max_size": self.cache_size}
+
+    # -------------------------------------------------------- 동기
+
+    def encode(self, text: str) -> np.ndarray:
+        """쿼리 1건 인코딩 (LRU 재사용)"""
+        if not text:
+            return np.zeros(self.dim)
+        vector = self._cache_get(text)
+        if vector is None:
+            vector = self._cache_put(
+                text, self.model.encode(text, convert_to_numpy=True)
+            )
+        return vector
+
+    def encode_queries(self, texts: List[str]) -> np.ndarray:
+        """
+        쿼리 여러 건 인코딩 (LRU 미스만 한 번의 forward pass)
+
+        Returns:
+            (N x dim) 배열, texts 순서
+        """
+        if not texts:
+            return np.zeros((0, self.dim))
+        vectors: Dict[str, np.ndarray] = {}
+        misses = []
+        for text in dict.fromkeys(texts):
+            vector = self._cache_get(text) if text else np.zeros(self.dim)
+            if vector is None:
+                misses.append(text)
+            else:
+                vectors[text] = vector
+        if misses:
+            encoded = self.model.encode(
+                misses, convert_to_numpy=True, show_progress_bar=False
+            )
+            for text, vector in zip(misses, encoded):
+                vectors[text] = self._cache_put(text, vector)
+        return np.stack([vectors[text] for text in texts])
+
+    def encode_batch(self, texts: List[str]) -> np.ndarray:
+        """문서 배치 인코딩 (LRU 미사용)"""
+        if not texts:
+            return np.zeros((0, self.dim))
+        return self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+
+    # -------------------------------------------------------- 비동기
+
+    async def aencode(self, text: str) -> np.ndarray:
+        """
+        쿼리 1건 비동기 인코딩
+
+        같은 이벤트 루프에서 batch window 안에 들어온 호출은 한 번의 model.encode로
+        묶이고(같은 텍스트는 1건으로), 인코딩은 기본 executor 스레드에서 실행됩니다.
+        """
+        if not text:
+            return np.zeros(self.dim)
+        vector = self._cache_get(text)
+        if vector is not None:
+            return vector
+
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = {}
+            loop.call_later(self.batch_window, self._schedule_flush, loop, batch)
+
+        future = batch.get(text)
+        if future is None:
+            future = batch[text] = loop.create_future()
+            if len(batch) >= self.max_batch_size:
+                self._schedule_flush(loop, batch)
+        return await asyncio.shield(future)
+
+    def _schedule_flush(
+        self, loop: asyncio.AbstractEventLoop, batch: Dict[str, asyncio.Future]
+    ) -> None:
+        if self._pending.get(loop) is batch:
+            del self._pending[loop]
+        if batch:
+            items = list(batch.items())
+            batch.clear()  # window 타이머가 늦게 와도 중복 flush 없음
+            loop.create_task(self._flush(loop, items))
+
+    async def _flush(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        items: List[Tuple[str, asyncio.Future]],
+    ) -> None:
+        texts = [text for text, _ in items]
+        try:
+            vectors = await loop.run_in_executor(None, self.encode_queries, texts)
+        except Exception as e:
+            logger.error(f"[EmbeddingRuntime] Batch encode failed ({len(texts)}): {e}")
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        logger.debug(f"[EmbeddingRuntime] Coalesced {len(texts)} queries")
+        for (_, future), vector in zip(items, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+_runtime: Optional[EmbeddingRuntime] = None
+
+
+def get_embedding_runtime() -> EmbeddingRuntime:
+    """
+    EmbeddingRuntime 싱글톤 인스턴스 반환
+
+    LRU 크기/배치 창/최대 배치는 settings.RAG_EMBEDDING_* 값을 따릅니다.
+    """
+    global _runtime
+    if _runtime is None:
+        _runtime = EmbeddingRuntime(
+            cache_size=getattr(
+                settings, "RAG_EMBEDDING_CACHE_SIZE", DEFAULT_CACHE_SIZE
+            ),
+            batch_window_ms=getattr(
+                settings, "RAG_EMBEDDING_BATCH_WINDOW_MS", DEFAULT_BATCH_WINDOW_MS
+            ),
+            max_batch_size=getattr(
+                settings, "RAG_EMBEDDING_MAX_BATCH", DEFAULT_MAX_BATCH_SIZE
+            ),
+        )
+    return _runtime
+
+
+def warm_up(include_cross_encoder: bool = True) -> bool:
+    """
+    모델 선로딩 + 더미 forward pass 1회 (첫 요청 지연 제거)
+
+    Returns:
+        성공 여부 (실패는 로그만 남기고 요청 시 지연 로딩으로 대체)
+    """
+    try:
+        get_embedding_runtime().model.encode(["warm up"], show_progress_bar=False)
+        if include_cross_encoder:
+            get_model(DEFAULT_CROSS_ENCODER_NAME, kind=CROSS_ENCODER).predict(
+                [("warm up", "warm up")]
+            )
+        logger.info("[EmbeddingRuntime] Warm-up completed")
+        return True
+    except Exception as e:
+        logger.warning(f"[EmbeddingRuntime] Warm-up failed: {e}")
+        return False
@@ -9,6 +9,8 @@ from typing import List, Optional, Tuple
 
 from sentence_transformers import CrossEncoder
 
+from .embedding_runtime import CROSS_ENCODER, get_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +21,7 @@ class CrossEncoderReranker:
     Features:
         - MS MARCO 사전학습 모델 사용
         - 질문-문서 쌍의 관련성 점수 계산
-        - 싱글톤 패턴으로 모델 재사용
+        - 싱글톤 패턴으로 모델 재사용 (EmbeddingRuntime 레지스트리 공유)
 
     Usage:
         >>> reranker = CrossEncoderReranker()
@@ -48,9 +50,9 @@ class CrossEncoderReranker:
             - 이후 호출은 캐시된 모델 재사용
         """
         if CrossEncoderReranker._model is None:
-            logger.info(f"Loading Cross-Encoder model: {self.MODEL_NAME}")
-            CrossEncoderReranker._model = CrossEncoder(self.MODEL_NAME)
-            logger.info("Cross-Encoder model loaded successfully")
+            CrossEncoderReranker._model = get_model(
+                self.MODEL_NAME, kind=CROSS_ENCODER, factory=CrossEncoder
+            )
         self.model = CrossEncoderReranker._model
 
     def rerank(
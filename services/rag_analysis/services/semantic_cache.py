@@ -11,8 +11,8 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
-from sentence_transformers import SentenceTransformer
 
+from .embedding_runtime import get_embedding_runtime, get_model
 from .neo4j_driver import get_neo4j_driver
 
 logger = logging.getLogger(__name__)
@@ -39,21 +39,18 @@ class SemanticCacheService:
     FINAL_THRESHOLD = 0.70  # 최종 점수 임계값
     CACHE_TTL_DAYS = 7  # 캐시 유효 기간
 
-    _encoder: Optional[SentenceTransformer] = None
+    _encoder: Optional[Any] = None
 
     def __init__(self):
         """인스턴스 초기화 (인코더는 지연 로딩)"""
         pass
 
     @property
-    def encoder(self) -> Optional[SentenceTransformer]:
-        """임베딩 인코더 (지연 로딩)"""
+    def encoder(self) -> Optional[Any]:
+        """임베딩 인코더 (지연 로딩, EmbeddingRuntime 레지스트리 공유 인스턴스)"""
         if SemanticCacheService._encoder is None:
             try:
-                SemanticCacheService._encoder = SentenceTransformer(
-                    self.EMBEDDING_MODEL
-                )
-                logger.info(f"Loaded embedding model: {self.EMBEDDING_MODEL}")
+                SemanticCacheService._encoder = get_model(self.EMBEDDING_MODEL)
             except Exception as e:
                 logger.error(f"Failed to load embedding model: {e}")
                 return None
@@ -73,8 +70,23 @@ class SemanticCacheService:
             return None
 
         try:
-            embedding = self.encoder.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            return get_embedding_runtime().encode(text).tolist()
+        except Exception as e:
+            logger.error(f"Embedding generation failed: {e}")
+            return None
+
+    async def _aget_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        텍스트를 벡터로 변환 (비동기, 동시 요청은 한 번의 forward pass로 병합)
+
+        Returns:
+            384차원 벡터 또는 None
+        """
+        if self.encoder is None:
+            return None
+
+        try:
+            return (await get_embedding_runtime().aencode(text)).tolist()
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return None
@@ -111,7 +123,7 @@ class SemanticCacheService:
             return None
 
         # 질문 임베딩 생성
-        embedding = self._get_embedding(question)
+        embedding = await self._aget_embedding(question)
         if embedding is None:
             logger.warning("Failed to generate embedding - cache disabled")
             return None
@@ -239,7 +251,7 @@ class SemanticCacheService:
             return None
 
         # 질문 임베딩 생성
-        embedding = self._get_embedding(question)
+        embedding = await self._aget_embedding(question)
         if embedding is None:
             logger.warning("Failed to generate embedding - cannot store cache")
             return None
@@ -2,13 +2,19 @@
 Vector Search Service
 
 sentence-transformers를 사용한 벡터 유사도 검색 서비스
+
+문서 임베딩은 DocumentIndex(영속, 내용 해시당 1회 인코딩)에서 읽고,
+쿼리 시에는 쿼리 문자열만 인코딩합니다. 인덱스 비활성화/오류 시 매 쿼리 인코딩.
+모델은 EmbeddingRuntime 레지스트리의 공유 인스턴스를 사용하고, 쿼리 벡터는 LRU로 재사용합니다.
 """
 
 import logging
 from typing import List, Optional, Tuple
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+from .document_index import document_text, get_document_index
+from .embedding_runtime import get_embedding_runtime, get_model
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +33,15 @@ class VectorSearchService:
         return cls._instance
 
     def __init__(self):
-        """싱글톤 패턴으로 모델 로딩"""
+        """싱글톤 패턴 (모델은 EmbeddingRuntime 레지스트리에서 공유)"""
         if VectorSearchService._model is None:
-            logger.info(f"Loading sentence-transformers model: {self.MODEL_NAME}")
-            VectorSearchService._model = SentenceTransformer(self.MODEL_NAME)
-            logger.info("Model loaded successfully")
+            VectorSearchService._model = get_model(self.MODEL_NAME)
         self.model = VectorSearchService._model
+        self.runtime = get_embedding_runtime()
 
     def encode(self, text: str) -> np.ndarray:
         """
-        단일 텍스트를 벡터로 인코딩
+        단일 텍스트를 벡터로 인코딩 (최근 쿼리는 LRU 재사용, 반환 벡터는 읽기 전용)
 
         Args:
             text: 인코딩할 텍스트
@@ -48,6 +53,8 @@ class VectorSearchService:
             logger.warning("Empty text provided for encoding")
             return np.zeros(384)  # all-MiniLM-L6-v2 차원
 
+        if self.runtime.model_name == self.MODEL_NAME:
+            return self.runtime.encode(text)
         return self.model.encode(text, convert_to_numpy=True)
 
     def encode_batch(self, texts: List[str]) -> np.ndarray:
@@ -97,23 +104,9 @@ class VectorSearchService:
             # 쿼리 임베딩
             query_embedding = self.encode(query)
 
-            # 문서 텍스트 추출
-            doc_texts = []
-            for d in documents:
-                text = d.get("content", d.get("text", ""))
-                if not text:
-                    logger.debug(f"Empty text in document: {d.get('id', 'unknown')}")
-                doc_texts.append(text)
-
-            # 문서 임베딩
-            doc_embeddings = self.encode_batch(doc_texts)
-
-            # 코사인 유사도 계산
-            # similarity = dot(A, B) / (norm(A) * norm(B))
-            similarities = np.dot(doc_embeddings, query_embedding) / (
-                np.linalg.norm(doc_embeddings, axis=1) * np.linalg.norm(query_embedding)
-                + 1e-9
-            )
+            similarities = self._index_similarities(query_embedding, documents)
+            if similarities is None:
+                similarities = self._direct_similarities(query_embedding, documents)
 
             # score_threshold 필터링
             if score_threshold is not None:
@@ -123,7 +116,8 @@ class VectorSearchService:
 
             # Top-K 추출
             if len(similarities) > top_k:
-                top_indices = np.argsort(similarities)[::-1][:top_k]
+                top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+                top_indices = top_indices[np.argsort(-similarities[top_indices])]
             else:
                 top_indices = np.argsort(similarities)[::-1]
 
@@ -140,6 +134,48 @@ class VectorSearchService:
             logger.error(f"Error during vector search: {str(e)}", exc_info=True)
             return []
 
+    def _index_similarities(
+        self, query_embedding: np.ndarray, documents: List[dict]
+    ) -> Optional[np.ndarray]:
+        """
+        영속 인덱스 기반 코사인 유사도 (미색인 문서만 인코딩 후 색인)
+
+        Returns:
+            문서별 유사도, 인덱스 비활성화/오류 시 None
+        """
+        index = get_document_index()
+        if index is None:
+            return None
+        try:
+            rows = index.ensure(documents, self.encode_batch)
+            query_norm = np.linalg.norm(query_embedding) + 1e-9
+            return index.vectors(rows) @ (query_embedding / query_norm)
+        except Exception as e:
+            logger.warning(f"Document index unavailable, encoding documents: {e}")
+            return None
+
+    def _direct_similarities(
+        self, query_embedding: np.ndarray, documents: List[dict]
+    ) -> np.ndarray:
+        """문서 전체를 인코딩해 코사인 유사도 계산"""
+        # 문서 텍스트 추출
+        doc_texts = []
+        for d in documents:
+            text = document_text(d)
+            if not text:
+                logger.debug(f"Empty text in document: {d.get('id', 'unknown')}")
+            doc_texts.append(text)
+
+        # 문서 임베딩
+        doc_embeddings = self.encode_batch(doc_texts)
+
+        # 코사인 유사도 계산
+        # similarity = dot(A, B) / (norm(A) * norm(B))
+        return np.dot(doc_embeddings, query_embedding) / (
+            np.linalg.norm(doc_embeddings, axis=1) * np.linalg.norm(query_embedding)
+            + 1e-9
+        )
+
 
 def get_vector_search_service() -> VectorSearchService:
     """
@@ -7,6 +7,7 @@ Critical:
 """
 
 import logging
+from datetime import timedelta
 
 from celery import shared_task
 
@@ -542,3 +543,108 @@ def get_semantic_cache_stats():
     except Exception as e:
         logger.error(f"Failed to get semantic cache stats: {e}")
         return {"status": "error", "error": str(e)}
+
+
+NEWS_DOCUMENT_PREFIX = "news-"
+
+
+def _recent_news_documents(since) -> list:
+    """보존 기간 내 아카이브되지 않은 뉴스 → RAG 검색 문서 dict 리스트"""
+    from services.news.models import NewsArticle
+
+    articles = NewsArticle.objects.filter(
+        published_at__gte=since, is_archived=False
+    ).values_list("id", "title", "summary", "published_at")
+    return [
+        {
+            "id": f"{NEWS_DOCUMENT_PREFIX}{article_id}",
+            "title": title,
+            "content": summary or title,
+            "date": published_at.date().isoformat(),
+            "type": "news",
+        }
+        for article_id, title, summary, published_at in articles
+    ]
+
+
+@shared_task
+def index_rag_documents(documents: list = None):
+    """
+    RAG 문서 사전 색인 + 인덱스 정리
+
+    Args:
+        documents: 검색 문서 dict 리스트 (id, title, content, symbol, date, type).
+            None이면 (beat) 보존 기간 내 뉴스를 색인하고, 보존 기간이 지난 행과
+            삭제/아카이브된 뉴스 행을 인덱스에서 제거
+
+    Returns:
+        {
+            'status': 'success' | 'skipped' | 'error',
+            'indexed_count': int,   # 새로 인코딩된 문서 수
+            'pruned_count': int,    # 인덱스에서 제거된 행 수
+            'error': None | str
+        }
+
+    Note:
+        - 이미 같은 내용으로 색인된 문서는 건너뜀 (Idempotent)
+        - 색인되지 않은 문서도 첫 검색 시 색인되므로 누락돼도 결과는 동일
+        - RAG_DOCUMENT_INDEX_ENABLED OFF(기본)면 뉴스 조회·인코딩 없이 skipped
+          (검색 경로가 인덱스를 소비하기 전까지 beat 실행 비용 없음)
+    """
+    try:
+        from django.conf import settings
+        from django.utils import timezone
+
+        from .services.document_index import get_document_index
+        from .services.vector_search import get_vector_search_service
+
+        index = get_document_index()
+        if index is None:
+            return {
+                "status": "skipped",
+                "indexed_count": 0,
+                "pruned_count": 0,
+                "error": "document_index_disabled",
+            }
+
+        retention = timedelta(days=settings.RAG_DOCUMENT_INDEX_RETENTION_DAYS)
+        scheduled = documents is None
+        if scheduled:
+            documents = _recent_news_documents(timezone.now() - retention)
+
+        missing = sum(row is None for row in index.lookup(documents))
+        if missing:
+            index.ensure(documents, get_vector_search_service().encode_batch)
+
+        pruned = 0
+        if scheduled:
+            live = {str(doc["id"]) for doc in documents}
+            deleted = [
+                key
+                for key in index.keys()
+                if key.startswith(NEWS_DOCUMENT_PREFIX) and key not in live
+            ]
+            pruned = index.prune(retention.total_seconds(), deleted_keys=deleted)
+
+        logger.info(
+            f"RAG document index: {missing}/{len(documents)} indexed, {pruned} pruned"
+        )
+        return {
+            "status": "success",
+            "indexed_count": missing,
+            "pruned_count": pruned,
+            "error": None,
+        }
+
+    except ImportError as e:
+        logger.warning(f"Document index not available: {e}")
+        return {
+            "status": "skipped",
+            "indexed_count": 0,
+            "pruned_count": 0,
+            "error": "vector_search_not_available",
+        }
+
+    except Exception as e:
+        logger.error(f"RAG document indexing failed: {e}")
+        return {"status": "error", "indexed_count": 0, "pruned_count": 0, "error": str(e)}
@@ -7,8 +7,11 @@ Step 3: 섹션 추출 (regex 3단계) → fallback (edgartools)
 Step 4: 사후 검증 → RawDocumentStore 저장
 
 Note: FMP sec-filings 엔드포인트 Starter 플랜 미지원 → SEC EDGAR 직접 조회.
+SEC_EDGAR_CACHE_ENABLED면 ticker 인덱스/submissions/10-K HTML을 SECEdgarClient와 같은
+디스크 캐시(sec_edgar_cache)로 재사용합니다 (캐시 적중 시 rate limit sleep 없음).
 """
 
+import json
 import logging
 import re
 import time
@@ -18,6 +21,9 @@ from typing import Optional
 
 import requests
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+from django.conf import settings
+
+from packages.shared.api_request.sec_edgar_cache import get_sec_edgar_cache, get_ticker_index
 
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
@@ -80,12 +86,22 @@ class SECFilingCollector:
             return None
 
         # Step 2: submissions JSON에서 10-K 찾기
-        time.sleep(0.12)  # SEC rate limit
+        url = f"{SEC_SUBMISSIONS_URL}/CIK{cik}.json"
+        sec_cache = get_sec_edgar_cache()
         try:
-            url = f"{SEC_SUBMISSIONS_URL}/CIK{cik}.json"
-            resp = requests.get(url, headers=SEC_HEADERS, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
+            if sec_cache is not None:
+                data = json.loads(
+                    sec_cache.get(
+                        url,
+                        lambda headers: self._sec_get(url, headers, timeout=30),
+                        max_age=getattr(settings, "SEC_EDGAR_SUBMISSIONS_MAX_AGE", 3600),
+                    )
+                )
+            else:
+                time.sleep(0.12)  # SEC rate limit
+                resp = requests.get(url, headers=SEC_HEADERS, timeout=30)
+                resp.raise_for_status()
+                data = resp.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"SEC submissions API error for {symbol}: {e}")
             raise
@@ -127,6 +143,19 @@ class SECFilingCollector:
         if symbol in self._cik_cache:
             return self._cik_cache[symbol]
 
+        if get_sec_edgar_cache() is not None:
+            try:
+                index = get_ticker_index(
+                    lambda headers: self._sec_get(SEC_TICKERS_URL, headers, timeout=15)
+                )
+            except Exception as e:
+                logger.error(f"CIK lookup failed for {symbol}: {e}")
+                return None
+            cik = index.get(symbol)
+            if cik:
+                self._cik_cache[symbol] = cik
+            return cik
+
         time.sleep(0.12)
         try:
             resp = requests.get(SEC_TICKERS_URL, headers=SEC_HEADERS, timeout=15)
@@ -147,6 +176,19 @@ class SECFilingCollector:
         if not final_link:
             return None
 
+        sec_cache = get_sec_edgar_cache()
+        if sec_cache is not None:
+            # filing 문서는 불변 → 캐시 본문이 있으면 요청하지 않음
+            try:
+                return sec_cache.get(
+                    final_link,
+                    lambda headers: self._sec_get(final_link, headers, timeout=60),
+                    immutable=True,
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error(f"SEC EDGAR fetch error: {e}")
+                raise
+
         # SEC rate limit 준수 (10 req/sec → 0.12초 sleep)
         time.sleep(0.12)
 
@@ -158,6 +200,14 @@ class SECFilingCollector:
             logger.error(f"SEC EDGAR fetch error: {e}")
             raise
 
+    @staticmethod
+    def _sec_get(url: str, headers: dict, timeout: int) -> requests.Response:
+        """rate limit sleep + GET (조건부 헤더 병합, 304는 그대로 반환)."""
+        time.sleep(0.12)
+        resp = requests.get(url, headers={**SEC_HEADERS, **headers}, timeout=timeout)
+        resp.raise_for_status()
+        return resp
+
     def extract_sections(self, html: str) -> dict:
         """
         HTML에서 Item 1, 1A, 7 섹션 추출.
@@ -8,15 +8,19 @@ status='matched' + resolved_ticker 있을 때:
 
 ⚠️ 다른 sector evidence에 전파 금지
 ⚠️ Neo4j 직접 동기화 금지. dirty flag만.
+
+Stock 이름 추가/변경/삭제 시 TickerMatcher 공유 이름 인덱스 무효화.
 """
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
 
+_UNKNOWN = object()  # 로드 시점 종목명 미상 (DB에서 읽지 않은 인스턴스) → 무효화
+
 
 @receiver(post_save, sender="sec_pipeline.UnmatchedCompanyQueue")
 def on_unmatched_resolved(sender, instance, **kwargs):
@@ -72,3 +76,26 @@ def on_unmatched_resolved(sender, instance, **kwargs):
         logger.info(
             f"CompanyAlias: {raw_name} → {resolved_ticker} [sector={sector or 'global'}]"
         )
+
+
+@receiver(post_save, sender="stocks.Stock")
+def on_stock_saved(sender, instance, created, **kwargs):
+    """Stock 추가·이름 변경 시 TickerMatcher 공유 인덱스 무효화 (이름이 그대로인 save는 무시)."""
+    from .ticker_matcher import invalidate_stock_name_index
+
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "stock_name" not in update_fields:
+        return
+    previous = getattr(instance, "_loaded_stock_name", _UNKNOWN)
+    instance._loaded_stock_name = instance.stock_name
+    if not created and previous == instance.stock_name:
+        return
+    invalidate_stock_name_index()
+
+
+@receiver(post_delete, sender="stocks.Stock")
+def on_stock_deleted(sender, instance, **kwargs):
+    """Stock 삭제 시 TickerMatcher 공유 인덱스 무효화."""
+    from .ticker_matcher import invalidate_stock_name_index
+
+    invalidate_stock_name_index()
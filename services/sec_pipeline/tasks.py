@@ -225,12 +225,8 @@ def extract_from_document(self, doc_id: int, symbol: str):
                         from .ticker_matcher import TickerMatcher
 
                         matcher = TickerMatcher()
-                        for evidence in created:
-                            ticker, method = matcher.match_with_queue(
-                                evidence.target_company_name, evidence, doc, symbol
-                            )
-                            if ticker:
-                                matched_count += 1
+                        matches = matcher.match_evidences(created, doc, symbol)
+                        matched_count = sum(1 for ticker, _ in matches if ticker)
                         _log_stage(
                             symbol,
                             "ticker_match",
@@ -4,20 +4,39 @@ SEC-PR-7: Ticker 매칭 엔진
 3단계 매칭:
   1순위: CompanyAlias (context_sector 포함, 없으면 범용)
   2순위: Stock.stock_name 정확 매칭
-  3순위: rapidfuzz token_sort_ratio ≥ 85%
+  3순위: rapidfuzz token_sort_ratio ≥ 80%
 
 미매칭 시 UnmatchedCompanyQueue 적재.
+
+Stock 이름 인덱스는 프로세스 단위로 공유 (_StockNameIndex):
+  - 정규화 이름 리스트 + symbol + 표시 이름 + 토큰 블로킹 인덱스를 1회 구축
+  - fingerprint(이름 있는 종목 수, 최신 created_at, 무효화 버전)가 바뀌면 재구축
+  - Stock 이름 변경/삭제 시그널이 캐시 버전을 올려 다른 프로세스도 재구축
+fuzzy 단계는 rapidfuzz process.extractOne / cdist (C 루프, score_cutoff)로 계산합니다.
 """
 
 import logging
-from typing import Optional
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
 
-from rapidfuzz import fuzz
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Lower
+from rapidfuzz import fuzz, process
 
 from packages.shared.stocks.models import Stock
 
 logger = logging.getLogger(__name__)
 
+FUZZY_THRESHOLD = 80
+CANDIDATE_THRESHOLD = 50
+# 블로킹 키 = 토큰 앞 4글자 (접미 오타 허용)
+BLOCK_KEY_LENGTH = 4
+INDEX_VERSION_CACHE_KEY = "sec_pipeline:stock_name_index:version"
+
 
 # 2026-05-26 C 옵션: UnmatchedQueue 블록리스트.
 # 사용자 1순위 정책: Chain Sight / Market Pulse / Dashboard 데이터 풍부도 최우선.
@@ -87,28 +106,126 @@ BLOCKED_NAMES = frozenset(
 )
 
 
+def _block_keys(name: str) -> set:
+    """이름 토큰별 블로킹 키."""
+    return {token[:BLOCK_KEY_LENGTH] for token in re.findall(r"[a-z0-9]+", name.lower())}
+
+
+class _StockNameIndex:
+    """
+    Stock 이름 매칭 인덱스 (읽기 전용, 프로세스 공유)
+
+    names[i] → symbols[i] 병렬 리스트 (stock_map 삽입 순서 = 기존 순회 순서)
+    """
+
+    def __init__(self, stock_map: dict, display: Optional[dict] = None, fingerprint=None):
+        self.stock_map = stock_map
+        self.names: List[str] = list(stock_map)
+        self.symbols: List[str] = list(stock_map.values())
+        self.display: Dict[str, str] = display or {}
+        self.fingerprint = fingerprint
+
+        # 후보 집계용 symbol 코드 (첫 등장 순서)
+        codes: Dict[str, int] = {}
+        self.symbol_codes = np.fromiter(
+            (codes.setdefault(symbol, len(codes)) for symbol in self.symbols),
+            dtype=np.int64,
+            count=len(self.symbols),
+        )
+        self.unique_symbols: List[str] = list(codes)
+
+        blocks: Dict[str, list] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            for key in _block_keys(name):
+                blocks[key].append(position)
+        self.blocks = dict(blocks)
+
+    @classmethod
+    def build(cls, fingerprint=None) -> "_StockNameIndex":
+        """Stock 테이블 1회 조회로 구축."""
+        stock_map: dict = {}
+        display: dict = {}
+        for symbol, name in Stock.objects.values_list("symbol", "stock_name"):
+            if name:
+                stock_map[name.lower()] = symbol
+                # 약어 변형도 등록 (Inc., Corp. 등 제거)
+                cleaned = TickerMatcher._clean_name(name)
+                if cleaned:
+                    stock_map[cleaned] = symbol
+                display.setdefault(symbol, name)
+        return cls(stock_map, display, fingerprint)
+
+    def candidates(self, name: str) -> List[int]:
+        """블로킹 키를 공유하는 이름 위치 (오름차순)."""
+        positions: set = set()
+        for key in _block_keys(name):
+            positions.update(self.blocks.get(key, ()))
+        return sorted(positions)
+
+
+_index_lock = threading.Lock()
+_shared_index: Dict[str, Optional[_StockNameIndex]] = {"index": None}
+
+
+def _index_fingerprint() -> tuple:
+    """인덱스 유효성 키 — bulk_create/삭제는 집계로, 이름 변경은 시그널 버전으로 감지."""
+    stats = Stock.objects.exclude(Q(stock_name__isnull=True) | Q(stock_name="")).aggregate(
+        count=Count("symbol"), latest=Max("created_at")
+    )
+    return stats["count"], stats["latest"], cache.get(INDEX_VERSION_CACHE_KEY, 0)
+
+
+def get_stock_name_index() -> _StockNameIndex:
+    """프로세스 공유 Stock 이름 인덱스 (fingerprint가 바뀌면 재구축)."""
+    fingerprint = _index_fingerprint()
+    index = _shared_index["index"]
+    if index is not None and index.fingerprint == fingerprint:
+        return index
+    with _index_lock:
+        index = _shared_index["index"]
+        if index is None or index.fingerprint != fingerprint:
+            index = _StockNameIndex.build(fingerprint)
+            _shared_index["index"] = index
+            logger.info(
+                f"[TickerMatcher] stock name index built: "
+                f"{len(index.names)} names / {len(index.unique_symbols)} symbols"
+            )
+    return index
+
+
+def invalidate_stock_name_index() -> None:
+    """Stock 추가·이름 변경·삭제 시 인덱스 무효화 (모든 프로세스가 다음 조회에서 재구축)."""
+    _shared_index["index"] = None
+    try:
+        cache.incr(INDEX_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(INDEX_VERSION_CACHE_KEY, 1, None)
+
+
 class TickerMatcher:
     """LLM 추출 회사명 → Ticker 매칭."""
 
     def __init__(self):
-        # Stock 이름 → symbol 캐시 (lazy load)
+        # Stock 이름 → symbol 캐시 (lazy load, 공유 인덱스의 stock_map)
         self._stock_map: dict = {}
         self._loaded = False
+        self._index: Optional[_StockNameIndex] = None
 
     def _ensure_loaded(self):
-        """Stock 테이블 캐시 로드."""
+        """공유 Stock 이름 인덱스 바인딩 (인스턴스당 1회)."""
         if self._loaded:
             return
-        stocks = Stock.objects.values_list("symbol", "stock_name")
-        for symbol, name in stocks:
-            if name:
-                self._stock_map[name.lower()] = symbol
-                # 약어 변형도 등록 (Inc., Corp. 등 제거)
-                cleaned = self._clean_name(name)
-                if cleaned:
-                    self._stock_map[cleaned] = symbol
+        self._index = get_stock_name_index()
+        self._stock_map = self._index.stock_map
         self._loaded = True
 
+    def _name_index(self) -> _StockNameIndex:
+        """현재 _stock_map 기준 인덱스 (직접 주입된 map이면 로컬 인덱스 구축)."""
+        self._ensure_loaded()
+        if self._index is None or self._index.stock_map is not self._stock_map:
+            self._index = _StockNameIndex(self._stock_map)
+        return self._index
+
     def match(self, company_name: str, context_sector: str = "") -> tuple:
         """
         회사명 → (ticker | None, method).
@@ -136,7 +253,7 @@ class TickerMatcher:
         if ticker:
             return ticker, "exact"
 
-        # 3순위: rapidfuzz ≥ 85%
+        # 3순위: rapidfuzz ≥ 80%
         ticker, score = self._match_fuzzy(name)
         if ticker:
             return ticker, "fuzzy"
@@ -155,8 +272,6 @@ class TickerMatcher:
             document: RawDocumentStore 인스턴스
             source_symbol: 어떤 기업의 10-K에서 나왔는지
         """
-        from .models import UnmatchedCompanyQueue
-
         # 소스 기업의 sector 가져오기
         source_stock = Stock.objects.filter(symbol=source_symbol.upper()).first()
         context_sector = source_stock.sector if source_stock else ""
@@ -174,6 +289,112 @@ class TickerMatcher:
             return ticker, method
 
         # 매칭 실패 → 큐 적재
+        self._enqueue_unmatched(company_name, source_symbol, context_sector)
+        return None, None
+
+    def match_many(self, company_names: Iterable[str], context_sector: str = "") -> list:
+        """
+        회사명 배치 → [(ticker | None, method), ...] (입력 순서 유지).
+
+        match()와 같은 우선순위를 배치로 처리합니다:
+        CompanyAlias 1회 조회 → 정확 매칭 → 남은 이름 전체를 process.cdist 1회로 fuzzy 매칭.
+        """
+        company_names = list(company_names)
+        results: list = [(None, None)] * len(company_names)
+        pending: Dict[str, List[int]] = defaultdict(list)
+        for position, company_name in enumerate(company_names):
+            if not company_name or len(company_name) < 2:
+                continue
+            name = company_name.strip()
+            if name.lower() in BLOCKED_NAMES:
+                results[position] = (None, "blocked")
+                continue
+            pending[name].append(position)
+        if not pending:
+            return results
+
+        resolved: Dict[str, tuple] = {}
+        aliases = self._match_alias_many(pending, context_sector)
+        self._ensure_loaded()
+        fuzzy_names = []
+        for name in pending:
+            ticker = aliases.get(name.lower())
+            if ticker:
+                resolved[name] = (ticker, "alias")
+            elif ticker := self._match_exact(name):
+                resolved[name] = (ticker, "exact")
+            else:
+                fuzzy_names.append(name)
+
+        index = self._name_index()
+        if fuzzy_names and index.names:
+            scores = process.cdist(
+                [name.lower() for name in fuzzy_names],
+                index.names,
+                scorer=fuzz.token_sort_ratio,
+                processor=None,
+                score_cutoff=FUZZY_THRESHOLD,
+                workers=-1,
+            )
+            best = scores.argmax(axis=1)
+            for row, name in enumerate(fuzzy_names):
+                if scores[row, best[row]] >= FUZZY_THRESHOLD:
+                    resolved[name] = (index.symbols[best[row]], "fuzzy")
+
+        for name, positions in pending.items():
+            for position in positions:
+                results[position] = resolved.get(name, (None, None))
+        return results
+
+    def match_evidences(self, evidences: list, document, source_symbol: str) -> list:
+        """
+        한 문서(10-K)의 evidence 배치 매칭 + 미매칭 큐 적재.
+
+        match_with_queue 배치판: 소스 sector 1회 조회, match_many 1회,
+        매칭 evidence는 bulk_update 1회로 갱신합니다.
+
+        Returns:
+            [(ticker | None, method), ...] (evidences 순서)
+        """
+        from .models import SupplyChainEvidence
+
+        source_stock = Stock.objects.filter(symbol=source_symbol.upper()).first()
+        context_sector = source_stock.sector if source_stock else ""
+
+        results = self.match_many(
+            [evidence.target_company_name for evidence in evidences], context_sector
+        )
+        targets = Stock.objects.in_bulk({ticker for ticker, _ in results if ticker})
+
+        updated = []
+        for evidence, (ticker, method) in zip(evidences, results):
+            if not ticker:
+                self._enqueue_unmatched(
+                    evidence.target_company_name, source_symbol, context_sector
+                )
+                continue
+            target_stock = targets.get(ticker)
+            if target_stock:
+                evidence.target_company = target_stock
+                evidence.neo4j_dirty = True
+                updated.append(evidence)
+                logger.info(
+                    f"Matched: {evidence.target_company_name} → {ticker} (method={method})"
+                )
+        if updated:
+            SupplyChainEvidence.objects.bulk_update(
+                updated, ["target_company", "neo4j_dirty"]
+            )
+        return results
+
+    # ── Private methods ──
+
+    def _enqueue_unmatched(
+        self, company_name: str, source_symbol: str, context_sector: str
+    ) -> None:
+        """UnmatchedCompanyQueue 적재 (기존 건은 occurrence_count/source_sectors 누적)."""
+        from .models import UnmatchedCompanyQueue
+
         queue_entry, created = UnmatchedCompanyQueue.objects.get_or_create(
             raw_company_name=company_name,
             defaults={
@@ -194,9 +415,6 @@ class TickerMatcher:
             queue_entry.save(update_fields=["occurrence_count", "source_sectors"])
 
         logger.debug(f"Unmatched: {company_name} (source={source_symbol})")
-        return None, None
-
-    # ── Private methods ──
 
     def _match_alias(self, name: str, context_sector: str) -> Optional[str]:
         """CompanyAlias 테이블 조회."""
@@ -218,6 +436,25 @@ class TickerMatcher:
         ).first()
         return alias.ticker if alias else None
 
+    def _match_alias_many(self, names: Iterable[str], context_sector: str) -> dict:
+        """CompanyAlias 1회 조회 → {소문자 alias: ticker} (context_sector 우선)."""
+        from .models import CompanyAlias
+
+        lowered = {name.lower() for name in names}
+        sector_filter = Q(context_sector="")
+        if context_sector:
+            sector_filter |= Q(context_sector__iexact=context_sector)
+        rows = (
+            CompanyAlias.objects.annotate(alias_lower=Lower("alias"))
+            .filter(sector_filter, alias_lower__in=lowered)
+            .values_list("alias_lower", "context_sector", "ticker")
+        )
+        generic: dict = {}
+        specific: dict = {}
+        for alias, sector, ticker in rows:
+            (specific if sector else generic).setdefault(alias, ticker)
+        return {**generic, **specific}
+
     def _match_exact(self, name: str) -> Optional[str]:
         """Stock.stock_name 정확 매칭."""
         cleaned = name.lower()
@@ -231,51 +468,69 @@ class TickerMatcher:
 
         return None
 
-    def _match_fuzzy(self, name: str, threshold: int = 80) -> tuple:
-        """rapidfuzz token_sort_ratio 매칭."""
-        self._ensure_loaded()
-        best_score = 0
-        best_symbol = None
-
-        for stock_name, symbol in self._stock_map.items():
-            score = fuzz.token_sort_ratio(name.lower(), stock_name)
-            if score > best_score:
-                best_score = score
-                best_symbol = symbol
+    def _match_fuzzy(self, name: str, threshold: int = FUZZY_THRESHOLD) -> tuple:
+        """
+        rapidfuzz token_sort_ratio 매칭.
 
-        if best_score >= threshold:
-            return best_symbol, best_score
-        return None, best_score
+        블로킹 후보(토큰 키 공유)에서 먼저 찾고, 없으면 전체 이름을 C 루프로 스캔합니다.
+        """
+        index = self._name_index()
+        query = name.lower()
+        positions = index.candidates(query)
+        if positions:
+            found = process.extractOne(
+                query,
+                [index.names[i] for i in positions],
+                scorer=fuzz.token_sort_ratio,
+                processor=None,
+                score_cutoff=threshold,
+            )
+            if found:
+                return index.symbols[positions[found[2]]], found[1]
+
+        found = process.extractOne(
+            query, index.names, scorer=fuzz.token_sort_ratio, processor=None
+        )
+        if found and found[1] >= threshold:
+            return index.symbols[found[2]], found[1]
+        return None, found[1] if found else 0
 
     def _get_fuzzy_candidates(self, name: str, top_k: int = 5) -> list:
-        """상위 fuzzy 후보 리스트."""
-        self._ensure_loaded()
-        scored = []
-        seen_symbols = set()
-
-        for stock_name, symbol in self._stock_map.items():
-            if symbol in seen_symbols:
-                continue
-            score = fuzz.token_sort_ratio(name.lower(), stock_name)
-            if score >= 50:
-                stock = Stock.objects.filter(symbol=symbol).first()
-                scored.append(
-                    {
-                        "ticker": symbol,
-                        "name": stock.stock_name if stock else stock_name,
-                        "score": round(score / 100, 2),
-                    }
-                )
-                seen_symbols.add(symbol)
+        """상위 fuzzy 후보 리스트 (symbol별 최고 점수, 표시 이름은 인덱스에서)."""
+        index = self._name_index()
+        if not index.names:
+            return []
+        scores = process.cdist(
+            [name.lower()],
+            index.names,
+            scorer=fuzz.token_sort_ratio,
+            processor=None,
+            score_cutoff=CANDIDATE_THRESHOLD,
+        )[0]
+        return self._rank_candidates(index, scores, top_k)
 
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:top_k]
+    @staticmethod
+    def _rank_candidates(index: _StockNameIndex, scores: np.ndarray, top_k: int) -> list:
+        """이름별 점수 → symbol별 최고 점수 상위 top_k."""
+        best = np.zeros(len(index.unique_symbols), dtype=scores.dtype)
+        np.maximum.at(best, index.symbol_codes, scores)
+        codes = np.flatnonzero(best >= CANDIDATE_THRESHOLD)
+        codes = codes[np.argsort(-best[codes], kind="stable")][:top_k]
+        return [
+            {
+                "ticker": index.unique_symbols[code],
+                "name": index.display.get(
+                    index.unique_symbols[code],
+                    index.names[int(np.argmax(index.symbol_codes == code))],
+                ),
+                "score": round(float(best[code]) / 100, 2),
+            }
+            for code in codes
+        ]
 
     @staticmethod
     def _clean_name(name: str) -> str:
         """회사명에서 Inc., Corp., Ltd. 등 접미사 제거."""
-        import re
-
         cleaned = re.sub(
             r",?\s*(Inc\.?|Corp\.?|Corporation|Ltd\.?|Limited|Co\.?|"
             r"Company|LLC|L\.P\.|PLC|S\.A\.?|N\.V\.?|AG|SE|Group)\.?\s*$",
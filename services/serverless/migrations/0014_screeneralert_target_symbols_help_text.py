@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("serverless", "0013_admin_action_log"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="screeneralert",
+            name="target_symbols",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text='price_target 목표가 목록 [{"symbol": "AAPL", "target_price": 200, "direction": "above"|"below"}]',
+            ),
+        ),
+    ]
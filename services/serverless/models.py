@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 
 
@@ -626,6 +627,33 @@ class CorporateAction(models.Model):
 # ========================================
 
 
+PRICE_TARGET_DIRECTIONS = ("above", "below")
+
+
+def validate_price_targets(targets):
+    """
+    price_target 알림 target_symbols 검증
+
+    항목 형식: {"symbol": "AAPL", "target_price": 200, "direction": "above"|"below"}
+    (direction 생략 시 above). 1개 이상 필요.
+    """
+    if not isinstance(targets, list) or not targets:
+        raise ValidationError("목표가 알림에는 1개 이상의 목표가 항목이 필요합니다.")
+    for i, target in enumerate(targets):
+        if not isinstance(target, dict):
+            raise ValidationError(
+                f"{i}번 항목: {{symbol, target_price, direction}} 객체여야 합니다."
+            )
+        symbol = target.get("symbol")
+        if not isinstance(symbol, str) or not symbol.strip():
+            raise ValidationError(f"{i}번 항목: symbol이 필요합니다.")
+        price = target.get("target_price")
+        if isinstance(price, bool) or not isinstance(price, (int, float)) or price <= 0:
+            raise ValidationError(f"{i}번 항목: target_price는 양수여야 합니다.")
+        if target.get("direction", "above") not in PRICE_TARGET_DIRECTIONS:
+            raise ValidationError(f"{i}번 항목: direction은 above 또는 below입니다.")
+
+
 class ScreenerAlert(models.Model):
     """
     스크리너 알림 설정
@@ -675,7 +703,12 @@ class ScreenerAlert(models.Model):
         help_text="필터 매칭 종목 수 임계값 (예: 10개 이상이면 알림)",
     )
     target_symbols = models.JSONField(
-        default=list, blank=True, help_text="특정 종목 모니터링 (price_target용)"
+        default=list,
+        blank=True,
+        help_text=(
+            "price_target 목표가 목록 "
+            '[{"symbol": "AAPL", "target_price": 200, "direction": "above"|"below"}]'
+        ),
     )
 
     # 알림 상태
@@ -711,6 +744,14 @@ class ScreenerAlert(models.Model):
         status = "활성" if self.is_active else "비활성"
         return f"[{status}] {self.name} ({self.user.email})"
 
+    def clean(self):
+        """price_target 알림의 target_symbols 형식 검증"""
+        if self.alert_type == "price_target":
+            try:
+                validate_price_targets(self.target_symbols)
+            except ValidationError as e:
+                raise ValidationError({"target_symbols": e.messages})
+
     def get_effective_filters(self):
         """
         실제 적용될 필터 반환 (프리셋 또는 커스텀)
@@ -4,6 +4,7 @@ Serverless App Serializers
 Market Movers, Market Breadth, Screener Presets, Sector Heatmap
 """
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
 from services.serverless.models import (
@@ -19,9 +20,20 @@ from services.serverless.models import (
     SectorPerformance,
     StockSectorInfo,
     VolatilityBaseline,
+    validate_price_targets,
 )
 
 
+def _validate_alert_targets(alert_type, target_symbols):
+    """price_target 알림은 {symbol, target_price, direction} 목록 필수"""
+    if alert_type != "price_target":
+        return
+    try:
+        validate_price_targets(target_symbols)
+    except DjangoValidationError as e:
+        raise serializers.ValidationError({"target_symbols": e.messages})
+
+
 class MarketMoverSerializer(serializers.ModelSerializer):
     """
     Market Mover 직렬화
@@ -571,6 +583,15 @@ class ScreenerAlertSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def validate(self, data):
+        """수정 후 알림 타입 기준으로 target_symbols 검증 (부분 수정은 기존 값과 병합)"""
+        instance = self.instance
+        _validate_alert_targets(
+            data.get("alert_type", getattr(instance, "alert_type", "filter_match")),
+            data.get("target_symbols", getattr(instance, "target_symbols", [])),
+        )
+        return data
+
     def get_preset_name(self, obj):
         """프리셋 이름 반환"""
         if obj.preset:
@@ -632,6 +653,7 @@ class ScreenerAlertCreateSerializer(serializers.ModelSerializer):
         alert_type = data.get("alert_type", "filter_match")
         if alert_type == "filter_match" and not data.get("target_count"):
             data["target_count"] = 1  # 기본값: 1개 이상 매칭 시 알림
+        _validate_alert_targets(alert_type, data.get("target_symbols", []))
 
         return data
 
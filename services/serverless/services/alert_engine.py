@@ -0,0 +1,333 @@
+"""
+스크리너 알림 배치 평가 엔진
+
+check_screener_alerts 1회 = 스크리너 유니버스 스냅샷 1개 로드 →
+정규화 필터 해시가 같은 알림끼리 묶어 그룹당 mask 1회 평가 → 알림 타입별 조건 적용.
+비용은 알림 수가 아니라 서로 다른 필터 조합 수에 비례합니다.
+
+알림 타입 (모두 같은 스냅샷 위에서 평가):
+- filter_match: 필터 매칭 종목 수 >= target_count
+- volume_spike: 필터 매칭 종목 중 rvol >= 임계값 (filters의 rvol_min 또는 기본값)
+- new_high / new_low: 필터 매칭 종목 중 현재가 >= 52주 고가 / <= 52주 저가
+- price_target: target_symbols의 {"symbol", "target_price", "direction"} 도달 여부
+- ai_signal: 미구현 (발송 안 함)
+"""
+
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from services.serverless.models import AlertHistory, ScreenerAlert, validate_price_targets
+from services.serverless.services.filter_engine import FilterEngine
+from services.serverless.services.screener_universe import (
+    ScreenerUniverse,
+    filter_hash,
+    get_universe,
+    refresh_universe,
+)
+
+logger = logging.getLogger(__name__)
+
+ALERT_SORT_BY = "marketCap"
+ALERT_SORT_ORDER = "desc"
+MAX_MATCHED_SYMBOLS = 10
+DEFAULT_RVOL_THRESHOLD = 2.0
+
+# 조건 mask를 스냅샷 단위로 1회 계산하는 알림 타입
+CONDITION_TYPES = ("volume_spike", "new_high", "new_low")
+
+
+class ScreenerAlertEngine:
+    """
+    활성 ScreenerAlert 배치 평가
+
+    Usage:
+        result = ScreenerAlertEngine().run()
+    """
+
+    def __init__(
+        self,
+        universe: Optional[ScreenerUniverse] = None,
+        filter_engine: Optional[FilterEngine] = None,
+    ):
+        self.universe = universe
+        self.filter_engine = filter_engine or FilterEngine()
+        self.rvol_threshold = float(
+            getattr(settings, "SCREENER_ALERT_RVOL_THRESHOLD", DEFAULT_RVOL_THRESHOLD)
+        )
+        self._conditions: Dict[Any, np.ndarray] = {}
+
+    def run(self) -> Dict[str, Any]:
+        """
+        1회 평가 사이클
+
+        Returns:
+            {
+                'checked': 10, 'triggered': 3, 'skipped_cooldown': 2, 'errors': 0,
+                'groups': 4, 'universe_built_at': '...',
+                'universe_unavailable': True,  # 스냅샷 없음 → filter_match만 FMP 평가
+                'timing_ms': {'load': .., 'evaluate': .., 'persist': .., 'total': ..}
+            }
+        """
+        started = time.perf_counter()
+        result = {
+            "checked": 0,
+            "triggered": 0,
+            "skipped_cooldown": 0,
+            "errors": 0,
+            "groups": 0,
+        }
+
+        alerts = list(
+            ScreenerAlert.objects.filter(is_active=True).select_related("preset")
+        )
+        result["checked"] = len(alerts)
+        ready = [alert for alert in alerts if alert.can_trigger()]
+        result["skipped_cooldown"] = len(alerts) - len(ready)
+
+        universe = self._load_universe() if ready else self.universe
+        loaded = time.perf_counter()
+
+        groups: Dict[str, List[ScreenerAlert]] = defaultdict(list)
+        for alert in ready:
+            filters = alert.get_effective_filters() or {}
+            groups[filter_hash(filters, ALERT_SORT_BY, ALERT_SORT_ORDER)].append(alert)
+        result["groups"] = len(groups)
+
+        triggered: List[tuple] = []
+        failed: List[tuple] = []
+        if ready and universe is None:
+            result["universe_unavailable"] = True
+            triggered, failed = self._evaluate_without_universe(ready)
+        else:
+            for members in groups.values():
+                filters = members[0].get_effective_filters() or {}
+                try:
+                    positions = self.filter_engine.match_positions(
+                        universe, filters, ALERT_SORT_BY, ALERT_SORT_ORDER
+                    )
+                except Exception as e:
+                    logger.exception(f"[ScreenerAlertEngine] group evaluation failed: {e}")
+                    failed.extend((alert, e) for alert in members)
+                    continue
+
+                for alert in members:
+                    try:
+                        matched = self._evaluate(universe, alert, filters, positions)
+                    except Exception as e:
+                        logger.exception(f"[ScreenerAlertEngine] {alert.name}: {e}")
+                        failed.append((alert, e))
+                        continue
+                    if matched is not None:
+                        triggered.append((alert, filters, matched))
+        evaluated = time.perf_counter()
+
+        self._persist(universe, triggered, failed)
+        finished = time.perf_counter()
+
+        result["triggered"] = len(triggered)
+        result["errors"] = len(failed)
+        result["universe_built_at"] = universe.built_at if universe else None
+        result["timing_ms"] = {
+            "load": round((loaded - started) * 1000, 1),
+            "evaluate": round((evaluated - loaded) * 1000, 1),
+            "persist": round((finished - evaluated) * 1000, 1),
+            "total": round((finished - started) * 1000, 1),
+        }
+        logger.info(
+            f"[ScreenerAlertEngine] {result['checked']} alerts / {result['groups']} groups, "
+            f"triggered={result['triggered']}, timing={result['timing_ms']}"
+        )
+        return result
+
+    # ========================================
+    # Private Methods
+    # ========================================
+
+    def _load_universe(self) -> Optional[ScreenerUniverse]:
+        """사이클당 스냅샷 1개 (없으면 즉시 시세 갱신 1회, 그래도 없으면 None)"""
+        if self.universe is None:
+            self.universe = get_universe() or refresh_universe()
+        if self.universe is None:
+            logger.error(
+                "[ScreenerAlertEngine] screener universe unavailable, "
+                "filter_match 알림만 FMP 경로로 평가"
+            )
+        return self.universe
+
+    def _evaluate_without_universe(self, alerts: List[ScreenerAlert]) -> tuple:
+        """
+        스냅샷이 없을 때 (콜드 스타트·갱신 실패) filter_match 알림만 FMP 필터로 평가.
+
+        같은 필터 조합은 apply_filters 1회. 나머지 타입은 스냅샷이 필요하므로 이번 사이클 보류.
+        """
+        triggered: List[tuple] = []
+        failed: List[tuple] = []
+        results: Dict[str, Dict[str, Any]] = {}
+        for alert in alerts:
+            if alert.alert_type != "filter_match":
+                continue
+            filters = alert.get_effective_filters() or {}
+            key = filter_hash(filters, ALERT_SORT_BY, ALERT_SORT_ORDER)
+            try:
+                if key not in results:
+                    results[key] = self.filter_engine.apply_filters(
+                        filters_dict=filters,
+                        limit=MAX_MATCHED_SYMBOLS,
+                        offset=0,
+                        sort_by=ALERT_SORT_BY,
+                        sort_order=ALERT_SORT_ORDER,
+                    )
+            except Exception as e:
+                logger.exception(f"[ScreenerAlertEngine] {alert.name}: {e}")
+                failed.append((alert, e))
+                continue
+            count = results[key].get("count", 0)
+            if count >= (alert.target_count or 1):
+                symbols = [s.get("symbol") for s in results[key].get("results", [])]
+                matched = {"count": count, "symbols": symbols[:MAX_MATCHED_SYMBOLS], "extra": {}}
+                triggered.append((alert, filters, matched))
+        return triggered, failed
+
+    def _evaluate(
+        self,
+        universe: ScreenerUniverse,
+        alert: ScreenerAlert,
+        filters: Dict[str, Any],
+        positions: np.ndarray,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        알림 1개 평가
+
+        Returns:
+            발송 조건 충족 시 {'count', 'symbols', 'extra'}, 아니면 None
+        """
+        extra: Dict[str, Any] = {}
+        if alert.alert_type == "filter_match":
+            hits = positions
+        elif alert.alert_type in CONDITION_TYPES:
+            hits = positions[self._condition(universe, alert.alert_type, filters)[positions]]
+        elif alert.alert_type == "price_target":
+            hits, extra["prices"] = self._price_targets(universe, alert.target_symbols)
+        else:
+            return None
+
+        if len(hits) < (alert.target_count or 1):
+            return None
+        head = hits[:MAX_MATCHED_SYMBOLS]
+        return {
+            "count": int(len(hits)),
+            "symbols": universe.frame["symbol"].to_numpy()[head].tolist(),
+            "extra": extra,
+        }
+
+    def _condition(
+        self, universe: ScreenerUniverse, alert_type: str, filters: Dict[str, Any]
+    ) -> np.ndarray:
+        """알림 타입별 종목 조건 mask (스냅샷당 임계값별 1회 계산)"""
+        threshold = None
+        if alert_type == "volume_spike":
+            try:
+                threshold = float(filters.get("rvol_min") or self.rvol_threshold)
+            except (TypeError, ValueError):
+                threshold = self.rvol_threshold
+        key = (alert_type, threshold)
+        if key in self._conditions:
+            return self._conditions[key]
+
+        column, bound = {
+            "volume_spike": ("rvol", None),
+            "new_high": ("price", "yearHigh"),
+            "new_low": ("price", "yearLow"),
+        }[alert_type]
+        if not universe.has(column) or (bound and not universe.has(bound)):
+            mask = np.zeros(len(universe), dtype=bool)
+        else:
+            values = universe.numeric(column)
+            with np.errstate(invalid="ignore"):
+                if alert_type == "volume_spike":
+                    mask = values >= threshold
+                elif alert_type == "new_high":
+                    mask = values >= universe.numeric(bound)
+                else:
+                    mask = values <= universe.numeric(bound)
+        self._conditions[key] = mask
+        return mask
+
+    def _price_targets(self, universe: ScreenerUniverse, targets: List[Any]) -> tuple:
+        """
+        target_symbols 목표가 도달 종목
+
+        항목 형식: {"symbol": "AAPL", "target_price": 200, "direction": "above"|"below"}
+        (direction 기본 above). 형식이 틀린 항목은 ValidationError → 알림 failed 이력.
+        스냅샷에 없거나 시세가 없는 종목만 건너뜁니다.
+        """
+        validate_price_targets(targets)
+        prices = universe.numeric("price") if universe.has("price") else None
+        hits: List[int] = []
+        reached: Dict[str, float] = {}
+        for target in targets:
+            position = universe.position_of(target["symbol"])
+            if prices is None or position is None or np.isnan(prices[position]):
+                continue
+            goal = float(target["target_price"])
+            price = float(prices[position])
+            below = target.get("direction") == "below"
+            if (price <= goal) if below else (price >= goal):
+                hits.append(position)
+                reached[str(target["symbol"]).upper()] = price
+        return np.asarray(hits, dtype=int), reached
+
+    def _persist(
+        self,
+        universe: Optional[ScreenerUniverse],
+        triggered: List[tuple],
+        failed: List[tuple],
+    ) -> None:
+        """AlertHistory bulk_create + 발송 알림 상태 일괄 갱신"""
+        built_at = universe.built_at if universe else None
+        history = [
+            AlertHistory(
+                alert=alert,
+                matched_count=matched["count"],
+                matched_symbols=matched["symbols"],
+                snapshot={
+                    "filters": filters,
+                    "alert_type": alert.alert_type,
+                    "target_count": alert.target_count,
+                    "universe_built_at": built_at,
+                    **matched["extra"],
+                },
+                status="sent",
+            )
+            for alert, filters, matched in triggered
+        ]
+        history.extend(
+            AlertHistory(
+                alert=alert,
+                matched_count=0,
+                matched_symbols=[],
+                snapshot={"error": str(error)},
+                status="failed",
+                error_message=str(error),
+            )
+            for alert, error in failed
+        )
+        if history:
+            AlertHistory.objects.bulk_create(history)
+        if triggered:
+            ScreenerAlert.objects.filter(
+                pk__in=[alert.pk for alert, _, _ in triggered]
+            ).update(
+                last_triggered_at=timezone.now(), trigger_count=F("trigger_count") + 1
+            )
+        # TODO: 실제 알림 발송
+        # - notify_in_app: WebSocket 메시지
+        # - notify_email: 이메일 발송
+        # - notify_push: PWA 푸시 알림
@@ -251,17 +251,17 @@ class EnhancedScreenerService:
         FMP key-metrics-ttm 배치 호출
 
         캐싱: Redis 1시간 TTL
-        Rate Limit 대응: 캐시된 것 먼저 사용
+        Rate Limit 대응: 캐시된 것 먼저 사용, 미스는 fetch_many로 병렬 조회
         """
         result = {}
         uncached_symbols = []
 
-        # 1. 캐시 확인
+        # 1. 캐시 확인 (1회 왕복)
+        cached = cache.get_many([f"fmp:metrics_ttm:{symbol}" for symbol in symbols])
         for symbol in symbols:
-            cache_key = f"fmp:metrics_ttm:{symbol}"
-            cached = cache.get(cache_key)
-            if cached:
-                result[symbol] = cached
+            data = cached.get(f"fmp:metrics_ttm:{symbol}")
+            if data:
+                result[symbol] = data
             else:
                 uncached_symbols.append(symbol)
 
@@ -269,15 +269,24 @@ class EnhancedScreenerService:
             f"Metrics 캐시: {len(result)}개 HIT, {len(uncached_symbols)}개 MISS"
         )
 
-        # 2. 캐시 미스 종목 API 호출 (최대 20개씩, Rate Limit 고려)
-        for symbol in uncached_symbols[:20]:
-            try:
-                data = self._fetch_single_key_metrics(symbol)
-                if data:
-                    result[symbol] = data
-                    cache.set(f"fmp:metrics_ttm:{symbol}", data, self.METRICS_CACHE_TTL)
-            except Exception as e:
-                logger.warning(f"Metrics 조회 실패 ({symbol}): {e}")
+        # 2. 캐시 미스 종목 동시 조회 (동시성/속도 제한은 FMPClient.fetch_many가 담당)
+        if uncached_symbols:
+            responses = self.fmp_client.fetch_many(
+                "/stable/key-metrics-ttm",
+                [{"symbol": symbol.upper()} for symbol in uncached_symbols],
+            )
+            fetched = {}
+            for symbol, response in zip(uncached_symbols, responses):
+                if isinstance(response, Exception):
+                    logger.warning(f"Key Metrics API 오류 ({symbol}): {response}")
+                elif isinstance(response, list) and len(response) > 0:
+                    fetched[symbol] = response[0]
+            if fetched:
+                cache.set_many(
+                    {f"fmp:metrics_ttm:{s}": data for s, data in fetched.items()},
+                    self.METRICS_CACHE_TTL,
+                )
+            result.update(fetched)
 
         return result
 
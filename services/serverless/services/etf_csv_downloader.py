@@ -27,6 +27,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 import httpx
+from django.db import transaction
 from django.utils import timezone
 
 from services.serverless.models import ETFHolding, ETFProfile
@@ -1005,8 +1006,9 @@ class ETFCSVDownloader:
         """
         Holdings 데이터 DB 저장
 
-        기존 데이터 삭제 후 새 데이터 저장 (전체 교체)
+        오늘자 snapshot을 새 데이터로 교체 (종목 단위 upsert + 빠진 종목만 삭제)
         중복 티커는 비중을 합산하여 저장
+        직전 snapshot 대비 편입/편출 종목 수를 로깅
 
         Args:
             profile: ETFProfile 인스턴스
@@ -1018,9 +1020,6 @@ class ETFCSVDownloader:
         """
         today = date.today()
 
-        # 오늘자 기존 데이터 삭제
-        ETFHolding.objects.filter(etf=profile, snapshot_date=today).delete()
-
         # 중복 티커 합산
         deduped = {}
         for h in holdings:
@@ -1060,7 +1059,35 @@ class ETFCSVDownloader:
                 )
             )
 
-        ETFHolding.objects.bulk_create(holding_objects)
+        symbols = [h["symbol"] for h in holdings_list]
+        with transaction.atomic():
+            ETFHolding.objects.bulk_create(
+                holding_objects,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["etf", "stock_symbol", "snapshot_date"],
+                update_fields=["weight_percent", "shares", "market_value", "rank"],
+            )
+            ETFHolding.objects.filter(etf=profile, snapshot_date=today).exclude(
+                stock_symbol__in=symbols
+            ).delete()
+
+        previous_date = (
+            ETFHolding.objects.filter(etf=profile, snapshot_date__lt=today)
+            .order_by("-snapshot_date")
+            .values_list("snapshot_date", flat=True)
+            .first()
+        )
+        if previous_date:
+            previous = set(
+                ETFHolding.objects.filter(
+                    etf=profile, snapshot_date=previous_date
+                ).values_list("stock_symbol", flat=True)
+            )
+            logger.info(
+                f"{profile.symbol}: {previous_date} 대비 편입 {len(set(symbols) - previous)}, "
+                f"편출 {len(previous - set(symbols))}"
+            )
 
         # 프로필 업데이트
         profile.last_updated = timezone.now()
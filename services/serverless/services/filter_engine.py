@@ -2,15 +2,29 @@
 동적 필터 엔진 (Lambda 전환 대상)
 
 50개 이상의 필터를 동적으로 적용하고 FMP API와 클라이언트 사이드 필터링을 조합합니다.
+
+스크리너 유니버스 스냅샷(screener_universe.py)이 있으면 FMP 호출 없이 스냅샷 컬럼에
+벡터화된 mask를 적용하고, 정렬된 결과 행 번호를 정규화 필터 해시로 캐시합니다
+(페이지 이동 = 슬라이스). 스냅샷이 없으면 기존 FMP 경로로 처리합니다.
 """
 
 import logging
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
+from django.conf import settings
 from django.core.cache import cache
 
 from services.serverless.models import ScreenerFilter
+from services.serverless.services.screener_universe import (
+    RESULT_TTL,
+    ScreenerUniverse,
+    filter_hash,
+    get_universe,
+    result_cache_key,
+)
 from packages.shared.api_request.providers.fmp.serverless_client import FMPAPIError, FMPClient
 
 logger = logging.getLogger(__name__)
@@ -80,6 +94,40 @@ class FilterEngine:
         "change_percent_max",
     }
 
+    # 클라이언트 필터 필드명 매핑 (snake_case → API/유니버스 필드명)
+    CLIENT_FIELD_MAP = {
+        "pe_ratio": "pe",
+        "pb_ratio": "priceToBook",
+        "peg_ratio": "peg",
+        "roe": "roe",
+        "roa": "roa",
+        "debt_equity": "debtToEquity",
+        "current_ratio": "currentRatio",
+        "eps_growth": "epsGrowth",
+        "revenue_growth": "revenueGrowth",
+        "profit_margin": "grossProfitMargin",
+        "rsi": "rsi",
+        "change_percent": "changesPercentage",
+    }
+
+    # FMP 서버 사이드 필터 → 유니버스 컬럼 (스냅샷 경로에서 FMP와 같은 의미로 평가)
+    UNIVERSE_RANGE_COLUMNS = {
+        "market_cap": "marketCap",
+        "price": "price",
+        "beta": "beta",
+        "volume": "volume",
+        "dividend": "lastAnnualDividend",
+    }
+    UNIVERSE_CHOICE_COLUMNS = {
+        "sector": ("sector",),
+        "exchange": ("exchangeShortName", "exchange"),
+        "country": ("country",),
+    }
+    UNIVERSE_FLAG_COLUMNS = {
+        "is_etf": "isEtf",
+        "is_actively_trading": "isActivelyTrading",
+    }
+
     def __init__(self):
         self.fmp_client = FMPClient()
 
@@ -120,6 +168,19 @@ class FilterEngine:
         # 필터 분리: FMP API용 vs 클라이언트 사이드
         fmp_params, client_filters = self._split_filters(filters_dict)
 
+        universe = (
+            get_universe()
+            if getattr(settings, "SCREENER_UNIVERSE_ENABLED", True)
+            else None
+        )
+        if universe is not None:
+            try:
+                return self._apply_on_universe(
+                    universe, filters_dict, limit, offset, sort_by, sort_order
+                )
+            except Exception as e:
+                logger.warning(f"유니버스 필터 실패, FMP 경로로 대체: {e}")
+
         try:
             # FMP API 호출
             all_stocks = self._fetch_from_fmp(fmp_params, limit=1000)
@@ -234,10 +295,166 @@ class FilterEngine:
         cache.set(cache_key, result, 3600)  # 1시간 캐시
         return result
 
+    def match_positions(
+        self,
+        universe: ScreenerUniverse,
+        filters_dict: Dict[str, Any],
+        sort_by: str = "marketCap",
+        sort_order: str = "desc",
+    ) -> np.ndarray:
+        """
+        스냅샷에서 필터를 통과한 정렬된 행 번호 (정규화 필터 해시로 캐시)
+
+        화면 조회와 알림 평가(ScreenerAlertEngine)가 같은 캐시를 공유합니다.
+        """
+        cache_key = result_cache_key(
+            universe, filter_hash(filters_dict, sort_by, sort_order)
+        )
+        positions = cache.get(cache_key)
+        if positions is None:
+            mask = self._compile_mask(universe, filters_dict)
+            positions = self._sorted_positions(universe, mask, sort_by, sort_order)
+            cache.set(cache_key, positions, RESULT_TTL)
+        else:
+            logger.debug("스크리너 결과 캐시 HIT")
+        return positions
+
     # ========================================
     # Private Methods
     # ========================================
 
+    def _apply_on_universe(
+        self,
+        universe: ScreenerUniverse,
+        filters_dict: Dict[str, Any],
+        limit: int,
+        offset: int,
+        sort_by: str,
+        sort_order: str,
+    ) -> Dict:
+        """스냅샷 경로: 결과 행 번호 캐시 → 페이지 슬라이스"""
+        positions = self.match_positions(universe, filters_dict, sort_by, sort_order)
+
+        fmp_params, client_filters = self._split_filters(filters_dict)
+        total_count = len(positions)
+        return {
+            "results": universe.records(positions[offset : offset + limit]),
+            "count": total_count,
+            "total_pages": (total_count + limit - 1) // limit,
+            "current_page": (offset // limit) + 1,
+            "page_size": limit,
+            "filters_applied": {
+                "fmp_filters": list(fmp_params.keys()),
+                "client_filters": list(client_filters.keys()),
+            },
+            "universe_built_at": universe.built_at,
+        }
+
+    def _compile_mask(
+        self, universe: ScreenerUniverse, filters_dict: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        필터 딕셔너리 → boolean mask (필터별 컬럼 연산 1회)
+
+        FMP 서버 사이드 필터는 값이 없으면 제외, 클라이언트 필터는
+        _matches_filter와 같이 값 없음/숫자 변환 불가 시 통과.
+        """
+        mask = np.ones(len(universe), dtype=bool)
+        for key, value in filters_dict.items():
+            if key in self.FMP_PARAM_MAP:
+                if value is None:
+                    continue  # FMP 요청에서도 None 파라미터는 빠짐
+                mask &= self._server_filter_mask(universe, key, value)
+            else:
+                mask &= self._client_filter_mask(universe, key, value)
+        return mask
+
+    def _server_filter_mask(
+        self, universe: ScreenerUniverse, key: str, value: Any
+    ) -> np.ndarray:
+        everything = np.ones(len(universe), dtype=bool)
+
+        if key in self.UNIVERSE_FLAG_COLUMNS:
+            column = self.UNIVERSE_FLAG_COLUMNS[key]
+            if not universe.has(column):
+                return everything
+            return universe.frame[column].to_numpy() == bool(value)
+
+        if key in self.UNIVERSE_CHOICE_COLUMNS:
+            choices = value if isinstance(value, (list, tuple)) else [value]
+            wanted = [str(v).lower() for v in choices]
+            columns = [c for c in self.UNIVERSE_CHOICE_COLUMNS[key] if universe.has(c)]
+            if not columns:
+                return everything
+            result = np.zeros(len(universe), dtype=bool)
+            for column in columns:
+                result |= np.isin(universe.text(column), wanted)
+            return result
+
+        field, operator = key[:-4], key[-3:]
+        column = self.UNIVERSE_RANGE_COLUMNS.get(field)
+        if column is None or not universe.has(column):
+            return everything
+        try:
+            bound = float(value)
+        except (ValueError, TypeError):
+            return everything
+        values = universe.numeric(column)
+        with np.errstate(invalid="ignore"):
+            return values >= bound if operator == "min" else values <= bound
+
+    def _client_filter_mask(
+        self, universe: ScreenerUniverse, filter_key: str, filter_value: Any
+    ) -> np.ndarray:
+        field, operator = self._parse_filter_key(filter_key)
+        column = self.CLIENT_FIELD_MAP.get(field, field)
+        everything = np.ones(len(universe), dtype=bool)
+        if not universe.has(column):
+            return everything  # 데이터 없으면 통과 (필터 제외)
+        try:
+            bound = float(filter_value)
+        except (ValueError, TypeError):
+            return everything
+
+        values = universe.numeric(column)
+        with np.errstate(invalid="ignore"):
+            if operator == "gte":
+                matched = values >= bound
+            elif operator == "lte":
+                matched = values <= bound
+            else:
+                matched = values == bound
+        return matched | np.isnan(values)
+
+    def _sorted_positions(
+        self, universe: ScreenerUniverse, mask: np.ndarray, sort_by: str, sort_order: str
+    ) -> np.ndarray:
+        """
+        mask 통과 행 번호를 정렬 (_sort_results와 같이 안정 정렬, 값 없음은 항상 끝)
+        """
+        positions = np.flatnonzero(mask)
+        if len(positions) < 2 or not universe.has(sort_by):
+            return positions
+
+        keys = pd.Series(universe.numeric(sort_by)[positions])
+        if keys.isna().all():
+            raw = universe.frame[sort_by].to_numpy()[positions]
+            if pd.notna(raw).any():
+                keys = pd.Series(raw)  # 문자열 컬럼
+        order = keys.sort_values(
+            ascending=sort_order.lower() != "desc", kind="mergesort", na_position="last"
+        ).index.to_numpy()
+        return positions[order]
+
+    @staticmethod
+    def _parse_filter_key(filter_key: str) -> tuple:
+        """필터 키 → (필드명, 연산자)"""
+        if filter_key.endswith("_min"):
+            return filter_key[:-4], "gte"
+        if filter_key.endswith("_max"):
+            return filter_key[:-4], "lte"
+        return filter_key, "eq"
+
     def _split_filters(self, filters_dict: Dict) -> tuple:
         """FMP API 필터와 클라이언트 사이드 필터 분리"""
         fmp_params = {}
@@ -299,33 +516,9 @@ class FilterEngine:
     def _matches_filter(self, stock: Dict, filter_key: str, filter_value: Any) -> bool:
         """단일 필터 조건 매칭"""
         # 필터 키에서 필드명과 연산자 추출
-        if filter_key.endswith("_min"):
-            field = filter_key[:-4]
-            operator = "gte"
-        elif filter_key.endswith("_max"):
-            field = filter_key[:-4]
-            operator = "lte"
-        else:
-            field = filter_key
-            operator = "eq"
-
-        # 필드명 매핑 (snake_case → API 필드명)
-        field_map = {
-            "pe_ratio": "pe",
-            "pb_ratio": "priceToBook",
-            "peg_ratio": "peg",
-            "roe": "roe",
-            "roa": "roa",
-            "debt_equity": "debtToEquity",
-            "current_ratio": "currentRatio",
-            "eps_growth": "epsGrowth",
-            "revenue_growth": "revenueGrowth",
-            "profit_margin": "grossProfitMargin",
-            "rsi": "rsi",
-            "change_percent": "changesPercentage",
-        }
+        field, operator = self._parse_filter_key(filter_key)
 
-        actual_field = field_map.get(field, field)
+        actual_field = self.CLIENT_FIELD_MAP.get(field, field)
         stock_value = stock.get(actual_field)
 
         if stock_value is None:
@@ -29,11 +29,11 @@ Usage:
 """
 
 import logging
-from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from django.db import transaction
 from django.db.models import Count, Q
 
@@ -41,6 +41,11 @@ from services.serverless.models import StockRelationship
 
 logger = logging.getLogger(__name__)
 
+# 동일 펀드 보유 관계: 종목당 유지할 관계 수 / 행렬곱 행 chunk / bulk upsert 배치
+CO_HOLDING_TOP_K = 50
+CO_HOLDING_CHUNK_SIZE = 1024
+RELATIONSHIP_BATCH_SIZE = 1000
+
 
 class InstitutionalHoldingsService:
     """
@@ -364,22 +369,27 @@ class InstitutionalHoldingsService:
             logger.error(f"기관 동기화 에러 {name}: {e}")
             raise
 
-    def generate_held_by_same_fund(self, min_shared_institutions: int = 3) -> int:
+    def generate_held_by_same_fund(
+        self, min_shared_institutions: int = 3, top_k: int = CO_HOLDING_TOP_K
+    ) -> int:
         """
         '동일 펀드 보유' 관계 생성
 
         Algorithm:
         1. Get latest report_date across all institutions
-        2. For each pair of stocks held by >= min_shared_institutions
-        3. Calculate strength = shared_count / total_institutions_holding_either
-        4. Create/update StockRelationship(relationship_type='HELD_BY_SAME_FUND')
-        5. Store context: {"shared_institutions": [...], "shared_count": N}
+        2. Build stock × institution incidence matrix (0/1)
+        3. shared counts = incidence @ incidence.T (row chunks)
+        4. strength = shared_count / total_institutions_holding_either (Jaccard)
+        5. Keep pairs with shared >= min_shared_institutions, top_k targets per source
+        6. Bulk upsert StockRelationship(relationship_type='HELD_BY_SAME_FUND')
+           with context: {"shared_institutions": [...], "shared_count": N}
 
         Args:
             min_shared_institutions: 최소 공통 기관 수 (기본 3)
+            top_k: 종목당 유지할 관계 수 (strength 상위)
 
         Returns:
-            생성된 관계 수
+            생성된 관계 수 (종목쌍 기준)
         """
         try:
             from services.serverless.models import InstitutionalHolding
@@ -398,76 +408,99 @@ class InstitutionalHoldingsService:
         latest_report_date = latest_holding.report_date
         logger.info(f"최신 보고 날짜: {latest_report_date}")
 
-        # Build holdings map: {symbol: set(institution_ciks)}
-        holdings_map = defaultdict(set)
-
-        holdings_qs = InstitutionalHolding.objects.filter(
-            report_date=latest_report_date
-        ).values("stock_symbol", "institution_cik", "institution_name")
-
-        institution_names = {}  # CIK -> Name mapping
-
-        for holding in holdings_qs:
-            symbol = holding["stock_symbol"]
-            cik = holding["institution_cik"]
-            name = holding["institution_name"]
-
-            holdings_map[symbol].add(cik)
-            institution_names[cik] = name
-
-        logger.info(f"종목 수: {len(holdings_map)}")
-
-        # Find pairs with shared institutions
-        symbols = list(holdings_map.keys())
-        relationship_count = 0
+        rows = list(
+            InstitutionalHolding.objects.filter(
+                report_date=latest_report_date
+            ).values_list("stock_symbol", "institution_cik", "institution_name")
+        )
 
-        for i, symbol_a in enumerate(symbols):
-            institutions_a = holdings_map[symbol_a]
+        institution_names = {cik: name for _, cik, name in rows}  # CIK -> Name
+        symbols, symbol_idx = np.unique([r[0] for r in rows], return_inverse=True)
+        ciks, cik_idx = np.unique([r[1] for r in rows], return_inverse=True)
+
+        # 기관 축은 KEY_INSTITUTIONS(수십 개)로 고정 → 밀집 float32 행렬로 충분.
+        # 추적 기관이 수천 개 규모로 늘면 scipy.sparse(csr) 곱으로 바꾼다.
+        incidence = np.zeros((len(symbols), len(ciks)), dtype=np.float32)
+        incidence[symbol_idx, cik_idx] = 1.0
+
+        logger.info(f"종목 수: {len(symbols)}, 기관 수: {len(ciks)}")
+
+        relationships = []
+        pairs = set()
+        for source, target, shared_count, total_institutions in self._co_holding_edges(
+            incidence, min_shared_institutions, top_k
+        ):
+            shared_ciks = ciks[
+                np.flatnonzero(incidence[source] * incidence[target])[:10]
+            ]
+            relationships.append(
+                StockRelationship(
+                    source_symbol=str(symbols[source]),
+                    target_symbol=str(symbols[target]),
+                    relationship_type="HELD_BY_SAME_FUND",
+                    strength=Decimal(str(shared_count / total_institutions)),
+                    source_provider="sec_13f",
+                    context={
+                        "shared_institutions": [
+                            institution_names.get(cik, str(cik)) for cik in shared_ciks
+                        ],
+                        "shared_count": shared_count,
+                        "total_institutions": total_institutions,
+                        "report_date": str(latest_report_date),
+                    },
+                )
+            )
+            pairs.add((min(source, target), max(source, target)))
+
+        with transaction.atomic():
+            StockRelationship.objects.bulk_create(
+                relationships,
+                batch_size=RELATIONSHIP_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["source_symbol", "target_symbol", "relationship_type"],
+                update_fields=[
+                    "strength",
+                    "source_provider",
+                    "context",
+                    "last_verified_at",
+                ],
+            )
 
-            for symbol_b in symbols[i + 1 :]:
-                institutions_b = holdings_map[symbol_b]
+        relationship_count = len(pairs)
+        logger.info(
+            f"동일 펀드 보유 관계 생성 완료: {relationship_count}개 "
+            f"(방향 관계 {len(relationships)}개)"
+        )
+        return relationship_count
 
-                # Find shared institutions
-                shared = institutions_a & institutions_b
-                shared_count = len(shared)
+    @staticmethod
+    def _co_holding_edges(incidence: np.ndarray, min_shared: int, top_k: int):
+        """
+        공통 보유 기관 수 기준 방향 관계 (source, target, shared, union)
 
-                if shared_count < min_shared_institutions:
+        incidence 행 chunk마다 행렬곱 1회로 모든 쌍의 공통 기관 수를 구하고,
+        source별 Jaccard strength 상위 top_k 대상만 남깁니다
+        (동률은 공통 기관 수, 심볼 순).
+        """
+        degrees = incidence.sum(axis=1)
+        n = len(incidence)
+        for start in range(0, n, CO_HOLDING_CHUNK_SIZE):
+            stop = min(start + CO_HOLDING_CHUNK_SIZE, n)
+            shared = incidence[start:stop] @ incidence.T
+            shared[np.arange(stop - start), np.arange(start, stop)] = 0  # 자기 자신 제외
+            union = degrees[start:stop, None] + degrees[None, :] - shared
+
+            for offset, row in enumerate(shared):
+                targets = np.flatnonzero(row >= min_shared)
+                if not len(targets):
                     continue
-
-                # Calculate strength
-                total_institutions = len(institutions_a | institutions_b)
-                strength = Decimal(str(shared_count / total_institutions))
-
-                # Get institution names for context
-                shared_institution_names = [
-                    institution_names.get(cik, cik) for cik in list(shared)[:10]
-                ]
-
-                # Create relationship (bidirectional)
-                for source, target in [(symbol_a, symbol_b), (symbol_b, symbol_a)]:
-                    StockRelationship.objects.update_or_create(
-                        source_symbol=source,
-                        target_symbol=target,
-                        relationship_type="HELD_BY_SAME_FUND",
-                        defaults={
-                            "strength": strength,
-                            "source_provider": "sec_13f",
-                            "context": {
-                                "shared_institutions": shared_institution_names,
-                                "shared_count": shared_count,
-                                "total_institutions": total_institutions,
-                                "report_date": str(latest_report_date),
-                            },
-                        },
-                    )
-
-                relationship_count += 1
-
-                if relationship_count % 100 == 0:
-                    logger.debug(f"관계 생성 중: {relationship_count}개...")
-
-        logger.info(f"동일 펀드 보유 관계 생성 완료: {relationship_count}개")
-        return relationship_count
+                counts = row[targets]
+                strengths = counts / union[offset, targets]
+                order = np.lexsort((targets, -counts, -strengths))[:top_k]
+                for target, count, total in zip(
+                    targets[order], counts[order], union[offset, targets[order]]
+                ):
+                    yield start + offset, int(target), int(count), int(total)
 
     def get_institution_holdings(self, cik: str) -> List[Dict[str, Any]]:
         """
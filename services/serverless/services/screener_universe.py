@@ -0,0 +1,308 @@
+"""
+스크리너 유니버스 스냅샷 (컬럼형)
+
+FMP company-screener 전체 + key-metrics-ttm + 자체 DB(Stock)를 종목 × 필드 DataFrame으로
+주기적으로 구축해 Django cache에 보관합니다. FilterEngine은 요청마다 FMP를 호출하는 대신
+이 스냅샷에 벡터화된 boolean mask를 적용하고, 필터 결과(정렬된 행 번호)를
+정규화 필터 해시로 캐시하여 페이지 이동은 슬라이스만 수행합니다.
+
+갱신 (refresh_screener_universe 태스크):
+- 시세 갱신 (장중 15분): company-screener 1회 + DB. 펀더멘탈 컬럼은 직전 스냅샷 재사용
+- 펀더멘탈 갱신 (일 1회): + key-metrics-ttm (시가총액 상위 SCREENER_UNIVERSE_METRICS_LIMIT개)
+
+컬럼 이름은 FMP 스크리너 응답 필드 + FilterEngine 클라이언트 필터 필드(pe, roe, ...)입니다.
+알림 평가용으로 yearHigh/yearLow(Stock 52주 고저), avgVolume/rvol(DailyPrice 평균 거래량)도 포함합니다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+UNIVERSE_CACHE_KEY = "screener_universe:v1"
+VERSION_CACHE_KEY = "screener_universe:version"
+RESULT_CACHE_PREFIX = "screener_result"
+
+UNIVERSE_TTL = 60 * 60 * 24  # 갱신 실패 시에도 하루 동안은 직전 스냅샷 사용
+RESULT_TTL = 60 * 15
+SCREENER_FETCH_LIMIT = 10000
+DEFAULT_METRICS_LIMIT = 1000
+
+# key-metrics-ttm 병합 결과(EnhancedScreenerService._merge_metrics) → 유니버스 컬럼
+METRIC_COLUMNS = {
+    "pe_ratio": "pe",
+    "pb_ratio": "priceToBook",
+    "roe": "roe",
+    "roa": "roa",
+    "debt_equity": "debtToEquity",
+    "current_ratio": "currentRatio",
+}
+
+# 자체 DB(Stock) 보조 컬럼: FMP 값이 없을 때만 채움
+_DB_FIELDS = (
+    "symbol",
+    "pe_ratio",
+    "peg_ratio",
+    "price_to_book_ratio",
+    "return_on_equity_ttm",
+    "return_on_assets_ttm",
+    "quarterly_earnings_growth_yoy",
+    "quarterly_revenue_growth_yoy",
+    "gross_profit_ttm",
+    "revenue_ttm",
+    "change_percent",
+    "week_52_high",
+    "week_52_low",
+)
+
+# 평균 거래량(RVOL 분모) 기간: 최근 N 거래일 ≈ 캘린더 일수
+AVG_VOLUME_CALENDAR_DAYS = 30
+
+
+@dataclass
+class ScreenerUniverse:
+    """스크리너 스냅샷 (행 순서 = FMP 스크리너 응답 순서)"""
+
+    version: str
+    built_at: str
+    frame: pd.DataFrame
+    _numeric: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+    _positions: Optional[Dict[str, int]] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def has(self, column: str) -> bool:
+        return column in self.frame.columns
+
+    def numeric(self, column: str) -> np.ndarray:
+        """float64 컬럼 (변환 불가/결측 NaN), 컬럼별 1회 변환"""
+        values = self._numeric.get(column)
+        if values is None:
+            values = pd.to_numeric(self.frame[column], errors="coerce").to_numpy(
+                dtype=float
+            )
+            self._numeric[column] = values
+        return values
+
+    def text(self, column: str) -> np.ndarray:
+        """소문자 문자열 컬럼 (결측 빈 문자열)"""
+        return self.frame[column].fillna("").astype(str).str.lower().to_numpy()
+
+    def position_of(self, symbol: str) -> Optional[int]:
+        """심볼 → 행 번호 (없으면 None)"""
+        if self._positions is None:
+            self._positions = {
+                str(s).upper(): i for i, s in enumerate(self.frame["symbol"].tolist())
+            }
+        return self._positions.get(str(symbol).upper())
+
+    def records(self, positions: np.ndarray) -> List[Dict[str, Any]]:
+        """행 번호 → dict 리스트 (NaN은 None)"""
+        page = self.frame.iloc[positions]
+        return page.astype(object).where(page.notna(), None).to_dict("records")
+
+
+def build_universe_frame(
+    include_metrics: bool = True,
+    previous: Optional[pd.DataFrame] = None,
+    metrics_limit: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    FMP 스크리너 + key-metrics-ttm + DB → 유니버스 DataFrame
+
+    Args:
+        include_metrics: key-metrics-ttm 조회 여부 (False면 previous의 펀더멘탈 컬럼 재사용)
+        previous: 직전 스냅샷 frame
+        metrics_limit: key-metrics-ttm 조회 종목 수 (시가총액 상위)
+    """
+    from .enhanced_screener_service import EnhancedScreenerService
+
+    service = EnhancedScreenerService()
+    rows = service.fmp_client._make_request(
+        "/stable/company-screener",
+        {"limit": SCREENER_FETCH_LIMIT, "isActivelyTrading": "true"},
+    )
+    frame = pd.DataFrame(rows or [])
+    if frame.empty or "symbol" not in frame.columns:
+        return frame
+    frame = frame.drop_duplicates("symbol").reset_index(drop=True)
+
+    metric_columns = list(METRIC_COLUMNS.values())
+    if include_metrics or previous is None or previous.empty:
+        if metrics_limit is None:
+            metrics_limit = getattr(
+                settings, "SCREENER_UNIVERSE_METRICS_LIMIT", DEFAULT_METRICS_LIMIT
+            )
+        if "marketCap" in frame.columns:
+            caps = pd.to_numeric(frame["marketCap"], errors="coerce")
+            order = caps.sort_values(ascending=False, na_position="last").index
+        else:
+            order = frame.index
+        symbols = frame.loc[order[:metrics_limit], "symbol"].tolist()
+        metrics = service._fetch_key_metrics_batch(symbols)
+        merged = service._merge_metrics([{"symbol": s} for s in symbols], metrics)
+        fundamentals = pd.DataFrame(merged, columns=["symbol", *METRIC_COLUMNS])
+        fundamentals = fundamentals.rename(columns=METRIC_COLUMNS)
+    else:
+        keep = ["symbol"] + [c for c in metric_columns if c in previous.columns]
+        fundamentals = previous[keep]
+
+    frame = frame.merge(fundamentals, on="symbol", how="left")
+    frame = _merge_db_columns(frame)
+    frame = _merge_volume_averages(frame)
+    logger.info(
+        f"[ScreenerUniverse] built: {len(frame)} symbols, "
+        f"{len(frame.columns)} columns (metrics={'fresh' if include_metrics else 'reused'})"
+    )
+    return frame
+
+
+def _merge_db_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Stock 테이블 값으로 결측 펀더멘탈 보완 + DB 전용 컬럼(peg, 성장률, 등락률)"""
+    from packages.shared.stocks.models import Stock
+
+    db = pd.DataFrame.from_records(
+        Stock.objects.filter(symbol__in=frame["symbol"].tolist()).values_list(*_DB_FIELDS),
+        columns=_DB_FIELDS,
+    )
+    if db.empty:
+        return frame
+    num = db.drop(columns=["symbol", "change_percent"]).apply(
+        pd.to_numeric, errors="coerce"
+    )
+    revenue = num["revenue_ttm"].where(num["revenue_ttm"] != 0)
+    derived = pd.DataFrame(
+        {
+            "symbol": db["symbol"],
+            "db_pe": num["pe_ratio"],
+            "db_priceToBook": num["price_to_book_ratio"],
+            "db_roe": num["return_on_equity_ttm"] * 100,
+            "db_roa": num["return_on_assets_ttm"] * 100,
+            "peg": num["peg_ratio"],
+            "epsGrowth": num["quarterly_earnings_growth_yoy"] * 100,
+            "revenueGrowth": num["quarterly_revenue_growth_yoy"] * 100,
+            "grossProfitMargin": num["gross_profit_ttm"] / revenue * 100,
+            "changesPercentage": pd.to_numeric(
+                db["change_percent"].str.rstrip("%"), errors="coerce"
+            ),
+            "yearHigh": num["week_52_high"],
+            "yearLow": num["week_52_low"],
+        }
+    )
+    frame = frame.merge(derived, on="symbol", how="left")
+    for column in ("pe", "priceToBook", "roe", "roa"):
+        fallback = frame.pop(f"db_{column}")
+        if column in frame.columns:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").fillna(fallback)
+        else:
+            frame[column] = fallback
+    return frame
+
+
+def _merge_volume_averages(frame: pd.DataFrame) -> pd.DataFrame:
+    """DailyPrice 최근 평균 거래량(avgVolume) + 상대 거래량(rvol = volume / avgVolume)"""
+    from datetime import timedelta
+
+    from django.db.models import Avg
+
+    from packages.shared.stocks.models import DailyPrice
+
+    since = timezone.now().date() - timedelta(days=AVG_VOLUME_CALENDAR_DAYS)
+    averages = pd.DataFrame.from_records(
+        DailyPrice.objects.filter(date__gte=since)
+        .values("stock_id")
+        .annotate(avg_volume=Avg("volume"))
+        .values_list("stock_id", "avg_volume"),
+        columns=["symbol", "avgVolume"],
+    )
+    if averages.empty:
+        return frame
+    frame = frame.merge(averages, on="symbol", how="left")
+    if "volume" in frame.columns:
+        avg = pd.to_numeric(frame["avgVolume"], errors="coerce")
+        frame["rvol"] = pd.to_numeric(frame["volume"], errors="coerce") / avg.where(avg > 0)
+    return frame
+
+
+def refresh_universe(include_metrics: bool = False) -> Optional[ScreenerUniverse]:
+    """
+    스냅샷 재구축 후 cache 교체 (버전 키는 본문 저장 후 교체)
+
+    스크리너 응답이 비면 교체하지 않고 현재 스냅샷을 유지합니다.
+    """
+    current = get_universe()
+    frame = build_universe_frame(
+        include_metrics=include_metrics,
+        previous=current.frame if current is not None else None,
+    )
+    if frame.empty:
+        logger.warning("[ScreenerUniverse] empty screener response, keeping current")
+        return current
+    built_at = timezone.now().isoformat()
+    version = hashlib.sha1(built_at.encode("utf-8")).hexdigest()[:12]
+    cache.set(
+        UNIVERSE_CACHE_KEY,
+        {"version": version, "built_at": built_at, "frame": frame},
+        UNIVERSE_TTL,
+    )
+    cache.set(VERSION_CACHE_KEY, version, UNIVERSE_TTL)
+    return _remember(ScreenerUniverse(version=version, built_at=built_at, frame=frame))
+
+
+# 프로세스 로컬 사본 — 요청마다 버전 키만 확인하고 본문은 버전이 바뀔 때만 로드
+_local: Dict[str, Optional[ScreenerUniverse]] = {"universe": None}
+_local_lock = threading.Lock()
+
+
+def _remember(universe: ScreenerUniverse) -> ScreenerUniverse:
+    with _local_lock:
+        _local["universe"] = universe
+    return universe
+
+
+def get_universe() -> Optional[ScreenerUniverse]:
+    """현재 스냅샷 (미구축/만료 시 None)"""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        return None
+    local = _local["universe"]
+    if local is not None and local.version == version:
+        return local
+    payload = cache.get(UNIVERSE_CACHE_KEY)
+    if not payload or payload.get("version") != version:
+        return None
+    return _remember(
+        ScreenerUniverse(
+            version=version, built_at=payload["built_at"], frame=payload["frame"]
+        )
+    )
+
+
+def filter_hash(filters: Dict[str, Any], sort_by: str, sort_order: str) -> str:
+    """
+    정규화 필터 해시 (키 순서/리스트 순서/None 값 무관)
+    """
+    normalized = {
+        key: sorted(value, key=str) if isinstance(value, (list, tuple)) else value
+        for key, value in filters.items()
+        if value is not None
+    }
+    payload = json.dumps(
+        [normalized, sort_by, sort_order.lower()], sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def result_cache_key(universe: ScreenerUniverse, digest: str) -> str:
+    return f"{RESULT_CACHE_PREFIX}:{universe.version}:{digest}"
@@ -16,7 +16,8 @@ from collections import defaultdict
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Set, Tuple
 
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery
 from django.utils import timezone
 
 from services.serverless.models import (
@@ -28,6 +29,10 @@ from services.serverless.models import (
 
 logger = logging.getLogger(__name__)
 
+# refresh_all_matches: Tier A 매칭에서 갱신 대상 필드 / 일괄 쓰기 배치 크기
+THEME_MATCH_SYNC_FIELDS = ("confidence", "source", "etf_symbol", "weight_in_etf", "evidence")
+THEME_MATCH_BATCH_SIZE = 1000
+
 
 # 테마별 키워드 정의
 THEME_KEYWORDS = {
@@ -610,62 +615,110 @@ class ThemeMatchingService:
         """
         전체 ThemeMatch 갱신 (ETF Holdings 기반)
 
-        모든 ETF Holdings를 스캔하여 Tier A 매칭을 재생성합니다.
+        ETF별 최신 snapshot Holdings를 한 번에 읽어 목표 Tier A 매칭 집합을 만들고,
+        기존 ThemeMatch와 비교해 변경분만 일괄 반영합니다.
+        - 신규: bulk_create(update_conflicts=True)
+        - 변경: bulk_update
+        - 삭제: 최신 Holdings에서 빠진 etf_holding 매칭
+        같은 (종목, 테마)가 여러 ETF에 있으면 ETF 심볼 순 마지막 ETF 기준입니다.
 
         Returns:
-            {'created': 100, 'updated': 50, 'total': 150}
+            {'created': 100, 'updated': 50, 'deleted': 3, 'unchanged': 900,
+             'total': 1050, 'etfs': 21}
         """
-        # 오늘 또는 가장 최근 snapshot
-        latest_holdings = ETFHolding.objects.select_related("etf").order_by(
-            "etf", "-snapshot_date", "rank"
-        )
+        desired, etf_count = self._desired_tier_a_matches()
 
-        # ETF별 최신 holdings만 사용
-        processed_etfs: Set[str] = set()
-        created_count = 0
-        updated_count = 0
-
-        for holding in latest_holdings:
-            etf_symbol = holding.etf.symbol
-            if etf_symbol in processed_etfs:
-                continue
-
-            # 해당 ETF의 모든 holdings 처리
-            etf_holdings = ETFHolding.objects.filter(
-                etf=holding.etf, snapshot_date=holding.snapshot_date
+        existing = {
+            (m.stock_symbol, m.theme_id): m
+            for m in ThemeMatch.objects.only(
+                "stock_symbol", "theme_id", *THEME_MATCH_SYNC_FIELDS
             )
+        }
 
-            for h in etf_holdings:
-                match, created = ThemeMatch.objects.update_or_create(
-                    stock_symbol=h.stock_symbol,
-                    theme_id=holding.etf.theme_id,
-                    defaults={
-                        "confidence": "high",
-                        "source": "etf_holding",
-                        "etf_symbol": holding.etf.symbol,
-                        "weight_in_etf": h.weight_percent,
-                        "evidence": [
-                            f"{holding.etf.symbol} #{h.rank}위 ({h.weight_percent}%)"
-                        ],
-                    },
+        now = timezone.now()
+        to_create: List[ThemeMatch] = []
+        to_update: List[ThemeMatch] = []
+        for key, fields in desired.items():
+            match = existing.get(key)
+            if match is None:
+                to_create.append(
+                    ThemeMatch(stock_symbol=key[0], theme_id=key[1], **fields)
                 )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-            processed_etfs.add(etf_symbol)
+                continue
+            if any(getattr(match, name) != value for name, value in fields.items()):
+                for name, value in fields.items():
+                    setattr(match, name, value)
+                match.last_updated = now
+                to_update.append(match)
+
+        # 최신 Holdings가 하나도 없으면 기존 매칭을 지우지 않음
+        stale = (
+            [
+                m.pk
+                for key, m in existing.items()
+                if m.source == "etf_holding" and key not in desired
+            ]
+            if desired
+            else []
+        )
 
-        total = created_count + updated_count
+        with transaction.atomic():
+            ThemeMatch.objects.bulk_create(
+                to_create,
+                batch_size=THEME_MATCH_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["stock_symbol", "theme_id"],
+                update_fields=[*THEME_MATCH_SYNC_FIELDS, "last_updated"],
+            )
+            ThemeMatch.objects.bulk_update(
+                to_update,
+                [*THEME_MATCH_SYNC_FIELDS, "last_updated"],
+                batch_size=THEME_MATCH_BATCH_SIZE,
+            )
+            if stale:
+                ThemeMatch.objects.filter(pk__in=stale).delete()
+
+        result = {
+            "created": len(to_create),
+            "updated": len(to_update),
+            "deleted": len(stale),
+            "unchanged": len(desired) - len(to_create) - len(to_update),
+            "total": len(desired),
+            "etfs": etf_count,
+        }
         logger.info(
-            f"ThemeMatch 갱신 완료: 생성 {created_count}, 업데이트 {updated_count}, 총 {total}"
+            f"ThemeMatch 갱신 완료: 생성 {result['created']}, 업데이트 {result['updated']}, "
+            f"삭제 {result['deleted']}, 유지 {result['unchanged']} (ETF {etf_count}개)"
         )
+        return result
 
-        return {
-            "created": created_count,
-            "updated": updated_count,
-            "total": total,
-        }
+    def _desired_tier_a_matches(self) -> Tuple[Dict[Tuple[str, str], Dict], int]:
+        """
+        ETF별 최신 snapshot Holdings (쿼리 1회) → {(종목, 테마): ThemeMatch 필드}
+        """
+        latest_snapshot = (
+            ETFHolding.objects.filter(etf=OuterRef("etf"))
+            .order_by("-snapshot_date")
+            .values("snapshot_date")[:1]
+        )
+        rows = (
+            ETFHolding.objects.filter(snapshot_date=Subquery(latest_snapshot))
+            .order_by("etf", "rank")
+            .values_list("etf_id", "etf__theme_id", "stock_symbol", "weight_percent", "rank")
+        )
+
+        desired: Dict[Tuple[str, str], Dict] = {}
+        etfs: Set[str] = set()
+        for etf_symbol, theme_id, stock_symbol, weight, rank in rows:
+            etfs.add(etf_symbol)
+            desired[(stock_symbol, theme_id)] = {
+                "confidence": "high",
+                "source": "etf_holding",
+                "etf_symbol": etf_symbol,
+                "weight_in_etf": weight,
+                "evidence": [f"{etf_symbol} #{rank}위 ({weight}%)"],
+            }
+        return desired, len(etfs)
 
     def get_etf_peers(self, symbol: str, limit: int = 10) -> List[Dict]:
         """
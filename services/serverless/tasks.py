@@ -624,6 +624,41 @@ def calculate_daily_sector_heatmap(self, target_date: str = None):
 # ============================================================
 
 
+@shared_task(
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+    soft_time_limit=900,
+    time_limit=960,
+)
+def refresh_screener_universe(self, include_metrics=False):
+    """
+    스크리너 유니버스 스냅샷 갱신
+
+    Args:
+        include_metrics: True면 key-metrics-ttm까지 재조회 (일 1회),
+            False면 시세/DB 컬럼만 갱신하고 펀더멘탈은 직전 스냅샷 재사용
+
+    Returns:
+        dict: {'symbols': int, 'columns': int, 'built_at': str}
+    """
+    from services.serverless.services.screener_universe import refresh_universe
+
+    try:
+        universe = refresh_universe(include_metrics=include_metrics)
+    except FMPAPIError as e:
+        logger.error(f"스크리너 유니버스 갱신 실패: {e}")
+        raise self.retry(exc=e)
+
+    if universe is None:
+        return {"symbols": 0, "columns": 0, "built_at": None}
+    return {
+        "symbols": len(universe),
+        "columns": len(universe.frame.columns),
+        "built_at": universe.built_at,
+    }
+
+
 @shared_task(
     bind=True,
     max_retries=2,
@@ -638,119 +673,30 @@ def check_screener_alerts(self):
     15분마다 실행되어 활성화된 알림 조건을 검사하고,
     조건 충족 시 알림을 발송합니다.
 
+    스크리너 유니버스 스냅샷 1개 위에서 같은 필터 조합의 알림을 묶어
+    그룹당 1회만 평가합니다 (ScreenerAlertEngine).
+
     Returns:
         {
             'checked': 10,
             'triggered': 3,
             'skipped_cooldown': 2,
-            'errors': 0
+            'errors': 0,
+            'groups': 4,
+            'universe_built_at': '2026-01-05T14:30:00+00:00',
+            'timing_ms': {'load': 3.1, 'evaluate': 12.4, 'persist': 8.0, 'total': 23.5}
         }
 
     Usage:
         from services.serverless.tasks import check_screener_alerts
         result = check_screener_alerts.delay()
     """
-    from datetime import timedelta
-
-    from services.serverless.models import AlertHistory, ScreenerAlert
-    from services.serverless.services.filter_engine import FilterEngine
+    from services.serverless.services.alert_engine import ScreenerAlertEngine
 
     try:
         logger.info("🔔 스크리너 알림 체크 시작")
 
-        # 활성 알림 조회 (쿨다운 체크)
-        active_alerts = ScreenerAlert.objects.filter(is_active=True).select_related(
-            "preset", "user"
-        )
-
-        result = {
-            "checked": 0,
-            "triggered": 0,
-            "skipped_cooldown": 0,
-            "errors": 0,
-        }
-
-        engine = FilterEngine()
-
-        for alert in active_alerts:
-            result["checked"] += 1
-
-            try:
-                # 쿨다운 체크
-                if not alert.can_trigger():
-                    result["skipped_cooldown"] += 1
-                    logger.debug(f"  ⏭️ {alert.name}: 쿨다운 중")
-                    continue
-
-                # 필터 가져오기
-                filters = alert.get_effective_filters()
-
-                # 필터 적용 (count만 조회)
-                filter_result = engine.apply_filters(
-                    filters_dict=filters,
-                    limit=20,  # 최대 20개만 조회
-                    offset=0,
-                    sort_by="marketCap",
-                    sort_order="desc",
-                )
-
-                matched_count = filter_result.get("count", 0)
-                matched_stocks = filter_result.get("results", [])[:10]
-
-                # 조건 충족 체크
-                should_trigger = False
-
-                if alert.alert_type == "filter_match":
-                    target_count = alert.target_count or 1
-                    should_trigger = matched_count >= target_count
-
-                # TODO: 다른 alert_type 처리
-                # - price_target: 특정 종목 목표가 도달
-                # - volume_spike: RVOL 임계값 초과
-                # - new_high/new_low: 52주 신고가/신저가
-
-                if should_trigger:
-                    # 알림 이력 생성
-                    AlertHistory.objects.create(
-                        alert=alert,
-                        matched_count=matched_count,
-                        matched_symbols=[s.get("symbol") for s in matched_stocks],
-                        snapshot={
-                            "filters": filters,
-                            "alert_type": alert.alert_type,
-                            "target_count": alert.target_count,
-                        },
-                        status="sent",
-                    )
-
-                    # 알림 상태 업데이트
-                    alert.last_triggered_at = timezone.now()
-                    alert.trigger_count += 1
-                    alert.save(update_fields=["last_triggered_at", "trigger_count"])
-
-                    result["triggered"] += 1
-                    logger.info(
-                        f"  ✅ {alert.name}: 알림 발송 (매칭 {matched_count}개)"
-                    )
-
-                    # TODO: 실제 알림 발송
-                    # - notify_in_app: WebSocket 메시지
-                    # - notify_email: 이메일 발송
-                    # - notify_push: PWA 푸시 알림
-
-            except Exception as e:
-                result["errors"] += 1
-                logger.exception(f"  ❌ {alert.name}: 에러 - {e}")
-
-                # 에러 이력 기록
-                AlertHistory.objects.create(
-                    alert=alert,
-                    matched_count=0,
-                    matched_symbols=[],
-                    snapshot={"error": str(e)},
-                    status="failed",
-                    error_message=str(e),
-                )
+        result = ScreenerAlertEngine().run()
 
         logger.info(f"✅ 스크리너 알림 체크 완료: {result}")
         return result
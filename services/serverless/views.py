@@ -2497,7 +2497,10 @@ def refresh_theme_matches_api(request):
         {
                 "created": 100,
                 "updated": 50,
-                "total": 150
+                "deleted": 3,
+                "unchanged": 900,
+                "total": 1050,
+                "etfs": 21
             }
         }
     """
@@ -5,13 +5,18 @@ Step 1: select_peers — industry + size bucket 기반 peer 선정
 Step 2: benchmark 계산 — peer/industry별 median, p25, p75
 Step 3: company_benchmark_delta — percentile_rank, rank, total
 Step 4: peer_list_cache 갱신
+
+calculate_universe: 위 단계를 유니버스 전체에 대해 단일 패스로 수행
+(Stock/CompanyMetricSnapshot 1회 로드 → 종목 × 지표 × 연도 배열 → NumPy 통계 → bulk upsert)
 """
 
 import logging
+from collections import defaultdict
 from decimal import Decimal
 from typing import Optional
 
 import numpy as np
+from django.db import transaction
 from django.db.models import Q
 
 from packages.shared.metrics.models import (
@@ -27,6 +32,7 @@ from services.validation.models import CompanyBenchmarkDelta
 logger = logging.getLogger(__name__)
 
 SIZE_BUCKETS = ["small", "mid", "large", "mega"]
+BULK_BATCH_SIZE = 1000
 
 
 def assign_size_bucket(market_cap: Optional[float]) -> str:
@@ -152,6 +158,389 @@ class BenchmarkCalculator:
             "error_details": error_details[:20],
         }
 
+    def calculate_universe(self, symbols: list[str] = None) -> dict:
+        """
+        유니버스 일괄 benchmark 계산 (단일 패스)
+
+        calculate_for_symbols와 같은 결과를 종목별 쿼리 없이 계산합니다.
+        - Stock / MetricDefinition / CompanyMetricSnapshot 각 1회 로드
+        - peer 선정은 메모리 인덱스(industry/sector별 종목)로 수행
+        - 종목별 peer 분포(p25/median/p75)와 percentile_rank/rank를 지표 × 연도 단위로 벡터 계산
+        - industry benchmark는 industry × 연도당 1회 (종목마다 반복하지 않음)
+        - PeerMetricBenchmark / CompanyBenchmarkDelta / IndustryMetricBenchmark /
+          PeerListCache를 bulk_create(update_conflicts=True)로 저장
+        """
+        sp500_symbols = set(
+            SP500Constituent.objects.filter(is_active=True).values_list(
+                "symbol", flat=True
+            )
+        )
+        targets = (
+            [s.upper() for s in symbols] if symbols is not None else sorted(sp500_symbols)
+        )
+
+        stocks = {
+            sym: {
+                "industry": industry,
+                "sector": sector,
+                "mcap": float(mcap) if mcap else None,
+            }
+            for sym, industry, sector, mcap in Stock.objects.filter(
+                symbol__in=sp500_symbols | set(targets)
+            ).values_list("symbol", "industry", "sector", "market_capitalization")
+        }
+        error_details = [
+            {"symbol": sym, "error": "Stock not found"}
+            for sym in targets
+            if sym not in stocks
+        ]
+        targets = [sym for sym in targets if sym in stocks]
+
+        metric_rows = list(
+            MetricDefinition.objects.filter(is_benchmarkable=True)
+            .order_by("metric_code")
+            .values_list("metric_code", "higher_is_better")
+        )
+        metric_codes = [code for code, _ in metric_rows]
+        higher_is_better = np.array([bool(h) for _, h in metric_rows], dtype=bool)
+
+        # 종목별 snapshot 연도 (최근 5개, value_status 무관 — _get_available_years와 동일)
+        years_by_symbol = defaultdict(set)
+        for sym, fy in CompanyMetricSnapshot.objects.filter(
+            symbol_id__in=targets
+        ).values_list("symbol_id", "fiscal_year").distinct():
+            years_by_symbol[sym].add(fy)
+        target_years = {
+            sym: sorted(years_by_symbol[sym], reverse=True)[:5] for sym in targets
+        }
+
+        universe = sorted(sp500_symbols & set(stocks) | set(targets))
+        years = sorted({fy for fys in target_years.values() for fy in fys})
+        cube = self._load_metric_cube(universe, metric_codes, years)
+        sym_idx = {sym: i for i, sym in enumerate(universe)}
+        year_idx = {fy: i for i, fy in enumerate(years)}
+
+        peer_index = self._build_peer_index(stocks, sp500_symbols)
+
+        peer_benchmarks = []
+        deltas = []
+        peer_caches = []
+        for sym in targets:
+            stock = stocks[sym]
+            peer_symbols, basis = self._select_peers_from_index(sym, stock, peer_index)
+            confidence = self._determine_confidence(len(peer_symbols), basis)
+            fiscal_years = target_years[sym]
+
+            if peer_symbols and fiscal_years and metric_codes:
+                peer_cube = cube[[sym_idx[p] for p in peer_symbols]]
+                own = cube[sym_idx[sym]]
+                for fy in fiscal_years:
+                    y = year_idx[fy]
+                    b, d = self._peer_rows_for_year(
+                        sym,
+                        fy,
+                        peer_cube[:, :, y],
+                        own[:, y],
+                        metric_codes,
+                        higher_is_better,
+                        peer_symbols,
+                        basis,
+                        confidence,
+                    )
+                    peer_benchmarks.extend(b)
+                    deltas.extend(d)
+
+            peer_caches.append(
+                PeerListCache(
+                    symbol_id=sym,
+                    peer_symbols=peer_symbols[:50],
+                    peer_count=len(peer_symbols),
+                    benchmark_basis=basis,
+                    size_bucket=assign_size_bucket(stock["mcap"]),
+                    use_industry_fallback=basis == "sector",
+                    fallback_reason=f"peer {len(peer_symbols)}개 ({basis})"
+                    if basis != "industry_size"
+                    else "",
+                    source="validation_batch",
+                )
+            )
+
+        industry_benchmarks = self._industry_rows(
+            targets, stocks, target_years, peer_index, cube, sym_idx, year_idx, metric_codes
+        )
+
+        with transaction.atomic():
+            PeerMetricBenchmark.objects.bulk_create(
+                peer_benchmarks,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["symbol", "fiscal_year", "metric_code", "preset_key"],
+                update_fields=[
+                    "p25_value",
+                    "median_value",
+                    "p75_value",
+                    "peer_count",
+                    "peer_symbols_used",
+                    "benchmark_confidence",
+                    "calculated_at",
+                ],
+            )
+            CompanyBenchmarkDelta.objects.bulk_create(
+                deltas,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["symbol", "fiscal_year", "metric_code", "preset_key"],
+                update_fields=[
+                    "company_value",
+                    "benchmark_type",
+                    "benchmark_median",
+                    "benchmark_p25",
+                    "benchmark_p75",
+                    "benchmark_basis",
+                    "benchmark_confidence",
+                    "delta_vs_median",
+                    "percentile_rank",
+                    "rank",
+                    "total",
+                    "calculated_at",
+                ],
+            )
+            IndustryMetricBenchmark.objects.bulk_create(
+                industry_benchmarks,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["industry", "fiscal_year", "metric_code"],
+                update_fields=[
+                    "p25_value",
+                    "median_value",
+                    "p75_value",
+                    "mean_value",
+                    "sample_count",
+                    "benchmark_confidence",
+                    "calculated_at",
+                ],
+            )
+            PeerListCache.objects.bulk_create(
+                peer_caches,
+                batch_size=BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["symbol"],
+                update_fields=[
+                    "peer_symbols",
+                    "peer_count",
+                    "benchmark_basis",
+                    "size_bucket",
+                    "use_industry_fallback",
+                    "fallback_reason",
+                    "source",
+                    "updated_at",
+                ],
+            )
+
+        logger.info(
+            f"Universe benchmark: {len(targets)} symbols, {len(peer_benchmarks)} peer benchmarks, "
+            f"{len(deltas)} deltas, {len(industry_benchmarks)} industry benchmarks"
+        )
+        return {
+            "total": len(targets) + len(error_details),
+            "success": len(targets),
+            "errors": len(error_details),
+            "error_details": error_details[:20],
+            "peer_benchmarks": len(peer_benchmarks),
+            "deltas": len(deltas),
+            "industry_benchmarks": len(industry_benchmarks),
+        }
+
+    def _load_metric_cube(
+        self, symbols: list[str], metric_codes: list[str], years: list[int]
+    ) -> np.ndarray:
+        """normal 상태 snapshot 값 → (종목 × 지표 × 연도) float 배열 (없으면 NaN)"""
+        cube = np.full((len(symbols), len(metric_codes), len(years)), np.nan)
+        if not (symbols and metric_codes and years):
+            return cube
+        sym_idx = {sym: i for i, sym in enumerate(symbols)}
+        metric_idx = {code: i for i, code in enumerate(metric_codes)}
+        year_idx = {fy: i for i, fy in enumerate(years)}
+        rows = CompanyMetricSnapshot.objects.filter(
+            symbol_id__in=symbols,
+            metric_code_id__in=metric_codes,
+            fiscal_year__in=years,
+            value_status="normal",
+            metric_value__isnull=False,
+        ).values_list("symbol_id", "metric_code_id", "fiscal_year", "metric_value")
+        for sym, code, fy, value in rows.iterator(chunk_size=10000):
+            cube[sym_idx[sym], metric_idx[code], year_idx[fy]] = float(value)
+        return cube
+
+    @staticmethod
+    def _build_peer_index(stocks: dict, sp500_symbols: set) -> dict:
+        """S&P 500 종목의 industry/sector(소문자)별 종목 목록 (심볼 순)"""
+        by_industry = defaultdict(list)
+        by_sector = defaultdict(list)
+        members = sorted(sym for sym in sp500_symbols if sym in stocks)
+        for sym in members:
+            stock = stocks[sym]
+            if stock["industry"] is not None:
+                by_industry[stock["industry"].lower()].append(sym)
+            if stock["sector"] is not None:
+                by_sector[stock["sector"].lower()].append(sym)
+        return {
+            "stocks": stocks,
+            "members": members,
+            "industry": by_industry,
+            "sector": by_sector,
+        }
+
+    def _select_peers_from_index(self, symbol: str, stock: dict, index: dict) -> tuple:
+        """_select_peers와 같은 규칙을 메모리 인덱스로 적용. Returns: (peer 심볼 리스트, basis)"""
+        stocks = index["stocks"]
+
+        if stock["industry"]:
+            industry_peers = [
+                p for p in index["industry"].get(stock["industry"].lower(), []) if p != symbol
+            ]
+            adjacent = get_adjacent_buckets(assign_size_bucket(stock["mcap"]))
+            # DB 범위 필터와 같이 market cap 없는 종목은 size 매칭에서 제외
+            sized = [
+                p
+                for p in industry_peers
+                if stocks[p]["mcap"] is not None
+                and assign_size_bucket(stocks[p]["mcap"]) in adjacent
+            ]
+            if len(sized) >= 8:
+                return sized, "industry_size"
+            if len(industry_peers) >= 5:
+                return industry_peers, "industry"
+
+        if stock["sector"]:
+            return [
+                p for p in index["sector"].get(stock["sector"].lower(), []) if p != symbol
+            ], "sector"
+
+        return [p for p in index["members"] if p != symbol][:20], "sector"
+
+    @staticmethod
+    def _peer_rows_for_year(
+        symbol,
+        fiscal_year,
+        peer_values,
+        own_values,
+        metric_codes,
+        higher_is_better,
+        peer_symbols,
+        basis,
+        confidence,
+    ) -> tuple:
+        """
+        한 연도의 모든 지표 peer 통계 (peer × 지표 배열 1회 연산)
+
+        Returns: (PeerMetricBenchmark 리스트, CompanyBenchmarkDelta 리스트)
+        """
+        counts = np.sum(~np.isnan(peer_values), axis=0)
+        valid = np.flatnonzero(counts >= 2)
+        if not len(valid):
+            return [], []
+
+        block = peer_values[:, valid]
+        p25, median, p75 = np.nanpercentile(block, [25, 50, 75], axis=0)
+        own = own_values[valid]
+        with np.errstate(invalid="ignore"):
+            below = np.sum(block < own, axis=0)
+            above = np.sum(block > own, axis=0)
+            equal = np.sum(block == own, axis=0)
+        pct_rank = (below + 0.5 * equal) / counts[valid] * 100
+        rank = np.where(higher_is_better[valid], above, below) + 1
+
+        benchmarks = []
+        deltas = []
+        for j, m in enumerate(valid):
+            stats = {
+                "p25": Decimal(str(round(float(p25[j]), 6))),
+                "median": Decimal(str(round(float(median[j]), 6))),
+                "p75": Decimal(str(round(float(p75[j]), 6))),
+            }
+            benchmarks.append(
+                PeerMetricBenchmark(
+                    symbol_id=symbol,
+                    fiscal_year=fiscal_year,
+                    metric_code_id=metric_codes[m],
+                    p25_value=stats["p25"],
+                    median_value=stats["median"],
+                    p75_value=stats["p75"],
+                    peer_count=int(counts[m]),
+                    peer_symbols_used=peer_symbols[:30],
+                    benchmark_confidence=confidence,
+                )
+            )
+            if np.isnan(own[j]):
+                continue
+            deltas.append(
+                CompanyBenchmarkDelta(
+                    symbol_id=symbol,
+                    fiscal_year=fiscal_year,
+                    metric_code_id=metric_codes[m],
+                    company_value=Decimal(str(round(float(own[j]), 6))),
+                    benchmark_type="peer",
+                    benchmark_median=stats["median"],
+                    benchmark_p25=stats["p25"],
+                    benchmark_p75=stats["p75"],
+                    benchmark_basis=basis,
+                    benchmark_confidence=confidence,
+                    delta_vs_median=Decimal(str(round(float(own[j] - median[j]), 6))),
+                    percentile_rank=Decimal(str(round(float(pct_rank[j]), 2))),
+                    rank=int(rank[j]),
+                    total=int(counts[m]) + 1,
+                )
+            )
+        return benchmarks, deltas
+
+    @staticmethod
+    def _industry_rows(
+        targets, stocks, target_years, index, cube, sym_idx, year_idx, metric_codes
+    ) -> list:
+        """대상 종목 industry별 IndustryMetricBenchmark (industry × 연도당 1회)"""
+        years_by_industry = defaultdict(set)
+        for sym in targets:
+            industry = stocks[sym]["industry"]
+            if industry:
+                years_by_industry[industry].update(target_years[sym])
+
+        rows = []
+        for industry, fiscal_years in years_by_industry.items():
+            members = index["industry"].get(industry.lower(), [])
+            if len(members) < 2:
+                continue
+            member_cube = cube[[sym_idx[sym] for sym in members]]
+            for fy in sorted(fiscal_years):
+                values = member_cube[:, :, year_idx[fy]]
+                counts = np.sum(~np.isnan(values), axis=0)
+                valid = np.flatnonzero(counts >= 2)
+                if not len(valid):
+                    continue
+                block = values[:, valid]
+                p25, median, p75 = np.nanpercentile(block, [25, 50, 75], axis=0)
+                for j, m in enumerate(valid):
+                    sample_count = int(counts[m])
+                    column = block[:, j]
+                    # np.mean과 같은 합산 순서 (nanmean은 마지막 자리 반올림이 달라짐)
+                    mean = float(np.mean(column[~np.isnan(column)]))
+                    rows.append(
+                        IndustryMetricBenchmark(
+                            industry=industry,
+                            fiscal_year=fy,
+                            metric_code_id=metric_codes[m],
+                            p25_value=Decimal(str(round(float(p25[j]), 6))),
+                            median_value=Decimal(str(round(float(median[j]), 6))),
+                            p75_value=Decimal(str(round(float(p75[j]), 6))),
+                            mean_value=Decimal(str(round(mean, 6))),
+                            sample_count=sample_count,
+                            benchmark_confidence="high"
+                            if sample_count >= 10
+                            else ("medium" if sample_count >= 5 else "low"),
+                        )
+                    )
+        return rows
+
     def _select_peers(self, stock: Stock) -> tuple:
         """
         Peer 선정 알고리즘.
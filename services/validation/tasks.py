@@ -56,12 +56,12 @@ def calculate_derived_metrics(self, prev_result=None, symbols=None):
 
 @shared_task(bind=True, max_retries=1, soft_time_limit=7200, time_limit=7260)
 def calculate_benchmarks(self, prev_result=None, symbols=None):
-    """Task 3: Peer 선정 + Benchmark 계산."""
+    """Task 3: Peer 선정 + Benchmark 계산 (유니버스 단일 패스)."""
     try:
         from services.validation.services.benchmark_calculator import BenchmarkCalculator
 
         calc = BenchmarkCalculator()
-        result = calc.calculate_for_symbols(symbols)
+        result = calc.calculate_universe(symbols)
         logger.info(
             f"Task 3: {result['total']} total, {result['success']} success, {result['errors']} errors"
         )
@@ -262,3 +262,71 @@ class TestFiling10K:
         assert filing.accession_number == '0000320193230001'
         assert filing.company_name == 'Apple Inc.'
         assert filing.form_type == '10-K'
+
+
+class TestSECEdgarCache:
+    """SEC 디스크 캐시 (ticker 인덱스 / 조건부 GET / 불변 문서)"""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, settings):
+        from packages.shared.api_request import sec_edgar_cache
+
+        settings.SEC_EDGAR_CACHE_ENABLED = True
+        settings.SEC_EDGAR_CACHE_DIR = tmp_path
+        sec_edgar_cache._ticker_index.update(map=None, checked_at=0.0)
+        yield tmp_path
+        sec_edgar_cache._ticker_index.update(map=None, checked_at=0.0)
+
+    @staticmethod
+    def make_response(status=200, body=b'', headers=None):
+        response = Mock()
+        response.status_code = status
+        response.content = body
+        response.text = body.decode()
+        response.encoding = 'utf-8'
+        response.headers = headers or {}
+        return response
+
+    @patch('packages.shared.api_request.sec_edgar_client.requests.Session.get')
+    def test_ticker_index_shared_across_clients(self, mock_get):
+        tickers = b'{"0": {"cik_str": 320193, "ticker": "AAPL"}, "1": {"cik_str": 789019, "ticker": "MSFT"}}'
+        mock_get.return_value = self.make_response(body=tickers, headers={'ETag': '"t1"'})
+
+        assert SECEdgarClient().get_cik('aapl') == '0000320193'
+        assert SECEdgarClient().get_cik('MSFT') == '0000789019'
+        assert SECEdgarClient().get_cik('NOPE') is None
+
+        assert mock_get.call_count == 1
+
+    @patch('packages.shared.api_request.sec_edgar_client.requests.Session.get')
+    def test_submissions_revalidated_with_etag(self, mock_get, settings):
+        settings.SEC_EDGAR_SUBMISSIONS_MAX_AGE = 0
+        body = b'{"name": "Apple Inc.", "filings": {"recent": {}}}'
+        mock_get.side_effect = [
+            self.make_response(body=body, headers={'ETag': '"v1"'}),
+            self.make_response(status=304),
+        ]
+        client = SECEdgarClient()
+
+        first = client.get_company_info('320193')
+        second = client.get_company_info('320193')
+
+        assert first == second == {'name': 'Apple Inc.', 'filings': {'recent': {}}}
+        assert mock_get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    @patch('packages.shared.api_request.sec_edgar_client.requests.Session.get')
+    def test_filing_documents_downloaded_once(self, mock_get):
+        mock_get.return_value = self.make_response(body=b'<html><body>Item 1A</body></html>')
+        filing = Filing10K(
+            accession_number='000032019323000106',
+            filing_date=date(2023, 11, 3),
+            report_date=date(2023, 9, 30),
+            primary_document='aapl-20230930.htm',
+            cik='320193',
+            company_name='Apple Inc.',
+        )
+
+        texts = [SECEdgarClient().download_10k_text(filing) for _ in range(2)]
+
+        assert texts == ['Item 1A', 'Item 1A']
+        assert mock_get.call_count == 1
@@ -6,6 +6,7 @@ C4 콜드스타트 게이트 + C6/C7 배선 테스트 (TH-8, 결정13=C) — 설
 - C4 확장→정식 이음새: 창 전환 z 연속성(급점프 없음)
 - C7: no_symbols / no_data / 3년 커버 미달 insufficient / 정상 z(3년 fixture)
 - C6: no_pairs / 커버 미달 insufficient / 정상 z
+- 롤링 엔진: 평균 pairwise 상관(표준화 항등식) · 트레일링 합이 기존 순수 파이썬 경로와 일치, 패널 1회 조회
 - 조립기: _NOT_WIRED=(C1,C3) / C4·C6·C7 comp 편입 + missing 산술
 """
 
@@ -127,6 +128,96 @@ class TestC6Correlation:
         assert c["missing_reason"] is None and c["z"] is not None
 
 
+# ────────────────────────────── 롤링 엔진 패리티 ──────────────────────────────
+def _ref_avg_corr(closes_by_sym, anchor, window):
+    """기존 순수 파이썬 경로(종목별 최근 window 개 → 쌍별 Pearson 평균) 참조 구현."""
+    rets = {}
+    for s, seq in closes_by_sym.items():
+        w = [(d, c) for d, c in seq if d <= anchor][-window:]
+        if len(w) >= window:
+            rets[s] = [w[i][1] / w[i - 1][1] - 1 for i in range(1, len(w))]
+    names, corrs = list(rets), []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            a, b = rets[names[i]], rets[names[j]]
+            n = len(a)
+            ma, mb = sum(a) / n, sum(b) / n
+            va = sum((x - ma) ** 2 for x in a)
+            vb = sum((x - mb) ** 2 for x in b)
+            if va > 0 and vb > 0:
+                corrs.append(sum((a[k] - ma) * (b[k] - mb) for k in range(n)) / (va * vb) ** 0.5)
+    return sum(corrs) / len(corrs) if corrs else None
+
+
+class TestRollingEngine:
+    def test_avg_pairwise_corr_matches_reference(self):
+        import numpy as np
+
+        from apps.chain_sight.services.price_panel import anchor_dates, avg_pairwise_corr_at
+
+        rng = np.random.default_rng(7)
+        n_days, window = 120, 10
+        dates = np.arange(np.datetime64("2023-01-01"), np.datetime64("2023-01-01") + n_days)
+        market = rng.normal(0, 0.01, n_days)
+        close = 100 * np.cumprod(1 + market + rng.normal(0, 0.01, (4, n_days)), axis=1)
+        close[3, :] = 50.0           # 분산 0 → 쌍에서 제외
+        close[2, :40] = np.nan       # 늦게 상장 → 초기 앵커 미참여
+
+        as_of = date(2023, 4, 30)
+        anchors = anchor_dates(as_of, 100, 5)
+        got = avg_pairwise_corr_at(dates, close, anchors, window)
+
+        by_sym = {
+            i: [(d.astype(object), float(c)) for d, c in zip(dates, close[i]) if not np.isnan(c)]
+            for i in range(4)
+        }
+        for anchor, value in zip(anchors, got):
+            expected = _ref_avg_corr(by_sym, anchor.astype(object), window)
+            if expected is None:
+                assert value is None
+            else:
+                assert value == pytest.approx(expected, abs=1e-12)
+        assert any(v is not None for v in got)
+
+    def test_rolling_sum_matches_trailing_window(self):
+        import numpy as np
+
+        from apps.chain_sight.services.price_panel import rolling_sum_at
+
+        dates = np.array(["2023-01-02", "2023-01-03", "2023-01-05", "2023-01-06"],
+                         dtype="datetime64[D]")
+        anchors = np.array(["2023-01-02", "2023-01-04", "2023-01-06", "2023-02-01"],
+                           dtype="datetime64[D]")
+        assert rolling_sum_at(dates, np.array([1.0, 2.0, 4.0, 8.0]), anchors, 2) == [
+            None, 3.0, 12.0, 12.0,
+        ]
+
+    @pytest.mark.django_db
+    def test_shared_panel_single_query(self, django_assert_num_queries):
+        from apps.chain_sight.services.c6c7_service import load_sector_panel
+
+        start = date(2023, 1, 1)
+        _mk_prices("AAA", 60, lambda i: 100 + (i % 7) * 2, lambda i: 1000, start)
+        _mk_prices("BBB", 60, lambda i: 50 + (i % 5) * 1.5, lambda i: 2000, start)
+        as_of = date(2023, 3, 1)
+
+        with django_assert_num_queries(1):
+            panel = load_sector_panel(["aaa", "bbb"], as_of, lookback_days=40)
+            c6 = c6_correlation_from_db(["AAA", "BBB"], as_of, lookback_days=40,
+                                        corr_window=5, step_days=5, min_n=3, panel=panel)
+            c7 = c7_dollar_volume_from_db(["AAA", "BBB"], as_of, lookback_days=40,
+                                          window=5, step_days=5, min_n=3, panel=panel)
+
+        assert panel.symbols == ["AAA", "BBB"] and panel.close.shape == (2, 60)
+        assert c6 == c6_correlation_from_db(["AAA", "BBB"], as_of, lookback_days=40,
+                                            corr_window=5, step_days=5, min_n=3)
+        assert c7["missing_reason"] is None
+        expected_dv = sum(
+            (100 + (i % 7) * 2) * 1000 + (50 + (i % 5) * 1.5) * 2000 for i in range(55, 60)
+        )
+        assert c7["raw"] == pytest.approx(expected_dv)
+
+
 # ────────────────────────────── 조립기 편입 ──────────────────────────────
 @pytest.mark.django_db
 class TestAssemblyWiring:
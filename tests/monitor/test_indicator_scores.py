@@ -0,0 +1,170 @@
+"""지표 score 물질화 + 배치 평가 검증 (MON-PERF).
+
+- score_series: 물질화 score 기반 결과 = 거래일별 dispatch 재계산(구 경로)과 동일,
+  재조회는 창·지표 수와 무관한 고정 쿼리
+- refresh_score_series: 바뀐 행만 upsert, 지표 설정 변경 시 재물질화
+- evaluate_monitors: 선조회 배치 결과 = 모니터 단위 evaluate_monitor, 판독 조회 1회
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.monitor.models import IndicatorScore, Monitor, MonitorIndicator
+from apps.monitor.services.indicator_scores import (
+    active_indicators,
+    load_scoring_inputs,
+    refresh_score_series,
+)
+from apps.monitor.services.monitor_aggregator import aggregate_monitor
+from apps.monitor.services.pipeline import evaluate_monitor, evaluate_monitors
+from apps.monitor.services.sparkline import score_series
+from apps.monitor.services.technical import score_indicator_dispatch
+
+
+@pytest.fixture
+def scored_monitor(monitor, make_indicator, add_readings):
+    """EODSignal(min_n 게이트) · bounded(rsi14) · custom 지표 3종 + 30일 판독."""
+    from packages.shared.stocks.models import DailyPrice, EODSignal, Stock
+
+    stock = Stock.objects.create(symbol="AAPL", stock_name="Apple Inc.")
+    today = date.today()
+    for i in range(8):  # 최근 8일만 EODSignal → 그 이전 거래일은 source_n < min_n
+        EODSignal.objects.create(
+            stock=stock, date=today - timedelta(days=i), close_price=100,
+            composite_score=0.1 * i, change_percent=0.0, dollar_volume=1000,
+        )
+    for i in range(20):
+        c = Decimal(100 + i)
+        DailyPrice.objects.create(
+            stock=stock, date=today - timedelta(days=i), open_price=c, high_price=c,
+            low_price=c, close_price=c, volume=1000,
+        )
+
+    eod = make_indicator(name="eod", source_key="eod_composite")
+    rsi = make_indicator(
+        name="rsi", source_key="rsi14",
+        indicator_type=MonitorIndicator.IndicatorType.TECHNICAL,
+    )
+    custom = make_indicator(name="custom", weight=2.0, window=10)
+    add_readings(eod, [((i * 7) % 11) / 10 - 0.5 for i in range(30)])
+    add_readings(rsi, [20 + (i * 13) % 60 for i in range(30)])
+    add_readings(custom, [float((i * 5) % 9) for i in range(30)])
+    return monitor
+
+
+def _reference_series(monitor, window):
+    """구 sparkline 경로: 거래일마다 지표별 DB 스코어링 + 집계."""
+    indicators = list(monitor.indicators.filter(is_active=True))
+    dates = sorted({
+        r.asof.date() for ind in indicators for r in ind.readings.all()
+    })[-window:]
+    series = []
+    for d in dates:
+        scores = {}
+        for ind in indicators:
+            r = score_indicator_dispatch(ind, as_of_date=d)
+            scores[str(ind.id)] = {"score": r["score"], "is_sufficient": r["is_sufficient"]}
+        ov = aggregate_monitor(monitor, scores)["overall_score"]
+        series.append({"asof": d.isoformat(), "score": ov if ov is not None else 0.0})
+    return series
+
+
+@pytest.mark.django_db
+class TestScoreSeries:
+    def test_matches_per_date_scoring(self, scored_monitor):
+        result = score_series(scored_monitor, window=30)
+
+        assert result["series"] == _reference_series(scored_monitor, 30)
+        assert len(result["series"]) == 30
+        assert IndicatorScore.objects.count() == 90
+
+    def test_materialized_read_is_constant_queries(self, scored_monitor):
+        first = score_series(scored_monitor, window=30)
+
+        with CaptureQueriesContext(connection) as ctx:
+            again = score_series(scored_monitor, window=30)
+        with CaptureQueriesContext(connection) as ctx_small:
+            score_series(scored_monitor, window=5)
+
+        assert again == first
+        assert len(ctx.captured_queries) == len(ctx_small.captured_queries) <= 4
+
+    def test_indicator_change_rematerializes(self, scored_monitor):
+        score_series(scored_monitor)
+        custom = scored_monitor.indicators.get(name="custom")
+        custom.override_score = 0.9
+        custom.save()
+
+        result = score_series(scored_monitor, window=30)
+
+        assert result["series"] == _reference_series(scored_monitor, 30)
+
+
+@pytest.mark.django_db
+class TestRefreshScoreSeries:
+    def test_only_changed_rows_upserted(self, scored_monitor):
+        assert refresh_score_series(scored_monitor) == 90
+        assert refresh_score_series(scored_monitor) == 0
+
+        custom = scored_monitor.indicators.get(name="custom")
+        latest = custom.readings.order_by("-asof").first()
+        latest.value = 100.0
+        latest.save()
+
+        # 마지막 판독만 바뀜 → 그 거래일 score 1행만 재기록
+        assert refresh_score_series(scored_monitor) == 1
+
+    def test_window_bounds_rows(self, scored_monitor):
+        refresh_score_series(scored_monitor, days=10)
+
+        assert IndicatorScore.objects.count() == 30
+        refresh_score_series(scored_monitor, days=5)
+        assert IndicatorScore.objects.count() == 15
+
+
+@pytest.mark.django_db
+class TestEvaluateMonitorsBatch:
+    def _second_monitor(self, user, add_readings):
+        other = Monitor.objects.create(
+            user=user, scope=Monitor.Scope.STOCK, target_ref="MSFT", name="MS"
+        )
+        ind = MonitorIndicator.objects.create(
+            monitor=other, name="x", indicator_type="market_data", source_key="eod_composite",
+        )
+        add_readings(ind, [float(i % 4) for i in range(12)])
+        return other
+
+    def test_batch_matches_single(self, scored_monitor, user, add_readings):
+        other = self._second_monitor(user, add_readings)
+        qs = Monitor.objects.filter(id__in=[scored_monitor.id, other.id]).order_by("name")
+
+        batch = evaluate_monitors(qs)
+        single = [evaluate_monitor(m) for m in qs]
+
+        keys = ["overall_score", "state", "data_coverage", "indicator_scores", "weakest_link"]
+        assert [{k: r[k] for k in keys} for r in batch] == [
+            {k: r[k] for k in keys} for r in single
+        ]
+
+    def test_readings_loaded_once(self, scored_monitor, user, add_readings):
+        self._second_monitor(user, add_readings)
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = evaluate_monitors(Monitor.objects.all())
+
+        assert len(results) == 2
+        reading_queries = [
+            q for q in ctx.captured_queries if 'FROM "monitor_indicatorreading"' in q["sql"]
+        ]
+        assert len(reading_queries) == 1
+
+    def test_inputs_match_db_scoring(self, scored_monitor):
+        indicators = active_indicators([scored_monitor])[scored_monitor.id]
+        as_of = date.today() - timedelta(days=3)
+        inputs = load_scoring_inputs(indicators, as_of_date=as_of)
+
+        for ind in indicators:
+            assert inputs.score(ind, as_of) == score_indicator_dispatch(ind, as_of_date=as_of)
@@ -0,0 +1,160 @@
+"""
+EntityMatcher (Aho–Corasick) 테스트
+
+- 자동자: 겹치는 패턴 / 실패 링크 출력
+- 회사명: 단어 경계 + 대문자 시작 규칙, 다단어 이름
+- 티커: 전부 대문자인 단어 단위 Stock.symbol (동음이의어는 주식 문맥 필요)
+- 섹터: 기존 부분 문자열 match_sectors와 같은 결과
+- classify_batch: NewsEntity 1회 조회 + 배치 스캔
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from packages.shared.stocks.models import Stock
+from services.news.models import NewsArticle, NewsEntity
+from services.news.services.entity_matcher import (
+    AhoCorasick,
+    EntityMatcher,
+    sectors_in,
+)
+from services.news.services.keyword_sector_map import KEYWORD_SECTOR_MAP
+from services.news.services.news_classifier import NewsClassifier
+
+
+def _substring_sectors(text: str) -> list:
+    """기존 match_sectors 구현 (키워드별 `in` 검사)"""
+    text_lower = text.lower()
+    sector_counts = {}
+    for keyword, sector in KEYWORD_SECTOR_MAP.items():
+        if keyword in text_lower:
+            sector_counts[sector] = sector_counts.get(sector, 0) + 1
+    return sorted(sector_counts.keys(), key=lambda s: sector_counts[s], reverse=True)
+
+
+class TestAhoCorasick:
+
+    def test_reports_overlapping_patterns(self):
+        automaton = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+        found = sorted((end, value) for end, _, value in automaton.iter("ushers"))
+
+        assert found == [(3, 1), (3, 2), (5, 4)]
+
+    def test_empty_patterns_skipped(self):
+        automaton = AhoCorasick([("", 1), ("ab", 2)])
+
+        assert [value for _, _, value in automaton.iter("xabx")] == [2]
+
+
+class TestEntityMatcherScan:
+
+    def setup_method(self):
+        self.matcher = EntityMatcher(
+            {
+                "Apple": "AAPL",
+                "Block": "SQ",
+                "Nvidia Corporation": "NVDA",
+                "AT&T": "T",
+                "Apple Inc": "IGNORED",  # 다른 토큰열 → 별도 패턴
+                "apple": "DUPLICATE",  # 같은 토큰열 → 먼저 나온 항목 우선
+            }
+        )
+
+    def test_word_boundaries(self):
+        mentions = self.matcher.scan("Pineapple growers and Blockchain firms")
+
+        assert mentions.tickers == set()
+
+    def test_capitalized_mentions_only(self):
+        assert self.matcher.scan("apple pie recipe").tickers == set()
+        assert self.matcher.scan("Apple unveils new chip").tickers == {"AAPL"}
+
+    def test_multi_word_and_punctuation(self):
+        mentions = self.matcher.scan("NVIDIA Corporation and AT&T rally; Block slips")
+
+        assert mentions.tickers == {"NVDA", "T", "SQ"}
+
+    def test_bare_uppercase_tickers(self):
+        matcher = EntityMatcher({}, symbols=["NVDA", "AMD", "TSM", "GE", "BRK.B"])
+
+        mentions = matcher.scan("Chip rally: NVDA shares jump as AMD, TSM gain; BRK.B flat")
+
+        assert mentions.tickers == {"NVDA", "AMD", "TSM", "BRK.B"}  # GE: 3글자 미만
+        assert matcher.scan("Amd and Nvda, NVDAX or $amd").tickers == set()
+
+    def test_scan_many_preserves_order(self):
+        results = self.matcher.scan_many(["Apple", "", "Block oil"])
+
+        assert [m.tickers for m in results] == [{"AAPL"}, set(), {"SQ"}]
+        assert results[2].sectors == sectors_in("block oil")
+
+
+@pytest.mark.django_db
+class TestTickerMentions:
+
+    def test_build_includes_stock_symbols(self):
+        Stock.objects.create(symbol="NVDA", stock_name="")
+        Stock.objects.create(symbol="META", stock_name="")
+        classifier = NewsClassifier()
+        classifier._entity_matcher = EntityMatcher.build()
+
+        assert classifier._match_company_names("NVDA shares jump") == {"NVDA"}
+        # 동음이의어 티커는 주식 문맥이 있을 때만
+        assert classifier._match_company_names("Zuckerberg says META is next") == set()
+        assert classifier._match_company_names("META stock rises") == {"META"}
+
+
+class TestSectorsIn:
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Nvidia semiconductor chip demand lifts AI cloud stocks",
+            "Oil prices drop as OPEC raises output; bank earnings mixed",
+            "Fed rate cut hopes boost biotech and pharma, retail lags",
+            "Nothing relevant here",
+            "",
+        ],
+    )
+    def test_matches_substring_implementation(self, text):
+        assert sectors_in(text.lower()) == _substring_sectors(text)
+
+
+@pytest.mark.django_db
+class TestClassifyBatchScan:
+
+    def test_single_entity_query_and_batch_scan(self):
+        articles = [
+            NewsArticle.objects.create(
+                url=f"https://example.com/entity/{i}",
+                title=title,
+                summary="",
+                source="Reuters",
+                published_at=timezone.now(),
+                language="en",
+                category="general",
+            )
+            for i, title in enumerate(["Apple beats on earnings", "Block stock jumps"])
+        ]
+        NewsEntity.objects.create(
+            news=articles[1], symbol="SQ", entity_name="Block", entity_type="equity",
+            source="finnhub",
+        )
+        classifier = NewsClassifier()
+        classifier._entity_matcher = EntityMatcher({"Apple": "AAPL"})
+
+        with CaptureQueriesContext(connection) as ctx:
+            entity_symbols, mentions = classifier.scan_batch(articles)
+
+        assert len(ctx.captured_queries) == 1
+        assert entity_symbols == {articles[1].id: ["SQ"]}
+        assert [m.tickers for m in mentions] == [{"AAPL"}, set()]
+
+        result = classifier.classify_batch(article_ids=[a.id for a in articles])
+
+        assert result["classified"] == 2
+        articles[0].refresh_from_db()
+        assert articles[0].rule_tickers == ["AAPL"]
@@ -640,6 +640,18 @@ class TestCeleryTasks:
         mock_check.assert_called_once()
         assert result['action'] == 'wait'
 
+    @pytest.mark.django_db
+    @patch('services.news.tasks.reclassify_news_importance')
+    @patch('services.news.services.ml_production_manager.MLProductionManager.check_auto_deploy')
+    def test_check_auto_deploy_task_reclassifies_on_deploy(self, mock_check, mock_reclassify):
+        from services.news.tasks import check_auto_deploy
+
+        mock_check.return_value = {'action': 'deployed', 'reason': 'test'}
+
+        check_auto_deploy()
+
+        mock_reclassify.delay.assert_called_once_with()
+
     @pytest.mark.django_db
     @patch('services.news.services.ml_production_manager.MLProductionManager.generate_weekly_report')
     def test_generate_weekly_ml_report_task(self, mock_report):
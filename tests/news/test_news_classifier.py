@@ -2,7 +2,7 @@
 NewsClassifier 단위 테스트
 
 커버 범위:
-- Engine A: extract_tickers() - cashtag, exchange bracket, SymbolMatcher, entity 추출
+- Engine A: extract_tickers() - cashtag, exchange bracket, EntityMatcher, entity 추출
 - Engine B: extract_sectors() - 키워드 기반 섹터 분류
 - Engine C: calculate_importance() - 5-factor 중요도 스코어
 - classify_batch() - 배치 분류 처리
@@ -11,12 +11,13 @@ NewsClassifier 단위 테스트
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.utils import timezone
 
 from services.news.models import NewsArticle, NewsEntity
+from services.news.services.entity_matcher import EntityMatcher, EntityMentions
 from services.news.services.news_classifier import (
     AMBIGUOUS_TICKERS,
     CASHTAG_PATTERN,
@@ -315,29 +316,28 @@ class TestHasStockContext:
 
 
 # ─────────────────────────────────────────────────────────────
-# Engine A: _match_company_names (SymbolMatcher mock)
+# Engine A: _match_company_names (EntityMatcher 주입)
 # ─────────────────────────────────────────────────────────────
 
 class TestMatchCompanyNames:
-    """_match_company_names() 단위 테스트 (SymbolMatcher mock 사용)"""
+    """_match_company_names() 단위 테스트 (DB 없이 구축한 EntityMatcher 사용)"""
 
     def setup_method(self):
         self.classifier = NewsClassifier()
 
     def _patch_symbol_matcher(self, match_map: dict):
         """
-        SymbolMatcher.match()를 mock_map 기반으로 패치하는 헬퍼.
+        회사명 사전으로 EntityMatcher를 만들어 주입하는 헬퍼.
         match_map: {'Apple': 'AAPL', 'Google': 'GOOGL', ...}
         """
-        mock_matcher = MagicMock()
-        mock_matcher.match.side_effect = lambda candidate: match_map.get(candidate)
-        # symbol_matcher lazy property를 직접 교체
-        self.classifier._symbol_matcher = mock_matcher
-        return mock_matcher
+        matcher = EntityMatcher(match_map)
+        # entity_matcher lazy property를 직접 교체
+        self.classifier._entity_matcher = matcher
+        return matcher
 
     def test_company_name_matched_to_ticker(self):
         """
-        Given: 'Apple' 이라는 단어가 포함된 텍스트 + SymbolMatcher가 'AAPL' 반환
+        Given: 'Apple' 이라는 단어가 포함된 텍스트 + 회사명 사전 {'Apple': 'AAPL'}
         When: _match_company_names() 호출
         Then: {'AAPL'} 반환
         """
@@ -351,7 +351,7 @@ class TestMatchCompanyNames:
 
     def test_ambiguous_ticker_with_stock_context_included(self):
         """
-        Given: SymbolMatcher가 'META' 반환 + 텍스트에 'earnings' 포함
+        Given: 회사명 사전 {'Meta': 'META'} + 텍스트에 'earnings' 포함
         When: _match_company_names() 호출
         Then: 'META' 포함 (주식 문맥 있으므로)
         """
@@ -365,7 +365,7 @@ class TestMatchCompanyNames:
 
     def test_ambiguous_ticker_without_stock_context_excluded(self):
         """
-        Given: SymbolMatcher가 'NOW' 반환 + 주식 문맥 없는 텍스트
+        Given: 회사명 사전 {'Now': 'NOW'} + 주식 문맥 없는 텍스트
         When: _match_company_names() 호출
         Then: 'NOW' 미포함 (동음이의어 필터)
         """
@@ -379,7 +379,7 @@ class TestMatchCompanyNames:
 
     def test_no_match_returns_empty(self):
         """
-        Given: SymbolMatcher가 모든 후보에 None 반환
+        Given: 빈 회사명 사전
         When: _match_company_names() 호출
         Then: 빈 set 반환
         """
@@ -391,7 +391,7 @@ class TestMatchCompanyNames:
 
     def test_two_word_candidate_matched(self):
         """
-        Given: 'Nvidia Corporation' 2단어 후보에 대해 SymbolMatcher 'NVDA' 반환
+        Given: 'Nvidia Corporation' 2단어 회사명 → 'NVDA'
         When: _match_company_names() 호출
         Then: 'NVDA' 포함
         """
@@ -405,17 +405,30 @@ class TestMatchCompanyNames:
         """
         Given: 2글자 단어 'It' - 후보 추출 조건 (3글자 이상)에 미달
         When: _match_company_names() 호출
-        Then: SymbolMatcher.match 호출되더라도 'It' 후보 제외
+        Then: 'It' 은 자동자 패턴에서 제외되어 매칭 안 됨
         """
-        mock_matcher = MagicMock()
-        mock_matcher.match.return_value = None
-        self.classifier._symbol_matcher = mock_matcher
+        self._patch_symbol_matcher({"It": "IT"})
 
-        self.classifier._match_company_names("It was a great day for the market")
+        result = self.classifier._match_company_names(
+            "It was a great day for the market and stock earnings"
+        )
 
         # 'It' 는 2글자이므로 후보에 포함 안 됨
-        all_calls = [call[0][0] for call in mock_matcher.match.call_args_list]
-        assert "It" not in all_calls
+        assert "IT" not in result
+
+    def test_lowercase_mention_and_partial_word_ignored(self):
+        """
+        Given: 'Apple'/'Block' 패턴 + 소문자 'apple', 단어 일부 'Blockchain'
+        When: _match_company_names() 호출
+        Then: 대문자로 시작하는 단어 경계 언급만 매칭
+        """
+        self._patch_symbol_matcher({"Apple": "AAPL", "Block": "SQ"})
+
+        result = self.classifier._match_company_names(
+            "Blockchain startups love apple pie"
+        )
+
+        assert result == set()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -428,10 +441,8 @@ class TestExtractTickers:
 
     def setup_method(self):
         self.classifier = NewsClassifier()
-        # SymbolMatcher는 기본적으로 None 반환하도록 mock
-        mock_matcher = MagicMock()
-        mock_matcher.match.return_value = None
-        self.classifier._symbol_matcher = mock_matcher
+        # 회사명 사전이 빈 EntityMatcher (회사명 매칭 없음)
+        self.classifier._entity_matcher = EntityMatcher({})
 
     def test_entity_symbol_extracted_first(self):
         """
@@ -516,35 +527,34 @@ class TestExtractTickers:
         """
         Given: entity 3개 이상 (len(tickers) >= 3)
         When: extract_tickers() 호출
-        Then: SymbolMatcher.match() 호출되지 않음 (skip 조건)
+        Then: EntityMatcher.scan() 호출되지 않음 (skip 조건)
         """
         article = _make_article(title="Multi stock news")
         for sym in ["AAPL", "TSLA", "NVDA"]:
             _make_entity(article, sym)
 
         mock_matcher = MagicMock()
-        mock_matcher.match.return_value = None
-        self.classifier._symbol_matcher = mock_matcher
+        self.classifier._entity_matcher = mock_matcher
 
         self.classifier.extract_tickers(article)
 
-        mock_matcher.match.assert_not_called()
+        mock_matcher.scan.assert_not_called()
 
     def test_symbol_matcher_called_when_few_tickers(self):
         """
         Given: entity 0개 (tickers < 3)
         When: extract_tickers() 호출
-        Then: SymbolMatcher.match() 호출됨
+        Then: EntityMatcher.scan() 호출됨
         """
         article = _make_article(title="Apple is a great company")
 
         mock_matcher = MagicMock()
-        mock_matcher.match.return_value = None
-        self.classifier._symbol_matcher = mock_matcher
+        mock_matcher.scan.return_value = EntityMentions()
+        self.classifier._entity_matcher = mock_matcher
 
         self.classifier.extract_tickers(article)
 
-        mock_matcher.match.assert_called()
+        mock_matcher.scan.assert_called_once()
 
     def test_empty_article_no_tickers(self):
         """
@@ -959,10 +969,8 @@ class TestClassifyBatch:
 
     def setup_method(self):
         self.classifier = NewsClassifier()
-        # SymbolMatcher mock
-        mock_matcher = MagicMock()
-        mock_matcher.match.return_value = None
-        self.classifier._symbol_matcher = mock_matcher
+        # 회사명 사전이 빈 EntityMatcher
+        self.classifier._entity_matcher = EntityMatcher({})
 
     def test_batch_classifies_unscored_articles(self):
         """
@@ -1105,6 +1113,51 @@ class TestClassifyBatch:
         article.refresh_from_db()
         assert article.rule_tickers is None
 
+    def test_batch_chunks_and_bulk_updates(self):
+        """
+        Given: 미분류 뉴스 5개 + 이미 점수가 있는 뉴스 1개
+        When: classify_batch(chunk_size=2) 호출
+        Then: 3개 청크, 청크당 UPDATE 1회, 점수 있는 뉴스는 건너뜀
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        articles = [_make_article(title=f"$AAPL news {i}") for i in range(5)]
+        scored = _make_article(title="$TSLA scored", importance_score=0.9)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = self.classifier.classify_batch(hours=4, chunk_size=2)
+
+        assert result["classified"] == 5
+        assert result["chunks"] == 3
+        assert "articles_per_sec" in result and "elapsed_ms" in result
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 3
+        for article in articles:
+            article.refresh_from_db()
+            assert article.rule_tickers == ["AAPL"]
+        scored.refresh_from_db()
+        assert scored.importance_score == 0.9
+
+    def test_batch_reclassify_includes_scored_articles(self):
+        """
+        Given: 이미 점수가 있는 오래된 뉴스
+        When: classify_batch(hours=None, reclassify=True) 호출
+        Then: 새 가중치로 다시 계산
+        """
+        article = _make_article(
+            title="$NVDA archive",
+            published_at=timezone.now() - timedelta(days=30),
+            importance_score=0.99,
+        )
+
+        result = self.classifier.classify_batch(hours=None, reclassify=True)
+
+        assert result["classified"] == 1
+        article.refresh_from_db()
+        assert article.importance_score != 0.99
+        assert article.rule_tickers == ["NVDA"]
+
 
 # ─────────────────────────────────────────────────────────────
 # select_for_analysis
@@ -1337,58 +1390,54 @@ class TestNewsClassifierInit:
 
         assert classifier.weights == custom
 
-    def test_symbol_matcher_is_lazy(self):
+    def test_entity_matcher_is_lazy(self):
         """
         Given: NewsClassifier 초기화 직후
-        When: _symbol_matcher 확인
+        When: _entity_matcher 확인
         Then: None (lazy initialization)
         """
         classifier = NewsClassifier()
 
-        assert classifier._symbol_matcher is None
+        assert classifier._entity_matcher is None
 
-    def test_symbol_matcher_lazy_init_called(self):
+    def test_entity_matcher_lazy_init_called(self):
         """
-        Given: NewsClassifier 초기화 후 symbol_matcher property 접근
-        When: get_symbol_matcher import + 호출
-        Then: _symbol_matcher 설정됨
+        Given: NewsClassifier 초기화 후 entity_matcher property 접근
+        When: get_entity_matcher 호출
+        Then: _entity_matcher 설정됨
         """
         classifier = NewsClassifier()
         mock_matcher_instance = MagicMock()
 
-        # get_symbol_matcher is imported inside the property body from serverless
         with patch(
-            "services.serverless.services.symbol_matcher.get_symbol_matcher",
+            "services.news.services.news_classifier.get_entity_matcher",
             return_value=mock_matcher_instance,
-        ):
-            # Directly patch the inner import by setting _symbol_matcher to None
-            # and using the module-level import path
-            classifier._symbol_matcher = None
-            with patch(
-                "services.news.services.news_classifier.NewsClassifier.symbol_matcher",
-                new_callable=PropertyMock,
-                return_value=mock_matcher_instance,
-            ):
-                result = classifier.symbol_matcher
+        ) as factory:
+            result = classifier.entity_matcher
 
+        factory.assert_called_once()
         assert result is mock_matcher_instance
+        assert classifier._entity_matcher is mock_matcher_instance
 
-    def test_symbol_matcher_not_called_twice(self):
+    def test_entity_matcher_not_called_twice(self):
         """
-        Given: symbol_matcher를 한 번 초기화한 상태
-        When: 두 번째 symbol_matcher 접근
-        Then: _symbol_matcher 재초기화 없음 (캐시됨)
+        Given: entity_matcher를 한 번 초기화한 상태
+        When: 두 번째 entity_matcher 접근
+        Then: _entity_matcher 재초기화 없음 (캐시됨)
         """
         classifier = NewsClassifier()
         mock_matcher_instance = MagicMock()
 
         # Set the cached matcher directly
-        classifier._symbol_matcher = mock_matcher_instance
+        classifier._entity_matcher = mock_matcher_instance
 
-        # Accessing property again should return the cached instance
-        result1 = classifier.symbol_matcher
-        result2 = classifier.symbol_matcher
+        with patch(
+            "services.news.services.news_classifier.get_entity_matcher"
+        ) as factory:
+            result1 = classifier.entity_matcher
+            result2 = classifier.entity_matcher
 
+        factory.assert_not_called()
         assert result1 is mock_matcher_instance
         assert result2 is mock_matcher_instance
 
@@ -0,0 +1,248 @@
+"""
+ScreenerAlertEngine 배치 평가 테스트
+
+- 같은 정규화 필터의 알림은 mask 1회 평가 (알림 수가 아닌 필터 조합 수에 비례)
+- filter_match / volume_spike / new_high / new_low / price_target 판정
+- price_target target_symbols 형식 검증 (serializer/model, 형식 오류 알림은 failed 이력)
+- 쿨다운 스킵, 발송 상태 일괄 갱신, 타이밍 리포트
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from services.serverless.models import AlertHistory, ScreenerAlert
+from services.serverless.serializers import (
+    ScreenerAlertCreateSerializer,
+    ScreenerAlertSerializer,
+)
+from services.serverless.services import screener_universe as su
+from services.serverless.services.alert_engine import ScreenerAlertEngine
+from services.serverless.services.filter_engine import FilterEngine
+
+User = get_user_model()
+
+FRAME = pd.DataFrame(
+    [
+        {"symbol": "AAPL", "marketCap": 3.0e12, "sector": "Technology", "price": 200.0,
+         "yearHigh": 199.0, "yearLow": 150.0, "rvol": 1.1},
+        {"symbol": "NVDA", "marketCap": 2.9e12, "sector": "Technology", "price": 120.0,
+         "yearHigh": 140.0, "yearLow": 80.0, "rvol": 3.5},
+        {"symbol": "INTC", "marketCap": 9.0e10, "sector": "Technology", "price": 19.0,
+         "yearHigh": 45.0, "yearLow": 19.5, "rvol": 2.4},
+        {"symbol": "XOM", "marketCap": 4.5e11, "sector": "Energy", "price": 110.0,
+         "yearHigh": 120.0, "yearLow": 95.0, "rvol": None},
+    ]
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def universe():
+    return su.ScreenerUniverse(version="v1", built_at="2026-10-16T14:30:00", frame=FRAME)
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(
+        username="alerts", email="alerts@example.com", password="pass12345"
+    )
+
+
+def make_alert(user, alert_type="filter_match", filters=None, **kwargs):
+    return ScreenerAlert.objects.create(
+        user=user,
+        name=f"{alert_type}-{ScreenerAlert.objects.count()}",
+        alert_type=alert_type,
+        filters_json=filters if filters is not None else {"sector": ["Technology"]},
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestScreenerAlertEngine:
+
+    def test_identical_filters_evaluated_once(self, user, universe):
+        for _ in range(3):
+            make_alert(user, filters={"sector": ["Technology"], "pe_ratio_max": None})
+        make_alert(user, filters={"sector": ["Energy"]})
+        engine = FilterEngine()
+
+        with patch.object(
+            engine, "_compile_mask", wraps=engine._compile_mask
+        ) as compile_mask:
+            result = ScreenerAlertEngine(universe, engine).run()
+
+        assert compile_mask.call_count == 2
+        assert result["checked"] == 4 and result["groups"] == 2
+        assert result["triggered"] == 4
+        assert set(result["timing_ms"]) == {"load", "evaluate", "persist", "total"}
+        history = AlertHistory.objects.filter(alert__filters_json={"sector": ["Energy"]})
+        assert history.get().matched_symbols == ["XOM"]
+
+    def test_condition_alert_types(self, user, universe):
+        spike = make_alert(user, "volume_spike")
+        strict_spike = make_alert(user, "volume_spike", {"sector": ["Technology"], "rvol_min": 3})
+        high = make_alert(user, "new_high")
+        low = make_alert(user, "new_low")
+        many_highs = make_alert(user, "new_high", target_count=2)
+
+        ScreenerAlertEngine(universe, FilterEngine()).run()
+
+        def symbols(alert):
+            return AlertHistory.objects.get(alert=alert).matched_symbols
+
+        assert symbols(spike) == ["NVDA", "INTC"]
+        assert symbols(strict_spike) == ["NVDA"]
+        assert symbols(high) == ["AAPL"]
+        assert symbols(low) == ["INTC"]
+        assert not AlertHistory.objects.filter(alert=many_highs).exists()
+
+    def test_price_target(self, user, universe):
+        alert = make_alert(
+            user,
+            "price_target",
+            target_symbols=[
+                {"symbol": "aapl", "target_price": 190},
+                {"symbol": "XOM", "target_price": 100, "direction": "below"},
+                {"symbol": "NVDA", "target_price": 100, "direction": "below"},
+                {"symbol": "ZZZZ", "target_price": 1},
+            ],
+        )
+
+        ScreenerAlertEngine(universe, FilterEngine()).run()
+
+        history = AlertHistory.objects.get(alert=alert)
+        assert history.matched_symbols == ["AAPL"]
+        assert history.snapshot["prices"] == {"AAPL": 200.0}
+
+    def test_malformed_price_target_recorded_as_failed(self, user, universe):
+        """기존 심볼 문자열 목록 알림은 건너뛰지 않고 failed 이력으로 남김"""
+        alert = make_alert(user, "price_target", target_symbols=["AAPL"])
+
+        result = ScreenerAlertEngine(universe, FilterEngine()).run()
+
+        history = AlertHistory.objects.get(alert=alert)
+        assert result["errors"] == 1
+        assert history.status == "failed"
+        assert "target_price" in history.snapshot["error"]
+
+    def test_cooldown_and_trigger_update(self, user, universe):
+        cooling = make_alert(user, last_triggered_at=timezone.now() - timedelta(hours=1))
+        ready = make_alert(user, trigger_count=4)
+
+        result = ScreenerAlertEngine(universe, FilterEngine()).run()
+
+        assert result["skipped_cooldown"] == 1 and result["triggered"] == 1
+        ready.refresh_from_db()
+        assert ready.trigger_count == 5 and ready.last_triggered_at is not None
+        assert not AlertHistory.objects.filter(alert=cooling).exists()
+
+    def test_loads_snapshot_once_when_missing(self, user, universe):
+        make_alert(user)
+        make_alert(user, filters={"sector": ["Energy"]})
+
+        with patch(
+            "services.serverless.services.alert_engine.get_universe", return_value=None
+        ), patch(
+            "services.serverless.services.alert_engine.refresh_universe",
+            return_value=universe,
+        ) as refresh:
+            result = ScreenerAlertEngine(filter_engine=FilterEngine()).run()
+
+        refresh.assert_called_once()
+        assert result["universe_built_at"] == universe.built_at
+
+    def test_missing_universe_falls_back_to_fmp_filters(self, user):
+        """스냅샷 없음(콜드 스타트·갱신 실패) → 실패 대신 filter_match만 FMP 필터로 평가."""
+        hit = make_alert(user)
+        make_alert(user)  # 같은 필터 → apply_filters 1회
+        make_alert(user, alert_type="new_high")
+        fmp_result = {"count": 2, "results": [{"symbol": "AAPL"}, {"symbol": "NVDA"}]}
+
+        with patch(
+            "services.serverless.services.alert_engine.get_universe", return_value=None
+        ), patch(
+            "services.serverless.services.alert_engine.refresh_universe", return_value=None
+        ), patch.object(
+            FilterEngine, "apply_filters", return_value=fmp_result
+        ) as apply_filters:
+            result = ScreenerAlertEngine(filter_engine=FilterEngine()).run()
+
+        apply_filters.assert_called_once()
+        assert result["universe_unavailable"] is True
+        assert result["triggered"] == 2 and result["errors"] == 0
+        history = AlertHistory.objects.get(alert=hit)
+        assert history.matched_symbols == ["AAPL", "NVDA"]
+        assert history.snapshot["universe_built_at"] is None
+
+
+@pytest.mark.django_db
+class TestPriceTargetValidation:
+
+    def _create(self, **fields):
+        data = {"name": "pt", "filters_json": {"sector": "Technology"},
+                "alert_type": "price_target", **fields}
+        return ScreenerAlertCreateSerializer(data=data)
+
+    @pytest.mark.parametrize(
+        "targets",
+        [
+            [],
+            ["AAPL"],
+            [{"symbol": "AAPL"}],
+            [{"symbol": "AAPL", "target_price": "200"}],
+            [{"symbol": "AAPL", "target_price": 200, "direction": "up"}],
+            [{"target_price": 200}],
+        ],
+    )
+    def test_create_rejects_malformed_targets(self, targets):
+        serializer = self._create(target_symbols=targets)
+
+        assert not serializer.is_valid()
+        assert "target_symbols" in serializer.errors
+
+    def test_create_accepts_price_target_objects(self):
+        serializer = self._create(
+            target_symbols=[
+                {"symbol": "AAPL", "target_price": 200},
+                {"symbol": "XOM", "target_price": 99.5, "direction": "below"},
+            ]
+        )
+
+        assert serializer.is_valid(), serializer.errors
+
+    def test_other_alert_types_unaffected(self):
+        assert self._create(alert_type="filter_match", target_symbols=["AAPL"]).is_valid()
+
+    def test_partial_update_checks_existing_type(self, user):
+        alert = make_alert(
+            user, "price_target", target_symbols=[{"symbol": "AAPL", "target_price": 200}]
+        )
+
+        serializer = ScreenerAlertSerializer(
+            alert, data={"target_symbols": ["AAPL"]}, partial=True
+        )
+
+        assert not serializer.is_valid()
+        assert "target_symbols" in serializer.errors
+
+    def test_model_clean(self, user):
+        alert = ScreenerAlert(user=user, name="pt", alert_type="price_target",
+                              target_symbols=["AAPL"])
+
+        with pytest.raises(ValidationError) as exc:
+            alert.full_clean()
+
+        assert "target_symbols" in exc.value.message_dict
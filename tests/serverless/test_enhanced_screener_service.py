@@ -266,19 +266,18 @@ class TestEnhancedScreenerIntegration:
         mock_client = MagicMock()
         mock_fmp_client.return_value = mock_client
 
-        # FMP Screener 응답 Mock
-        mock_client._make_request.side_effect = [
-            # 1차: company-screener
-            [
-                {'symbol': 'AAPL', 'companyName': 'Apple', 'marketCap': 2e12},
-                {'symbol': 'GOOGL', 'companyName': 'Alphabet', 'marketCap': 1.5e12},
-                {'symbol': 'META', 'companyName': 'Meta', 'marketCap': 800e9},
-            ],
-            # 2차: key-metrics-ttm (AAPL)
+        mock_cache.get_many.return_value = {}
+
+        # FMP Screener 응답 Mock (1차: company-screener)
+        mock_client._make_request.return_value = [
+            {'symbol': 'AAPL', 'companyName': 'Apple', 'marketCap': 2e12},
+            {'symbol': 'GOOGL', 'companyName': 'Alphabet', 'marketCap': 1.5e12},
+            {'symbol': 'META', 'companyName': 'Meta', 'marketCap': 800e9},
+        ]
+        # 2차: key-metrics-ttm (AAPL, GOOGL, META 동시 조회)
+        mock_client.fetch_many.return_value = [
             [{'peRatioTTM': 28.0, 'roeTTM': 150.0}],
-            # 2차: key-metrics-ttm (GOOGL)
             [{'peRatioTTM': 22.0, 'roeTTM': 25.0}],
-            # 2차: key-metrics-ttm (META)
             [{'peRatioTTM': 12.0, 'roeTTM': 18.0}],
         ]
 
@@ -296,6 +295,10 @@ class TestEnhancedScreenerIntegration:
         # META (PE=12, ROE=18) 와 GOOGL (PE=22, ROE=25) 만 통과
         # AAPL은 PE=28로 실패
         assert result['count'] <= 3
+        mock_client.fetch_many.assert_called_once_with(
+            '/stable/key-metrics-ttm',
+            [{'symbol': 'AAPL'}, {'symbol': 'GOOGL'}, {'symbol': 'META'}],
+        )
 
     @patch('services.serverless.services.enhanced_screener_service.FMPClient')
     @patch('services.serverless.services.enhanced_screener_service.cache')
@@ -275,6 +275,17 @@ class TestETFHoldingSave:
         symbols = set(h.stock_symbol for h in holdings)
         assert symbols == {'MSFT', 'GOOGL'}
 
+        # 재저장은 기존 행 갱신 (비중/순위 변경 반영)
+        holdings3 = [
+            {'symbol': 'GOOGL', 'weight': 25.0, 'shares': 600000, 'market_value': None, 'rank': 1},
+            {'symbol': 'MSFT', 'weight': 20.0, 'shares': 800000, 'market_value': None, 'rank': 2},
+        ]
+        downloader._save_holdings(profile, holdings3, 'hash3')
+
+        googl = ETFHolding.objects.get(etf=profile, stock_symbol='GOOGL')
+        assert googl.rank == 1 and googl.weight_percent == Decimal('25.000')
+        assert ETFHolding.objects.filter(etf=profile).count() == 2
+
 
 class TestGenericParser:
     """범용 파서 테스트"""
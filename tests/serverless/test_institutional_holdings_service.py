@@ -672,6 +672,70 @@ class TestGenerateHeldBySameFund:
         count_min2 = service.generate_held_by_same_fund(min_shared_institutions=2)
         assert count_min2 == 1
 
+    @pytest.mark.django_db
+    def test_generate_held_by_same_fund_matches_pairwise_and_prunes(self):
+        """행렬곱 결과가 쌍별 집합 연산과 같고, top_k로 source별 관계 수 제한"""
+        import random
+
+        rng = random.Random(7)
+        report_date = date(2025, 9, 30)
+        symbols = [f"S{i:02d}" for i in range(30)]
+        holdings = {}
+        rows = []
+        for n in range(12):
+            cik = f"{n:010d}"
+            held = rng.sample(symbols, rng.randint(5, 20))
+            for symbol in held:
+                holdings.setdefault(symbol, set()).add(cik)
+                rows.append(
+                    InstitutionalHolding(
+                        institution_cik=cik,
+                        institution_name=f"Fund {n}",
+                        filing_date=date(2025, 11, 14),
+                        report_date=report_date,
+                        accession_number=f"acc-{n}",
+                        stock_symbol=symbol,
+                        shares=100,
+                        value_thousands=1,
+                    )
+                )
+        InstitutionalHolding.objects.bulk_create(rows)
+
+        expected = {}
+        for a in holdings:
+            for b in holdings:
+                shared = holdings[a] & holdings[b]
+                if a != b and len(shared) >= 3:
+                    expected[(a, b)] = (len(shared), len(holdings[a] | holdings[b]))
+
+        service = InstitutionalHoldingsService()
+        count = service.generate_held_by_same_fund(min_shared_institutions=3, top_k=100)
+
+        assert count == len(expected) // 2
+        stored = StockRelationship.objects.filter(relationship_type='HELD_BY_SAME_FUND')
+        assert {
+            (r.source_symbol, r.target_symbol): (
+                r.context['shared_count'], r.context['total_institutions']
+            )
+            for r in stored
+        } == expected
+
+        # 재실행(top_k=2): 기존 관계는 갱신(upsert), source별 상위 2개만 기록
+        StockRelationship.objects.all().delete()
+        service.generate_held_by_same_fund(min_shared_institutions=3, top_k=2)
+        service.generate_held_by_same_fund(min_shared_institutions=3, top_k=2)
+        per_source = {}
+        for r in StockRelationship.objects.all():
+            per_source.setdefault(r.source_symbol, []).append(r)
+        assert per_source and all(len(v) <= 2 for v in per_source.values())
+        for source, kept in per_source.items():
+            best = max(
+                shared / total
+                for (a, _), (shared, total) in expected.items()
+                if a == source
+            )
+            assert float(max(r.strength for r in kept)) == pytest.approx(best, abs=1e-3)
+
 
 # ========================================
 # get_institution_holdings() 테스트
@@ -0,0 +1,205 @@
+"""
+Screener Universe / FilterEngine 스냅샷 경로 테스트
+
+- 벡터 mask + 정렬이 기존 per-stock 필터(_apply_client_filters/_sort_results)와 같은 결과
+- FMP 서버 사이드 필터(시가총액/섹터/거래소/ETF)의 스냅샷 평가
+- 결과 캐시: 페이지 이동은 mask 재계산 없이 슬라이스, FMP 호출 없음
+- 유니버스 구축(FMP + key-metrics + DB 보완)과 버전 교체
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from django.core.cache import cache
+
+from services.serverless.services import screener_universe as su
+from services.serverless.services.filter_engine import FilterEngine
+
+STOCKS = [
+    {"symbol": "AAPL", "marketCap": 3.0e12, "sector": "Technology", "exchangeShortName": "NASDAQ",
+     "isEtf": False, "price": 190.0, "pe": 30.0, "roe": 150.0, "changesPercentage": 1.2},
+    {"symbol": "MSFT", "marketCap": 2.8e12, "sector": "Technology", "exchangeShortName": "NASDAQ",
+     "isEtf": False, "price": 410.0, "pe": 35.0, "roe": 38.0, "changesPercentage": None},
+    {"symbol": "JPM", "marketCap": 5.0e11, "sector": "Financial Services", "exchangeShortName": "NYSE",
+     "isEtf": False, "price": 180.0, "pe": 11.0, "roe": 15.0, "changesPercentage": -0.4},
+    {"symbol": "XOM", "marketCap": 4.5e11, "sector": "Energy", "exchangeShortName": "NYSE",
+     "isEtf": False, "price": 110.0, "pe": None, "roe": 18.0, "changesPercentage": 1.2},
+    {"symbol": "SPY", "marketCap": None, "sector": None, "exchangeShortName": "AMEX",
+     "isEtf": True, "price": 520.0, "pe": None, "roe": None, "changesPercentage": 0.3},
+    {"symbol": "SMCI", "marketCap": 4.0e10, "sector": "technology", "exchangeShortName": "NASDAQ",
+     "isEtf": False, "price": 800.0, "pe": 9.0, "roe": 30.0, "changesPercentage": 1.2},
+]
+
+
+@pytest.fixture
+def universe():
+    return su.ScreenerUniverse(version="v1", built_at="t", frame=pd.DataFrame(STOCKS))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    su._local["universe"] = None
+    yield
+    cache.clear()
+    su._local["universe"] = None
+
+
+def symbols(records):
+    return [r["symbol"] for r in records]
+
+
+class TestVectorizedFilters:
+
+    @pytest.mark.parametrize(
+        "filters,sort_by,order",
+        [
+            ({"pe_ratio_max": 31}, "marketCap", "desc"),
+            ({"roe_min": 20, "change_percent_min": 1}, "changesPercentage", "desc"),
+            ({"pe_ratio_min": "abc"}, "price", "asc"),
+            ({"unknown_field_min": 3}, "pe", "asc"),
+            ({}, "changesPercentage", "asc"),
+        ],
+    )
+    def test_matches_per_stock_path(self, universe, filters, sort_by, order):
+        engine = FilterEngine()
+
+        mask = engine._compile_mask(universe, filters)
+        got = universe.records(engine._sorted_positions(universe, mask, sort_by, order))
+
+        expected = engine._sort_results(
+            engine._apply_client_filters(STOCKS, filters), sort_by, order
+        )
+        assert symbols(got) == symbols(expected)
+
+    def test_server_side_filters(self, universe):
+        engine = FilterEngine()
+
+        def run(filters):
+            return list(np.asarray(universe.frame["symbol"])[engine._compile_mask(universe, filters)])
+
+        assert run({"market_cap_min": 4.5e11}) == ["AAPL", "MSFT", "JPM", "XOM"]
+        assert run({"sector": ["Technology", "Energy"]}) == ["AAPL", "MSFT", "XOM", "SMCI"]
+        assert run({"exchange": "nyse"}) == ["JPM", "XOM"]
+        assert run({"is_etf": True}) == ["SPY"]
+        assert run({"market_cap_max": 1e12, "sector": None}) == ["JPM", "XOM", "SMCI"]
+
+    def test_records_use_none_for_missing(self, universe):
+        record = universe.records(np.array([4]))[0]
+        assert record["marketCap"] is None and record["pe"] is None
+        assert record["isEtf"] is True
+
+
+class TestApplyFiltersOnUniverse:
+
+    def test_pages_are_slices_of_cached_result(self, universe):
+        engine = FilterEngine()
+        filters = {"sector": ["Technology"], "pe_ratio_max": 40}
+
+        with patch.object(su, "get_universe", return_value=universe), patch(
+            "services.serverless.services.filter_engine.get_universe", return_value=universe
+        ), patch.object(engine, "_fetch_from_fmp") as fmp, patch.object(
+            engine, "_compile_mask", wraps=engine._compile_mask
+        ) as compile_mask:
+            page1 = engine.apply_filters(filters, limit=2, offset=0)
+            page2 = engine.apply_filters(
+                {"pe_ratio_max": 40, "sector": ["Technology"]}, limit=2, offset=2
+            )
+
+        fmp.assert_not_called()
+        assert compile_mask.call_count == 1  # 정규화 해시가 같으면 재계산 없음
+        assert symbols(page1["results"]) == ["AAPL", "MSFT"]
+        assert symbols(page2["results"]) == ["SMCI"]
+        assert page1["count"] == 3 and page1["total_pages"] == 2
+        assert page2["current_page"] == 2
+
+    def test_without_universe_uses_fmp(self):
+        engine = FilterEngine()
+        with patch.object(engine, "_fetch_from_fmp", return_value=STOCKS[:2]) as fmp:
+            result = engine.apply_filters({"pe_ratio_max": 31})
+
+        fmp.assert_called_once()
+        assert symbols(result["results"]) == ["AAPL"]
+
+
+class TestUniverseBuild:
+
+    SCREENER = [
+        {"symbol": "AAPL", "marketCap": 3.0e12, "price": 190.0},
+        {"symbol": "ZZZ", "marketCap": 1.0e9, "price": 5.0, "volume": 3000},
+        {"symbol": "AAPL", "marketCap": 3.0e12, "price": 190.0},
+    ]
+
+    @pytest.mark.django_db
+    def test_build_merges_metrics_and_db(self):
+        from django.utils import timezone
+
+        from packages.shared.stocks.models import DailyPrice, Stock
+
+        stock = Stock.objects.create(
+            symbol="ZZZ",
+            stock_name="Zed",
+            pe_ratio=Decimal("12.5"),
+            return_on_equity_ttm=Decimal("0.2"),
+            quarterly_revenue_growth_yoy=Decimal("0.1"),
+            change_percent="+2.50%",
+            week_52_high=Decimal("6.0"),
+        )
+        for days, volume in ((1, 1000), (2, 2000), (60, 90000)):
+            DailyPrice.objects.create(
+                stock=stock,
+                date=timezone.now().date() - timedelta(days=days),
+                open_price=5, high_price=5, low_price=5, close_price=5,
+                volume=volume,
+            )
+
+        with patch(
+            "services.serverless.services.enhanced_screener_service.FMPClient"
+        ) as client_cls:
+            client = client_cls.return_value
+            client._make_request.return_value = self.SCREENER
+            client.fetch_many.return_value = [[{"earningsYieldTTM": 0.04, "returnOnEquityTTM": 1.5}]]
+            frame = su.build_universe_frame(metrics_limit=1)
+
+        client.fetch_many.assert_called_once_with(
+            "/stable/key-metrics-ttm", [{"symbol": "AAPL"}]
+        )
+        rows = frame.set_index("symbol")
+        assert list(frame["symbol"]) == ["AAPL", "ZZZ"]
+        assert rows.loc["AAPL", "pe"] == pytest.approx(25.0)
+        assert rows.loc["AAPL", "roe"] == pytest.approx(150.0)
+        # key-metrics 미조회 종목은 DB 값으로 보완
+        assert rows.loc["ZZZ", "pe"] == pytest.approx(12.5)
+        assert rows.loc["ZZZ", "roe"] == pytest.approx(20.0)
+        assert rows.loc["ZZZ", "revenueGrowth"] == pytest.approx(10.0)
+        assert rows.loc["ZZZ", "changesPercentage"] == pytest.approx(2.5)
+        assert rows.loc["ZZZ", "yearHigh"] == pytest.approx(6.0)
+        # 평균 거래량은 최근 기간만 (60일 전 봉 제외)
+        assert rows.loc["ZZZ", "avgVolume"] == pytest.approx(1500)
+        assert rows.loc["ZZZ", "rvol"] == pytest.approx(2.0)
+        assert np.isnan(rows.loc["AAPL", "rvol"])
+
+    def test_refresh_swaps_version_and_keeps_on_empty(self):
+        first = pd.DataFrame([{"symbol": "AAPL", "pe": 25.0}])
+        with patch.object(su, "build_universe_frame", return_value=first) as build:
+            built = su.refresh_universe(include_metrics=True)
+
+        assert su.get_universe() is built
+        su._local["universe"] = None  # 다른 프로세스: cache에서 로드
+        assert su.get_universe().version == built.version
+
+        with patch.object(su, "build_universe_frame", return_value=pd.DataFrame()) as build:
+            kept = su.refresh_universe()
+
+        # 시세 갱신은 직전 펀더멘탈을 넘겨받음, 빈 응답이면 교체하지 않음
+        assert build.call_args.kwargs["previous"] is not None
+        assert kept.version == built.version
+
+    def test_filter_hash_normalized(self):
+        a = su.filter_hash({"sector": ["B", "A"], "pe_ratio_max": 20, "x": None}, "price", "DESC")
+        b = su.filter_hash({"pe_ratio_max": 20, "sector": ["A", "B"]}, "price", "desc")
+        assert a == b
+        assert a != su.filter_hash({"pe_ratio_max": 21, "sector": ["A", "B"]}, "price", "desc")
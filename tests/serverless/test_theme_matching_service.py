@@ -380,6 +380,43 @@ class TestRefreshAllMatches:
         # Holdings 기반 매치 생성
         assert result['created'] >= 0 or result['updated'] >= 0
 
+    def test_refresh_all_matches_diffs_against_latest_snapshot(
+        self, service, sample_etf_profile, sample_holdings
+    ):
+        """최신 snapshot 기준 신규/변경/유지/삭제 일괄 반영"""
+        from datetime import timedelta
+
+        # 과거 snapshot만 있는 종목은 매칭 대상 아님
+        ETFHolding.objects.create(
+            etf=sample_etf_profile,
+            stock_symbol='TXN',
+            weight_percent=Decimal('3.00'),
+            rank=4,
+            snapshot_date=date.today() - timedelta(days=7),
+        )
+        ThemeMatch.objects.create(
+            stock_symbol='MU', theme_id='semiconductor',
+            confidence='high', source='etf_holding', etf_symbol='SOXX',
+        )
+        ThemeMatch.objects.create(
+            stock_symbol='ASML', theme_id='semiconductor',
+            confidence='medium', source='keyword',
+        )
+
+        first = service.refresh_all_matches()
+
+        assert first['created'] == 3 and first['deleted'] == 1 and first['etfs'] == 1
+        assert not ThemeMatch.objects.filter(stock_symbol__in=['MU', 'TXN']).exists()
+        assert ThemeMatch.objects.filter(stock_symbol='ASML', source='keyword').exists()
+        nvda = ThemeMatch.objects.get(stock_symbol='NVDA', theme_id='semiconductor')
+        assert nvda.evidence == ['SOXX #1위 (10.500%)']
+
+        ETFHolding.objects.filter(stock_symbol='AMD').update(weight_percent=Decimal('9.00'))
+        second = service.refresh_all_matches()
+
+        assert (second['created'], second['updated'], second['unchanged']) == (0, 1, 2)
+        assert ThemeMatch.objects.get(stock_symbol='AMD').weight_in_etf == Decimal('9.000')
+
 
 @pytest.mark.django_db
 class TestGetETFPeers:
@@ -127,6 +127,162 @@ class TestCohesionGating:
         assert efg.cohesion is None and efg.is_hidden is True
 
 
+def _ref_cohesion(series, min_overlap=20):
+    """기존 쌍 루프 구현 (series: {sym: {date: ret}})."""
+    from itertools import combinations
+
+    import numpy as np
+    cors = []
+    for a, b in combinations(list(series), 2):
+        common = sorted(set(series[a]) & set(series[b]))
+        if len(common) < min_overlap:
+            continue
+        va = np.array([series[a][d] for d in common])
+        vb = np.array([series[b][d] for d in common])
+        if va.std() == 0 or vb.std() == 0:
+            continue
+        cors.append(np.corrcoef(va, vb)[0, 1])
+    return round(float(np.mean(cors)), 4) if cors else None
+
+
+def _ref_breadth(series, min_members=2):
+    import numpy as np
+    agrees = []
+    for d in set().union(*series.values()):
+        vals = [s[d] for s in series.values() if d in s]
+        if len(vals) < min_members:
+            continue
+        up = sum(1 for v in vals if v > 0)
+        agrees.append(max(up / len(vals), 1 - up / len(vals)))
+    return round(float(np.mean(agrees)), 4) if agrees else None
+
+
+class TestVectorizedMetrics:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        pipe._PRICE_CACHE.clear()
+        yield
+        pipe._PRICE_CACHE.clear()
+
+    def _ragged_prices(self, syms, days=60, seed=7):
+        """종목별 시작일/결측일이 다른 랜덤 종가 (쌍별 공통 날짜가 제각각)."""
+        from datetime import date as _d, timedelta as _td
+
+        import numpy as np
+
+        from packages.shared.stocks.models import DailyPrice
+        rng = np.random.default_rng(seed)
+        market = rng.normal(0, 0.01, days)
+        rows = []
+        for k, s in enumerate(syms):
+            px = 100.0
+            for i in range(3 * k, days):
+                px *= 1 + 0.6 * market[i] + rng.normal(0, 0.01)
+                if rng.random() < 0.1:
+                    continue
+                rows.append(DailyPrice(
+                    stock_id=s, date=_d(2026, 1, 1) + _td(days=i),
+                    open_price=px, high_price=px, low_price=px,
+                    close_price=round(px, 4), volume=1000,
+                ))
+        DailyPrice.objects.bulk_create(rows)
+
+    def _as_dicts(self, syms, as_of):
+        return {
+            s: {str(d): r for d, r in zip(*v)}
+            for s, v in pipe._load_prices(syms, as_of).items()
+        }
+
+    def test_matches_pairwise_reference(self, db):
+        from datetime import date as _d
+
+        syms = [f"S{i}" for i in range(6)]
+        for s in syms:
+            _mk_stock(s)
+        self._ragged_prices(syms)
+        as_of = _d(2026, 3, 31)
+        series = self._as_dicts(syms, as_of)
+
+        coh = pipe._pairwise_cohesion(syms, as_of=as_of)
+        assert coh is not None
+        assert coh == pytest.approx(_ref_cohesion(series), abs=1e-4)
+        assert pipe._pairwise_cohesion(syms, min_overlap=45, as_of=as_of) == pytest.approx(
+            _ref_cohesion(series, min_overlap=45), abs=1e-4
+        )
+        assert pipe._group_breadth(syms, as_of=as_of) == _ref_breadth(series)
+        assert pipe._group_breadth(syms, min_members=5, as_of=as_of) == _ref_breadth(
+            series, min_members=5
+        )
+
+    def test_constant_returns_excluded(self, db):
+        from datetime import date as _d, timedelta as _td
+
+        from packages.shared.stocks.models import DailyPrice
+        for s in ["K1", "K2", "K3"]:
+            _mk_stock(s)
+        for i in range(30):
+            for s, px in [("K1", 100.0), ("K2", 50.0 + (i % 2)), ("K3", 50.0 + (i % 2))]:
+                DailyPrice.objects.create(
+                    stock_id=s, date=_d(2026, 1, 1) + _td(days=i), open_price=px,
+                    high_price=px, low_price=px, close_price=px, volume=1,
+                )
+        # K1 수익률 분산 0 → K1 쌍 제외, K2-K3 쌍만 남음
+        assert pipe._pairwise_cohesion(["K1", "K2", "K3"], as_of=_d(2026, 2, 28)) == 1.0
+
+    def test_lookback_window_and_cache(self, db):
+        from datetime import date as _d
+
+        syms = ["W1", "W2"]
+        for s in syms:
+            _mk_stock(s)
+        self._ragged_prices(syms, days=40)
+
+        # as_of 가 가격보다 lookback 이상 뒤면 창 밖 → 산출 불가
+        assert pipe._pairwise_cohesion(syms, as_of=_d(2030, 1, 1)) is None
+        as_of = _d(2026, 3, 1)
+        assert pipe._pairwise_cohesion(syms, as_of=as_of) is not None
+        hits = pipe._PRICE_CACHE.hits
+        assert pipe._group_breadth(syms, as_of=as_of) is not None
+        assert pipe._PRICE_CACHE.hits == hits + 2  # 같은 창은 DB 재조회 없이 재사용
+
+    def test_cache_bounded_lru(self):
+        cache = pipe._ReturnCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == (1, True)  # a 최근 사용 → b 가 LRU
+        cache.put("c", 3)
+        assert cache.get("b") == (None, False)
+        assert cache.stats() == {"size": 2, "max_size": 2, "hits": 1, "misses": 1,
+                                 "evictions": 1}
+        cache.clear()  # 실행마다 통계 초기화 (load_event_groups summary)
+        assert cache.stats() == {"size": 0, "max_size": 2, "hits": 0, "misses": 0,
+                                 "evictions": 0}
+
+        expired = pipe._ReturnCache(max_size=2, ttl=-1)
+        expired.put("a", 1)
+        assert expired.get("a") == (None, False)
+        assert expired.stats()["size"] == 0
+
+    def test_cohold_map_matches_set_intersection(self, db):
+        from datetime import date as _d
+
+        from services.serverless.models import InstitutionalHolding
+        holdings = {
+            "A": {"1", "2", "3"}, "B": {"2", "3"}, "C": {"3", "4"}, "D": {"5"},
+        }
+        for sym, ciks in holdings.items():
+            for cik in ciks:
+                for report in [_d(2025, 12, 31), _d(2026, 3, 31)]:  # 분기 중복은 1회로
+                    InstitutionalHolding.objects.create(
+                        institution_cik=cik.zfill(10), stock_symbol=sym,
+                        report_date=report, institution_name="x",
+                        filing_date=report, accession_number="",
+                        shares=1, value_thousands=1,
+                    )
+        assert pipe._cohold_map() == {("A", "B"): 2, ("A", "C"): 1, ("B", "C"): 1}
+        assert pipe._cohold_map(["B", "C", "D"]) == {("B", "C"): 1}
+
+
 class TestTfidfNames:
     def test_core_names_attached(self, db):
         from datetime import timedelta as _td
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+
+from apps.chain_sight.models import RelationConfidence
+from apps.chain_sight.services import neo4j_sync
+from apps.chain_sight.services.path_service import build_edge_snapshot
+
+
+class FakeRepo:
+    """UNWIND 배치 호출 기록. fail_ticker가 포함된 배치는 실패."""
+
+    def __init__(self, fail_ticker=None, rows=None):
+        self.fail_ticker = fail_ticker
+        self.rows = rows or []
+        self.calls = []
+
+    def _record(self, action, rel_type, rows):
+        if any(self.fail_ticker in (r["from_ticker"], r["to_ticker"]) for r in rows):
+            raise RuntimeError("constraint violation")
+        self.calls.append((action, rel_type, rows))
+        return len(rows)
+
+    def bulk_upsert_edge_props(self, rel_type, rows):
+        return self._record("upsert", rel_type, rows)
+
+    def bulk_delete_edges(self, rel_type, rows):
+        return self._record("delete", rel_type, rows)
+
+    def run_query(self, cypher, params=None):
+        self.calls.append(("query", cypher, params))
+        return self.rows
+
+
+def make_rc(a, b, rel_type="PEER_OF", status="confirmed", **kwargs):
+    return RelationConfidence.objects.create(
+        symbol_a=a,
+        symbol_b=b,
+        relation_type=rel_type,
+        relation_status=status,
+        truth_score=0.8,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+def test_dirty_relations_sent_in_grouped_chunks():
+    peers = [make_rc("MSFT", "AAPL"), make_rc("AMD", "NVDA"), make_rc("GOOG", "META")]
+    supply = make_rc("TSM", "NVDA", rel_type="SUPPLIES_TO", market_score=0.3)
+    hidden = make_rc("ZM", "CSCO", status="hidden")
+    repo = FakeRepo()
+
+    with patch.object(neo4j_sync, "get_graph_repository", return_value=repo), patch.object(
+        neo4j_sync, "SYNC_CHUNK_SIZE", 2
+    ):
+        synced = neo4j_sync.sync_dirty_relations()
+
+    assert synced == 5
+    summary = sorted((action, rel_type, len(rows)) for action, rel_type, rows in repo.calls)
+    assert summary == [
+        ("delete", "PEER_OF", 1),
+        ("upsert", "PEER_OF", 1),
+        ("upsert", "PEER_OF", 2),
+        ("upsert", "SUPPLIES_TO", 1),
+    ]
+    rows = {(r["from_ticker"], r["to_ticker"]): r for _, _, batch in repo.calls for r in batch}
+    # undirected는 정규화 방향, directed는 원 방향
+    assert ("AAPL", "MSFT") in rows and ("TSM", "NVDA") in rows
+    assert rows[("TSM", "NVDA")]["props"]["market_score"] == 0.3
+    assert "props" not in rows[("CSCO", "ZM")]
+    assert not RelationConfidence.objects.filter(
+        pk__in=[rc.pk for rc in peers + [supply, hidden]], neo4j_dirty=True
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_failed_chunk_isolates_bad_row():
+    good = make_rc("AAPL", "MSFT")
+    bad = make_rc("BAD", "NVDA")
+    repo = FakeRepo(fail_ticker="BAD")
+
+    with patch.object(neo4j_sync, "get_graph_repository", return_value=repo):
+        synced = neo4j_sync.sync_dirty_relations()
+
+    assert synced == 1
+    good.refresh_from_db()
+    bad.refresh_from_db()
+    assert good.neo4j_dirty is False and good.neo4j_synced_at is not None
+    assert bad.neo4j_dirty is True
+
+
+def test_edge_snapshot_single_query():
+    repo = FakeRepo(
+        rows=[
+            {"i": 0, "rel_type": "SUPPLIES_TO", "truth_score": 0.9,
+             "status": "confirmed", "start_ticker": "TSM"},
+            {"i": 1, "rel_type": None, "truth_score": None,
+             "status": None, "start_ticker": None},
+        ]
+    )
+
+    with patch(
+        "apps.chain_sight.services.path_service.get_graph_repository", return_value=repo
+    ):
+        snapshot = build_edge_snapshot(["NVDA", "TSM", "ASML"])
+
+    assert len(repo.calls) == 1
+    assert repo.calls[0][2]["pairs"] == [
+        {"i": 0, "a": "NVDA", "b": "TSM"},
+        {"i": 1, "a": "TSM", "b": "ASML"},
+    ]
+    assert snapshot == [
+        {"from": "TSM", "to": "NVDA", "type": "SUPPLIES_TO",
+         "truth_score": 0.9, "status": "confirmed"},
+        {"from": "TSM", "to": "ASML", "type": None,
+         "truth_score": None, "status": "hidden"},
+    ]
@@ -0,0 +1,124 @@
+"""
+NewsAggregatorService._save_articles bulk 경로.
+
+- 쿼리 수가 기사 수와 무관 (URL 일괄 조회 + bulk insert/update)
+- 기존 뉴스: 비어 있는 provider ID/감성만 보강, 엔티티 없는 뉴스에만 엔티티 추가
+- 청크 실패 시 기사별 savepoint 경로와 같은 결과
+"""
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from services.news.models import EntityHighlight, NewsArticle, NewsEntity
+from services.news.providers.base import RawNewsArticle
+from services.news.services import aggregator as aggregator_module
+from services.news.services.aggregator import NewsAggregatorService
+
+
+def _article(url, provider_name="finnhub", provider_id="1", entities=None, **kwargs):
+    return RawNewsArticle(
+        url=url,
+        title=kwargs.pop("title", "T"),
+        summary="s",
+        source="Test",
+        published_at=datetime(2026, 6, 19, 12, 0, tzinfo=timezone.utc),
+        provider_name=provider_name,
+        provider_id=provider_id,
+        entities=entities or [],
+        **kwargs,
+    )
+
+
+def _entity(symbol, **extra):
+    return {"symbol": symbol, "entity_name": symbol, "entity_type": "equity",
+            "source": "marketaux", **extra}
+
+
+@pytest.fixture
+def agg(settings):
+    settings.FINNHUB_API_KEY = ""
+    settings.MARKETAUX_API_KEY = ""
+    settings.FMP_API_KEY = ""
+    return NewsAggregatorService()
+
+
+@pytest.mark.django_db
+def test_query_count_independent_of_batch_size(agg):
+    def run(prefix, n):
+        batch = [
+            _article(f"https://q.com/{prefix}/{i}", provider_id=str(i),
+                     entities=[_entity("NVDA"), _entity("AAPL")])
+            for i in range(n)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            assert agg._save_articles(batch) == (n, 0, 0)
+        return len(ctx.captured_queries)
+
+    assert run("small", 2) == run("large", 30)
+    assert NewsEntity.objects.count() == 64
+    article = NewsArticle.objects.get(url="https://q.com/large/7")
+    assert article.finnhub_id == 7
+    assert article.url_hash == NewsArticle.hash_url(article.url)
+
+
+@pytest.mark.django_db
+def test_existing_articles_enriched_and_entities_only_when_missing(agg):
+    agg._save_articles([
+        _article("https://e.com/a", entities=[_entity("AAPL")]),
+        _article("https://e.com/b"),
+    ])
+
+    saved, updated, skipped = agg._save_articles([
+        _article("https://e.com/a", "marketaux", "mx-a", entities=[_entity("MSFT")],
+                 sentiment_score=Decimal("0.400"), sentiment_source="marketaux"),
+        _article("https://e.com/b", "fmp", "fmp-b",
+                 entities=[_entity("TSLA", highlights=[
+                     {"text": "Tesla beats", "sentiment": Decimal("0.5"), "location": "title"},
+                 ])]),
+        _article("https://e.com/c", "fmp", "fmp-c"),
+    ])
+
+    assert (saved, updated, skipped) == (1, 2, 0)
+    a = NewsArticle.objects.get(url="https://e.com/a")
+    assert a.marketaux_uuid == "mx-a"
+    assert a.sentiment_score == Decimal("0.400")
+    assert list(a.entities.values_list("symbol", flat=True)) == ["AAPL"]
+    b = NewsArticle.objects.get(url="https://e.com/b")
+    assert b.fmp_id == "fmp-b"
+    entity = b.entities.get()
+    assert entity.symbol == "TSLA"
+    assert EntityHighlight.objects.get(news_entity=entity).location == "title"
+
+
+@pytest.mark.django_db
+def test_same_url_in_batch_merges_into_one_row(agg):
+    saved, updated, skipped = agg._save_articles([
+        _article("https://d.com/x", "alpha_vantage", "av"),
+        _article("https://d.com/x", "marketaux", "mx", entities=[_entity("NVDA")]),
+        _article("https://d.com/y", "finnhub", "not-a-number"),
+    ])
+
+    assert (saved, updated, skipped) == (1, 1, 1)
+    article = NewsArticle.objects.get(url="https://d.com/x")
+    assert article.marketaux_uuid == "mx"
+    assert list(article.entities.values_list("symbol", flat=True)) == ["NVDA"]
+    assert not NewsArticle.objects.filter(url="https://d.com/y").exists()
+
+
+@pytest.mark.django_db
+def test_failed_chunk_falls_back_per_row(agg, monkeypatch):
+    monkeypatch.setattr(aggregator_module, "BULK_SAVE_CHUNK_SIZE", 2)
+    poison_url = "https://x.com/" + "z" * 2100  # varchar(2000) 초과
+    batch = [
+        _article("https://f.com/a"),
+        _article(poison_url),
+        _article("https://f.com/b", entities=[_entity("AAPL")]),
+    ]
+
+    saved, updated, skipped = agg._save_articles(batch)
+
+    assert (saved, updated, skipped) == (2, 0, 1)
+    assert NewsEntity.objects.get().news.url == "https://f.com/b"
@@ -0,0 +1,151 @@
+"""
+뉴스 제목 MinHash/LSH 중복 제거 테스트
+
+LSH 후보 + 정확 유사도 검증이 전체 쌍 비교와 같은 결과를 내는지, 비교 횟수가
+줄어드는지, cross-batch window가 다른 URL의 유사 제목만 제거하는지 검증합니다.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.core.cache import cache
+
+from services.news.providers.base import RawNewsArticle
+from services.news.services.deduplicator import NewsDeduplicator
+from services.news.services.title_lsh import TitleMinHasher, normalize_title, shingles
+
+pytestmark = pytest.mark.unit
+
+COMPANIES = ["Apple", "Nvidia", "Tesla", "Microsoft", "Amazon", "Meta", "Intel", "AMD"]
+EVENTS = [
+    "Announces Record Quarterly Earnings",
+    "Shares Slide After Guidance Cut",
+    "Unveils New AI Chip Lineup",
+    "Faces Antitrust Probe In Europe",
+    "Raises Dividend By 10 Percent",
+]
+
+
+def make_article(url, title, provider="finnhub"):
+    return RawNewsArticle(
+        url=url,
+        title=title,
+        summary="",
+        source="Source",
+        published_at=datetime(2026, 10, 1, 9, 30),
+        image_url="",
+        language="en",
+        category="company",
+        provider_id=url,
+        provider_name=provider,
+        sentiment_score=None,
+        sentiment_source="none",
+        entities=[],
+        is_press_release=False,
+    )
+
+
+def burst():
+    """Provider 3곳이 같은 이벤트를 약간 다른 제목으로 보도하는 배치"""
+    articles = []
+    for c in COMPANIES:
+        for e in EVENTS:
+            articles.append(make_article(f"https://a.com/{c}/{e}", f"{c} {e}"))
+            articles.append(make_article(f"https://b.com/{c}/{e}", f"{c} {e} - Reuters"))
+            articles.append(make_article(f"https://c.com/{c}/{e}", f"{c.upper()}  {e}"))
+    return articles
+
+
+def brute_force(dedup, articles):
+    unique = []
+    for article in articles:
+        if not any(
+            dedup._calculate_title_similarity(article.title, u.title)
+            >= dedup.title_similarity_threshold
+            for u in unique
+        ):
+            unique.append(article)
+    return unique
+
+
+class TestTitleMinHasher:
+
+    def test_batched_signature_matches_per_title_min(self):
+        hasher = TitleMinHasher(num_bands=4, rows_per_band=2)
+        titles = [normalize_title(t) for t in ["Apple Beats", "ab", "Tesla  Recall"]]
+
+        sigs = hasher.signatures(titles)
+
+        for title, sig in zip(titles, sigs):
+            np.testing.assert_array_equal(sig, hasher.signatures([title])[0])
+        assert shingles("ab") == ["ab"]
+
+    def test_identical_titles_share_all_buckets(self):
+        hasher = TitleMinHasher()
+        keys = hasher.band_keys([normalize_title("Apple  BEATS"), "apple beats"])
+        assert keys[0] == keys[1]
+        assert len(keys[0]) == hasher.num_bands
+
+
+class TestLSHDeduplicate:
+
+    def test_matches_all_pairs_result(self):
+        dedup = NewsDeduplicator(title_similarity_threshold=0.85, cross_batch=False)
+        articles = burst()
+
+        result = dedup._deduplicate_by_title_similarity(articles)
+
+        assert [a.url for a in result] == [a.url for a in brute_force(dedup, articles)]
+        assert len(result) <= len(articles) // 3
+
+    def test_compares_only_candidates(self):
+        dedup = NewsDeduplicator(cross_batch=False)
+        articles = burst()
+
+        with patch.object(
+            dedup, "_calculate_title_similarity", wraps=dedup._calculate_title_similarity
+        ) as similarity:
+            dedup._deduplicate_by_title_similarity(articles)
+
+        # 전체 쌍 비교라면 입력마다 kept 전체와 비교 (수백 회)
+        assert similarity.call_count < len(articles) * 3
+
+
+class TestCrossBatchWindow:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_other_provider_duplicate_removed_refetch_kept(self):
+        first = NewsDeduplicator(cross_batch=True)
+        first.deduplicate([make_article("https://a.com/1", "Apple Announces Record Earnings")])
+
+        second = NewsDeduplicator(cross_batch=True)
+        result = second.deduplicate(
+            [
+                make_article("https://a.com/1", "Apple Announces Record Earnings"),
+                make_article(
+                    "https://m.com/9", "Apple announces record earnings!", "marketaux"
+                ),
+                make_article("https://m.com/10", "Tesla Recalls Model Y", "marketaux"),
+            ]
+        )
+
+        # 같은 URL 재수집은 유지(저장 단계에서 갱신), 다른 URL 유사 제목은 제거
+        assert [a.url for a in result] == ["https://a.com/1", "https://m.com/10"]
+
+    def test_disabled_window_ignores_previous_batches(self):
+        NewsDeduplicator(cross_batch=True).deduplicate(
+            [make_article("https://a.com/1", "Apple Announces Record Earnings")]
+        )
+
+        result = NewsDeduplicator(cross_batch=False).deduplicate(
+            [make_article("https://m.com/9", "Apple announces record earnings!")]
+        )
+
+        assert len(result) == 1
@@ -0,0 +1,213 @@
+"""
+FMP 공용 전송 계층 테스트
+
+토큰 버킷(로컬 fallback), 동일 요청 병합(SingleFlight), pooled FMPClient.fetch_many,
+AsyncFMPClient(httpx.MockTransport), serverless FMPClient.fetch_many를 검증합니다.
+HTTP는 발생하지 않습니다.
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from packages.shared.api_request.providers.fmp import transport
+from packages.shared.api_request.providers.fmp.client import (
+    FMPAuthError,
+    FMPClient,
+)
+from packages.shared.api_request.providers.fmp.transport import (
+    PooledTransport,
+    SingleFlight,
+    TokenBucket,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def fast_bucket():
+    return TokenBucket("test", rate=1000, capacity=1000)
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        bucket = TokenBucket("test", rate=10, capacity=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_redis_error_falls_back_to_local_bucket(self):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        bucket = TokenBucket("test", rate=10, capacity=1)
+        with patch.object(transport, "cache") as cache:
+            cache._cache.get_client.return_value.eval.side_effect = RedisConnectionError()
+            waits = [bucket.reserve() for _ in range(2)]
+
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+
+    def test_rate_from_rate_limits(self):
+        # RATE_LIMITS['fmp'] 분당 240 → 초당 4
+        assert transport.get_token_bucket("fmp").rate == pytest.approx(4.0)
+
+
+class TestSingleFlight:
+    def test_concurrent_same_key_runs_once(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(2)
+            return {"v": 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        while not calls:
+            pass
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.2)  # follower들이 leader Future에 대기할 때까지
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"v": 1}] * 5
+        # 완료 후 key는 비워짐 → 다음 호출은 새로 실행
+        assert flight.do("k", lambda: 2) == 2
+
+    def test_error_raised_and_key_cleared(self):
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        assert flight.do("k", lambda: "ok") == "ok"
+
+
+class _Resp:
+    def __init__(self, status_code=200, data=None):
+        self.status_code = status_code
+        self._data = data
+        self.text = ""
+
+    def json(self):
+        return self._data
+
+
+class TestPooledClient:
+    def test_fetch_many_uses_shared_session(self, fast_bucket):
+        pooled = PooledTransport(fast_bucket, max_concurrency=4)
+        sent = []
+
+        def fake_get(url, params=None, timeout=None):
+            sent.append(dict(params))
+            if params["symbol"] == "BAD":
+                return _Resp(401)
+            return _Resp(data=[{"symbol": params["symbol"]}])
+
+        pooled.session.get = fake_get
+        with patch(
+            "packages.shared.api_request.providers.fmp.client.get_transport",
+            return_value=pooled,
+        ):
+            client = FMPClient(api_key="test-key", pooled=True)
+
+        with patch(
+            "packages.shared.api_request.providers.fmp.client.requests.get"
+        ) as plain_get:
+            results = client.fetch_many(
+                [
+                    ("/stable/quote", {"symbol": "AAPL"}),
+                    ("/stable/quote", {"symbol": "BAD"}),
+                    ("/stable/quote", {"symbol": "BRK.B"}),
+                ]
+            )
+
+        plain_get.assert_not_called()
+        assert results[0] == [{"symbol": "AAPL"}]
+        assert isinstance(results[1], FMPAuthError)
+        # 요청은 hyphen, 응답은 dot 원형으로 복원
+        assert results[2] == [{"symbol": "BRK.B"}]
+        assert {p["symbol"] for p in sent} == {"AAPL", "BAD", "BRK-B"}
+
+    def test_default_mode_is_unpooled(self):
+        client = FMPClient(api_key="test-key")
+        assert client._transport is None
+
+
+class TestAsyncClient:
+    def test_get_many_coalesces_duplicates(self, fast_bucket):
+        from packages.shared.api_request.providers.fmp.async_client import (
+            AsyncFMPClient,
+        )
+
+        seen = []
+
+        async def handler(request):
+            seen.append(request.url.params["symbol"])
+            await asyncio.sleep(0.01)
+            if request.url.params["symbol"] == "NOPE":
+                return httpx.Response(200, json={"Error Message": "Invalid API KEY"})
+            return httpx.Response(200, json=[{"symbol": request.url.params["symbol"]}])
+
+        async def run():
+            with patch(
+                "packages.shared.api_request.providers.fmp.async_client.get_token_bucket",
+                return_value=fast_bucket,
+            ):
+                client = AsyncFMPClient(api_key="test-key", max_concurrency=2)
+            client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.get_many(
+                    [
+                        ("/stable/key-metrics-ttm", {"symbol": "AAPL"}),
+                        ("/stable/key-metrics-ttm", {"symbol": "AAPL"}),
+                        ("/stable/key-metrics-ttm", {"symbol": "BF.B"}),
+                        ("/stable/key-metrics-ttm", {"symbol": "NOPE"}),
+                    ]
+                )
+
+        results = asyncio.run(run())
+
+        assert results[0] == results[1] == [{"symbol": "AAPL"}]
+        assert results[2] == [{"symbol": "BF.B"}]
+        assert isinstance(results[3], FMPAuthError)
+        assert sorted(seen) == ["AAPL", "BF-B", "NOPE"]
+
+
+class TestServerlessFetchMany:
+    def test_ordered_results_with_errors_in_place(self, settings, fast_bucket):
+        from packages.shared.api_request.providers.fmp import serverless_client
+
+        settings.FMP_API_KEY = "test-key"
+        client = serverless_client.FMPClient()
+
+        def fake_request(endpoint, params=None):
+            if params["symbol"] == "BAD":
+                raise serverless_client.FMPAPIError("HTTP 500")
+            return [{"symbol": params["symbol"]}]
+
+        with patch.object(client, "_make_request", side_effect=fake_request), patch(
+            "packages.shared.api_request.providers.fmp.serverless_client.get_token_bucket",
+            return_value=fast_bucket,
+        ):
+            results = client.fetch_many(
+                "/stable/key-metrics-ttm",
+                [{"symbol": s} for s in ("AAPL", "BAD", "MSFT")],
+            )
+
+        assert results[0] == [{"symbol": "AAPL"}]
+        assert isinstance(results[1], serverless_client.FMPAPIError)
+        assert results[2] == [{"symbol": "MSFT"}]
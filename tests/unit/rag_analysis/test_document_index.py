@@ -0,0 +1,212 @@
+"""
+DocumentIndex 단위 테스트
+
+내용 해시당 1회 인코딩, 프로세스 간 재사용(mmap 세그먼트), 내용 변경 재색인과 병합,
+캐시된 용어 통계 BM25가 rank_bm25.BM25Okapi와 같은 점수를 내는지,
+보존 기간/삭제 문서 정리(prune, index_rag_documents beat)를 검증합니다.
+모델은 결정적 가짜 인코더로 대체합니다.
+"""
+
+import hashlib
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from rank_bm25 import BM25Okapi
+
+from services.rag_analysis.services import document_index as di
+from services.news.models import NewsArticle
+from services.rag_analysis.services.bm25_search import BM25SearchService
+from services.rag_analysis.tasks import index_rag_documents
+
+pytestmark = pytest.mark.unit
+
+DOCS = [
+    {"id": 1, "title": "AAPL 실적", "content": "Apple revenue grew 8% in Q4", "symbol": "AAPL"},
+    {"id": 2, "title": "NVDA 가이던스", "content": "Nvidia data center demand", "symbol": "NVDA"},
+    {"id": 3, "title": "MSFT", "content": "Azure growth and revenue 2024", "symbol": "MSFT"},
+]
+
+
+class FakeEncoder:
+    def __init__(self, dim=di.DEFAULT_DIM):
+        self.dim = dim
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.stack([self.vector(t) for t in texts])
+
+    def vector(self, text):
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).normal(size=self.dim)
+
+
+@pytest.fixture
+def encoder():
+    return FakeEncoder()
+
+
+class TestDocumentIndex:
+
+    def test_encodes_each_content_once(self, tmp_path, encoder):
+        index = di.DocumentIndex(tmp_path)
+
+        rows = index.ensure(DOCS, encoder)
+        again = index.ensure(DOCS + [{"id": 4, "content": "Tesla deliveries"}], encoder)
+
+        assert encoder.calls == [[d["content"] for d in DOCS], ["Tesla deliveries"]]
+        assert again[:3] == rows
+        # 다른 워커(새 인스턴스)는 인코딩 없이 mmap으로 읽음
+        other = di.DocumentIndex(tmp_path)
+        assert None not in other.lookup(DOCS)
+        assert isinstance(other._vectors[0], np.memmap)
+
+    def test_vectors_match_direct_cosine(self, tmp_path, encoder):
+        index = di.DocumentIndex(tmp_path)
+        query = encoder.vector("revenue growth")
+
+        rows = index.ensure(DOCS, encoder)
+        sims = index.vectors(rows) @ (query / np.linalg.norm(query))
+
+        direct = np.array([encoder.vector(d["content"]) for d in DOCS])
+        expected = direct @ query / (
+            np.linalg.norm(direct, axis=1) * np.linalg.norm(query)
+        )
+        np.testing.assert_allclose(sims, expected, atol=1e-5)
+
+    def test_changed_content_reindexed_and_compacted(self, tmp_path, encoder):
+        index = di.DocumentIndex(tmp_path)
+        index.ensure(DOCS, encoder)
+        edited = dict(DOCS[0], content="Apple revenue fell")
+
+        with patch.object(di, "MAX_SEGMENTS", 1):
+            rows = index.ensure([edited] + DOCS[1:], encoder)
+
+        assert len(index.segments) == 1
+        assert len(index) == 3  # id=1의 이전 내용은 병합 시 제거
+        assert index.lookup([DOCS[0]]) == [None]
+        assert len(list(tmp_path.glob("seg-*"))) == 1
+        np.testing.assert_allclose(
+            index.vectors(rows[:1])[0],
+            di._normalize(encoder.vector("Apple revenue fell")),
+            atol=1e-6,
+        )
+
+    def test_model_change_ignores_existing_segments(self, tmp_path, encoder):
+        di.DocumentIndex(tmp_path).ensure(DOCS, encoder)
+
+        other = di.DocumentIndex(tmp_path, model_name="another-model")
+
+        assert other.lookup(DOCS) == [None, None, None]
+
+    def test_prune_drops_expired_and_deleted_rows(self, tmp_path, encoder):
+        index = di.DocumentIndex(tmp_path)
+        with patch.object(di.time, "time", return_value=1_000.0):
+            index.ensure(DOCS[:2], encoder)
+        index.ensure(DOCS[2:], encoder)
+
+        assert index.prune(max_age=3600, deleted_keys=["3"]) == 3
+        assert len(index) == 0
+        assert index.prune(max_age=3600) == 0
+
+        index.ensure(DOCS, encoder)
+        assert index.prune(max_age=3600, deleted_keys=["2"]) == 1
+        assert index.lookup(DOCS) == [0, None, 1]
+        assert len(list(tmp_path.glob("seg-*"))) == 1
+        np.testing.assert_allclose(
+            index.vectors([1])[0],
+            di._normalize(encoder.vector(DOCS[2]["content"])),
+            atol=1e-6,
+        )
+
+
+class TestCachedBM25:
+
+    def test_okapi_scorer_matches_rank_bm25(self):
+        corpus = [di.tokenize(di.document_bm25_text(d)) for d in DOCS * 2]
+        freqs = [dict((t, doc.count(t)) for t in set(doc)) for doc in corpus]
+
+        scorer = di.OkapiScorer(freqs, [len(doc) for doc in corpus])
+        query = di.tokenize("revenue 실적 growth")
+
+        np.testing.assert_allclose(
+            scorer.get_scores(query), BM25Okapi(corpus).get_scores(query)
+        )
+
+    def test_search_uses_cached_terms(self, tmp_path, encoder):
+        expected = BM25SearchService().search("revenue growth", DOCS, top_k=3)
+
+        with override_settings(
+            RAG_DOCUMENT_INDEX_ENABLED=True, RAG_DOCUMENT_INDEX_DIR=tmp_path
+        ):
+            di.get_document_index().ensure(DOCS, encoder)
+            service = BM25SearchService()
+            with patch.object(service, "_tokenize", wraps=service._tokenize) as tok:
+                results = service.search("revenue growth", DOCS, top_k=3)
+
+        # 문서는 다시 토큰화하지 않고 쿼리만 토큰화
+        tok.assert_called_once_with("revenue growth")
+        assert isinstance(service._index, di.OkapiScorer)
+        assert [(d["id"], pytest.approx(s)) for d, s in results] == [
+            (d["id"], s) for d, s in expected
+        ]
+
+
+@pytest.mark.django_db
+class TestIndexRagDocumentsTask:
+
+    def _article(self, n, days_ago, **fields):
+        return NewsArticle.objects.create(
+            url=f"https://example.com/news/{n}",
+            title=f"Headline {n}",
+            summary=f"Summary {n}",
+            source="test",
+            published_at=timezone.now() - timedelta(days=days_ago),
+            **fields,
+        )
+
+    def test_disabled_index_skips_without_work(self, django_assert_num_queries):
+        self._article(1, days_ago=1)
+
+        with override_settings(RAG_DOCUMENT_INDEX_ENABLED=False), patch(
+            "services.rag_analysis.services.vector_search.get_vector_search_service"
+        ) as service, django_assert_num_queries(0):
+            result = index_rag_documents()
+
+        assert result["status"] == "skipped"
+        assert result["error"] == "document_index_disabled"
+        service.assert_not_called()
+
+    def test_beat_indexes_recent_news_and_prunes_removed(self, tmp_path, encoder):
+        fresh = self._article(1, days_ago=1)
+        removed = self._article(2, days_ago=2)
+        self._article(3, days_ago=40)  # 보존 기간(30일) 밖
+        self._article(4, days_ago=1, is_archived=True)
+
+        with override_settings(
+            RAG_DOCUMENT_INDEX_ENABLED=True,
+            RAG_DOCUMENT_INDEX_DIR=tmp_path,
+            RAG_DOCUMENT_INDEX_RETENTION_DAYS=30,
+        ), patch(
+            "services.rag_analysis.services.vector_search.get_vector_search_service"
+        ) as service:
+            service.return_value.encode_batch = encoder
+            first = index_rag_documents()
+            removed.delete()
+            second = index_rag_documents()
+            keys = di.get_document_index().keys()
+
+        assert first == {
+            "status": "success", "indexed_count": 2, "pruned_count": 0, "error": None
+        }
+        assert second == {
+            "status": "success", "indexed_count": 0, "pruned_count": 1, "error": None
+        }
+        assert keys == [f"news-{fresh.id}"]
+        # 두 번째 실행은 이미 색인된 뉴스를 다시 인코딩하지 않음
+        assert len(encoder.calls) == 1
+        assert sorted(encoder.calls[0]) == ["Summary 1", "Summary 2"]
@@ -0,0 +1,165 @@
+"""
+EmbeddingRuntime 단위 테스트
+
+모델 레지스트리 공유(semantic cache / vector search), 쿼리 LRU, 비동기 encode 마이크로
+배칭(동시 호출 → forward pass 1회), warm-up 설정 게이트를 검증합니다.
+sentence_transformers 대신 가짜 모델을 레지스트리에 등록합니다.
+"""
+
+import asyncio
+import hashlib
+import threading
+
+import numpy as np
+import pytest
+
+from services.rag_analysis.services import embedding_runtime as er
+
+pytestmark = pytest.mark.unit
+
+
+class FakeModel:
+    def __init__(self, dim=er.DEFAULT_DIM):
+        self.dim = dim
+        self.calls = []
+        self.threads = []
+
+    def encode(self, texts, convert_to_numpy=True, show_progress_bar=False):
+        self.calls.append(texts)
+        self.threads.append(threading.get_ident())
+        if isinstance(texts, str):
+            return self.vector(texts)
+        return np.stack([self.vector(t) for t in texts])
+
+    def vector(self, text):
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).normal(size=self.dim)
+
+
+@pytest.fixture
+def model():
+    er.reset_models()
+    fake = FakeModel()
+    er.register_model(er.DEFAULT_MODEL_NAME, fake)
+    yield fake
+    er.reset_models()
+
+
+class TestModelRegistry:
+
+    def test_factory_called_once_per_name(self):
+        er.reset_models()
+        created = []
+
+        def factory(name):
+            created.append(name)
+            return object()
+
+        first = er.get_model("m", factory=factory)
+        assert er.get_model("m", factory=factory) is first
+        assert er.get_model("m", kind=er.CROSS_ENCODER, factory=factory) is not first
+        assert created == ["m", "m"]
+        er.reset_models()
+
+    def test_services_share_one_instance(self, model):
+        from services.rag_analysis.services.semantic_cache import SemanticCacheService
+        from services.rag_analysis.services.vector_search import VectorSearchService
+
+        VectorSearchService._instance = VectorSearchService._model = None
+        SemanticCacheService._encoder = None
+        try:
+            assert VectorSearchService().model is model
+            assert SemanticCacheService().encoder is model
+        finally:
+            VectorSearchService._instance = VectorSearchService._model = None
+            SemanticCacheService._encoder = None
+
+
+class TestQueryCache:
+
+    def test_repeated_query_encoded_once(self, model):
+        runtime = er.EmbeddingRuntime(cache_size=2)
+
+        first = runtime.encode("AAPL 실적")
+        second = runtime.encode("AAPL 실적")
+
+        assert first is second
+        assert model.calls == ["AAPL 실적"]
+        assert not first.flags.writeable
+        np.testing.assert_allclose(first, model.vector("AAPL 실적"))
+
+    def test_least_recent_evicted(self, model):
+        runtime = er.EmbeddingRuntime(cache_size=2)
+
+        runtime.encode("a")
+        runtime.encode("b")
+        runtime.encode("a")  # a가 최근 → b가 밀려남
+        runtime.encode("c")
+        runtime.encode("a")
+        runtime.encode("b")
+
+        assert model.calls == ["a", "b", "c", "b"]
+        assert runtime.cache_info() == {"size": 2, "max_size": 2}
+
+
+class TestMicroBatching:
+
+    def test_concurrent_calls_single_forward_pass(self, model):
+        runtime = er.EmbeddingRuntime(batch_window_ms=20)
+        runtime.encode("cached")
+        texts = ["NVDA", "TSLA", "NVDA", "cached", "MSFT"]
+
+        async def run():
+            return await asyncio.gather(*(runtime.aencode(t) for t in texts))
+
+        results = asyncio.run(run())
+
+        assert model.calls == ["cached", ["NVDA", "TSLA", "MSFT"]]
+        assert model.threads[1] != threading.get_ident()
+        for text, vector in zip(texts, results):
+            np.testing.assert_allclose(vector, model.vector(text))
+
+    def test_max_batch_size_flushes_early(self, model):
+        runtime = er.EmbeddingRuntime(batch_window_ms=10_000, max_batch_size=2)
+
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(runtime.aencode("a"), runtime.aencode("b")), timeout=5
+            )
+
+        asyncio.run(run())
+
+        assert model.calls == [["a", "b"]]
+
+    def test_error_propagates_to_all_waiters(self, model):
+        runtime = er.EmbeddingRuntime(batch_window_ms=1)
+        model.encode = lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("oom"))
+
+        async def run():
+            return await asyncio.gather(
+                runtime.aencode("a"), runtime.aencode("b"), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert runtime.cache_info()["size"] == 0
+
+
+class TestWarmUp:
+
+    def test_celery_hook_respects_setting(self, settings, model):
+        from config.celery import warm_up_embedding_models
+
+        settings.RAG_EMBEDDING_WARMUP = False
+        warm_up_embedding_models()
+        assert model.calls == []
+
+        settings.RAG_EMBEDDING_WARMUP = True
+        er.register_model(
+            er.DEFAULT_CROSS_ENCODER_NAME,
+            type("Cross", (), {"predict": lambda self, pairs: [0.0]})(),
+            kind=er.CROSS_ENCODER,
+        )
+        warm_up_embedding_models()
+        assert model.calls == [["warm up"]]
@@ -139,3 +139,112 @@ class TestMatchFuzzy:
         matcher._loaded = True
         ticker, score = matcher._match_fuzzy('zzz completely different xyz', threshold=80)
         assert ticker is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: 공유 이름 인덱스 / 배치 매칭
+# ---------------------------------------------------------------------------
+
+@pytest.mark.django_db
+class TestSharedIndexAndBatch:
+    def test_index_shared_and_invalidated_on_stock_change(self):
+        from packages.shared.stocks.models import Stock
+        from services.sec_pipeline import ticker_matcher as tm
+
+        stock = Stock.objects.create(symbol='AAPL', stock_name='Apple Inc.')
+        first = tm.get_stock_name_index()
+        assert tm.get_stock_name_index() is first
+
+        # 시세만 갱신한 save는 인덱스 유지
+        stock.save()
+        assert tm.get_stock_name_index() is first
+
+        stock.stock_name = 'Apple Computer Inc.'
+        stock.save()
+        rebuilt = tm.get_stock_name_index()
+        assert rebuilt is not first
+        assert rebuilt.stock_map['apple computer'] == 'AAPL'
+
+    def test_unchanged_name_save_keeps_version_without_local_index(self):
+        """인덱스를 아직 만들지 않은 프로세스(시세 동기화 워커)에서도 이름이 같으면 버전 유지."""
+        from django.core.cache import cache
+
+        from packages.shared.stocks.models import Stock
+        from services.sec_pipeline import ticker_matcher as tm
+
+        Stock.objects.create(symbol='AAPL', stock_name='Apple Inc.')
+        tm._shared_index["index"] = None
+        version = cache.get(tm.INDEX_VERSION_CACHE_KEY, 0)
+
+        Stock.objects.get(symbol='AAPL').save()
+        Stock.objects.update_or_create(symbol='AAPL', defaults={'stock_name': 'Apple Inc.'})
+        assert cache.get(tm.INDEX_VERSION_CACHE_KEY, 0) == version
+
+        Stock.objects.update_or_create(symbol='AAPL', defaults={'stock_name': 'Apple Corp.'})
+        assert cache.get(tm.INDEX_VERSION_CACHE_KEY, 0) != version
+
+    def test_fuzzy_candidates_without_stock_queries(self, django_assert_num_queries):
+        from packages.shared.stocks.models import Stock
+
+        Stock.objects.create(symbol='AAPL', stock_name='Apple Inc.')
+        Stock.objects.create(symbol='APLE', stock_name='Apple Hospitality Co')
+        Stock.objects.create(symbol='MSFT', stock_name='Microsoft Corporation')
+        matcher = TickerMatcher()
+        matcher._ensure_loaded()
+
+        with django_assert_num_queries(0):
+            candidates = matcher._get_fuzzy_candidates('Apple Inc', top_k=5)
+
+        assert [c['ticker'] for c in candidates] == ['AAPL', 'APLE']
+        assert candidates[0] == {'ticker': 'AAPL', 'name': 'Apple Inc.', 'score': 0.95}
+
+    def test_match_many_equals_single_match(self):
+        from packages.shared.stocks.models import Stock
+        from services.sec_pipeline.models import CompanyAlias
+
+        Stock.objects.create(symbol='NVDA', stock_name='NVIDIA Corporation')
+        Stock.objects.create(symbol='AAPL', stock_name='Apple Inc.')
+        Stock.objects.create(symbol='TSM', stock_name='Taiwan Semiconductor Manufacturing')
+        CompanyAlias.objects.create(alias='TSMC', ticker='TSM', context_sector='')
+        names = [
+            'TSMC', 'Apple Inc.', 'Nvidia Corp', 'Nvida Corporation',
+            'KPMG', 'Unknown Widget Maker', 'A', '', 'apple inc.',
+        ]
+
+        batch = TickerMatcher().match_many(names, context_sector='Technology')
+
+        assert batch == [TickerMatcher().match(name, 'Technology') for name in names]
+        assert batch[3] == ('NVDA', 'fuzzy')
+        assert batch[4] == (None, 'blocked')
+
+    def test_match_evidences_updates_and_enqueues(self):
+        from datetime import date
+
+        from packages.shared.stocks.models import Stock
+        from services.sec_pipeline.models import (
+            RawDocumentStore,
+            SupplyChainEvidence,
+            UnmatchedCompanyQueue,
+        )
+
+        source = Stock.objects.create(symbol='AAPL', stock_name='Apple Inc.', sector='Technology')
+        target = Stock.objects.create(symbol='TSM', stock_name='Taiwan Semiconductor')
+        doc = RawDocumentStore.objects.create(
+            symbol=source, accession_no='acc-match-many', filing_date=date(2024, 11, 1),
+            fiscal_year=2024, final_link='https://sec.gov/t',
+        )
+        evidences = [
+            SupplyChainEvidence.objects.create(
+                source_document=doc, source_company=source, target_company_name=name,
+                relationship_type='SUPPLIES_TO', evidence_text='text', system_confidence=0.8,
+            )
+            for name in ('Taiwan Semiconductor', 'Foxconn Widgets')
+        ]
+
+        results = TickerMatcher().match_evidences(evidences, doc, 'aapl')
+
+        assert results == [('TSM', 'exact'), (None, None)]
+        evidences[0].refresh_from_db()
+        assert evidences[0].target_company == target and evidences[0].neo4j_dirty is True
+        entry = UnmatchedCompanyQueue.objects.get(raw_company_name='Foxconn Widgets')
+        assert entry.source_symbol == 'AAPL' and entry.source_sectors == ['Technology']
@@ -0,0 +1,151 @@
+"""
+BakeWriter 단위 테스트
+
+내용 해시 기반 skip-unchanged(hardlink), 사전 압축, 스레드 풀 분산,
+직렬화 호환성(json.dump default=str)과 EODJSONBaker 카드 정렬 보존을 검증합니다.
+"""
+
+import gzip
+import json
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from packages.shared.stocks.services.eod_bake_writer import (
+    MANIFEST_NAME,
+    BakeWriter,
+    dumps,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _bake(root, prev, payloads, **kwargs):
+    writer = BakeWriter(root, prev, **kwargs)
+    writer.write_many([(root / rel, data) for rel, data in payloads.items()])
+    return writer, writer.finalize()
+
+
+class TestBakeWriter:
+
+    def test_dumps_matches_stdlib_semantics(self):
+        data = {
+            "price": np.float64(1.5),
+            "amount": Decimal("2.50"),
+            "date": date(2026, 2, 25),
+            "name": "애플",
+        }
+
+        assert json.loads(dumps(data)) == json.loads(
+            json.dumps(data, ensure_ascii=False, default=str)
+        )
+        # numpy 정수는 문자열이 아닌 숫자로
+        assert json.loads(dumps({"volume": np.int64(7)})) == {"volume": 7}
+
+    def test_unchanged_files_are_hardlinked(self, tmp_path):
+        first, second = tmp_path / "v1", tmp_path / "v2"
+        _bake(first, None, {"stocks/AAPL.json": {"c": 1}, "stocks/NVDA.json": {"c": 2}})
+
+        _, stats = _bake(
+            second,
+            first,
+            {"stocks/AAPL.json": {"c": 1}, "stocks/NVDA.json": {"c": 3}},
+        )
+
+        assert stats == {"written": 1, "reused": 1}
+        aapl_old, aapl_new = first / "stocks/AAPL.json", second / "stocks/AAPL.json"
+        assert aapl_new.stat().st_ino == aapl_old.stat().st_ino
+        assert (second / "stocks/NVDA.json").stat().st_ino != (
+            first / "stocks/NVDA.json"
+        ).stat().st_ino
+        assert json.loads((second / "stocks/NVDA.json").read_bytes()) == {"c": 3}
+        manifest = json.loads((second / MANIFEST_NAME).read_text())
+        assert set(manifest) == {"stocks/AAPL.json", "stocks/NVDA.json"}
+
+    def test_precompressed_siblings(self, tmp_path):
+        first, second = tmp_path / "v1", tmp_path / "v2"
+        _bake(first, None, {"meta.json": {"a": 1}}, precompress=False)
+
+        # 직전 bake에 압축본이 없어도 재사용 시 새로 생성
+        _bake(second, first, {"meta.json": {"a": 1}}, precompress=True)
+
+        body = (second / "meta.json").read_bytes()
+        assert gzip.decompress((second / "meta.json.gz").read_bytes()) == body
+        assert not (first / "meta.json.gz").exists()
+
+    def test_thread_pool_fan_out(self, tmp_path):
+        payloads = {f"stocks/S{i}.json": {"i": i} for i in range(10)}
+
+        with patch(
+            "packages.shared.stocks.services.eod_bake_writer.PARALLEL_MIN_FILES", 4
+        ):
+            writer, stats = _bake(tmp_path / "v1", None, payloads, workers=2)
+
+        assert stats == {"written": 10, "reused": 0}
+        assert len(writer.digests) == 10
+        for rel, data in payloads.items():
+            assert json.loads((tmp_path / "v1" / rel).read_bytes()) == data
+
+    def test_daemonic_process_still_fans_out(self, tmp_path, monkeypatch):
+        """Celery prefork 워커(데몬)에서도 스레드 풀은 기동 가능 → 병렬 유지."""
+        payloads = {f"stocks/S{i}.json": {"i": i} for i in range(10)}
+        monkeypatch.setitem(multiprocessing.current_process()._config, "daemon", True)
+
+        with patch(
+            "packages.shared.stocks.services.eod_bake_writer.PARALLEL_MIN_FILES", 4
+        ), patch(
+            "packages.shared.stocks.services.eod_bake_writer.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            writer, stats = _bake(tmp_path / "v1", None, payloads, workers=4)
+
+        executor.assert_called_once_with(max_workers=4)
+        assert stats == {"written": 10, "reused": 0}
+        for rel, data in payloads.items():
+            assert json.loads((tmp_path / "v1" / rel).read_bytes()) == data
+
+
+@pytest.mark.django_db
+def test_card_json_orderings_preserved(tmp_path, stock_aapl, stock_nvda):
+    from packages.shared.stocks.services.eod_json_baker import EODJSONBaker
+
+    baker = EODJSONBaker()
+    baker.TMP_DIR = tmp_path / "tmp"
+    baker.OUTPUT_DIR = tmp_path / "out"
+    signals = [
+        {
+            "stock_id": "AAPL",
+            "volume": 10,
+            "change_pct": -5.0,
+            "market_cap": 3,
+            "signals": [{"id": "V1", "value": 0.2}],
+        },
+        {
+            "stock_id": "NVDA",
+            "volume": 20,
+            "change_pct": 1.0,
+            "market_cap": None,
+            "signals": [{"id": "V1", "value": -0.9}],
+        },
+    ]
+
+    assert baker._build_card_jsons(signals, {}) == 1
+
+    card = json.loads((baker.TMP_DIR / "cards" / "V1.json").read_bytes())
+    order = {
+        k: [s["symbol"] for s in v]
+        for k, v in card.items()
+        if k.startswith("stocks_by")
+    }
+    assert order == {
+        "stocks_by_score": ["NVDA", "AAPL"],
+        "stocks_by_volume": ["NVDA", "AAPL"],
+        "stocks_by_return": ["AAPL", "NVDA"],
+        "stocks_by_market_cap": ["AAPL", "NVDA"],
+    }
+    assert card["stocks_by_score"][0]["company_name"] == "NVIDIA Corporation"
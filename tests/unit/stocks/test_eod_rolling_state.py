@@ -0,0 +1,203 @@
+"""
+EODRollingStateEngine 단위 테스트
+
+증분 롤링 상태(EODRollingState)가 기존 pandas 전체 경로(_calculate_indicators)와
+같은 지표를 내는지, 전진/재구축/불일치 감지가 올바른지 검증합니다.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _make_bars(stock, dates, base, seed):
+    from packages.shared.stocks.models import DailyPrice
+
+    rng = np.random.default_rng(seed)
+    prices = base + np.cumsum(rng.normal(0, 1.5, len(dates)))
+    return [
+        DailyPrice(
+            stock=stock,
+            date=d,
+            open_price=Decimal(str(round(max(p, 10.0) * 0.99, 4))),
+            high_price=Decimal(str(round(max(p, 10.0) * 1.02, 4))),
+            low_price=Decimal(str(round(max(p, 10.0) * 0.97, 4))),
+            close_price=Decimal(str(round(max(p, 10.0), 4))),
+            volume=int(rng.uniform(5_000_000, 100_000_000)),
+        )
+        for d, p in zip(dates, prices)
+    ]
+
+
+@pytest.fixture
+def trading_dates(target_date):
+    """target_date 포함 270거래일 + 다음 거래일"""
+    dates = [d.date() for d in pd.bdate_range(end=target_date, periods=270)]
+    return dates, target_date + timedelta(days=1)
+
+
+@pytest.fixture
+def daily_prices_270d(db, sp500_constituents, trading_dates):
+    """AAPL/NVDA/SPY x 270거래일 DailyPrice (SMA200·52주 최고가 충족)"""
+    from packages.shared.stocks.models import DailyPrice, Stock
+
+    dates, _ = trading_dates
+    bars = []
+    for seed, (symbol, base) in enumerate(
+        [("AAPL", 180.0), ("NVDA", 140.0), ("SPY", 500.0)]
+    ):
+        bars += _make_bars(Stock.objects.get(symbol=symbol), dates, base, seed)
+    DailyPrice.objects.bulk_create(bars)
+    return bars
+
+
+def _add_next_day(next_date, closes):
+    from packages.shared.stocks.models import DailyPrice, Stock
+
+    DailyPrice.objects.bulk_create(
+        [
+            DailyPrice(
+                stock=Stock.objects.get(symbol=symbol),
+                date=next_date,
+                open_price=Decimal(str(close * 0.99)),
+                high_price=Decimal(str(close * 1.05)),
+                low_price=Decimal(str(close * 0.98)),
+                close_price=Decimal(str(close)),
+                volume=50_000_000,
+            )
+            for symbol, close in closes.items()
+        ]
+    )
+
+
+class TestEODRollingStateEngine:
+
+    @pytest.mark.django_db
+    def test_cold_start_rebuilds_and_matches_full_path(
+        self, calculator, daily_prices_270d, target_date
+    ):
+        from packages.shared.stocks.models import EODRollingState
+        from packages.shared.stocks.services.eod_rolling_state import (
+            EODRollingStateEngine,
+            verify_equivalence,
+        )
+
+        df, stats = EODRollingStateEngine().compute(
+            ["AAPL", "NVDA", "SPY"], target_date
+        )
+
+        assert stats["rebuilt"] == 3
+        assert stats["incremental"] == 0
+        assert len(df) == 3
+        assert EODRollingState.objects.filter(as_of=target_date).count() == 3
+        assert df["sma_200"].notna().all()
+        assert df["high_52w"].notna().all()
+
+        report = verify_equivalence(calculator, target_date)
+        assert report["symbols"] == 3
+        assert report["missing"] == []
+        assert report["mismatches"] == {}
+
+    @pytest.mark.django_db
+    def test_advance_one_bar_is_incremental_and_equivalent(
+        self, calculator, daily_prices_270d, trading_dates, target_date
+    ):
+        from packages.shared.stocks.models import EODRollingState
+        from packages.shared.stocks.services.eod_rolling_state import (
+            EODRollingStateEngine,
+            verify_equivalence,
+        )
+
+        _, next_date = trading_dates
+        engine = EODRollingStateEngine()
+        engine.compute(["AAPL", "NVDA", "SPY"], target_date)
+        _add_next_day(next_date, {"AAPL": 250.0, "NVDA": 90.0, "SPY": 510.0})
+
+        df, stats = engine.compute(["AAPL", "NVDA", "SPY"], next_date)
+
+        assert stats == {"incremental": 3, "rebuilt": 0, "stale": 0, "persisted": 3}
+        assert set(df["date"]) == {next_date}
+        state = EODRollingState.objects.get(stock_id="AAPL")
+        assert state.as_of == next_date
+        assert len(state.buffers["close"]) == 252
+
+        report = verify_equivalence(calculator, next_date)
+        assert report["mismatches"] == {}
+
+    @pytest.mark.django_db
+    def test_corrected_as_of_close_triggers_rebuild(
+        self, daily_prices_270d, target_date
+    ):
+        from packages.shared.stocks.models import DailyPrice
+        from packages.shared.stocks.services.eod_rolling_state import (
+            EODRollingStateEngine,
+        )
+
+        engine = EODRollingStateEngine()
+        engine.compute(["AAPL", "NVDA", "SPY"], target_date)
+        # 분할 소급 조정 등으로 as_of 종가가 바뀐 경우
+        DailyPrice.objects.filter(stock_id="AAPL", date=target_date).update(
+            close_price=Decimal("1.2345")
+        )
+
+        df, stats = engine.compute(["AAPL", "NVDA", "SPY"], target_date)
+
+        assert stats["stale"] == 1
+        assert stats["rebuilt"] == 1
+        assert df.set_index("symbol").loc["AAPL", "close"] == pytest.approx(1.2345)
+
+    @pytest.mark.django_db
+    def test_past_date_rebuilds_without_regressing_state(
+        self, calculator, daily_prices_270d, trading_dates, target_date
+    ):
+        from packages.shared.stocks.models import EODRollingState
+        from packages.shared.stocks.services.eod_rolling_state import (
+            EODRollingStateEngine,
+            verify_equivalence,
+        )
+
+        dates, _ = trading_dates
+        past = dates[-5]
+        engine = EODRollingStateEngine()
+        engine.compute(["AAPL", "NVDA", "SPY"], target_date)
+
+        df, stats = engine.compute(["AAPL", "NVDA", "SPY"], past)
+
+        assert stats["rebuilt"] == 3
+        assert set(df["date"]) == {past}
+        assert set(
+            EODRollingState.objects.values_list("as_of", flat=True)
+        ) == {target_date}
+        assert verify_equivalence(calculator, past)["mismatches"] == {}
+
+
+class TestCalculateBatchRollingState:
+
+    @pytest.mark.django_db
+    def test_rolling_state_signals_match_full_path(
+        self, calculator, daily_prices_270d, target_date
+    ):
+        with patch.object(calculator, "_get_vix_regime", return_value="normal"):
+            full = calculator.calculate_batch(target_date)
+            rolling = calculator.calculate_batch(target_date, use_rolling_state=True)
+
+        full = full.set_index("symbol").sort_index()
+        rolling = rolling.set_index("symbol").sort_index()
+        sig_cols = [
+            c for c in full.columns if c.startswith("sig_") and c.count("_") == 1
+        ]
+
+        assert list(rolling.index) == list(full.index)
+        assert sig_cols
+        pd.testing.assert_frame_equal(
+            rolling[sig_cols].astype(bool), full[sig_cols].astype(bool)
+        )
+        np.testing.assert_allclose(
+            rolling["change_pct"], full["change_pct"], rtol=1e-9
+        )
@@ -0,0 +1,168 @@
+"""
+기술적 지표 스냅샷 + 시계열 캐시 (views_indicators)
+
+- IndicatorComparisonView: 스냅샷 결과 = 기존 종목별 50일 재계산, 조회 1회
+- 스냅샷 없는 종목은 요청 시점 계산 후 저장
+- TechnicalIndicatorView: 캐시 배열에 신규 봉 덧붙임, 결과 = 전체 재계산
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from packages.shared.stocks.indicators import IndicatorSignals, TechnicalIndicators
+from packages.shared.stocks.models import DailyPrice, IndicatorSnapshot, Stock
+from packages.shared.stocks.services.indicator_snapshot import (
+    compute_indicator_series,
+    refresh_indicator_snapshots,
+)
+from packages.shared.stocks.views_indicators import (
+    IndicatorComparisonView,
+    TechnicalIndicatorView,
+)
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(username="indicator-user", password="pw")
+
+
+def _seed(symbol, days, seed):
+    Stock.objects.create(symbol=symbol, stock_name=f"{symbol} Inc.")
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 2, days))
+    today = date.today()
+    for i, c in enumerate(closes):
+        price = Decimal(str(round(float(c), 2)))
+        DailyPrice.objects.create(
+            stock_id=symbol, date=today - timedelta(days=days - 1 - i),
+            open_price=price, high_price=price + 1, low_price=price - 1,
+            close_price=price, volume=1000 + i,
+        )
+
+
+def _reference_comparison(symbol):
+    """기존 IndicatorComparisonView 종목별 계산 (최근 50일 종가)."""
+    prices = DailyPrice.objects.filter(stock_id=symbol).order_by("-date")[:50]
+    closes = list(reversed([float(p.close_price) for p in prices]))
+    out = {}
+    rsi = TechnicalIndicators.calculate_rsi(closes)
+    if rsi[-1] is not None:
+        out["rsi"] = rsi[-1]
+        out["rsi_signal"] = IndicatorSignals.get_rsi_signal(rsi[-1])
+    macd = TechnicalIndicators.calculate_macd(closes)
+    if macd["macd"][-1] is not None:
+        out["macd"] = macd["macd"][-1]
+        out["macd_signal_value"] = macd["signal"][-1] or 0
+        out["macd_histogram"] = macd["histogram"][-1] or 0
+    bb = TechnicalIndicators.calculate_bollinger_bands(closes)
+    if bb["percent_b"][-1] is not None:
+        out["bb_percent_b"] = bb["percent_b"][-1]
+        out["bb_bandwidth"] = bb["bandwidth"][-1] or 0
+    return closes[-1], out
+
+
+def _compare(user, symbols):
+    request = factory.post(
+        "/api/v1/stocks/api/indicators/compare/",
+        {"symbols": symbols, "indicators": ["rsi", "macd", "bollinger"]},
+        format="json",
+    )
+    force_authenticate(request, user=user)
+    return IndicatorComparisonView.as_view()(request)
+
+
+def _series(user, symbol, indicators="all", period="90d"):
+    request = factory.get(
+        f"/api/v1/stocks/api/indicators/{symbol}/",
+        {"period": period, "indicators": indicators},
+    )
+    force_authenticate(request, user=user)
+    return TechnicalIndicatorView.as_view()(request, symbol=symbol)
+
+
+@pytest.mark.django_db
+class TestIndicatorComparison:
+    def test_snapshot_matches_per_symbol_computation(self, user):
+        _seed("AAPL", 80, 1)
+        _seed("MSFT", 40, 2)  # 50일 미만 — MACD signal 미정의
+        _seed("NVDA", 12, 3)  # RSI 미정의
+        assert refresh_indicator_snapshots()["symbols"] == 3
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = _compare(user, ["aapl", "MSFT", "NVDA", "ZZZZ"])
+
+        assert response.status_code == 200
+        # 스냅샷 1회 + 스냅샷 없는 ZZZZ 계산 시도 1회 (종목 수와 무관)
+        assert len(ctx.captured_queries) == 2
+        stocks = response.data["stocks"]
+        assert [s["symbol"] for s in stocks] == ["AAPL", "MSFT", "NVDA"]
+        for entry in stocks:
+            close, expected = _reference_comparison(entry["symbol"])
+            assert entry["current_price"] == close
+            assert entry["indicators"] == expected
+
+    def test_missing_snapshot_computed_on_demand(self, user):
+        _seed("AAPL", 60, 4)
+
+        response = _compare(user, ["AAPL"])
+
+        snapshot = IndicatorSnapshot.objects.get(stock_id="AAPL")
+        assert snapshot.as_of == date.today()
+        assert response.data["stocks"][0]["indicators"] == _reference_comparison("AAPL")[1]
+
+
+@pytest.mark.django_db
+class TestTechnicalIndicatorSeries:
+    def _expected(self, symbol, period_days):
+        start = date.today() - timedelta(days=period_days)
+        prices = list(DailyPrice.objects.filter(stock_id=symbol, date__gte=start).order_by("date"))
+        close = [float(p.close_price) for p in prices]
+        return prices, compute_indicator_series(
+            close,
+            [float(p.high_price) for p in prices],
+            [float(p.low_price) for p in prices],
+            [float(p.volume) for p in prices],
+        )
+
+    def test_subset_matches_full_computation(self, user):
+        _seed("AAPL", 150, 5)
+
+        data = _series(user, "AAPL", indicators="rsi,bollinger").data
+
+        prices, expected = self._expected("AAPL", 90)
+        assert data["dates"] == [p.date.isoformat() for p in prices]
+        assert data["indicators"] == {
+            k: v for k, v in expected.items() if k.startswith(("rsi", "bb_"))
+        }
+        close = [float(p.close_price) for p in prices]
+        assert data["indicators"]["rsi"] == TechnicalIndicators.calculate_rsi(close)
+
+    def test_new_bar_appended_to_cached_arrays(self, user):
+        _seed("AAPL", 150, 6)
+        _series(user, "AAPL")
+        DailyPrice.objects.filter(stock_id="AAPL", date=date.today()).delete()
+        cache.clear()
+        _series(user, "AAPL")  # 캐시 = 어제까지
+
+        last = DailyPrice.objects.create(
+            stock_id="AAPL", date=date.today(), open_price=Decimal("90"),
+            high_price=Decimal("95"), low_price=Decimal("85"),
+            close_price=Decimal("91.5"), volume=5000,
+        )
+        cache.delete("indicators_AAPL_90d_all")  # 응답 캐시(5분)만 비움
+        with CaptureQueriesContext(connection) as ctx:
+            data = _series(user, "AAPL").data
+
+        assert data["dates"][-1] == last.date.isoformat()
+        _, expected = self._expected("AAPL", 90)
+        assert data["indicators"] == expected
+        price_queries = [q["sql"] for q in ctx.captured_queries if "stocks_daily_price" in q["sql"]]
+        assert len(price_queries) == 1 and '"date" >=' in price_queries[0]
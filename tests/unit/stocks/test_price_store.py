@@ -0,0 +1,233 @@
+"""
+PriceHistoryStore 단위 테스트
+
+컬럼형 캐시가 DailyPrice와 같은 값을 내는지, 증분 갱신(재동기화 창·신규 종목·
+분할 재적재)이 올바른지, 소비자(Calculator / JSONBaker)가 ORM 경로와 같은
+결과를 내는지 검증합니다.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from django.test import override_settings
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def store_settings(tmp_path):
+    """저장소 활성화 + 임시 디렉토리 + 프로세스 캐시 초기화"""
+    from packages.shared.stocks.services import price_store
+
+    price_store._store = None
+    price_store._store_mtime = None
+    with override_settings(PRICE_STORE_ENABLED=True, PRICE_STORE_DIR=tmp_path):
+        yield tmp_path
+    price_store._store = None
+    price_store._store_mtime = None
+
+
+@pytest.fixture
+def price_rows(db, sp500_constituents, target_date):
+    """AAPL/NVDA/SPY x 30거래일 DailyPrice (NVDA는 중간 5일 결측)"""
+    from packages.shared.stocks.models import DailyPrice, Stock
+
+    dates = [d.date() for d in pd.bdate_range(end=target_date, periods=30)]
+    rng = np.random.default_rng(7)
+    bars = []
+    for symbol, base in [("AAPL", 180.0), ("NVDA", 140.0), ("SPY", 500.0)]:
+        stock = Stock.objects.get(symbol=symbol)
+        for i, d in enumerate(dates):
+            if symbol == "NVDA" and 10 <= i < 15:
+                continue
+            close = round(base + rng.normal(0, 2), 4)
+            bars.append(
+                DailyPrice(
+                    stock=stock,
+                    date=d,
+                    open_price=Decimal(str(round(close * 0.99, 4))),
+                    high_price=Decimal(str(round(close * 1.02, 4))),
+                    low_price=Decimal(str(round(close * 0.97, 4))),
+                    close_price=Decimal(str(close)),
+                    volume=int(rng.uniform(1_000_000, 50_000_000)),
+                )
+            )
+    DailyPrice.objects.bulk_create(bars)
+    return dates
+
+
+def _orm_frame(symbols, start, end):
+    from packages.shared.stocks.models import DailyPrice
+
+    rows = DailyPrice.objects.filter(
+        stock_id__in=symbols, date__gte=start, date__lte=end
+    ).values_list(
+        "stock_id", "date", "open_price", "high_price", "low_price",
+        "close_price", "volume",
+    )
+    df = pd.DataFrame(
+        list(rows),
+        columns=["symbol", "date", "open", "high", "low", "close", "volume"],
+    )
+    for col in ["open", "high", "low", "close", "volume"]:
+        df[col] = df[col].astype(float)
+    return df.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+
+def _store_frame(store, symbols, start, end):
+    df = store.read(symbols, start, end).to_frame()
+    return df.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+
+class TestPriceHistoryStore:
+
+    @pytest.mark.django_db
+    def test_full_build_matches_daily_price(self, store_settings, price_rows):
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        store = PriceHistoryStore()
+        result = store.refresh()
+
+        assert result["mode"] == "full"
+        assert result["symbols"] == 3
+        assert result["dates"] == 30
+        assert store.last_date == price_rows[-1]
+
+        symbols = ["AAPL", "NVDA", "SPY"]
+        pd.testing.assert_frame_equal(
+            _store_frame(store, symbols, price_rows[0], price_rows[-1]),
+            _orm_frame(symbols, price_rows[0], price_rows[-1]),
+        )
+
+    @pytest.mark.django_db
+    def test_read_aligns_unknown_symbols_and_gaps(self, store_settings, price_rows):
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        store = PriceHistoryStore()
+        store.refresh()
+
+        m = store.read(["nvda", "ZZZZ"], price_rows[5], price_rows[20], fields=("volume",))
+
+        assert m.symbols == ["NVDA", "ZZZZ"]
+        assert m["close"].shape == (2, 16)
+        assert not m.valid[1].any()
+        assert m.valid[0].sum() == 11
+        assert (m["volume"][0][~m.valid[0]] == 0).all()
+
+    @pytest.mark.django_db
+    def test_incremental_refresh_picks_up_new_and_corrected_rows(
+        self, store_settings, price_rows
+    ):
+        from packages.shared.stocks.models import DailyPrice, Stock
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        store = PriceHistoryStore()
+        store.refresh()
+
+        next_date = price_rows[-1] + timedelta(days=3)
+        DailyPrice.objects.create(
+            stock=Stock.objects.get(symbol="AAPL"),
+            date=next_date,
+            open_price=Decimal("200"),
+            high_price=Decimal("205"),
+            low_price=Decimal("198"),
+            close_price=Decimal("203.5"),
+            volume=1234,
+        )
+        # 재동기화 창 안의 정정
+        DailyPrice.objects.filter(stock_id="SPY", date=price_rows[-2]).update(
+            close_price=Decimal("999.25")
+        )
+
+        result = store.refresh()
+
+        assert result["mode"] == "incremental"
+        assert result["reloaded_symbols"] == 0
+        assert store.last_date == next_date
+        symbols = ["AAPL", "NVDA", "SPY"]
+        pd.testing.assert_frame_equal(
+            _store_frame(store, symbols, None, None),
+            _orm_frame(symbols, date.min, date.max),
+        )
+        # 이전 버전 1개만 보존
+        assert len([p for p in store_settings.glob("v*") if p.is_dir()]) == 2
+
+    @pytest.mark.django_db
+    def test_split_reloads_full_history_of_symbol(self, store_settings, price_rows):
+        from packages.shared.stocks.models import DailyPrice, StockSplit
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        store = PriceHistoryStore()
+        store.refresh()
+
+        # 분할 소급 조정: 재동기화 창 밖 과거 이력까지 바뀜
+        for bar in DailyPrice.objects.filter(stock_id="NVDA"):
+            bar.close_price = bar.close_price / 10
+            bar.save(update_fields=["close_price"])
+        StockSplit.objects.create(
+            stock_id="NVDA",
+            date=price_rows[-1],
+            numerator=Decimal("10"),
+            denominator=Decimal("1"),
+        )
+
+        result = store.refresh()
+
+        assert result["reloaded_symbols"] == 1
+        pd.testing.assert_frame_equal(
+            _store_frame(store, ["NVDA"], None, None),
+            _orm_frame(["NVDA"], date.min, date.max),
+        )
+
+    @pytest.mark.django_db
+    def test_get_price_store_disabled_or_missing(self, store_settings, price_rows):
+        from packages.shared.stocks.services.price_store import (
+            PriceHistoryStore,
+            get_price_store,
+        )
+
+        assert get_price_store() is None  # 미구축
+
+        PriceHistoryStore().refresh()
+        assert get_price_store() is not None
+        with override_settings(PRICE_STORE_ENABLED=False):
+            assert get_price_store() is None
+
+
+class TestPriceStoreConsumers:
+
+    @pytest.mark.django_db
+    def test_calculator_load_matches_orm_path(
+        self, calculator, store_settings, price_rows, target_date
+    ):
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        with override_settings(PRICE_STORE_ENABLED=False):
+            orm = calculator._load_price_data(target_date)
+        PriceHistoryStore().refresh()
+        cached = calculator._load_price_data(target_date)
+
+        assert len(orm) == 85
+        key = ["symbol", "date"]
+        orm = orm.sort_values(key).reset_index(drop=True)
+        cached = cached.sort_values(key).reset_index(drop=True)
+        pd.testing.assert_frame_equal(cached[orm.columns], orm, check_dtype=False)
+
+    @pytest.mark.django_db
+    def test_baker_history_matches_orm_path(
+        self, store_settings, price_rows, target_date
+    ):
+        from packages.shared.stocks.services.eod_json_baker import EODJSONBaker
+        from packages.shared.stocks.services.price_store import PriceHistoryStore
+
+        baker = EODJSONBaker()
+        symbols = ["AAPL", "NVDA", "SPY"]
+        start = target_date - timedelta(days=40)
+        with override_settings(PRICE_STORE_ENABLED=False):
+            orm = baker._load_price_history(symbols, start, target_date)
+        PriceHistoryStore().refresh()
+
+        assert baker._load_price_history(symbols, start, target_date) == orm
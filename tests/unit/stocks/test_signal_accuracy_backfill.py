@@ -0,0 +1,151 @@
+"""
+SignalAccuracy 집합 기반 소급 단위 테스트
+
+선행 종가 해석(signal_date + h 이후 첫 거래일, as_of 이하), 초과수익률(vs SPY),
+미도래/미충족 행 보존, bulk 쓰기 범위를 검증합니다.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = pytest.mark.unit
+
+SIGNAL_DATE = date(2026, 2, 2)  # 월요일
+
+
+def _prices(stock, closes: dict):
+    from packages.shared.stocks.models import DailyPrice
+
+    DailyPrice.objects.bulk_create(
+        [
+            DailyPrice(
+                stock=stock,
+                date=d,
+                open_price=Decimal(str(c)),
+                high_price=Decimal(str(c)),
+                low_price=Decimal(str(c)),
+                close_price=Decimal(str(c)),
+                volume=1_000_000,
+            )
+            for d, c in closes.items()
+        ]
+    )
+
+
+def _accuracy(stock, signal_date=SIGNAL_DATE, tag="V1", **fields):
+    from packages.shared.stocks.models import SignalAccuracy
+
+    return SignalAccuracy.objects.create(
+        stock=stock,
+        signal_date=signal_date,
+        signal_tag=tag,
+        signal_value=1.0,
+        close_at_signal=Decimal("100"),
+        **fields,
+    )
+
+
+@pytest.fixture
+def price_history(stock_aapl, stock_spy):
+    """평일만 존재하는 AAPL(+1/일)·SPY(+0.5/일) 종가, 2026-02-02 ~ 2026-03-06"""
+    days = [
+        SIGNAL_DATE + timedelta(days=i)
+        for i in range(35)
+        if (SIGNAL_DATE + timedelta(days=i)).weekday() < 5
+    ]
+    _prices(stock_aapl, {d: 100 + i for i, d in enumerate(days)})
+    _prices(stock_spy, {d: 500 + i * 0.5 for i, d in enumerate(days)})
+    return days
+
+
+class TestBackfillSignalAccuracy:
+
+    @pytest.mark.django_db
+    def test_fills_all_due_horizons(self, stock_aapl, price_history):
+        from packages.shared.stocks.services.signal_accuracy_backfill import (
+            backfill_signal_accuracy,
+        )
+
+        acc = _accuracy(stock_aapl)
+
+        stats = backfill_signal_accuracy(date(2026, 3, 6))
+
+        acc.refresh_from_db()
+        assert stats["total"] == 3
+        # 1d: 화(+1) / 5d: 2/7 토 → 2/9 월(+5) / 20d: 2/22 일 → 2/23 월(+15)
+        assert acc.return_1d == pytest.approx(1.0)
+        assert acc.return_5d == pytest.approx(5.0)
+        assert acc.return_20d == pytest.approx(15.0)
+        assert acc.excess_1d == pytest.approx(1.0 - 0.1)
+        assert acc.excess_20d == pytest.approx(15.0 - 1.5)
+
+    @pytest.mark.django_db
+    def test_respects_as_of_and_keeps_filled_values(self, stock_aapl, price_history):
+        from packages.shared.stocks.services.signal_accuracy_backfill import (
+            backfill_signal_accuracy,
+        )
+
+        acc = _accuracy(stock_aapl, return_1d=9.9, excess_1d=8.8)
+
+        stats = backfill_signal_accuracy(date(2026, 2, 9))
+
+        acc.refresh_from_db()
+        assert stats["updated"] == {"1d": 0, "5d": 1, "20d": 0}
+        assert acc.return_1d == 9.9
+        assert acc.excess_1d == 8.8
+        assert acc.return_5d == pytest.approx(5.0)
+        assert acc.return_20d is None
+
+    @pytest.mark.django_db
+    def test_missing_prices_leave_row_pending(
+        self, stock_aapl, stock_nvda, stock_spy, price_history
+    ):
+        from packages.shared.stocks.models import DailyPrice
+        from packages.shared.stocks.services.signal_accuracy_backfill import (
+            backfill_signal_accuracy,
+        )
+
+        no_signal_close = _accuracy(stock_nvda)
+        _prices(stock_nvda, {SIGNAL_DATE + timedelta(days=1): 10})
+        DailyPrice.objects.filter(stock=stock_spy, date=SIGNAL_DATE).delete()
+        no_spy = _accuracy(stock_aapl)
+
+        backfill_signal_accuracy(date(2026, 3, 6), horizons=[1])
+
+        no_signal_close.refresh_from_db()
+        no_spy.refresh_from_db()
+        assert no_signal_close.return_1d is None
+        assert no_spy.return_1d == pytest.approx(1.0)
+        assert no_spy.excess_1d is None
+
+    @pytest.mark.django_db
+    def test_dry_run_and_command(self, stock_aapl, price_history):
+        from packages.shared.stocks.services.signal_accuracy_backfill import (
+            backfill_signal_accuracy,
+        )
+
+        acc = _accuracy(stock_aapl)
+
+        stats = backfill_signal_accuracy(date(2026, 3, 6), dry_run=True)
+        acc.refresh_from_db()
+        assert stats["total"] == 3
+        assert acc.return_1d is None
+
+        call_command(
+            "signal_accuracy_backfill", "--as-of", "2026-03-06", "--horizons", "5"
+        )
+        acc.refresh_from_db()
+        assert acc.return_5d == pytest.approx(5.0)
+        assert acc.return_1d is None
+
+    @pytest.mark.django_db
+    def test_pipeline_stage_returns_total(self, stock_aapl, price_history):
+        from packages.shared.stocks.services.eod_pipeline import EODPipeline
+
+        _accuracy(stock_aapl)
+        _accuracy(stock_aapl, tag="P2")
+
+        assert EODPipeline()._stage_accuracy_backfill(date(2026, 3, 6)) == 6
@@ -0,0 +1,233 @@
+"""
+TechnicalIndicators 단위 테스트
+
+벡터화 커널이 기존 Python 루프 알고리즘(반올림은 출력 시점에만)과 같은 값을 내는지,
+배치 API가 종목별 래퍼와 같은 결과를 내는지 검증합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from packages.shared.stocks.indicators import TechnicalIndicators as TI
+
+pytestmark = pytest.mark.unit
+
+
+# ── 기존 루프 구현 (중간 반올림 제거) ─────────────────────────────
+def _loop_sma(prices, period):
+    return [
+        None if i < period - 1 else sum(prices[i - period + 1 : i + 1]) / period
+        for i in range(len(prices))
+    ]
+
+
+def _loop_ema(prices, period):
+    if len(prices) < period:
+        return [None] * len(prices)
+    k = 2 / (period + 1)
+    ema = [None] * (period - 1) + [sum(prices[:period]) / period]
+    for p in prices[period:]:
+        ema.append(p * k + ema[-1] * (1 - k))
+    return ema
+
+
+def _loop_wilder(values, period):
+    avg = sum(values[:period]) / period
+    out = [avg]
+    for v in values[period:]:
+        avg = (avg * (period - 1) + v) / period
+        out.append(avg)
+    return out
+
+
+def _loop_rsi(prices, period=14):
+    changes = [b - a for a, b in zip(prices, prices[1:])]
+    gains = _loop_wilder([max(c, 0) for c in changes], period)
+    losses = _loop_wilder([max(-c, 0) for c in changes], period)
+    rsi = [100.0 if l == 0 else 100 - 100 / (1 + g / l) for g, l in zip(gains, losses)]
+    return [None] * period + rsi
+
+
+def _loop_atr(high, low, close, period=14):
+    tr = [
+        max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        for i in range(1, len(close))
+    ]
+    return [None] * period + _loop_wilder(tr, period)
+
+
+def _assert_close(actual, expected, atol=0.011):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None
+        else:
+            assert a == pytest.approx(e, abs=atol)
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, 300))
+    high = close + rng.uniform(0.1, 2.0, 300)
+    low = close - rng.uniform(0.1, 2.0, 300)
+    volume = rng.uniform(1e6, 5e7, 300).round()
+    return close.tolist(), high.tolist(), low.tolist(), volume.tolist()
+
+
+class TestPerSymbolParity:
+
+    def test_moving_averages(self, ohlcv):
+        close = ohlcv[0]
+        for period in (5, 20, 200):
+            _assert_close(TI.calculate_sma(close, period), _loop_sma(close, period))
+        for period in (12, 26):
+            _assert_close(TI.calculate_ema(close, period), _loop_ema(close, period))
+
+    def test_rsi_and_atr(self, ohlcv):
+        close, high, low, _ = ohlcv
+        _assert_close(TI.calculate_rsi(close), _loop_rsi(close))
+        _assert_close(TI.calculate_atr(high, low, close), _loop_atr(high, low, close))
+
+    def test_rsi_without_losses_is_100(self):
+        rsi = TI.calculate_rsi([float(p) for p in range(1, 31)])
+        assert rsi[:14] == [None] * 14
+        assert rsi[14:] == [100.0] * 16
+
+    def test_macd(self, ohlcv):
+        close = ohlcv[0]
+        fast, slow = _loop_ema(close, 12), _loop_ema(close, 26)
+        macd = [None if s is None else f - s for f, s in zip(fast, slow)]
+        signal = [None] * 25 + _loop_ema(macd[25:], 9)
+
+        result = TI.calculate_macd(close)
+
+        _assert_close(result["macd"], macd)
+        _assert_close(result["signal"], signal)
+        assert result["histogram"][-1] == pytest.approx(
+            macd[-1] - signal[-1], abs=0.011
+        )
+
+    def test_bollinger_bands(self, ohlcv):
+        close = ohlcv[0]
+        middle = _loop_sma(close, 20)
+        std = [
+            None if m is None else np.std(close[i - 19 : i + 1])
+            for i, m in enumerate(middle)
+        ]
+
+        result = TI.calculate_bollinger_bands(close)
+
+        _assert_close(result["middle"], middle)
+        _assert_close(
+            result["upper"],
+            [None if m is None else m + 2 * s for m, s in zip(middle, std)],
+        )
+        _assert_close(
+            result["percent_b"],
+            [
+                None if m is None else (c - (m - 2 * s)) / (4 * s) * 100
+                for c, m, s in zip(close, middle, std)
+            ],
+        )
+
+    def test_stochastic(self, ohlcv):
+        close, high, low, _ = ohlcv
+        raw_k = pd.Series(
+            [
+                None if i < 13 else (close[i] - min(low[i - 13 : i + 1]))
+                / (max(high[i - 13 : i + 1]) - min(low[i - 13 : i + 1])) * 100
+                for i in range(len(close))
+            ],
+            dtype=float,
+        )
+        k = raw_k.rolling(3).mean()
+        d = k.rolling(3).mean()
+
+        result = TI.calculate_stochastic(high, low, close)
+
+        _assert_close(result["percent_k"], [None if np.isnan(x) else x for x in k])
+        _assert_close(result["percent_d"], [None if np.isnan(x) else x for x in d])
+
+    def test_obv(self):
+        assert TI.calculate_obv([10, 20, 30, 40], [1.0, 2.0, 2.0, 1.5]) == [
+            10.0, 30.0, 30.0, -10.0,
+        ]
+        assert TI.calculate_obv([], []) == []
+        with pytest.raises(ValueError):
+            TI.calculate_obv([1], [1.0, 2.0])
+
+    def test_short_series_returns_none(self):
+        prices = [10.0, 11.0, 12.0]
+        assert TI.calculate_sma(prices, 5) == [None] * 3
+        assert TI.calculate_ema(prices, 5) == [None] * 3
+        assert TI.calculate_rsi(prices) == [None] * 3
+        assert TI.calculate_macd(prices)["signal"] == [None] * 3
+        assert TI.calculate_bollinger_bands(prices)["upper"] == [None] * 3
+        assert TI.calculate_atr(prices, prices, prices) == [None] * 3
+        assert TI.calculate_sma([], 5) == []
+        # 중심 ±20 창이 없는 40개 → 레벨 없음
+        assert TI.identify_support_resistance([float(i) for i in range(40)]) == {
+            "support": [], "resistance": [],
+        }
+
+
+class TestBatch:
+
+    def test_batch_matches_per_symbol_with_ragged_rows(self, ohlcv):
+        close, high, low, volume = (np.array(x) for x in ohlcv)
+        # 2행: 앞 40일 미상장 + 중간 5일 결측 (종목별 자체 거래일 기준)
+        c2, h2, l2, v2 = (x * 1.5 for x in (close, high, low, volume))
+        missing = np.zeros(300, dtype=bool)
+        missing[:40] = True
+        missing[150:155] = True
+        for arr in (c2, h2, l2):
+            arr[missing] = np.nan
+
+        batch = TI.calculate_all_indicators_batch(
+            np.vstack([close, c2]),
+            np.vstack([high, h2]),
+            np.vstack([low, l2]),
+            np.vstack([volume, v2]),
+        )
+
+        assert batch["sma_20"].shape == (2, 300)
+        assert np.isnan(batch["rsi"][1][missing]).all()
+
+        frame = pd.DataFrame(
+            {"close": close, "high": high, "low": low, "volume": volume}
+        )
+        single = TI.calculate_all_indicators(frame)
+        _assert_close(
+            [None if np.isnan(x) else x for x in batch["macd"][0]], single["macd"]
+        )
+
+        keep = ~missing
+        expected = TI.calculate_rsi(c2[keep].tolist())
+        _assert_close(
+            [None if np.isnan(x) else x for x in batch["rsi"][1][keep]], expected
+        )
+        expected = TI.calculate_stochastic(
+            h2[keep].tolist(), l2[keep].tolist(), c2[keep].tolist()
+        )["percent_d"]
+        _assert_close(
+            [None if np.isnan(x) else x for x in batch["stoch_d"][1][keep]], expected
+        )
+        assert batch["support_levels"][0] == single["support_levels"]
+
+    def test_calculate_all_indicators_keys(self, ohlcv):
+        close, high, low, volume = ohlcv
+        frame = pd.DataFrame(
+            {"close": close, "high": high, "low": low, "volume": volume}
+        )
+
+        result = TI.calculate_all_indicators(frame)
+
+        assert set(result) >= {
+            "sma_20", "sma_200", "ema_12", "rsi", "macd", "signal", "histogram",
+            "bb_upper", "bb_percent_b", "stoch_k", "stoch_d", "atr", "obv",
+            "support_levels", "resistance_levels",
+        }
+        assert all(len(result[k]) == 300 for k in ("sma_20", "stoch_d", "obv"))
+        assert result["stoch_d"][-1] is not None
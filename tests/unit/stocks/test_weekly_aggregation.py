@@ -0,0 +1,117 @@
+"""
+aggregate_weekly_prices — SQL 주간 롤업 + bulk upsert
+
+- 단일 주: 기존 Python 집계와 같은 값 (시가=첫 거래일, 종가=마지막 거래일, 주말 행 제외)
+- 백필: 여러 주를 한 번에 재생성, 재실행은 updated
+- 쿼리 수가 종목 수·주 수와 무관
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from packages.shared.stocks.models import DailyPrice, SP500Constituent, Stock, WeeklyPrice
+from packages.shared.stocks.tasks import aggregate_weekly_prices
+
+FRIDAY = date(2026, 3, 13)
+
+
+def _seed(symbols, weeks=3, skip=()):
+    """종목별 weeks주 × 월~토 일봉 (토요일 행은 집계 제외 대상)."""
+    for k, symbol in enumerate(symbols):
+        Stock.objects.create(symbol=symbol, stock_name=symbol)
+        SP500Constituent.objects.create(symbol=symbol, company_name=symbol, sector="Tech")
+        monday = FRIDAY - timedelta(days=4 + 7 * (weeks - 1))
+        for w in range(weeks):
+            for d in range(6):
+                day = monday + timedelta(days=7 * w + d)
+                if (symbol, day) in skip:
+                    continue
+                base = Decimal(100 + 10 * k + w * 5 + d)
+                DailyPrice.objects.create(
+                    stock_id=symbol, date=day, open_price=base, high_price=base + 2,
+                    low_price=base - 1 - (d % 3), close_price=base + 1,
+                    volume=1000 * (d + 1) + k,
+                )
+
+
+def _expected(symbol, week_end):
+    """기존 Python 집계 (월~금 DailyPrice)."""
+    prices = sorted(
+        DailyPrice.objects.filter(
+            stock_id=symbol, date__gte=week_end - timedelta(days=4), date__lte=week_end
+        ),
+        key=lambda p: p.date,
+    )
+    volumes = [p.volume for p in prices]
+    return {
+        "date": prices[-1].date,
+        "open_price": prices[0].open_price,
+        "high_price": max(p.high_price for p in prices),
+        "low_price": min(p.low_price for p in prices),
+        "close_price": prices[-1].close_price,
+        "volume": sum(volumes),
+        "week_start_date": prices[0].date,
+        "week_end_date": prices[-1].date,
+        "average_volume": sum(volumes) // len(volumes),
+    }
+
+
+def _row(symbol, week_end):
+    w = WeeklyPrice.objects.get(stock_id=symbol, date__gte=week_end - timedelta(days=4),
+                                date__lte=week_end)
+    return {key: getattr(w, key) for key in _expected(symbol, week_end)}
+
+
+@pytest.mark.django_db
+def test_single_week_matches_python_rollup():
+    # BBB는 월요일·금요일 결측 → 첫/마지막 거래일이 화/목
+    _seed(["AAA", "BBB"], skip={("BBB", FRIDAY - timedelta(days=4)), ("BBB", FRIDAY)})
+
+    result = aggregate_weekly_prices(target_week_end=str(FRIDAY))
+
+    assert result == {"week_end": str(FRIDAY), "symbols_aggregated": 2, "created": 2, "updated": 0}
+    assert WeeklyPrice.objects.count() == 2
+    for symbol in ["AAA", "BBB"]:
+        assert _row(symbol, FRIDAY) == _expected(symbol, FRIDAY)
+    assert WeeklyPrice.objects.get(stock_id="BBB").date == FRIDAY - timedelta(days=1)
+
+
+@pytest.mark.django_db
+def test_backfill_regenerates_range_and_upserts():
+    _seed(["AAA", "BBB"], weeks=3)
+    first_week_end = FRIDAY - timedelta(days=14)
+
+    result = aggregate_weekly_prices(
+        start_date=str(first_week_end - timedelta(days=2)), end_date=str(FRIDAY)
+    )
+
+    assert result["created"] == 6 and result["updated"] == 0
+    assert result["weeks"] == 3
+    assert result["week_start"] == str(first_week_end - timedelta(days=4))
+    for week_end in [first_week_end, first_week_end + timedelta(days=7), FRIDAY]:
+        assert _row("AAA", week_end) == _expected("AAA", week_end)
+
+    DailyPrice.objects.filter(stock_id="AAA", date=FRIDAY).update(close_price=Decimal("1.5"))
+    again = aggregate_weekly_prices(target_week_end=str(FRIDAY))
+
+    assert (again["created"], again["updated"]) == (0, 2)
+    assert WeeklyPrice.objects.get(stock_id="AAA", date=FRIDAY).close_price == Decimal("1.5")
+    assert WeeklyPrice.objects.count() == 6
+
+
+@pytest.mark.django_db
+def test_query_count_independent_of_universe_and_range():
+    def run(weeks):
+        with CaptureQueriesContext(connection) as ctx:
+            aggregate_weekly_prices(
+                start_date=str(FRIDAY - timedelta(days=7 * weeks)), end_date=str(FRIDAY)
+            )
+        return len(ctx.captured_queries)
+
+    _seed(["AAA"], weeks=1)
+    small = run(1)
+    _seed(["BBB", "CCC", "DDD"], weeks=4)
+    assert run(4) == small <= 6
@@ -250,3 +250,117 @@ class TestCalculateForSymbol:
         cache = PeerListCache.objects.filter(symbol=stock).first()
         assert cache is not None
         assert cache.peer_count >= 8
+
+
+# ---------------------------------------------------------------------------
+# Tests: calculate_universe (단일 패스) — 종목별 경로와 동일 결과
+# ---------------------------------------------------------------------------
+
+
+def _benchmark_state():
+    from packages.shared.metrics.models import IndustryMetricBenchmark, PeerMetricBenchmark
+
+    return {
+        "peer": {
+            (b.symbol_id, b.fiscal_year, b.metric_code_id): (
+                b.p25_value, b.median_value, b.p75_value, b.peer_count,
+                set(b.peer_symbols_used), b.benchmark_confidence,
+            )
+            for b in PeerMetricBenchmark.objects.all()
+        },
+        "delta": {
+            (d.symbol_id, d.fiscal_year, d.metric_code_id): (
+                d.company_value, d.benchmark_median, d.benchmark_p25, d.benchmark_p75,
+                d.benchmark_basis, d.benchmark_confidence, d.delta_vs_median,
+                d.percentile_rank, d.rank, d.total,
+            )
+            for d in CompanyBenchmarkDelta.objects.all()
+        },
+        "industry": {
+            (b.industry, b.fiscal_year, b.metric_code_id): (
+                b.p25_value, b.median_value, b.p75_value, b.mean_value,
+                b.sample_count, b.benchmark_confidence,
+            )
+            for b in IndustryMetricBenchmark.objects.all()
+        },
+        "cache": {
+            c.symbol_id: (
+                set(c.peer_symbols), c.peer_count, c.benchmark_basis, c.size_bucket,
+                c.use_industry_fallback, c.fallback_reason,
+            )
+            for c in PeerListCache.objects.all()
+        },
+    }
+
+
+def _clear_benchmarks():
+    from packages.shared.metrics.models import IndustryMetricBenchmark, PeerMetricBenchmark
+
+    for model in (PeerMetricBenchmark, CompanyBenchmarkDelta, IndustryMetricBenchmark, PeerListCache):
+        model.objects.all().delete()
+
+
+@pytest.mark.django_db
+class TestCalculateUniverse:
+    def _seed(self):
+        import random
+
+        rng = random.Random(3)
+        _make_metric_def("roe", higher_is_better=True)
+        _make_metric_def("debt_ratio", higher_is_better=False)
+        _make_metric_def("hidden", is_benchmarkable=False)
+        layout = (
+            [("SEMI", "Technology", "Semiconductors", 60e9)] * 12
+            + [("SOFT", "Technology", "Software", 5e9)] * 6
+            + [("BANK", "Financials", "Banks", 20e9)] * 3
+            + [("NOIND", "Financials", None, None)] * 2
+        )
+        for i, (prefix, sector, industry, mcap) in enumerate(layout):
+            sym = f"{prefix}{i:02d}"
+            _make_stock(sym, sector=sector, industry=industry,
+                        market_cap=mcap * (1 + i % 3) if mcap else None)
+            _make_sp500(sym)
+            for fy in (2023, 2024):
+                if rng.random() < 0.85:
+                    _make_snapshot(sym, fy, "roe", round(rng.uniform(-0.2, 0.4), 4))
+                if rng.random() < 0.85:
+                    status = "normal" if rng.random() < 0.9 else "outlier"
+                    _make_snapshot(sym, fy, "debt_ratio", round(rng.uniform(0, 2), 3), status)
+        # 동률 값 + 대소문자 다른 industry
+        _make_stock("SEMIX", sector="technology", industry="SEMICONDUCTORS", market_cap=1e9)
+        _make_sp500("SEMIX")
+        _make_snapshot("SEMIX", 2024, "roe", 0.1)
+        _make_snapshot("SEMI00", 2024, "hidden", 1.0)
+
+    def test_matches_per_symbol_path(self):
+        self._seed()
+        symbols = list(
+            SP500Constituent.objects.filter(is_active=True).values_list("symbol", flat=True)
+        ) + ["GHOST"]
+        calc = BenchmarkCalculator()
+
+        per_symbol = calc.calculate_for_symbols(symbols)
+        expected = _benchmark_state()
+        _clear_benchmarks()
+
+        result = calc.calculate_universe(symbols)
+
+        assert _benchmark_state() == expected
+        assert expected["delta"] and expected["industry"]
+        assert (result["success"], result["errors"]) == (per_symbol["success"], per_symbol["errors"])
+        assert result["error_details"] == [{"symbol": "GHOST", "error": "Stock not found"}]
+
+    def test_rerun_updates_in_place(self):
+        self._seed()
+        calc = BenchmarkCalculator()
+        calc.calculate_universe()
+        first = _benchmark_state()
+
+        CompanyMetricSnapshot.objects.filter(symbol_id="SEMI01", fiscal_year=2024).update(
+            metric_value=Decimal("9.9")
+        )
+        calc.calculate_universe()
+        second = _benchmark_state()
+
+        assert second["peer"].keys() == first["peer"].keys()
+        assert second["delta"] != first["delta"]